@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import create_async_engine
 from app.config.path_conf import ALEMBIC_VERSION_DIR
 from app.config.setting import settings
 from app.core.base_model import MappedBase
+from app.core.partition import LogPartition
 from app.utils.import_util import ImportUtil
 
 # 确保 alembic 版本目录存在
@@ -116,6 +117,8 @@ def run_migrations_online() -> None:
             target_metadata=target_metadata,
             compare_type=True,
             compare_server_default=True,
+            # 忽略日志分区子表及分区时调整过的索引与外键
+            include_object=LogPartition.include_object,
             transaction_per_migration=True,
             process_revision_directives=process_revision_directives,
         )
@@ -11,12 +11,15 @@ from fastapi import (
 )
 from fastapi.responses import FileResponse, JSONResponse
 
+from app.api.v1.module_system.auth.schema import AuthSchema
 from app.common.response import SuccessResponse, UploadFileResponse
+from app.config.setting import settings
 from app.core.dependencies import AuthPermission
 from app.core.logger import log
 from app.core.router_class import OperationLogRoute
 from app.utils.upload_util import UploadUtil
 
+from .schema import FileDigestCheckSchema
 from .service import FileService
 
 FileRouter = APIRouter(route_class=OperationLogRoute, prefix="/file", tags=["文件管理"])
@@ -25,12 +28,12 @@ FileRouter = APIRouter(route_class=OperationLogRoute, prefix="/file", tags=["文
 @FileRouter.post(
     "/upload",
     summary="上传文件",
-    description="上传文件",
-    dependencies=[Depends(AuthPermission(["module_common:file:upload"]))],
+    description="上传文件（启用去重时相同内容只存储一份）",
 )
 async def upload_controller(
     file: UploadFile,
     request: Request,
+    auth: Annotated[AuthSchema, Depends(AuthPermission(["module_common:file:upload"]))],
 ) -> JSONResponse:
     """
     上传文件
@@ -38,15 +41,101 @@ async def upload_controller(
     参数:
     - file (UploadFile): 上传的文件
     - request (Request): 请求对象
+    - auth (AuthSchema): 认证信息模型
 
     返回:
     - JSONResponse: 包含上传文件详情的JSON响应
     """
-    result_dict = await FileService.upload_service(base_url=str(request.base_url), file=file)
+    result_dict = await FileService.upload_service(
+        base_url=str(request.base_url),
+        file=file,
+        upload_type="blob" if settings.UPLOAD_DEDUP_ENABLE else "local",
+        auth=auth,
+    )
     log.info(f"上传文件成功 {result_dict}")
     return SuccessResponse(data=result_dict, msg="上传文件成功")
 
 
+@FileRouter.post(
+    "/check",
+    summary="上传预检",
+    description="按内容摘要检查文件是否已存在（只查询，不登记引用）",
+)
+async def check_digest_controller(
+    data: FileDigestCheckSchema,
+    request: Request,
+    auth: Annotated[AuthSchema, Depends(AuthPermission(["module_common:file:upload"]))],
+) -> JSONResponse:
+    """
+    上传预检
+
+    参数:
+    - data (FileDigestCheckSchema): 预检请求模型
+    - request (Request): 请求对象
+    - auth (AuthSchema): 认证信息模型
+
+    返回:
+    - JSONResponse: 包含预检结果的JSON响应
+    """
+    result_dict = await FileService.check_digest_service(
+        auth=auth, base_url=str(request.base_url), data=data
+    )
+    log.info(f"上传预检完成 {data.digest}: {result_dict['exists']}")
+    return SuccessResponse(data=result_dict, msg="上传预检完成")
+
+
+@FileRouter.post(
+    "/attach",
+    summary="引用已有文件",
+    description="按内容摘要引用已存在的文件，登记当前用户的引用，无需重复上传",
+)
+async def attach_digest_controller(
+    data: FileDigestCheckSchema,
+    request: Request,
+    auth: Annotated[AuthSchema, Depends(AuthPermission(["module_common:file:upload"]))],
+) -> JSONResponse:
+    """
+    引用已有文件
+
+    参数:
+    - data (FileDigestCheckSchema): 引用请求模型
+    - request (Request): 请求对象
+    - auth (AuthSchema): 认证信息模型
+
+    返回:
+    - JSONResponse: 包含文件详情的JSON响应
+    """
+    result_dict = await FileService.attach_digest_service(
+        auth=auth, base_url=str(request.base_url), data=data
+    )
+    log.info(f"引用已有文件成功 {data.digest}")
+    return SuccessResponse(data=result_dict, msg="引用已有文件成功")
+
+
+@FileRouter.delete(
+    "/release",
+    summary="释放文件引用",
+    description="按内容摘要释放当前用户的文件引用，引用归零时删除文件",
+)
+async def release_controller(
+    digests: Annotated[list[str], Body(description="内容摘要列表")],
+    auth: Annotated[AuthSchema, Depends(AuthPermission(["module_common:file:delete"]))],
+) -> JSONResponse:
+    """
+    释放文件引用
+
+    参数:
+    - digests (list[str]): 内容摘要列表
+    - auth (AuthSchema): 认证信息模型
+
+    返回:
+    - JSONResponse: 包含释放结果的JSON响应
+    """
+    await FileService.release_blob_service(auth=auth, digests=digests)
+    log.info(f"释放文件引用成功 {digests}")
+    return SuccessResponse(msg="释放文件引用成功")
+
+
 @FileRouter.post(
     "/download",
     summary="下载文件",
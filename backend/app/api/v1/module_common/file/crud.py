@@ -0,0 +1,147 @@
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import IntegrityError
+
+from app.api.v1.module_system.auth.schema import AuthSchema
+from app.core.base_crud import CRUDBase
+from app.core.exceptions import CustomException
+
+from .model import FileBlobModel, FileBlobRefModel
+from .schema import FileBlobCreateSchema, FileBlobUpdateSchema
+
+
+class FileBlobCRUD(CRUDBase[FileBlobModel, FileBlobCreateSchema, FileBlobUpdateSchema]):
+    """内容寻址文件数据层"""
+
+    def __init__(self, auth: AuthSchema) -> None:
+        """
+        初始化内容寻址文件数据层。
+
+        参数:
+        - auth (AuthSchema): 认证信息模型。
+        """
+        self.auth = auth
+        super().__init__(model=FileBlobModel, auth=auth)
+
+    async def get_by_digest_crud(self, digest: str) -> FileBlobModel | None:
+        """
+        根据内容摘要获取文件记录。
+
+        参数:
+        - digest (str): 内容摘要。
+
+        返回:
+        - FileBlobModel | None: 文件记录。
+        """
+        return await self.get(digest=digest)
+
+    async def create_if_absent_crud(self, data: FileBlobCreateSchema) -> FileBlobModel | None:
+        """
+        创建文件记录；相同摘要的记录已被并发请求写入时返回 None（在保存点中插入，不影响外层事务）。
+
+        参数:
+        - data (FileBlobCreateSchema): 文件记录创建模型。
+
+        返回:
+        - FileBlobModel | None: 新建的文件记录。
+        """
+        obj = FileBlobModel(**data.model_dump())
+        try:
+            async with self.auth.db.begin_nested():
+                self.auth.db.add(obj)
+                await self.auth.db.flush()
+        except IntegrityError:
+            return None
+        await self.auth.db.refresh(obj)
+        return obj
+
+    async def attach_crud(self, digest: str, origin_name: str | None) -> FileBlobModel | None:
+        """
+        为当前用户登记一条引用，并原子地增加引用计数（在数据库端计算，避免并发覆盖）。
+
+        参数:
+        - digest (str): 内容摘要。
+        - origin_name (str | None): 本次引用的原文件名。
+
+        返回:
+        - FileBlobModel | None: 更新后的文件记录，记录不存在时返回 None。
+        """
+        try:
+            result = await self.auth.db.execute(
+                update(FileBlobModel)
+                .where(FileBlobModel.digest == digest)
+                .values(ref_count=FileBlobModel.ref_count + 1)
+            )
+            if not result.rowcount:
+                return None
+            obj = await self.get(digest=digest)
+            if not obj:
+                return None
+            await self.auth.db.refresh(obj)
+            user_id = self.auth.user.id if self.auth.user else None
+            self.auth.db.add(
+                FileBlobRefModel(
+                    blob_id=obj.id,
+                    origin_name=origin_name,
+                    created_id=user_id,
+                    updated_id=user_id,
+                )
+            )
+            await self.auth.db.flush()
+        except Exception as e:
+            raise CustomException(msg=f"登记文件引用失败: {e!s}")
+        return obj
+
+    async def release_crud(self, digest: str) -> FileBlobModel | None:
+        """
+        释放当前用户对该内容的一条引用，并原子地减少引用计数。
+
+        参数:
+        - digest (str): 内容摘要。
+
+        返回:
+        - FileBlobModel | None: 更新后的文件记录，当前用户没有该内容的引用时返回 None。
+        """
+        if not self.auth.user:
+            return None
+        try:
+            ref = (
+                await self.auth.db.execute(
+                    select(FileBlobRefModel.id, FileBlobRefModel.blob_id)
+                    .join(FileBlobModel, FileBlobModel.id == FileBlobRefModel.blob_id)
+                    .where(
+                        FileBlobModel.digest == digest,
+                        FileBlobRefModel.created_id == self.auth.user.id,
+                    )
+                    .order_by(FileBlobRefModel.id.desc())
+                    .limit(1)
+                )
+            ).first()
+            if ref is None:
+                return None
+            await self.auth.db.execute(
+                delete(FileBlobRefModel).where(FileBlobRefModel.id == ref.id)
+            )
+            await self.auth.db.execute(
+                update(FileBlobModel)
+                .where(FileBlobModel.id == ref.blob_id)
+                .values(ref_count=FileBlobModel.ref_count - 1)
+            )
+            await self.auth.db.flush()
+        except Exception as e:
+            raise CustomException(msg=f"释放文件引用失败: {e!s}")
+        obj = await self.get(id=ref.blob_id)
+        if obj:
+            await self.auth.db.refresh(obj)
+        return obj
+
+    async def delete_crud(self, ids: list[int]) -> None:
+        """
+        删除文件记录。
+
+        参数:
+        - ids (list[int]): 文件记录ID列表。
+
+        返回:
+        - None
+        """
+        return await self.delete(ids=ids)
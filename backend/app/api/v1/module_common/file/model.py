@@ -0,0 +1,55 @@
+from sqlalchemy import BigInteger, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.base_model import ModelMixin, UserMixin
+
+
+class FileBlobModel(ModelMixin):
+    """
+    内容寻址文件存储表
+
+    以文件内容摘要作为唯一键，相同内容的文件只在磁盘上保存一份，
+    ref_count 记录引用条数（FileBlobRefModel），归零后才会删除物理文件。
+    """
+
+    __tablename__: str = "sys_file_blob"
+    __table_args__: dict[str, str] = {"comment": "内容寻址文件存储表"}
+
+    digest: Mapped[str] = mapped_column(
+        String(128), nullable=False, unique=True, index=True, comment="内容摘要"
+    )
+    hash_algorithm: Mapped[str] = mapped_column(
+        String(16), nullable=False, default="sha256", comment="摘要算法"
+    )
+    file_size: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0, comment="文件大小(字节)"
+    )
+    file_path: Mapped[str] = mapped_column(String(500), nullable=False, comment="存储路径")
+    origin_name: Mapped[str | None] = mapped_column(
+        String(255), nullable=True, comment="首次上传的原文件名"
+    )
+    content_type: Mapped[str | None] = mapped_column(String(128), nullable=True, comment="文件类型")
+    ref_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment="引用次数")
+
+
+class FileBlobRefModel(ModelMixin, UserMixin):
+    """
+    内容寻址文件引用表
+
+    每次上传或确认引用相同内容记录一条引用，created_id 为引用人，
+    用户只能释放自己的引用。
+    """
+
+    __tablename__: str = "sys_file_blob_ref"
+    __table_args__: dict[str, str] = {"comment": "内容寻址文件引用表"}
+
+    blob_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("sys_file_blob.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+        comment="文件记录ID",
+    )
+    origin_name: Mapped[str | None] = mapped_column(
+        String(255), nullable=True, comment="引用时的原文件名"
+    )
@@ -1,6 +1,8 @@
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from pydantic.alias_generators import to_camel
 
+from app.core.base_schema import UploadResponseSchema
+
 
 class ImportFieldModel(BaseModel):
     model_config = ConfigDict(alias_generator=to_camel, from_attributes=True)
@@ -61,3 +63,51 @@ class ImportModel(BaseModel):
                         raise ValueError("excel字段名存在重复")
                     seen.add(key)
         return self
+
+
+class FileBlobCreateSchema(BaseModel):
+    """内容寻址文件创建模型"""
+
+    digest: str = Field(..., max_length=128, description="内容摘要")
+    hash_algorithm: str = Field(default="sha256", description="摘要算法")
+    file_size: int = Field(default=0, ge=0, description="文件大小(字节)")
+    file_path: str = Field(..., max_length=500, description="存储路径")
+    origin_name: str | None = Field(default=None, max_length=255, description="原文件名")
+    content_type: str | None = Field(default=None, max_length=128, description="文件类型")
+    ref_count: int = Field(default=1, ge=0, description="引用次数")
+
+
+class FileBlobUpdateSchema(BaseModel):
+    """内容寻址文件更新模型"""
+
+    ref_count: int | None = Field(default=None, ge=0, description="引用次数")
+
+
+class FileBlobUploadSchema(UploadResponseSchema):
+    """内容寻址上传响应模型"""
+
+    digest: str | None = Field(default=None, description="内容摘要")
+    file_size: int | None = Field(default=None, description="文件大小(字节)")
+    duplicated: bool = Field(default=False, description="是否命中已有内容(未重复存储)")
+
+
+class FileDigestCheckSchema(BaseModel):
+    """内容摘要预检请求模型"""
+
+    digest: str = Field(..., min_length=32, max_length=128, description="内容摘要")
+    file_name: str | None = Field(default=None, max_length=255, description="原文件名")
+
+    @field_validator("digest")
+    @classmethod
+    def _validate_digest(cls, value: str) -> str:
+        value = value.strip().lower()
+        if any(c not in "0123456789abcdef" for c in value):
+            raise ValueError("内容摘要必须为十六进制字符串")
+        return value
+
+
+class FileDigestCheckOutSchema(BaseModel):
+    """内容摘要预检响应模型"""
+
+    exists: bool = Field(default=False, description="是否已存在相同内容")
+    file: FileBlobUploadSchema | None = Field(default=None, description="已存在时的文件信息")
@@ -1,9 +1,27 @@
+from functools import partial
+from pathlib import Path
+from urllib.parse import urljoin
+
 from fastapi import UploadFile
+from sqlalchemy import select
 
+from app.api.v1.module_system.auth.schema import AuthSchema
+from app.config.setting import settings
 from app.core.base_schema import DownloadFileSchema, UploadResponseSchema
+from app.core.database import after_commit, async_db_session
 from app.core.exceptions import CustomException
+from app.core.logger import log
 from app.utils.upload_util import UploadUtil
 
+from .crud import FileBlobCRUD
+from .model import FileBlobModel
+from .schema import (
+    FileBlobCreateSchema,
+    FileBlobUploadSchema,
+    FileDigestCheckOutSchema,
+    FileDigestCheckSchema,
+)
+
 
 class FileService:
     """
@@ -12,7 +30,11 @@ class FileService:
 
     @classmethod
     async def upload_service(
-        cls, base_url: str, file: UploadFile, upload_type: str = "local"
+        cls,
+        base_url: str,
+        file: UploadFile,
+        upload_type: str = "local",
+        auth: AuthSchema | None = None,
     ) -> dict:
         """
         上传文件。
@@ -20,7 +42,8 @@ class FileService:
         参数:
         - base_url (str): 基础访问 URL。
         - file (UploadFile): 上传文件对象。
-        - upload_type (str): 上传类型，'local' 或 'oss'，默认 'local'。
+        - upload_type (str): 上传类型，'local'、'blob'(内容寻址去重) 或 'oss'，默认 'local'。
+        - auth (AuthSchema | None): 认证信息模型，'blob' 类型必填。
 
         返回:
         - Dict: 上传响应字典。
@@ -28,6 +51,10 @@ class FileService:
         异常:
         - CustomException: 当未选择文件或上传类型错误时抛出。
         """
+        if upload_type == "blob":
+            if auth is None:
+                raise CustomException(msg="内容寻址上传缺少认证信息")
+            return await cls.upload_blob_service(auth=auth, base_url=base_url, file=file)
         if upload_type == "local":
             filename, filepath, file_url = await UploadUtil.upload_file(
                 file=file, base_url=base_url
@@ -42,6 +69,187 @@ class FileService:
             file_url=f"{file_url}",
         ).model_dump()
 
+    @classmethod
+    def _blob_response(
+        cls, blob: FileBlobModel, base_url: str, origin_name: str | None, duplicated: bool
+    ) -> dict:
+        """
+        构建内容寻址上传响应。
+
+        参数:
+        - blob (FileBlobModel): 文件记录。
+        - base_url (str): 基础访问 URL。
+        - origin_name (str | None): 本次上传的原文件名。
+        - duplicated (bool): 是否命中已有内容。
+
+        返回:
+        - dict: 上传响应字典。
+        """
+        return FileBlobUploadSchema(
+            file_path=blob.file_path,
+            file_name=Path(blob.file_path).name,
+            origin_name=origin_name or blob.origin_name,
+            file_url=urljoin(base_url, blob.file_path),
+            digest=blob.digest,
+            file_size=blob.file_size,
+            duplicated=duplicated,
+        ).model_dump()
+
+    @classmethod
+    async def upload_blob_service(cls, auth: AuthSchema, base_url: str, file: UploadFile) -> dict:
+        """
+        以内容摘要去重的方式上传文件：边写边算摘要，相同内容只保存一份，并为当前用户登记一条引用。
+
+        参数:
+        - auth (AuthSchema): 认证信息模型。
+        - base_url (str): 基础访问 URL。
+        - file (UploadFile): 上传文件对象。
+
+        返回:
+        - dict: 上传响应字典。
+
+        异常:
+        - CustomException: 当登记引用失败时抛出。
+        """
+        digest, size, tmp_path = await UploadUtil.write_temp_blob(file=file)
+        crud = FileBlobCRUD(auth)
+
+        blob = await crud.get_by_digest_crud(digest=digest)
+        duplicated = blob is not None
+        if blob is None:
+            ext = Path(file.filename).suffix.lower() if file.filename else ""
+            blob_path = UploadUtil.get_blob_path(digest=digest, ext=ext)
+            UploadUtil.commit_temp_blob(tmp_path, blob_path)
+            blob = await crud.create_if_absent_crud(
+                data=FileBlobCreateSchema(
+                    digest=digest,
+                    hash_algorithm=settings.UPLOAD_HASH_ALGORITHM,
+                    file_size=size,
+                    file_path=UploadUtil.to_blob_record_path(blob_path),
+                    origin_name=file.filename,
+                    content_type=file.content_type,
+                    ref_count=0,
+                )
+            )
+            # 并发上传相同内容时记录已由另一请求写入，按命中已有内容处理
+            duplicated = blob is None
+        else:
+            # 记录存在但物理文件丢失时，用本次内容修复；否则丢弃临时文件
+            blob_path = UploadUtil.from_blob_record_path(blob.file_path)
+            if not blob_path.exists():
+                log.warning(f"内容寻址文件缺失，重新写入: {blob.file_path}")
+            UploadUtil.commit_temp_blob(tmp_path, blob_path)
+
+        blob = await crud.attach_crud(digest=digest, origin_name=file.filename)
+        if not blob:
+            raise CustomException(msg="文件上传失败，文件记录不存在")
+        if duplicated:
+            log.info(f"命中已存储内容 {digest}，跳过重复存储")
+        return cls._blob_response(blob, base_url, file.filename, duplicated=duplicated)
+
+    @classmethod
+    async def check_digest_service(
+        cls, auth: AuthSchema, base_url: str, data: FileDigestCheckSchema
+    ) -> dict:
+        """
+        上传前预检：只查询是否已存在相同内容，不登记引用；确认使用时调用引用接口。
+
+        参数:
+        - auth (AuthSchema): 认证信息模型。
+        - base_url (str): 基础访问 URL。
+        - data (FileDigestCheckSchema): 预检请求模型。
+
+        返回:
+        - dict: 预检响应字典。
+        """
+        blob = await FileBlobCRUD(auth).get_by_digest_crud(digest=data.digest)
+        if not blob or not UploadUtil.from_blob_record_path(blob.file_path).exists():
+            return FileDigestCheckOutSchema(exists=False).model_dump()
+        return FileDigestCheckOutSchema(
+            exists=True,
+            file=FileBlobUploadSchema(
+                **cls._blob_response(blob, base_url, data.file_name, duplicated=True)
+            ),
+        ).model_dump()
+
+    @classmethod
+    async def attach_digest_service(
+        cls, auth: AuthSchema, base_url: str, data: FileDigestCheckSchema
+    ) -> dict:
+        """
+        引用已存在的内容：为当前用户登记一条引用（引用计数+1），客户端无需再上传。
+
+        参数:
+        - auth (AuthSchema): 认证信息模型。
+        - base_url (str): 基础访问 URL。
+        - data (FileDigestCheckSchema): 引用请求模型。
+
+        返回:
+        - dict: 上传响应字典。
+
+        异常:
+        - CustomException: 当内容不存在时抛出，客户端需重新上传。
+        """
+        crud = FileBlobCRUD(auth)
+        blob = await crud.get_by_digest_crud(digest=data.digest)
+        if not blob or not UploadUtil.from_blob_record_path(blob.file_path).exists():
+            raise CustomException(msg="文件不存在，请重新上传")
+        blob = await crud.attach_crud(digest=data.digest, origin_name=data.file_name)
+        if not blob:
+            raise CustomException(msg="文件不存在，请重新上传")
+        return cls._blob_response(blob, base_url, data.file_name, duplicated=True)
+
+    @classmethod
+    async def release_blob_service(cls, auth: AuthSchema, digests: list[str]) -> None:
+        """
+        释放当前用户的内容引用：每个摘要释放一条自己的引用，引用计数归零时删除记录，
+        事务提交后再删除物理文件。
+
+        参数:
+        - auth (AuthSchema): 认证信息模型。
+        - digests (list[str]): 内容摘要列表。
+
+        返回:
+        - None
+
+        异常:
+        - CustomException: 当释放对象为空时抛出。
+        """
+        if not digests:
+            raise CustomException(msg="释放失败，内容摘要不能为空")
+        crud = FileBlobCRUD(auth)
+        for digest in digests:
+            blob = await crud.release_crud(digest=digest.strip().lower())
+            if not blob:
+                log.warning(f"当前用户没有该内容的引用，跳过: {digest}")
+                continue
+            if blob.ref_count <= 0:
+                await crud.delete_crud(ids=[blob.id])
+                after_commit(auth.db, partial(cls._remove_blob_file, blob.digest, blob.file_path))
+
+    @classmethod
+    async def _remove_blob_file(cls, digest: str, file_path: str) -> None:
+        """
+        删除引用归零的物理文件（事务提交后执行）；期间相同内容被重新上传时保留文件。
+
+        参数:
+        - digest (str): 内容摘要。
+        - file_path (str): 记录路径。
+
+        返回:
+        - None
+        """
+        async with async_db_session() as session:
+            recreated = (
+                await session.execute(
+                    select(FileBlobModel.id).where(FileBlobModel.digest == digest)
+                )
+            ).first()
+        if recreated:
+            return
+        UploadUtil.delete_file(UploadUtil.from_blob_record_path(file_path))
+        log.info(f"内容寻址文件引用归零，已删除: {file_path}")
+
     @classmethod
     async def download_service(cls, file_path: str) -> DownloadFileSchema:
         """
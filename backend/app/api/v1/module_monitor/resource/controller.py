@@ -1,9 +1,8 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Body, Depends, Form, Query, Request, UploadFile
+from fastapi import APIRouter, Body, Depends, Form, Path, Query, Request, UploadFile
 from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 
-from app.common.request import PaginationService
 from app.common.response import StreamResponse, SuccessResponse
 from app.core.base_params import PaginationQueryParam
 from app.core.dependencies import AuthPermission
@@ -45,15 +44,12 @@ async def get_directory_list_controller(
     返回:
     - JSONResponse: 包含目录列表的JSON响应。
     """
-    # 获取资源列表（与案例模块保持一致的分页实现）
-    result_dict_list = await ResourceService.get_resources_list_service(
-        search=search, base_url=str(request.base_url)
-    )
-    # 使用分页服务进行分页处理（与案例模块保持一致）
-    result_dict = await PaginationService.paginate(
-        data_list=result_dict_list,
+    # 索引可用时在数据库中分页，否则回退到内存分页
+    result_dict = await ResourceService.get_resources_page_service(
+        search=search,
         page_no=page.page_no,
         page_size=page.page_size,
+        base_url=str(request.base_url),
     )
 
     log.info(f"获取目录列表成功: {getattr(search, 'name', None) or ''}")
@@ -133,17 +129,21 @@ async def download_file_controller(
 )
 async def delete_files_controller(
     paths: Annotated[list[str], Body(description="文件路径列表")],
+    background: Annotated[bool, Query(description="是否以后台任务执行")] = False,
 ) -> JSONResponse:
     """
     删除文件
 
     参数:
     - paths (list[str]): 文件路径列表。
+    - background (bool): 是否以后台任务执行。
 
     返回:
-    - JSONResponse: 包含删除结果的JSON响应。
+    - JSONResponse: 包含删除结果的JSON响应，后台执行时包含任务状态。
     """
-    await ResourceService.delete_file_service(paths=paths)
+    result_dict = await ResourceService.delete_file_service(paths=paths, background=background)
+    if result_dict:
+        return SuccessResponse(data=result_dict, msg="删除任务已提交")
     log.info(f"删除文件成功: {paths}")
     return SuccessResponse(msg="删除文件成功")
 
@@ -162,9 +162,11 @@ async def move_file_controller(data: ResourceMoveSchema) -> JSONResponse:
     - data (ResourceMoveSchema): 移动文件参数模型。
 
     返回:
-    - JSONResponse: 包含移动结果的JSON响应。
+    - JSONResponse: 包含移动结果的JSON响应，后台执行时包含任务状态。
     """
-    await ResourceService.move_file_service(data=data)
+    result_dict = await ResourceService.move_file_service(data=data)
+    if result_dict:
+        return SuccessResponse(data=result_dict, msg="移动任务已提交")
     log.info(f"移动文件成功: {data.source_path} -> {data.target_path}")
     return SuccessResponse(msg="移动文件成功")
 
@@ -183,13 +185,60 @@ async def copy_file_controller(data: ResourceCopySchema) -> JSONResponse:
     - data (ResourceCopySchema): 复制文件参数模型。
 
     返回:
-    - JSONResponse: 包含复制结果的JSON响应。
+    - JSONResponse: 包含复制结果的JSON响应，后台执行时包含任务状态。
     """
-    await ResourceService.copy_file_service(data=data)
+    result_dict = await ResourceService.copy_file_service(data=data)
+    if result_dict:
+        return SuccessResponse(data=result_dict, msg="复制任务已提交")
     log.info(f"复制文件成功: {data.source_path} -> {data.target_path}")
     return SuccessResponse(msg="复制文件成功")
 
 
+@ResourceRouter.get(
+    "/task/{task_id}",
+    summary="查询后台任务",
+    description="查询复制/移动/删除后台任务的进度",
+    dependencies=[Depends(AuthPermission(["module_monitor:resource:query"]))],
+)
+async def get_task_controller(
+    task_id: Annotated[str, Path(description="任务ID")],
+) -> JSONResponse:
+    """
+    查询后台任务
+
+    参数:
+    - task_id (str): 任务ID。
+
+    返回:
+    - JSONResponse: 包含任务状态的JSON响应。
+    """
+    result_dict = await ResourceService.get_task_service(task_id=task_id)
+    return SuccessResponse(data=result_dict, msg="查询任务成功")
+
+
+@ResourceRouter.post(
+    "/task/{task_id}/cancel",
+    summary="取消后台任务",
+    description="取消正在执行的复制/移动/删除后台任务",
+    dependencies=[Depends(AuthPermission(["module_monitor:resource:query"]))],
+)
+async def cancel_task_controller(
+    task_id: Annotated[str, Path(description="任务ID")],
+) -> JSONResponse:
+    """
+    取消后台任务
+
+    参数:
+    - task_id (str): 任务ID。
+
+    返回:
+    - JSONResponse: 包含任务状态的JSON响应。
+    """
+    result_dict = await ResourceService.cancel_task_service(task_id=task_id)
+    log.info(f"取消资源后台任务: {task_id}")
+    return SuccessResponse(data=result_dict, msg="已请求取消任务")
+
+
 @ResourceRouter.post(
     "/rename",
     summary="重命名文件",
@@ -0,0 +1,200 @@
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import asc, delete, desc, func, insert, or_, select, update
+
+from app.api.v1.module_system.auth.schema import AuthSchema
+from app.core.base_crud import CRUDBase
+from app.core.base_params import SortField, SortSpec
+from app.core.exceptions import CustomException
+
+from .model import ResourceIndexModel
+from .schema import ResourceIndexSchema
+
+
+class ResourceIndexCRUD(CRUDBase[ResourceIndexModel, ResourceIndexSchema, ResourceIndexSchema]):
+    """资源索引数据层"""
+
+    # 批量写入分块大小，避免单条语句参数过多
+    BATCH_SIZE = 1000
+
+    # 对外排序字段 -> 索引列
+    SORT_COLUMNS: dict[str, Any] = {
+        "name": ResourceIndexModel.name,
+        "size": ResourceIndexModel.size,
+        "modified_time": ResourceIndexModel.mtime,
+        "created_time": ResourceIndexModel.ctime,
+        "is_dir": ResourceIndexModel.is_dir,
+        "ext": ResourceIndexModel.ext,
+    }
+
+    def __init__(self, auth: AuthSchema) -> None:
+        """
+        初始化资源索引数据层。
+
+        参数:
+        - auth (AuthSchema): 认证信息模型。
+        """
+        self.auth = auth
+        super().__init__(model=ResourceIndexModel, auth=auth)
+
+    async def get_by_path_crud(self, path: str) -> ResourceIndexModel | None:
+        """
+        根据相对路径获取索引记录。
+
+        参数:
+        - path (str): 相对路径，根目录为空字符串。
+
+        返回:
+        - ResourceIndexModel | None: 索引记录。
+        """
+        result = await self.auth.db.execute(
+            select(ResourceIndexModel).where(ResourceIndexModel.path == path)
+        )
+        return result.scalars().first()
+
+    async def get_snapshot_crud(self) -> dict[str, tuple]:
+        """
+        获取索引快照，用于与磁盘扫描结果做差异比较。
+
+        返回:
+        - dict[str, tuple]: {path: (id, size, mtime, total_files, total_dirs, total_size)}。
+        """
+        result = await self.auth.db.execute(
+            select(
+                ResourceIndexModel.path,
+                ResourceIndexModel.id,
+                ResourceIndexModel.size,
+                ResourceIndexModel.mtime,
+                ResourceIndexModel.total_files,
+                ResourceIndexModel.total_dirs,
+                ResourceIndexModel.total_size,
+            )
+        )
+        return {row[0]: tuple(row[1:]) for row in result.all()}
+
+    async def bulk_insert_crud(self, rows: list[dict]) -> None:
+        """
+        批量插入索引记录（executemany）。
+
+        参数:
+        - rows (list[dict]): 索引记录字典列表。
+
+        返回:
+        - None
+        """
+        try:
+            for i in range(0, len(rows), self.BATCH_SIZE):
+                await self.auth.db.execute(
+                    insert(ResourceIndexModel), rows[i : i + self.BATCH_SIZE]
+                )
+        except Exception as e:
+            raise CustomException(msg=f"批量写入资源索引失败: {e!s}")
+
+    async def bulk_update_crud(self, rows: list[dict]) -> None:
+        """
+        按主键批量更新索引记录（executemany）。
+
+        参数:
+        - rows (list[dict]): 含 id 的索引记录字典列表。
+
+        返回:
+        - None
+        """
+        try:
+            for i in range(0, len(rows), self.BATCH_SIZE):
+                await self.auth.db.execute(
+                    update(ResourceIndexModel), rows[i : i + self.BATCH_SIZE]
+                )
+        except Exception as e:
+            raise CustomException(msg=f"批量更新资源索引失败: {e!s}")
+
+    async def bulk_delete_crud(self, ids: list[int]) -> None:
+        """
+        按主键批量删除索引记录。
+
+        参数:
+        - ids (list[int]): 主键列表。
+
+        返回:
+        - None
+        """
+        try:
+            for i in range(0, len(ids), self.BATCH_SIZE):
+                await self.auth.db.execute(
+                    delete(ResourceIndexModel).where(
+                        ResourceIndexModel.id.in_(ids[i : i + self.BATCH_SIZE])
+                    )
+                )
+        except Exception as e:
+            raise CustomException(msg=f"批量删除资源索引失败: {e!s}")
+
+    async def search_crud(
+        self,
+        base: str = "",
+        recursive: bool = False,
+        name: str | None = None,
+        ext: str | None = None,
+        include_hidden: bool = False,
+        order_by: str | list[dict[str, str]] | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[Sequence[ResourceIndexModel], int]:
+        """
+        在索引中搜索资源（支持递归、名称/拓展名过滤、排序与分页）。
+
+        参数:
+        - base (str): 起始目录相对路径，根目录为空字符串。
+        - recursive (bool): 是否包含所有子孙目录。
+        - name (str | None): 名称关键词（不区分大小写）。
+        - ext (str | None): 拓展名（小写，不含点）。
+        - include_hidden (bool): 是否包含隐藏项。
+        - order_by (str | list[dict[str, str]] | None): 排序，格式 [{'name': 'asc'}]，默认按名称升序。
+        - offset (int): 偏移量。
+        - limit (int | None): 数量限制，None 表示不限制。
+
+        返回:
+        - tuple[Sequence[ResourceIndexModel], int]: (当前页记录, 总数)。
+        """
+        conditions = []
+        if recursive:
+            conditions.append(ResourceIndexModel.path != base)
+            if base:
+                conditions.append(
+                    or_(
+                        ResourceIndexModel.parent == base,
+                        ResourceIndexModel.path.startswith(f"{base}/", autoescape=True),
+                    )
+                )
+        else:
+            conditions.append(ResourceIndexModel.parent == base)
+        if name:
+            conditions.append(
+                func.lower(ResourceIndexModel.name).contains(name.lower(), autoescape=True)
+            )
+        if ext:
+            conditions.append(ResourceIndexModel.ext == ext)
+        if not include_hidden:
+            conditions.append(ResourceIndexModel.is_hidden.is_(False))
+
+        spec = SortSpec.parse(order_by, allowed=self.SORT_COLUMNS) or SortSpec([SortField("name")])
+        columns = [
+            desc(self.SORT_COLUMNS[item.field])
+            if item.descending
+            else asc(self.SORT_COLUMNS[item.field])
+            for item in spec
+        ]
+
+        count_sql = select(func.count(ResourceIndexModel.id)).where(*conditions)
+        total = (await self.auth.db.execute(count_sql)).scalar() or 0
+
+        sql = (
+            select(ResourceIndexModel)
+            .where(*conditions)
+            .order_by(*columns, ResourceIndexModel.id)
+            .offset(offset)
+        )
+        if limit is not None:
+            sql = sql.limit(limit)
+        result = await self.auth.db.execute(sql)
+        return result.scalars().all(), total
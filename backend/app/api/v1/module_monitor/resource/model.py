@@ -0,0 +1,44 @@
+from sqlalchemy import BigInteger, Boolean, Double, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.base_model import MappedBase
+
+
+class ResourceIndexModel(MappedBase):
+    """
+    静态资源文件元数据索引表
+
+    由后台任务按 scandir 差异增量维护，列表/搜索/目录统计直接查询本表，
+    请求期间不再访问文件系统。路径均为相对静态资源根目录的 POSIX 路径，根目录为空字符串。
+    """
+
+    __tablename__: str = "sys_resource_index"
+    __table_args__: dict[str, str] = {"comment": "静态资源文件元数据索引表"}
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True, comment="主键ID")
+    path: Mapped[str] = mapped_column(
+        String(512), nullable=False, unique=True, index=True, comment="相对路径"
+    )
+    parent: Mapped[str | None] = mapped_column(
+        String(512), nullable=True, index=True, comment="父目录相对路径"
+    )
+    name: Mapped[str] = mapped_column(String(255), nullable=False, index=True, comment="名称")
+    ext: Mapped[str] = mapped_column(
+        String(32), nullable=False, default="", index=True, comment="拓展名(小写,不含点)"
+    )
+    is_dir: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False, comment="是否目录")
+    is_hidden: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, default=False, comment="是否隐藏(自身或上级以点开头)"
+    )
+    size: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, comment="文件大小")
+    mtime: Mapped[float] = mapped_column(Double, nullable=False, default=0, comment="修改时间戳")
+    ctime: Mapped[float] = mapped_column(Double, nullable=False, default=0, comment="创建时间戳")
+    total_files: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, comment="目录下(递归)文件数"
+    )
+    total_dirs: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, comment="目录下(递归)目录数"
+    )
+    total_size: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0, comment="目录下(递归)文件总大小"
+    )
@@ -86,6 +86,7 @@ class ResourceMoveSchema(BaseModel):
     source_path: str = Field(..., description="源路径")
     target_path: str = Field(..., description="目标路径")
     overwrite: bool = Field(False, description="是否覆盖")
+    background: bool = Field(False, description="是否以后台任务执行(返回任务ID)")
 
     @field_validator("source_path", "target_path")
     @classmethod
@@ -154,6 +155,8 @@ class ResourceSearchQueryParam:
         self,
         name: str | None = Query(None, description="搜索关键词"),
         path: str | None = Query(None, description="目录路径"),
+        ext: str | None = Query(None, description="文件拓展名，如 pdf"),
+        recursive: bool = Query(False, description="是否递归搜索子目录"),
     ) -> None:
 
         # 模糊查询字段
@@ -161,3 +164,43 @@ class ResourceSearchQueryParam:
 
         # 精确查询字段
         self.path = path
+        self.ext = ext.strip().lstrip(".").lower() if ext else None
+        self.recursive = recursive
+
+
+class ResourceIndexSchema(BaseModel):
+    """资源索引记录模型"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    path: str = Field(..., description="相对路径")
+    parent: str | None = Field(None, description="父目录相对路径")
+    name: str = Field(..., description="名称")
+    ext: str = Field("", description="拓展名")
+    is_dir: bool = Field(False, description="是否目录")
+    is_hidden: bool = Field(False, description="是否隐藏")
+    size: int = Field(0, description="文件大小")
+    mtime: float = Field(0, description="修改时间戳")
+    ctime: float = Field(0, description="创建时间戳")
+    total_files: int = Field(0, description="目录下(递归)文件数")
+    total_dirs: int = Field(0, description="目录下(递归)目录数")
+    total_size: int = Field(0, description="目录下(递归)文件总大小")
+
+
+class ResourceTaskSchema(BaseModel):
+    """资源后台任务状态模型"""
+
+    task_id: str = Field(..., description="任务ID")
+    action: str = Field(..., description="操作类型(copy/move/delete)")
+    source_path: str | None = Field(None, description="源路径")
+    target_path: str | None = Field(None, description="目标路径")
+    status: str = Field(..., description="状态(pending/running/success/failed/cancelled)")
+    total_files: int = Field(0, description="文件总数")
+    done_files: int = Field(0, description="已处理文件数")
+    total_bytes: int = Field(0, description="总字节数")
+    done_bytes: int = Field(0, description="已处理字节数")
+    percent: float = Field(0, description="完成百分比")
+    current: str | None = Field(None, description="当前处理路径")
+    error: str | None = Field(None, description="错误信息")
+    created_time: datetime = Field(..., description="创建时间")
+    finished_time: datetime | None = Field(None, description="结束时间")
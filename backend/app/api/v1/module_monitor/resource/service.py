@@ -1,5 +1,6 @@
+import heapq
 import os
-import shutil
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -7,11 +8,17 @@ from urllib.parse import urlparse
 
 from fastapi import UploadFile
 
+from app.api.v1.module_system.auth.schema import AuthSchema
+from app.common.request import PaginationService
 from app.config.setting import settings
+from app.core.base_params import SortField, SortSpec
+from app.core.database import async_db_session
 from app.core.exceptions import CustomException
 from app.core.logger import log
 from app.utils.excel_util import ExcelUtil
 
+from .crud import ResourceIndexCRUD
+from .model import ResourceIndexModel
 from .schema import (
     ResourceCopySchema,
     ResourceCreateDirSchema,
@@ -20,8 +27,47 @@ from .schema import (
     ResourceMoveSchema,
     ResourceRenameSchema,
     ResourceSearchQueryParam,
+    ResourceTaskSchema,
     ResourceUploadSchema,
 )
+from .tools.async_fs import AsyncFS, FSProgress
+from .tools.resource_index import ResourceIndexer
+from .tools.resource_task import ResourceTaskManager
+
+
+class _Descending:
+    """反转比较顺序的排序键包装，用于字符串等无法取负的字段降序排序"""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __lt__(self, other: "_Descending") -> bool:
+        return other.value < self.value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Descending) and other.value == self.value
+
+
+def _to_timestamp(value: Any) -> float:
+    """
+    将时间值转换为时间戳，便于排序比较。
+
+    参数:
+    - value (Any): ISO 格式时间字符串或 datetime。
+
+    返回:
+    - float: 时间戳，无法解析时为 0。
+    """
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, str) and value:
+        try:
+            return datetime.fromisoformat(value).timestamp()
+        except ValueError:
+            return 0.0
+    return 0.0
 
 
 class ResourceService:
@@ -34,6 +80,17 @@ class ResourceService:
     MAX_SEARCH_RESULTS = 1000  # 最大搜索结果数
     MAX_PATH_DEPTH = 20  # 最大路径深度
 
+    # 排序字段 -> (排序键, 是否数值)；排序键对每条记录只计算一次，数值键降序时直接取负
+    SORT_KEYS: dict[str, tuple[Callable[[dict], Any], bool]] = {
+        "name": (lambda item: item.get("name") or "", False),
+        "ext": (lambda item: os.path.splitext(item.get("name") or "")[1][1:].lower(), False),
+        "size": (lambda item: item.get("size") or 0, True),
+        "modified_time": (lambda item: _to_timestamp(item.get("modified_time")), True),
+        "created_time": (lambda item: _to_timestamp(item.get("created_time")), True),
+        "is_dir": (lambda item: int(bool(item.get("is_dir"))), True),
+        "is_file": (lambda item: int(bool(item.get("is_file"))), True),
+    }
+
     @classmethod
     def _get_resource_root(cls) -> str:
         """
@@ -222,6 +279,111 @@ class ResourceService:
             log.error(f"获取文件信息失败: {e!s}")
             return {}
 
+    @classmethod
+    def _index_to_file_info(cls, item: ResourceIndexModel, base_url: str | None = None) -> dict:
+        """
+        将索引记录转换为与 _get_file_info 相同结构的信息字典（不访问文件系统）。
+
+        参数:
+        - item (ResourceIndexModel): 索引记录。
+        - base_url (str | None): 基础URL，用于生成完整URL。
+
+        返回:
+        - dict: 文件或目录的详细信息字典。
+        """
+        abs_path = os.path.join(cls._get_resource_root(), *item.path.split("/"))
+        return {
+            "name": item.name,
+            "file_url": cls._generate_http_url(abs_path, base_url),
+            "relative_path": item.path.replace("/", os.sep),
+            "is_file": not item.is_dir,
+            "is_dir": item.is_dir,
+            "size": None if item.is_dir else item.size,
+            "created_time": datetime.fromtimestamp(item.ctime).isoformat(),
+            "modified_time": datetime.fromtimestamp(item.mtime).isoformat(),
+            "is_hidden": item.name.startswith("."),
+        }
+
+    @classmethod
+    async def _search_index(
+        cls,
+        search: ResourceSearchQueryParam | None,
+        order_by: str | list[dict[str, str]] | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+        include_hidden: bool = False,
+        base_path: str | None = None,
+    ) -> tuple[list[ResourceIndexModel], int]:
+        """
+        通过元数据索引搜索资源。
+
+        参数:
+        - search (ResourceSearchQueryParam | None): 查询参数模型。
+        - order_by (str | list[dict[str, str]] | None): 排序，格式 [{'name': 'asc'}]。
+        - offset (int): 偏移量。
+        - limit (int | None): 数量限制。
+        - include_hidden (bool): 是否包含隐藏项。
+        - base_path (str | None): 起始目录的绝对路径，未指定时由 search.path 决定。
+
+        返回:
+        - tuple[list[ResourceIndexModel], int]: (记录列表, 总数)。
+
+        异常:
+        - CustomException: 起始路径不存在或不是目录。
+        """
+        if base_path is None:
+            base_path = (
+                cls._get_safe_path(search.path)
+                if search and getattr(search, "path", None)
+                else cls._get_resource_root()
+            )
+        keyword = search.name[1] if search and getattr(search, "name", None) else None
+        async with async_db_session() as session:
+            crud = ResourceIndexCRUD(AuthSchema(db=session, check_data_scope=False))
+            base = ResourceIndexer.to_relative(base_path)
+            node = await crud.get_by_path_crud(path=base)
+            if not node:
+                raise CustomException(msg="目录不存在")
+            if not node.is_dir:
+                raise CustomException(msg="路径不是目录")
+            items, total = await crud.search_crud(
+                base=base,
+                recursive=bool(search and getattr(search, "recursive", False)),
+                name=keyword,
+                ext=getattr(search, "ext", None) if search else None,
+                include_hidden=include_hidden,
+                order_by=order_by,
+                offset=offset,
+                limit=limit,
+            )
+        return list(items), total
+
+    @classmethod
+    def _list_directory(
+        cls, safe_path: str, include_hidden: bool = False, base_url: str | None = None
+    ) -> list[dict]:
+        """
+        读取目录下各项的详细信息（同步，在文件线程池中执行）。
+
+        参数:
+        - safe_path (str): 目录路径。
+        - include_hidden (bool): 是否包含隐藏文件。
+        - base_url (str | None): 基础URL，用于生成完整URL。
+
+        返回:
+        - list[dict]: 文件或目录信息字典列表。
+        """
+        file_infos = []
+        for item_name in os.listdir(safe_path):
+            # 跳过隐藏文件
+            if not include_hidden and item_name.startswith("."):
+                continue
+
+            file_info = cls._get_file_info(os.path.join(safe_path, item_name), base_url)
+            if file_info:
+                file_infos.append(file_info)
+        return file_infos
+
     @classmethod
     async def get_directory_list_service(
         cls,
@@ -249,38 +411,55 @@ class ResourceService:
                 safe_path = cls._get_safe_path(path)
                 display_path = cls._generate_http_url(safe_path, base_url)
 
-            if not os.path.exists(safe_path):
-                raise CustomException(msg="目录不存在")
-
-            if not os.path.isdir(safe_path):
-                raise CustomException(msg="路径不是目录")
-
             items = []
             total_files = 0
             total_dirs = 0
             total_size = 0
 
-            try:
-                for item_name in os.listdir(safe_path):
-                    # 跳过隐藏文件
-                    if not include_hidden and item_name.startswith("."):
-                        continue
-
-                    item_path = os.path.join(safe_path, item_name)
-                    file_info = cls._get_file_info(item_path, base_url)
-
-                    if file_info:
-                        items.append(ResourceItemSchema(**file_info))
+            if await ResourceIndexer.is_fresh():
+                index_items, _ = await cls._search_index(
+                    search=None, include_hidden=include_hidden, base_path=safe_path
+                )
+                for index_item in index_items:
+                    items.append(
+                        ResourceItemSchema(**cls._index_to_file_info(index_item, base_url))
+                    )
+                    if index_item.is_dir:
+                        total_dirs += 1
+                    else:
+                        total_files += 1
+                        total_size += index_item.size
+                return ResourceDirectorySchema(
+                    path=display_path,
+                    name=os.path.basename(safe_path),
+                    items=items,
+                    total_files=total_files,
+                    total_dirs=total_dirs,
+                    total_size=total_size,
+                ).model_dump()
+
+            if not await AsyncFS.exists(safe_path):
+                raise CustomException(msg="目录不存在")
 
-                        if file_info["is_file"]:
-                            total_files += 1
-                            total_size += file_info.get("size", 0) or 0
-                        elif file_info["is_dir"]:
-                            total_dirs += 1
+            if not await AsyncFS.isdir(safe_path):
+                raise CustomException(msg="路径不是目录")
 
+            try:
+                file_infos = await AsyncFS.run(
+                    cls._list_directory, safe_path, include_hidden, base_url
+                )
             except PermissionError:
                 raise CustomException(msg="没有权限访问此目录")
 
+            for file_info in file_infos:
+                items.append(ResourceItemSchema(**file_info))
+
+                if file_info["is_file"]:
+                    total_files += 1
+                    total_size += file_info.get("size", 0) or 0
+                elif file_info["is_dir"]:
+                    total_dirs += 1
+
             return ResourceDirectorySchema(
                 path=display_path,  # 返回HTTP URL路径而不是文件系统路径
                 name=os.path.basename(safe_path),
@@ -300,7 +479,7 @@ class ResourceService:
     async def get_resources_list_service(
         cls,
         search: ResourceSearchQueryParam | None = None,
-        order_by: str | None = None,
+        order_by: str | list[dict[str, str]] | None = None,
         base_url: str | None = None,
     ) -> list[dict]:
         """
@@ -308,13 +487,20 @@ class ResourceService:
 
         参数:
         - search (ResourceSearchQueryParam | None): 查询参数模型。
-        - order_by (str | None): 排序参数。
+        - order_by (str | list[dict[str, str]] | None): 排序参数，格式 [{'name': 'asc'}]。
         - base_url (str | None): 基础URL，用于生成完整URL。
 
         返回:
         - list[dict]: 资源详情字典列表。
         """
         try:
+            # 索引可用时直接查询索引，不访问文件系统，也不受最大结果数限制
+            if await ResourceIndexer.is_fresh():
+                index_items, _ = await cls._search_index(search=search, order_by=order_by)
+                if not index_items:
+                    raise CustomException(msg="没有符合条件的资源")
+                return [cls._index_to_file_info(item, base_url) for item in index_items]
+
             # 确定搜索路径
             resource_root = (
                 cls._get_safe_path(search.path)
@@ -323,52 +509,136 @@ class ResourceService:
             )
 
             # 检查路径是否存在
-            if not os.path.exists(resource_root):
+            if not await AsyncFS.exists(resource_root):
                 raise CustomException(msg="目录不存在")
 
-            if not os.path.isdir(resource_root):
+            if not await AsyncFS.isdir(resource_root):
                 raise CustomException(msg="路径不是目录")
 
             # 收集资源
-            all_resources = []
-
             try:
-                for item_name in os.listdir(resource_root):
-                    # 跳过隐藏文件
-                    if item_name.startswith("."):
-                        continue
-
-                    item_path = os.path.join(resource_root, item_name)
-                    file_info = cls._get_file_info(item_path, base_url)
-
-                    if file_info:
-                        # 应用名称过滤
-                        if search and hasattr(search, "name") and search.name and search.name[1]:
-                            search_keyword = search.name[1].lower()
-                            if search_keyword not in file_info.get("name", "").lower():
-                                continue
-
-                        all_resources.append(file_info)
-
+                all_resources = await AsyncFS.run(
+                    cls._collect_resources, resource_root, search, base_url
+                )
             except PermissionError:
                 raise CustomException(msg="没有权限访问此目录")
 
-            # 应用排序
-            sorted_resources = cls._sort_results(all_resources, order_by)
-
-            if not sorted_resources:
+            if not all_resources:
                 raise CustomException(msg="没有符合条件的资源")
 
-            # 限制最大结果数
-            if len(sorted_resources) > cls.MAX_SEARCH_RESULTS:
-                sorted_resources = sorted_resources[: cls.MAX_SEARCH_RESULTS]
-
-            return sorted_resources
+            # 应用排序，并限制最大结果数
+            return cls._sort_results(all_resources, order_by, limit=cls.MAX_SEARCH_RESULTS)
 
         except Exception as e:
             log.error(f"搜索资源失败: {e!s}")
             raise CustomException(msg=f"搜索资源失败: {e!s}")
 
+    @classmethod
+    def _collect_resources(
+        cls,
+        resource_root: str,
+        search: ResourceSearchQueryParam | None = None,
+        base_url: str | None = None,
+    ) -> list[dict]:
+        """
+        扫描文件系统收集符合条件的资源（同步，在文件线程池中执行）。
+
+        参数:
+        - resource_root (str): 搜索起始目录。
+        - search (ResourceSearchQueryParam | None): 查询参数模型。
+        - base_url (str | None): 基础URL，用于生成完整URL。
+
+        返回:
+        - list[dict]: 资源详情字典列表（未排序）。
+        """
+        all_resources = []
+        ext = getattr(search, "ext", None) if search else None
+
+        for item_path in cls._iter_search_paths(
+            resource_root, recursive=bool(search and getattr(search, "recursive", False))
+        ):
+            if ext and (
+                os.path.isdir(item_path) or os.path.splitext(item_path)[1][1:].lower() != ext
+            ):
+                continue
+
+            file_info = cls._get_file_info(item_path, base_url)
+
+            if file_info:
+                # 应用名称过滤
+                if search and hasattr(search, "name") and search.name and search.name[1]:
+                    search_keyword = search.name[1].lower()
+                    if search_keyword not in file_info.get("name", "").lower():
+                        continue
+
+                all_resources.append(file_info)
+        return all_resources
+
+    @classmethod
+    def _iter_search_paths(cls, resource_root: str, recursive: bool = False):
+        """
+        遍历搜索范围内的非隐藏路径（索引不可用时的回退方案）。
+
+        参数:
+        - resource_root (str): 搜索起始目录。
+        - recursive (bool): 是否递归子目录。
+
+        返回:
+        - Iterator[str]: 路径迭代器。
+        """
+        if not recursive:
+            for item_name in os.listdir(resource_root):
+                if not item_name.startswith("."):
+                    yield os.path.join(resource_root, item_name)
+            return
+        for root, dirs, files in os.walk(resource_root):
+            dirs[:] = [d for d in dirs if not d.startswith(".")]
+            for item_name in dirs + files:
+                if not item_name.startswith("."):
+                    yield os.path.join(root, item_name)
+
+    @classmethod
+    async def get_resources_page_service(
+        cls,
+        search: ResourceSearchQueryParam | None = None,
+        page_no: int = 1,
+        page_size: int = 10,
+        order_by: str | list[dict[str, str]] | None = None,
+        base_url: str | None = None,
+    ) -> dict:
+        """
+        分页搜索资源：索引可用时在数据库中排序分页，否则回退到文件系统扫描后内存分页。
+
+        参数:
+        - search (ResourceSearchQueryParam | None): 查询参数模型。
+        - page_no (int): 页码。
+        - page_size (int): 每页数量。
+        - order_by (str | list[dict[str, str]] | None): 排序，格式 [{'name': 'asc'}]。
+        - base_url (str | None): 基础URL，用于生成完整URL。
+
+        返回:
+        - dict: 分页数据。
+        """
+        if await ResourceIndexer.is_fresh():
+            offset = (page_no - 1) * page_size
+            index_items, total = await cls._search_index(
+                search=search, order_by=order_by, offset=offset, limit=page_size
+            )
+            return {
+                "items": [cls._index_to_file_info(item, base_url) for item in index_items],
+                "total": total,
+                "page_no": page_no,
+                "page_size": page_size,
+                "has_next": offset + page_size < total,
+            }
+
+        result_dict_list = await cls.get_resources_list_service(
+            search=search, order_by=order_by, base_url=base_url
+        )
+        return await PaginationService.paginate(
+            data_list=result_dict_list, page_no=page_no, page_size=page_size
+        )
+
     @classmethod
     async def export_resource_service(cls, data_list: list[dict]) -> bytes:
         """
@@ -413,83 +683,123 @@ class ResourceService:
         """
         stats = {"files": 0, "dirs": 0, "size": 0}
 
-        try:
-            for root, dirs, files in os.walk(path):
-                # 过滤隐藏目录
-                if not include_hidden:
-                    dirs[:] = [d for d in dirs if not d.startswith(".")]
-                    files = [f for f in files if not f.startswith(".")]
-
-                stats["dirs"] += len(dirs)
-                stats["files"] += len(files)
-
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    try:
-                        stats["size"] += os.path.getsize(file_path)
-                    except OSError:
-                        continue
+        # 索引中已缓存了不含隐藏项的递归统计
+        if not include_hidden and await ResourceIndexer.is_fresh():
+            async with async_db_session() as session:
+                crud = ResourceIndexCRUD(AuthSchema(db=session, check_data_scope=False))
+                item = await crud.get_by_path_crud(path=ResourceIndexer.to_relative(path))
+            if item:
+                return {"files": item.total_files, "dirs": item.total_dirs, "size": item.total_size}
 
+        try:
+            return await AsyncFS.run(cls._walk_directory_stats, path, include_hidden)
         except Exception:
-            pass
+            return stats
+
+    @classmethod
+    def _walk_directory_stats(cls, path: str, include_hidden: bool = False) -> dict[str, int]:
+        """
+        遍历目录统计信息（同步，在文件线程池中执行）。
 
+        参数:
+        - path (str): 目录路径。
+        - include_hidden (bool): 是否包含隐藏文件。
+
+        返回:
+        - dict[str, int]: 包含文件数、目录数和总大小的字典。
+        """
+        stats = {"files": 0, "dirs": 0, "size": 0}
+        for root, dirs, files in os.walk(path):
+            # 过滤隐藏目录
+            if not include_hidden:
+                dirs[:] = [d for d in dirs if not d.startswith(".")]
+                files = [f for f in files if not f.startswith(".")]
+
+            stats["dirs"] += len(dirs)
+            stats["files"] += len(files)
+
+            for file in files:
+                file_path = os.path.join(root, file)
+                try:
+                    stats["size"] += os.path.getsize(file_path)
+                except OSError:
+                    continue
         return stats
 
     @classmethod
     def _sort_results(
-        cls, results: list[dict], order_by: str | None = None
-    ) -> list[dict[Any, Any]] | None:
+        cls,
+        results: list[dict],
+        order_by: str | list[dict[str, str]] | None = None,
+        limit: int | None = None,
+    ) -> list[dict[Any, Any]]:
         """
         排序搜索结果
 
+        排序键对每条记录只计算一次（时间转为时间戳、大小转为字节数），
+        只需前 limit 条时使用 heapq.nsmallest，避免对全部结果排序。
+
         参数:
         - results (list[dict]): 资源详情字典列表。
-        - order_by (str | None): 排序参数。
+        - order_by (str | list[dict[str, str]] | None): 排序参数，格式 [{'name': 'asc'}]，默认按名称升序。
+        - limit (int | None): 只返回排序后的前 limit 条，None 表示全部。
 
         返回:
         - list[dict]: 排序后的资源详情字典列表。
+
+        异常:
+        - CustomException: 排序参数格式错误或字段不支持时抛出。
         """
-        try:
-            # 默认按名称升序排序
-            if not order_by:
-                return sorted(results, key=lambda x: x.get("name", ""), reverse=False)
-
-            # 解析order_by参数，格式: [{'field':'asc/desc'}]
-
-            sort_conditions = eval(order_by)
-            if isinstance(sort_conditions, list):
-                # 构建排序键函数
-                def sort_key(item):
-                    keys = []
-                    for cond in sort_conditions:
-                        field = cond.get("field", "name")
-                        cond.get("direction", "asc")
-                        # 获取字段值，默认为空字符串
-                        value = item.get(field, "")
-                        # 如果是日期字段，转换为可比较的格式
-                        if (
-                            field
-                            in [
-                                "created_time",
-                                "modified_time",
-                                "accessed_time",
-                            ]
-                            and value
-                        ):
-                            value = datetime.fromisoformat(value)
-                        keys.append(value)
-                    return keys
-
-                # 确定排序方向（这里只支持单一方向，多个条件时使用第一个条件的方向）
-                reverse = False
-                if sort_conditions and isinstance(sort_conditions[0], dict):
-                    direction = sort_conditions[0].get("direction", "").lower()
-                    reverse = direction == "desc"
-
-                return sorted(results, key=sort_key, reverse=reverse)
+        spec = SortSpec.parse(order_by, allowed=cls.SORT_KEYS) or SortSpec([SortField("name")])
+        # 所有字段方向一致时直接按 reverse 排序；方向混合时对降序字段单独取反
+        reverse = all(item.descending for item in spec)
+        getters = []
+        for item in spec:
+            getter, numeric = cls.SORT_KEYS[item.field]
+            getters.append((getter, item.descending and not reverse, numeric))
+
+        def sort_key(result: dict) -> tuple:
+            keys = []
+            for getter, invert, numeric in getters:
+                value = getter(result)
+                if invert:
+                    value = -value if numeric else _Descending(value)
+                keys.append(value)
+            return tuple(keys)
+
+        if limit is not None and limit < len(results):
+            select_top = heapq.nlargest if reverse else heapq.nsmallest
+            return select_top(limit, results, key=sort_key)
+        return sorted(results, key=sort_key, reverse=reverse)
 
-        except Exception as e:
-            raise CustomException(msg=f"排序参数格式错误: {e!s}")
+    @classmethod
+    def _save_file(cls, safe_dir: str, filename: str, content: bytes) -> str:
+        """
+        保存文件，文件名冲突时自动追加序号（同步，在文件线程池中执行）。
+
+        参数:
+        - safe_dir (str): 目标目录。
+        - filename (str): 文件名。
+        - content (bytes): 文件内容。
+
+        返回:
+        - str: 实际保存的文件路径。
+        """
+        # 创建目录（如果不存在）
+        os.makedirs(safe_dir, exist_ok=True)
+
+        # 生成文件路径
+        file_path = os.path.join(safe_dir, filename)
+
+        # 检查文件是否已存在，存在则生成唯一文件名
+        base_name, ext = os.path.splitext(filename)
+        counter = 1
+        while os.path.exists(file_path):
+            file_path = os.path.join(safe_dir, f"{base_name}_{counter}{ext}")
+            counter += 1
+
+        Path(file_path).write_bytes(content)
+        return file_path
 
     @classmethod
     async def upload_file_service(
@@ -529,34 +839,18 @@ class ResourceService:
                 cls._get_resource_root() if target_path is None else cls._get_safe_path(target_path)
             )
 
-            # 创建目录（如果不存在）
-            os.makedirs(safe_dir, exist_ok=True)
-
-            # 生成文件路径
-            filename = file.filename
-            file_path = os.path.join(safe_dir, filename)
-
-            # 检查文件是否已存在
-            if os.path.exists(file_path):
-                # 生成唯一文件名
-                base_name, ext = os.path.splitext(filename)
-                counter = 1
-                while os.path.exists(file_path):
-                    new_filename = f"{base_name}_{counter}{ext}"
-                    file_path = os.path.join(safe_dir, new_filename)
-                    counter += 1
-                filename = os.path.basename(file_path)
-
             # 保存文件（使用已读取的内容）
-            Path(file_path).write_bytes(content)
+            file_path = await AsyncFS.run(cls._save_file, safe_dir, file.filename, content)
+            filename = os.path.basename(file_path)
 
             # 获取文件信息
-            file_info = cls._get_file_info(file_path, base_url)
+            file_info = await AsyncFS.run(cls._get_file_info, file_path, base_url)
 
             # 生成文件URL
             file_url = cls._generate_http_url(file_path, base_url)
 
             log.info(f"文件上传成功: {filename}")
+            await ResourceIndexer.mark_dirty()
 
             return ResourceUploadSchema(
                 filename=filename,
@@ -584,10 +878,10 @@ class ResourceService:
         try:
             safe_path = cls._get_safe_path(file_path)
 
-            if not os.path.exists(safe_path):
+            if not await AsyncFS.exists(safe_path):
                 raise CustomException(msg="文件不存在")
 
-            if not os.path.isfile(safe_path):
+            if not await AsyncFS.isfile(safe_path):
                 raise CustomException(msg="路径不是文件")
 
             # 返回本地文件路径给 FileResponse 使用
@@ -601,37 +895,70 @@ class ResourceService:
             raise CustomException(msg=f"下载文件失败: {e!s}")
 
     @classmethod
-    async def delete_file_service(cls, paths: list[str]) -> None:
+    def _delete_paths(cls, safe_paths: list[str], progress: FSProgress | None = None) -> None:
+        """
+        依次删除多个路径（同步，在文件线程池中执行）。
+
+        参数:
+        - safe_paths (list[str]): 已校验的文件或目录路径列表。
+        - progress (FSProgress | None): 进度对象。
+
+        返回:
+        - None
+        """
+        for safe_path in safe_paths:
+            if AsyncFS.delete(safe_path, progress=progress):
+                log.info(f"删除成功: {safe_path}")
+
+    @classmethod
+    async def delete_file_service(
+        cls, paths: list[str], background: bool = False
+    ) -> dict[str, Any] | None:
         """
         删除文件或目录
 
         参数:
         - paths (list[str]): 文件或目录路径列表。
+        - background (bool): 是否以后台任务执行。
 
         返回:
-        - None
+        - dict[str, Any] | None: 后台执行时返回任务状态，否则返回None。
         """
         if not paths:
             raise CustomException(msg="删除失败，删除路径不能为空")
 
+        if background:
+            safe_paths = []
+            for path in paths:
+                safe_path = cls._get_safe_path(path)
+                if not await AsyncFS.exists(safe_path):
+                    log.error(f"路径不存在，跳过: {path}")
+                    continue
+                safe_paths.append(safe_path)
+            return await ResourceTaskManager.submit(
+                "delete",
+                cls._delete_paths,
+                safe_paths,
+                source_path=", ".join(paths),
+                measure_paths=safe_paths,
+            )
+
         for path in paths:
             try:
                 safe_path = cls._get_safe_path(path)
 
-                if not os.path.exists(safe_path):
+                if not await AsyncFS.run(AsyncFS.delete, safe_path):
                     log.error(f"路径不存在，跳过: {path}")
                     continue
 
-                if os.path.isfile(safe_path):
-                    os.remove(safe_path)
-                    log.info(f"删除文件成功: {safe_path}")
-                elif os.path.isdir(safe_path):
-                    shutil.rmtree(safe_path)
-                    log.info(f"删除目录成功: {safe_path}")
+                log.info(f"删除成功: {safe_path}")
 
             except Exception as e:
                 log.error(f"删除失败 {path}: {e!s}")
                 raise CustomException(msg=f"删除失败 {path}: {e!s}")
+            finally:
+                await ResourceIndexer.mark_dirty()
+        return None
 
     @classmethod
     async def batch_delete_service(cls, paths: list[str]) -> dict[str, list[str]]:
@@ -654,27 +981,47 @@ class ResourceService:
             try:
                 safe_path = cls._get_safe_path(path)
 
-                if not os.path.exists(safe_path):
-                    failed_paths.append(path)
-                    continue
-
-                if os.path.isfile(safe_path):
-                    os.remove(safe_path)
-                    success_paths.append(path)
-                    log.info(f"删除文件成功: {safe_path}")
-                elif os.path.isdir(safe_path):
-                    shutil.rmtree(safe_path)
+                if await AsyncFS.run(AsyncFS.delete, safe_path):
                     success_paths.append(path)
-                    log.info(f"删除目录成功: {safe_path}")
+                    log.info(f"删除成功: {safe_path}")
+                else:
+                    failed_paths.append(path)
 
             except Exception as e:
                 log.error(f"删除失败 {path}: {e!s}")
                 failed_paths.append(path)
 
+        if success_paths:
+            await ResourceIndexer.mark_dirty()
         return {"success": success_paths, "failed": failed_paths}
 
     @classmethod
-    async def move_file_service(cls, data: ResourceMoveSchema) -> None:
+    async def _check_transfer(
+        cls, data: ResourceMoveSchema | ResourceCopySchema
+    ) -> tuple[str, str]:
+        """
+        校验移动/复制的源路径与目标路径。
+
+        参数:
+        - data (ResourceMoveSchema | ResourceCopySchema): 包含源路径和目标路径的模型。
+
+        返回:
+        - tuple[str, str]: (源路径, 目标路径)。
+        """
+        source_path = cls._get_safe_path(data.source_path)
+        target_path = cls._get_safe_path(data.target_path)
+
+        if not await AsyncFS.exists(source_path):
+            raise CustomException(msg="源路径不存在")
+
+        # 检查目标路径是否已存在
+        if not data.overwrite and await AsyncFS.exists(target_path):
+            raise CustomException(msg="目标路径已存在")
+
+        return source_path, target_path
+
+    @classmethod
+    async def move_file_service(cls, data: ResourceMoveSchema) -> dict[str, Any] | None:
         """
         移动文件或目录
 
@@ -682,32 +1029,28 @@ class ResourceService:
         - data (ResourceMoveSchema): 包含源路径和目标路径的模型。
 
         返回:
-        - None
+        - dict[str, Any] | None: 后台执行时返回任务状态，否则返回None。
         """
         try:
-            source_path = cls._get_safe_path(data.source_path)
-            target_path = cls._get_safe_path(data.target_path)
-
-            if not os.path.exists(source_path):
-                raise CustomException(msg="源路径不存在")
-
-            # 检查目标路径是否已存在
-            if os.path.exists(target_path):
-                if not data.overwrite:
-                    raise CustomException(msg="目标路径已存在")
-                # 删除目标路径
-                if os.path.isfile(target_path):
-                    os.remove(target_path)
-                else:
-                    shutil.rmtree(target_path)
-
-            # 确保目标目录存在
-            target_dir = os.path.dirname(target_path)
-            os.makedirs(target_dir, exist_ok=True)
+            source_path, target_path = await cls._check_transfer(data)
+
+            if data.background:
+                return await ResourceTaskManager.submit(
+                    "move",
+                    AsyncFS.move,
+                    source_path,
+                    target_path,
+                    data.overwrite,
+                    source_path=data.source_path,
+                    target_path=data.target_path,
+                    measure_paths=[source_path],
+                )
 
-            # 移动文件
-            shutil.move(source_path, target_path)
+            # 目标已存在且允许覆盖时先删除目标再移动
+            await AsyncFS.run(AsyncFS.move, source_path, target_path, data.overwrite)
             log.info(f"移动成功: {source_path} -> {target_path}")
+            await ResourceIndexer.mark_dirty()
+            return None
 
         except CustomException:
             raise
@@ -716,7 +1059,7 @@ class ResourceService:
             raise CustomException(msg=f"移动失败: {e!s}")
 
     @classmethod
-    async def copy_file_service(cls, data: ResourceCopySchema) -> None:
+    async def copy_file_service(cls, data: ResourceCopySchema) -> dict[str, Any] | None:
         """
         复制文件或目录
 
@@ -724,30 +1067,28 @@ class ResourceService:
         - data (ResourceCopySchema): 包含源路径和目标路径的模型。
 
         返回:
-        - None
+        - dict[str, Any] | None: 后台执行时返回任务状态，否则返回None。
         """
         try:
-            source_path = cls._get_safe_path(data.source_path)
-            target_path = cls._get_safe_path(data.target_path)
-
-            if not os.path.exists(source_path):
-                raise CustomException(msg="源路径不存在")
-
-            # 检查目标路径是否已存在
-            if os.path.exists(target_path) and not data.overwrite:
-                raise CustomException(msg="目标路径已存在")
-
-            # 确保目标目录存在
-            target_dir = os.path.dirname(target_path)
-            os.makedirs(target_dir, exist_ok=True)
+            source_path, target_path = await cls._check_transfer(data)
+
+            if data.background:
+                return await ResourceTaskManager.submit(
+                    "copy",
+                    AsyncFS.copy,
+                    source_path,
+                    target_path,
+                    data.overwrite,
+                    source_path=data.source_path,
+                    target_path=data.target_path,
+                    measure_paths=[source_path],
+                )
 
             # 复制文件或目录
-            if os.path.isfile(source_path):
-                shutil.copy2(source_path, target_path)
-            else:
-                shutil.copytree(source_path, target_path, dirs_exist_ok=data.overwrite)
-
+            await AsyncFS.run(AsyncFS.copy, source_path, target_path, data.overwrite)
             log.info(f"复制成功: {source_path} -> {target_path}")
+            await ResourceIndexer.mark_dirty()
+            return None
 
         except CustomException:
             raise
@@ -755,6 +1096,34 @@ class ResourceService:
             log.error(f"复制失败: {e!s}")
             raise CustomException(msg=f"复制失败: {e!s}")
 
+    @classmethod
+    async def get_task_service(cls, task_id: str) -> dict[str, Any]:
+        """
+        查询资源后台任务进度
+
+        参数:
+        - task_id (str): 任务ID。
+
+        返回:
+        - dict[str, Any]: 任务状态字典。
+        """
+        state = await ResourceTaskManager.get(task_id)
+        return ResourceTaskSchema(**state).model_dump(mode="json")
+
+    @classmethod
+    async def cancel_task_service(cls, task_id: str) -> dict[str, Any]:
+        """
+        取消资源后台任务
+
+        参数:
+        - task_id (str): 任务ID。
+
+        返回:
+        - dict[str, Any]: 任务状态字典。
+        """
+        state = await ResourceTaskManager.cancel(task_id)
+        return ResourceTaskSchema(**state).model_dump(mode="json")
+
     @classmethod
     async def rename_file_service(cls, data: ResourceRenameSchema) -> None:
         """
@@ -769,19 +1138,20 @@ class ResourceService:
         try:
             old_path = cls._get_safe_path(data.old_path)
 
-            if not os.path.exists(old_path):
+            if not await AsyncFS.exists(old_path):
                 raise CustomException(msg="文件或目录不存在")
 
             # 生成新路径
             parent_dir = os.path.dirname(old_path)
             new_path = os.path.join(parent_dir, data.new_name)
 
-            if os.path.exists(new_path):
+            if await AsyncFS.exists(new_path):
                 raise CustomException(msg="目标名称已存在")
 
             # 重命名
-            os.rename(old_path, new_path)
+            await AsyncFS.run(os.rename, old_path, new_path)
             log.info(f"重命名成功: {old_path} -> {new_path}")
+            await ResourceIndexer.mark_dirty()
 
         except CustomException:
             raise
@@ -803,10 +1173,10 @@ class ResourceService:
         try:
             parent_path = cls._get_safe_path(data.parent_path)
 
-            if not os.path.exists(parent_path):
+            if not await AsyncFS.exists(parent_path):
                 raise CustomException(msg="父目录不存在")
 
-            if not os.path.isdir(parent_path):
+            if not await AsyncFS.isdir(parent_path):
                 raise CustomException(msg="父路径不是目录")
 
             # 生成新目录路径
@@ -816,12 +1186,13 @@ class ResourceService:
             if ".." in data.dir_name or "/" in data.dir_name or "\\" in data.dir_name:
                 raise CustomException(msg="目录名称包含不安全字符")
 
-            if os.path.exists(new_dir_path):
+            if await AsyncFS.exists(new_dir_path):
                 raise CustomException(msg="目录已存在")
 
             # 创建目录
-            os.makedirs(new_dir_path)
+            await AsyncFS.run(os.makedirs, new_dir_path)
             log.info(f"创建目录成功: {new_dir_path}")
+            await ResourceIndexer.mark_dirty()
 
         except CustomException:
             raise
@@ -0,0 +1,297 @@
+import asyncio
+import functools
+import os
+import shutil
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from app.config.setting import settings
+
+T = TypeVar("T")
+
+
+class FSCancelledError(Exception):
+    """文件操作被取消"""
+
+
+class FSProgress:
+    """
+    文件操作进度（在工作线程中写入，在事件循环中读取）
+
+    计数字段只由执行操作的单个线程递增，读取方容忍瞬时不一致，因此不加锁；
+    取消通过 threading.Event 通知，工作线程在处理每个文件前检查。
+    """
+
+    def __init__(self) -> None:
+        self.total_files = 0
+        self.total_bytes = 0
+        self.done_files = 0
+        self.done_bytes = 0
+        self.current: str | None = None
+        self._cancel = threading.Event()
+
+    @property
+    def percent(self) -> float:
+        """
+        完成百分比（有字节数时按字节计算，否则按文件数计算）。
+
+        返回:
+        - float: 0~100 的百分比。
+        """
+        if self.total_bytes:
+            return round(min(self.done_bytes / self.total_bytes, 1) * 100, 2)
+        if self.total_files:
+            return round(min(self.done_files / self.total_files, 1) * 100, 2)
+        return 0.0
+
+    @property
+    def cancelled(self) -> bool:
+        """是否已请求取消"""
+        return self._cancel.is_set()
+
+    def cancel(self) -> None:
+        """请求取消操作"""
+        self._cancel.set()
+
+    def check(self, path: str) -> None:
+        """
+        处理一个条目前调用：记录当前路径，已请求取消时抛出异常。
+
+        参数:
+        - path (str): 即将处理的路径。
+
+        异常:
+        - FSCancelledError: 操作已被取消。
+        """
+        if self._cancel.is_set():
+            raise FSCancelledError(path)
+        self.current = path
+
+    def advance(self, size: int = 0) -> None:
+        """
+        标记一个文件处理完成。
+
+        参数:
+        - size (int): 该文件的字节数。
+        """
+        self.done_files += 1
+        self.done_bytes += size
+
+
+class AsyncFS:
+    """
+    静态资源异步文件系统层
+
+    所有阻塞的文件系统调用都提交到有界线程池执行，避免大目录复制/删除等操作阻塞事件循环；
+    线程池大小由 RESOURCE_FS_WORKERS 控制，超出的操作排队等待。
+    copy/move/delete 支持传入 FSProgress 以汇报进度并响应取消。
+    """
+
+    _executor: ThreadPoolExecutor | None = None
+
+    @classmethod
+    def executor(cls) -> ThreadPoolExecutor:
+        """
+        获取（必要时创建）文件操作线程池。
+
+        返回:
+        - ThreadPoolExecutor: 线程池。
+        """
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(
+                max_workers=settings.RESOURCE_FS_WORKERS, thread_name_prefix="resource-fs"
+            )
+        return cls._executor
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """
+        关闭线程池，丢弃尚未开始的操作。
+
+        返回:
+        - None
+        """
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=False, cancel_futures=True)
+            cls._executor = None
+
+    @classmethod
+    async def run(cls, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        在文件操作线程池中执行阻塞函数。
+
+        参数:
+        - func (Callable[..., T]): 阻塞函数。
+        - *args (Any): 位置参数。
+        - **kwargs (Any): 关键字参数。
+
+        返回:
+        - T: 函数返回值。
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(cls.executor(), functools.partial(func, *args, **kwargs))
+
+    @classmethod
+    async def exists(cls, path: str) -> bool:
+        """路径是否存在"""
+        return await cls.run(os.path.exists, path)
+
+    @classmethod
+    async def isdir(cls, path: str) -> bool:
+        """路径是否为目录"""
+        return await cls.run(os.path.isdir, path)
+
+    @classmethod
+    async def isfile(cls, path: str) -> bool:
+        """路径是否为文件"""
+        return await cls.run(os.path.isfile, path)
+
+    @staticmethod
+    def measure(path: str) -> tuple[int, int]:
+        """
+        统计路径下的文件数和总字节数（同步）。
+
+        参数:
+        - path (str): 文件或目录路径。
+
+        返回:
+        - tuple[int, int]: (文件数, 总字节数)。
+        """
+        if not os.path.isdir(path) or os.path.islink(path):
+            return 1, os.lstat(path).st_size
+        files = 0
+        size = 0
+        for root, _, names in os.walk(path):
+            for name in names:
+                try:
+                    size += os.lstat(os.path.join(root, name)).st_size
+                except OSError:
+                    continue
+                files += 1
+        return files, size
+
+    @classmethod
+    def delete(cls, path: str, progress: FSProgress | None = None) -> bool:
+        """
+        删除文件或目录（同步）。
+
+        参数:
+        - path (str): 文件或目录路径。
+        - progress (FSProgress | None): 进度对象，传入时逐个文件删除并响应取消。
+
+        返回:
+        - bool: 路径不存在时返回 False。
+
+        异常:
+        - FSCancelledError: 操作已被取消（已删除的部分不会恢复）。
+        """
+        if not os.path.lexists(path):
+            return False
+        if not os.path.isdir(path) or os.path.islink(path):
+            size = os.lstat(path).st_size
+            if progress:
+                progress.check(path)
+            os.remove(path)
+            if progress:
+                progress.advance(size)
+            return True
+        if progress is None:
+            shutil.rmtree(path)
+            return True
+
+        for root, dirs, names in os.walk(path, topdown=False):
+            for name in names:
+                file_path = os.path.join(root, name)
+                progress.check(file_path)
+                size = os.lstat(file_path).st_size
+                os.remove(file_path)
+                progress.advance(size)
+            for name in dirs:
+                dir_path = os.path.join(root, name)
+                if os.path.islink(dir_path):
+                    os.remove(dir_path)
+                else:
+                    os.rmdir(dir_path)
+        os.rmdir(path)
+        return True
+
+    @classmethod
+    def copy(
+        cls, source: str, target: str, overwrite: bool = False, progress: FSProgress | None = None
+    ) -> None:
+        """
+        复制文件或目录（同步）。目录复制时与已存在的目标目录合并。
+
+        参数:
+        - source (str): 源路径。
+        - target (str): 目标路径。
+        - overwrite (bool): 是否覆盖已存在的目标。
+        - progress (FSProgress | None): 进度对象，传入时逐个文件复制并响应取消。
+
+        返回:
+        - None
+
+        异常:
+        - FSCancelledError: 操作已被取消，此前不存在的目标会被清理。
+        """
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        if os.path.isfile(source):
+            if progress:
+                progress.check(source)
+            shutil.copy2(source, target)
+            if progress:
+                progress.advance(os.path.getsize(target))
+            return
+        if progress is None:
+            shutil.copytree(source, target, dirs_exist_ok=overwrite)
+            return
+
+        created = not os.path.exists(target)
+        try:
+            for root, _dirs, names in os.walk(source):
+                target_root = os.path.join(target, os.path.relpath(root, source))
+                os.makedirs(target_root, exist_ok=overwrite or root != source)
+                for name in names:
+                    source_file = os.path.join(root, name)
+                    progress.check(source_file)
+                    shutil.copy2(source_file, os.path.join(target_root, name))
+                    progress.advance(os.lstat(source_file).st_size)
+        except FSCancelledError:
+            if created:
+                shutil.rmtree(target, ignore_errors=True)
+            raise
+
+    @classmethod
+    def move(
+        cls, source: str, target: str, overwrite: bool = False, progress: FSProgress | None = None
+    ) -> None:
+        """
+        移动文件或目录（同步）。同一文件系统内直接重命名，跨文件系统时复制后删除源。
+
+        参数:
+        - source (str): 源路径。
+        - target (str): 目标路径。
+        - overwrite (bool): 是否覆盖已存在的目标。
+        - progress (FSProgress | None): 进度对象。
+
+        返回:
+        - None
+
+        异常:
+        - FSCancelledError: 操作在复制阶段被取消，源保持不变。
+        """
+        if overwrite:
+            cls.delete(target)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        try:
+            os.rename(source, target)
+        except OSError:
+            # 跨文件系统：复制完成后再删除源，取消只会发生在复制阶段
+            cls.copy(source, target, overwrite=False, progress=progress)
+            cls.delete(source)
+            return
+        if progress:
+            progress.done_files = progress.total_files
+            progress.done_bytes = progress.total_bytes
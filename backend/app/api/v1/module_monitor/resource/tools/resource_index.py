@@ -0,0 +1,346 @@
+import asyncio
+import os
+import time
+
+from fastapi import FastAPI
+from redis.asyncio.client import Redis
+
+from app.api.v1.module_system.auth.schema import AuthSchema
+from app.common.enums import RedisInitKeyConfig
+from app.config.setting import settings
+from app.core.database import async_db_session
+from app.core.logger import log
+from app.core.redis_crud import RedisCURD
+
+from ..crud import ResourceIndexCRUD
+from .async_fs import AsyncFS
+
+
+class ResourceIndexer:
+    """
+    静态资源元数据索引维护
+
+    - 后台任务周期性地 scandir 全量扫描并与索引做差异比较，只写入新增/变更/删除的记录；
+    - 资源管理的写操作调用 mark_dirty()，递增 Redis 中的版本号并唤醒刷新；
+    - 读取方通过 is_fresh() 判断索引版本是否已追上写入版本，未追上时回退到文件系统。
+    多进程部署时通过 Redis 锁保证同一时刻只有一个实例在刷新。
+    """
+
+    # 写操作后的防抖等待(秒)，合并连续写入触发的刷新
+    DEBOUNCE_SECONDS = 0.5
+    # 其他实例持有刷新锁时的重试间隔(秒)
+    RETRY_SECONDS = 2
+    # 刷新锁过期时间(秒)
+    LOCK_EXPIRE = 300
+    # 路径列长度限制
+    MAX_PATH_LENGTH = 512
+
+    redis_instance: Redis | None = None
+    _task: asyncio.Task | None = None
+    _wakeup: asyncio.Event | None = None
+
+    @classmethod
+    def _key(cls, name: str) -> str:
+        """
+        生成索引相关的 Redis 键名。
+
+        参数:
+        - name (str): 键名后缀。
+
+        返回:
+        - str: 完整键名。
+        """
+        return f"{RedisInitKeyConfig.RESOURCE_INDEX.key}:{name}"
+
+    @classmethod
+    def to_relative(cls, abs_path: str) -> str:
+        """
+        将绝对路径转换为索引使用的相对 POSIX 路径（根目录为空字符串）。
+
+        参数:
+        - abs_path (str): 绝对路径。
+
+        返回:
+        - str: 相对路径。
+        """
+        rel = os.path.relpath(abs_path, str(settings.STATIC_ROOT)).replace(os.sep, "/")
+        return "" if rel == "." else rel
+
+    @classmethod
+    def scan_tree(cls, root: str) -> dict[str, dict]:
+        """
+        迭代式 scandir 扫描整个目录树（每个条目仅一次 stat），并汇总各目录的递归统计。
+
+        参数:
+        - root (str): 扫描根目录。
+
+        返回:
+        - dict[str, dict]: {相对路径: 索引记录字典}。
+        """
+        root_stat = os.stat(root)
+        entries: dict[str, dict] = {
+            "": {
+                "path": "",
+                "parent": None,
+                "name": os.path.basename(root.rstrip(os.sep)),
+                "ext": "",
+                "is_dir": True,
+                "is_hidden": False,
+                "size": 0,
+                "mtime": root_stat.st_mtime,
+                "ctime": root_stat.st_ctime,
+            }
+        }
+        stack: list[tuple[str, str, bool]] = [("", root, False)]
+        while stack:
+            rel_dir, abs_dir, hidden = stack.pop()
+            try:
+                iterator = os.scandir(abs_dir)
+            except OSError as e:
+                log.warning(f"扫描目录失败，跳过: {abs_dir}: {e!s}")
+                continue
+            with iterator:
+                for entry in iterator:
+                    rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                    if len(rel) > cls.MAX_PATH_LENGTH:
+                        log.warning(f"路径过长，未加入索引: {rel}")
+                        continue
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                        stat = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    entry_hidden = hidden or entry.name.startswith(".")
+                    entries[rel] = {
+                        "path": rel,
+                        "parent": rel_dir,
+                        "name": entry.name,
+                        "ext": "" if is_dir else os.path.splitext(entry.name)[1][1:].lower()[:32],
+                        "is_dir": is_dir,
+                        "is_hidden": entry_hidden,
+                        "size": 0 if is_dir else stat.st_size,
+                        "mtime": stat.st_mtime,
+                        "ctime": stat.st_ctime,
+                    }
+                    if is_dir:
+                        stack.append((rel, entry.path, entry_hidden))
+
+        cls._compute_totals(entries)
+        return entries
+
+    @staticmethod
+    def _compute_totals(entries: dict[str, dict]) -> None:
+        """
+        汇总目录的递归文件数、目录数和总大小（不含隐藏项）。
+
+        先累加直接子项，再按深度从深到浅把子目录的统计并入父目录，整体 O(n log n)。
+
+        参数:
+        - entries (dict[str, dict]): 扫描结果，原地写入 total_* 字段。
+
+        返回:
+        - None
+        """
+        for item in entries.values():
+            item["total_files"] = 0
+            item["total_dirs"] = 0
+            item["total_size"] = 0
+
+        for path, item in entries.items():
+            if not path or item["is_hidden"]:
+                continue
+            parent = entries[item["parent"]]
+            if item["is_dir"]:
+                parent["total_dirs"] += 1
+            else:
+                parent["total_files"] += 1
+                parent["total_size"] += item["size"]
+
+        dirs = [item for path, item in entries.items() if path and item["is_dir"]]
+        dirs.sort(key=lambda item: item["path"].count("/"), reverse=True)
+        for item in dirs:
+            if item["is_hidden"]:
+                continue
+            parent = entries[item["parent"]]
+            parent["total_files"] += item["total_files"]
+            parent["total_dirs"] += item["total_dirs"]
+            parent["total_size"] += item["total_size"]
+
+    @classmethod
+    async def is_fresh(cls) -> bool:
+        """
+        判断索引是否可用：已完成过刷新，且已追上最近一次写操作的版本。
+
+        返回:
+        - bool: 索引可用返回 True，否则调用方应回退到文件系统。
+        """
+        if not settings.RESOURCE_INDEX_ENABLE or cls.redis_instance is None:
+            return False
+        data = await RedisCURD(cls.redis_instance).mget([cls._key("gen"), cls._key("indexed")])
+        if len(data) != 2 or data[1] is None:
+            return False
+        return int(data[1]) >= int(data[0] or 0)
+
+    @classmethod
+    async def mark_dirty(cls) -> None:
+        """
+        资源发生写操作后调用：递增写入版本并唤醒后台刷新。
+
+        返回:
+        - None
+        """
+        if cls.redis_instance is not None:
+            try:
+                await cls.redis_instance.incr(cls._key("gen"))
+            except Exception as e:
+                log.error(f"更新资源索引版本失败: {e!s}")
+        if cls._wakeup is not None:
+            cls._wakeup.set()
+
+    @classmethod
+    async def refresh(cls, force: bool = False) -> dict[str, int] | None:
+        """
+        扫描磁盘并将差异写入索引。
+
+        参数:
+        - force (bool): 为 False 时，若索引已是最新且距上次刷新不足一个周期则跳过。
+
+        返回:
+        - dict[str, int] | None: 新增/更新/删除数量；未执行(被跳过或其他实例持锁)时返回 None。
+        """
+        if cls.redis_instance is None:
+            return None
+        redis_client = RedisCURD(cls.redis_instance)
+
+        if not force and await cls.is_fresh():
+            last = await redis_client.get(cls._key("refreshed_at"))
+            if last and time.time() - float(last) < settings.RESOURCE_INDEX_INTERVAL:
+                return None
+
+        lock_key = cls._key("lock")
+        lock_acquired, lock_value = await redis_client.lock(lock_key, cls.LOCK_EXPIRE)
+        if not lock_acquired:
+            return None
+        try:
+            # 先记下扫描前的写入版本，扫描期间发生的写操作会在下一轮被追上
+            gen = await redis_client.get(cls._key("gen")) or 0
+            started = time.perf_counter()
+            entries = await AsyncFS.run(cls.scan_tree, str(settings.STATIC_ROOT))
+
+            async with async_db_session() as session:
+                async with session.begin():
+                    crud = ResourceIndexCRUD(AuthSchema(db=session, check_data_scope=False))
+                    snapshot = await crud.get_snapshot_crud()
+                    inserts: list[dict] = []
+                    updates: list[dict] = []
+                    for path, item in entries.items():
+                        old = snapshot.pop(path, None)
+                        if old is None:
+                            inserts.append(item)
+                        elif old[1:] != (
+                            item["size"],
+                            item["mtime"],
+                            item["total_files"],
+                            item["total_dirs"],
+                            item["total_size"],
+                        ):
+                            updates.append({"id": old[0], **item})
+                    removed = [old[0] for old in snapshot.values()]
+
+                    await crud.bulk_delete_crud(ids=removed)
+                    await crud.bulk_insert_crud(rows=inserts)
+                    await crud.bulk_update_crud(rows=updates)
+
+            await redis_client.set(cls._key("indexed"), int(gen))
+            await redis_client.set(cls._key("refreshed_at"), time.time())
+            stats = {"added": len(inserts), "updated": len(updates), "removed": len(removed)}
+            if any(stats.values()):
+                log.info(
+                    f"资源索引已刷新({time.perf_counter() - started:.2f}s, "
+                    f"共 {len(entries)} 项): {stats}"
+                )
+            return stats
+        finally:
+            await redis_client.unlock(lock_key, lock_value)
+
+    @classmethod
+    async def _run(cls) -> None:
+        """
+        后台刷新循环：周期刷新，或在写操作唤醒后防抖刷新。
+
+        返回:
+        - None
+        """
+        assert cls._wakeup is not None
+        force = True
+        while True:
+            timeout: float = settings.RESOURCE_INDEX_INTERVAL
+            try:
+                result = await cls.refresh(force=force)
+                if result is None and not await cls.is_fresh():
+                    # 其他实例正在刷新，稍后再确认是否已追上
+                    timeout = cls.RETRY_SECONDS
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.error(f"刷新资源索引失败: {e!s}")
+
+            force = False
+            try:
+                await asyncio.wait_for(cls._wakeup.wait(), timeout=timeout)
+                await asyncio.sleep(cls.DEBOUNCE_SECONDS)
+            except asyncio.TimeoutError:
+                # 周期到期：强制做一次差异扫描，捕获接口之外的文件变更
+                force = True
+            cls._wakeup.clear()
+
+    @classmethod
+    def start(cls, redis: Redis) -> None:
+        """
+        启动后台索引维护任务。
+
+        参数:
+        - redis (Redis): Redis 连接。
+
+        返回:
+        - None
+        """
+        cls.redis_instance = redis
+        cls._wakeup = asyncio.Event()
+        if cls._task is None or cls._task.done():
+            cls._task = asyncio.create_task(cls._run(), name="resource-index")
+
+    @classmethod
+    async def stop(cls) -> None:
+        """
+        停止后台索引维护任务。
+
+        返回:
+        - None
+        """
+        if cls._task and not cls._task.done():
+            cls._task.cancel()
+            try:
+                await cls._task
+            except asyncio.CancelledError:
+                pass
+        cls._task = None
+
+
+async def resource_index_event(app: FastAPI, status: bool) -> None:
+    """
+    全局事件：启动或停止静态资源索引维护。
+
+    参数:
+    - app (FastAPI): FastAPI应用实例。
+    - status (bool): True 为启动，False 为停止。
+
+    返回:
+    - None
+    """
+    if status:
+        ResourceIndexer.start(redis=app.state.redis)
+        log.info("✅️ 静态资源索引维护已启动")
+    else:
+        await ResourceIndexer.stop()
+        log.info("✅️ 静态资源索引维护已停止")
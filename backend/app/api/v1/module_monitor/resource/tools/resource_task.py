@@ -0,0 +1,332 @@
+import asyncio
+import json
+import time
+import uuid
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+from fastapi import FastAPI
+from redis.asyncio.client import Redis
+
+from app.common.enums import RedisInitKeyConfig
+from app.core.exceptions import CustomException
+from app.core.logger import log
+from app.core.redis_crud import RedisCURD
+
+from .async_fs import AsyncFS, FSCancelledError, FSProgress
+from .resource_index import ResourceIndexer
+
+
+class ResourceTask:
+    """资源后台任务状态"""
+
+    def __init__(self, action: str, source_path: str | None, target_path: str | None) -> None:
+        self.task_id = uuid.uuid4().hex
+        self.action = action
+        self.source_path = source_path
+        self.target_path = target_path
+        self.status = "pending"
+        self.error: str | None = None
+        self.progress = FSProgress()
+        self.created_time = datetime.now()
+        self.finished_time: datetime | None = None
+        self.finished_at: float | None = None
+        self.runner: asyncio.Task | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        转换为对外展示的字典。
+
+        返回:
+        - dict[str, Any]: 任务状态字典。
+        """
+        return {
+            "task_id": self.task_id,
+            "action": self.action,
+            "source_path": self.source_path,
+            "target_path": self.target_path,
+            "status": self.status,
+            "total_files": self.progress.total_files,
+            "done_files": self.progress.done_files,
+            "total_bytes": self.progress.total_bytes,
+            "done_bytes": self.progress.done_bytes,
+            "percent": 100.0 if self.status == "success" else self.progress.percent,
+            "current": self.progress.current,
+            "error": self.error,
+            "created_time": self.created_time,
+            "finished_time": self.finished_time,
+        }
+
+
+class ResourceTaskManager:
+    """
+    资源后台任务管理
+
+    大目录的复制/移动/删除以后台任务执行，立即返回任务ID，调用方通过任务ID查询进度或取消。
+    - 任务在提交它的进程中执行，进度每 SYNC_SECONDS 秒同步到 Redis，结束后保留 FINISHED_TTL 秒；
+    - 多 worker 部署时查询请求可能落到其他进程：本进程没有该任务时从 Redis 读取，
+      取消则写入取消标记，由执行任务的进程在下次同步时发现并停止；
+    - 未启用 Redis 时任务状态只在当前进程内存中，需以单 worker 方式运行。
+    """
+
+    # 已结束任务的保留时间(秒)
+    FINISHED_TTL = 3600
+    # 进度同步到 Redis 与检查取消标记的间隔(秒)
+    SYNC_SECONDS = 1.0
+
+    redis_instance: Redis | None = None
+    _tasks: dict[str, ResourceTask] = {}
+
+    @classmethod
+    def _key(cls, task_id: str, name: str = "state") -> str:
+        """
+        生成任务相关的 Redis 键名。
+
+        参数:
+        - task_id (str): 任务ID。
+        - name (str): 键名后缀（state: 任务状态，cancel: 取消标记）。
+
+        返回:
+        - str: 完整键名。
+        """
+        return f"{RedisInitKeyConfig.RESOURCE_TASK.key}:{task_id}:{name}"
+
+    @classmethod
+    async def _publish(cls, task: ResourceTask) -> None:
+        """
+        把任务状态写入 Redis，供其他进程查询（未启用 Redis 时跳过）。
+
+        参数:
+        - task (ResourceTask): 任务状态。
+
+        返回:
+        - None
+        """
+        if cls.redis_instance is None:
+            return
+        await RedisCURD(cls.redis_instance).set(
+            key=cls._key(task.task_id),
+            value=json.dumps(task.to_dict(), ensure_ascii=False, default=str),
+            expire=cls.FINISHED_TTL,
+        )
+
+    @classmethod
+    async def _sync(cls, task: ResourceTask) -> None:
+        """
+        任务执行期间周期性同步进度，并检查其他进程写入的取消标记。
+
+        参数:
+        - task (ResourceTask): 任务状态。
+
+        返回:
+        - None
+        """
+        while True:
+            await cls._publish(task)
+            if cls.redis_instance is not None and await RedisCURD(cls.redis_instance).exists(
+                cls._key(task.task_id, "cancel")
+            ):
+                task.progress.cancel()
+            await asyncio.sleep(cls.SYNC_SECONDS)
+
+    @classmethod
+    async def submit(
+        cls,
+        action: str,
+        func: Callable[..., Any],
+        *args: Any,
+        source_path: str | None = None,
+        target_path: str | None = None,
+        measure_paths: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """
+        提交后台任务。
+
+        参数:
+        - action (str): 操作类型，如 copy/move/delete。
+        - func (Callable[..., Any]): 在文件线程池中执行的同步函数，需接受 progress 关键字参数。
+        - *args (Any): 函数位置参数。
+        - source_path (str | None): 源路径（展示用）。
+        - target_path (str | None): 目标路径（展示用）。
+        - measure_paths (list[str] | None): 执行前统计总量的路径，用于计算进度。
+
+        返回:
+        - dict[str, Any]: 任务状态字典。
+        """
+        cls._prune()
+        task = ResourceTask(action=action, source_path=source_path, target_path=target_path)
+        cls._tasks[task.task_id] = task
+        await cls._publish(task)
+        task.runner = asyncio.create_task(
+            cls._execute(task, func, args, measure_paths or []),
+            name=f"resource-task-{task.task_id}",
+        )
+        log.info(f"已提交资源后台任务 {task.task_id}: {action} {source_path or ''}")
+        return task.to_dict()
+
+    @classmethod
+    async def _execute(
+        cls,
+        task: ResourceTask,
+        func: Callable[..., Any],
+        args: tuple[Any, ...],
+        measure_paths: list[str],
+    ) -> None:
+        """
+        执行后台任务并记录结果。
+
+        参数:
+        - task (ResourceTask): 任务状态。
+        - func (Callable[..., Any]): 同步执行函数。
+        - args (tuple[Any, ...]): 函数位置参数。
+        - measure_paths (list[str]): 执行前统计总量的路径。
+
+        返回:
+        - None
+        """
+        task.status = "running"
+        syncer = asyncio.create_task(cls._sync(task), name=f"resource-task-sync-{task.task_id}")
+        try:
+            for path in measure_paths:
+                files, size = await AsyncFS.run(AsyncFS.measure, path)
+                task.progress.total_files += files
+                task.progress.total_bytes += size
+            await AsyncFS.run(func, *args, progress=task.progress)
+            task.status = "success"
+        except FSCancelledError:
+            task.status = "cancelled"
+        except Exception as e:
+            task.status = "failed"
+            task.error = str(e)
+            log.error(f"资源后台任务失败 {task.task_id}: {e!s}")
+        finally:
+            task.finished_time = datetime.now()
+            task.finished_at = time.monotonic()
+            syncer.cancel()
+            await asyncio.gather(syncer, return_exceptions=True)
+            await cls._publish(task)
+            await ResourceIndexer.mark_dirty()
+        log.info(f"资源后台任务结束 {task.task_id}: {task.status}")
+
+    @classmethod
+    def _prune(cls) -> None:
+        """
+        清理超过保留时间的已结束任务。
+
+        返回:
+        - None
+        """
+        deadline = time.monotonic() - cls.FINISHED_TTL
+        expired = [
+            task_id
+            for task_id, task in cls._tasks.items()
+            if task.finished_at is not None and task.finished_at < deadline
+        ]
+        for task_id in expired:
+            cls._tasks.pop(task_id, None)
+
+    @classmethod
+    async def _load(cls, task_id: str) -> dict[str, Any] | None:
+        """
+        读取其他进程同步到 Redis 的任务状态。
+
+        参数:
+        - task_id (str): 任务ID。
+
+        返回:
+        - dict[str, Any] | None: 任务状态字典，不存在时返回 None。
+        """
+        if cls.redis_instance is None:
+            return None
+        value = await RedisCURD(cls.redis_instance).get(cls._key(task_id))
+        return json.loads(value) if value else None
+
+    @classmethod
+    async def get(cls, task_id: str) -> dict[str, Any]:
+        """
+        查询任务状态。
+
+        参数:
+        - task_id (str): 任务ID。
+
+        返回:
+        - dict[str, Any]: 任务状态字典。
+
+        异常:
+        - CustomException: 任务不存在或已过期。
+        """
+        task = cls._tasks.get(task_id)
+        if task:
+            return task.to_dict()
+        state = await cls._load(task_id)
+        if not state:
+            raise CustomException(msg="任务不存在或已过期")
+        return state
+
+    @classmethod
+    async def cancel(cls, task_id: str) -> dict[str, Any]:
+        """
+        取消任务。工作线程会在处理下一个文件前停止；任务在其他进程时写入取消标记，
+        由执行进程在 SYNC_SECONDS 秒内发现。
+
+        参数:
+        - task_id (str): 任务ID。
+
+        返回:
+        - dict[str, Any]: 任务状态字典。
+
+        异常:
+        - CustomException: 任务不存在或已结束。
+        """
+        task = cls._tasks.get(task_id)
+        if task:
+            if task.finished_at is not None:
+                raise CustomException(msg="任务已结束，无法取消")
+            task.progress.cancel()
+            return task.to_dict()
+
+        state = await cls._load(task_id)
+        if not state or cls.redis_instance is None:
+            raise CustomException(msg="任务不存在或已过期")
+        if state.get("finished_time"):
+            raise CustomException(msg="任务已结束，无法取消")
+        await RedisCURD(cls.redis_instance).set(
+            key=cls._key(task_id, "cancel"), value=1, expire=cls.FINISHED_TTL
+        )
+        return state
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """
+        取消所有未结束任务，等待其停止后关闭线程池。
+
+        返回:
+        - None
+        """
+        runners = []
+        for task in cls._tasks.values():
+            if task.runner and not task.runner.done():
+                task.progress.cancel()
+                runners.append(task.runner)
+        if runners:
+            await asyncio.gather(*runners, return_exceptions=True)
+        AsyncFS.shutdown()
+
+
+async def resource_task_event(app: FastAPI, status: bool) -> None:
+    """
+    全局事件：启动时记录 Redis 连接用于跨进程同步任务状态，关闭时取消资源后台任务并关闭文件线程池。
+
+    参数:
+    - app (FastAPI): FastAPI应用实例。
+    - status (bool): True 为启动，False 为停止。
+
+    返回:
+    - None
+    """
+    if status:
+        ResourceTaskManager.redis_instance = getattr(app.state, "redis", None)
+    else:
+        await ResourceTaskManager.shutdown()
+        log.info("✅️ 资源后台任务已停止")
@@ -65,6 +65,22 @@ class DiskInfoSchema(BaseModel):
     usage: float = Field(ge=0, le=100, description="使用率(%)")
 
 
+class HttpUpstreamSchema(BaseModel):
+    """外部HTTP上游统计模型"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    upstream: str = Field(description="上游地址")
+    requests: int = Field(description="请求次数")
+    failures: int = Field(description="失败次数")
+    retries: int = Field(description="重试次数")
+    short_circuits: int = Field(description="熔断拒绝次数")
+    in_flight: int = Field(description="进行中的请求数")
+    avg_ms: float = Field(description="平均耗时(毫秒)")
+    max_ms: float = Field(description="最大耗时(毫秒)")
+    circuit_open: bool = Field(description="是否熔断")
+
+
 class ServerMonitorSchema(BaseModel):
     """服务器监控信息模型"""
 
@@ -75,3 +91,4 @@ class ServerMonitorSchema(BaseModel):
     py: PyInfoSchema = Field(description="Python运行信息")
     sys: SysInfoSchema = Field(description="系统信息")
     disks: list[DiskInfoSchema] = Field(default_factory=list, description="磁盘信息")
+    http: list[HttpUpstreamSchema] = Field(default_factory=list, description="外部HTTP上游统计")
@@ -5,11 +5,13 @@ from pathlib import Path
 
 import psutil
 
+from app.core.http_client import HttpClient
 from app.utils.common_util import bytes2human
 
 from .schema import (
     CpuInfoSchema,
     DiskInfoSchema,
+    HttpUpstreamSchema,
     MemoryInfoSchema,
     PyInfoSchema,
     ServerMonitorSchema,
@@ -34,6 +36,7 @@ class ServerService:
             sys=cls._get_system_info(),
             py=cls._get_python_info(),
             disks=cls._get_disk_info(),
+            http=[HttpUpstreamSchema(**item) for item in HttpClient.stats()],
         ).model_dump()
 
     @classmethod
@@ -2,6 +2,7 @@ from collections.abc import Sequence
 
 from app.api.v1.module_system.auth.schema import AuthSchema
 from app.core.base_crud import CRUDBase
+from app.core.tree_path import TreePath
 
 from .model import DeptModel
 from .schema import DeptCreateSchema, DeptUpdateSchema
@@ -87,6 +88,37 @@ class DeptCRUD(CRUDBase[DeptModel, DeptCreateSchema, DeptUpdateSchema]):
         """
         await self.set(ids=ids, status=status)
 
+    async def set_tree_available_crud(self, ids: list[int], status: str) -> None:
+        """
+        级联设置部门可用状态：启用时连同所有上级一起启用，停用时连同所有下级一起停用。
+
+        上级ID由物化路径直接解析；下级通过路径前缀匹配，以单条 UPDATE 完成。
+
+        参数:
+        - ids (list[int]): 部门 ID 列表。
+        - status (str): 可用状态。
+
+        返回:
+        - None
+        """
+        if status == "0":
+            ancestor_ids = await TreePath.ancestor_ids(self.auth.db, DeptModel, ids)
+            await self.set(ids=ancestor_ids, status=status)
+        else:
+            await TreePath.update_subtree(self.auth.db, DeptModel, ids, status=status)
+
+    async def get_descendant_ids_crud(self, ids: list[int]) -> list[int]:
+        """
+        获取部门及其所有下级的 ID（路径前缀匹配，单条查询）。
+
+        参数:
+        - ids (list[int]): 部门 ID 列表。
+
+        返回:
+        - list[int]: 包含自身在内的所有下级 ID 列表。
+        """
+        return await TreePath.descendant_ids(self.auth.db, DeptModel, ids)
+
     async def get_name_crud(self, id: int) -> str | None:
         """
         根据 id 获取部门名称。
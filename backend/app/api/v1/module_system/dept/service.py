@@ -1,13 +1,10 @@
+from sqlalchemy.orm import noload
+
 from app.api.v1.module_system.auth.schema import AuthSchema
+from app.core.base_params import has_active_filter
 from app.core.base_schema import BatchSetAvailable
 from app.core.exceptions import CustomException
-from app.utils.common_util import (
-    get_child_id_map,
-    get_child_recursion,
-    get_parent_id_map,
-    get_parent_recursion,
-    traversal_to_tree,
-)
+from app.utils.tree_util import TreeIndex
 
 from .crud import DeptCRUD
 from .schema import (
@@ -61,14 +58,22 @@ class DeptService:
         返回:
         - list[dict]: 部门树形列表对象。
         """
-        # 使用树形结构查询，预加载children关系
-        dept_list = await DeptCRUD(auth).get_tree_list_crud(
-            search=search.__dict__, order_by=order_by
-        )
-        # 转换为字典列表
-        dept_dict_list = [DeptOutSchema.model_validate(dept).model_dump() for dept in dept_list]
-        # 使用traversal_to_tree构建树形结构
-        return traversal_to_tree(dept_dict_list)
+        crud = DeptCRUD(auth)
+        # 只加载本表字段，不通过 children 关系逐层预加载子树
+        dept_list = await crud.get_tree_list_crud(order_by=order_by, preload=[noload("*")])
+        # 转换为字典列表并一次性建立树形索引
+        index = TreeIndex([DeptOutSchema.model_validate(dept).model_dump() for dept in dept_list])
+        # 控制器总会构造查询对象，按是否有生效的过滤条件区分，无条件时直接返回整棵树
+        if not has_active_filter(search):
+            return index.to_tree(copy=False)
+        # 按条件查询命中的部门，裁剪出命中节点及其全部祖先，搜索结果保留完整层级
+        matched = {
+            dept.id
+            for dept in await crud.get_tree_list_crud(
+                search=search.__dict__, order_by=order_by, preload=[noload("*")]
+            )
+        }
+        return index.prune(lambda node: node["id"] in matched, copy=False)
 
     @classmethod
     async def create_dept_service(cls, auth: AuthSchema, data: DeptCreateSchema) -> dict:
@@ -137,22 +142,8 @@ class DeptService:
         if len(ids) < 1:
             raise CustomException(msg="删除失败，删除对象不能为空")
 
-        # 获取所有部门列表，用于构建树形关系
-        all_depts = await DeptCRUD(auth).get_list_crud()
-
-        # 构建子部门ID映射
-        child_id_map = get_child_id_map(model_list=all_depts)
-
         # 收集所有需要删除的部门ID，包括直接指定的ID和它们的所有子部门ID
-        delete_ids_set = set()
-
-        for id in ids:
-            # 递归获取该ID的所有子部门ID
-            all_descendants = get_child_recursion(id=id, id_map=child_id_map)
-            delete_ids_set.update(all_descendants)
-
-        # 将集合转换为列表
-        delete_ids = list(delete_ids_set)
+        delete_ids = await DeptCRUD(auth).get_descendant_ids_crud(ids=ids)
 
         # 执行批量删除操作
         await DeptCRUD(auth).delete(ids=delete_ids)
@@ -169,18 +160,5 @@ class DeptService:
         返回:
         - None
         """
-        dept_list = await DeptCRUD(auth).get_list_crud()
-        total_ids = []
-
-        if data.status == "0":
-            id_map = get_parent_id_map(model_list=dept_list)
-            for dept_id in data.ids:
-                enable_ids = get_parent_recursion(id=dept_id, id_map=id_map)
-                total_ids.extend(enable_ids)
-        else:
-            id_map = get_child_id_map(model_list=dept_list)
-            for dept_id in data.ids:
-                disable_ids = get_child_recursion(id=dept_id, id_map=id_map)
-                total_ids.extend(disable_ids)
-
-        await DeptCRUD(auth).set_available_crud(ids=total_ids, status=data.status)
+        # 启用时连同所有父级启用，停用时连同所有子级停用
+        await DeptCRUD(auth).set_tree_available_crud(ids=data.ids, status=data.status)
@@ -1,6 +1,6 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Body, Depends, Path
+from fastapi import APIRouter, Body, Depends, Path, Query
 from fastapi.responses import JSONResponse, StreamingResponse
 from redis.asyncio.client import Redis
 
@@ -495,6 +495,37 @@ async def export_data_list_controller(
     )
 
 
+@DictRouter.get(
+    "/data/info",
+    summary="批量根据字典类型获取数据",
+    description="一次获取多个字典类型的数据，不存在的字典类型不包含在结果中",
+    response_model=dict[str, list[DictDataOutSchema]],
+)
+async def get_init_dict_data_batch_controller(
+    dict_types: Annotated[list[str], Query(description="字典类型列表", min_length=1)],
+    redis: Annotated[Redis, Depends(redis_getter)],
+) -> JSONResponse:
+    """
+    批量根据字典类型获取数据
+
+    参数:
+    - dict_types (list[str]): 字典类型列表
+    - redis (Redis): Redis数据库连接
+
+    返回:
+    - JSONResponse: 包含 {字典类型: 字典数据列表} 的响应模型
+
+    异常:
+    - CustomException: 获取字典数据失败时抛出异常。
+    """
+    dict_data_query_result = await DictDataService.get_init_dict_batch_service(
+        redis=redis, dict_types=dict_types
+    )
+    log.info(f"批量获取初始化字典数据成功：{list(dict_data_query_result)}")
+
+    return SuccessResponse(data=dict_data_query_result, msg="获取初始化字典数据成功")
+
+
 @DictRouter.get(
     "/data/info/{dict_type}",
     summary="根据字典类型获取数据",
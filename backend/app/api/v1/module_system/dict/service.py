@@ -1,4 +1,6 @@
+import asyncio
 import json
+import time
 
 from redis.asyncio.client import Redis
 
@@ -89,13 +91,8 @@ class DictTypeService:
 
         new_obj_dict = DictTypeOutSchema.model_validate(obj).model_dump()
 
-        redis_key = f"{RedisInitKeyConfig.SYSTEM_DICT.key}:{data.dict_type}"
-
         try:
-            await RedisCURD(redis).set(
-                key=redis_key,
-                value="",
-            )
+            await DictDataService.write_cache_service(redis=redis, data={data.dict_type: []})
             log.info(f"创建字典类型成功: {new_obj_dict}")
         except Exception as e:
             log.error(f"创建字典类型失败: {e}")
@@ -158,21 +155,13 @@ class DictTypeService:
 
         new_obj_dict = DictTypeOutSchema.model_validate(obj).model_dump()
 
-        redis_key = f"{RedisInitKeyConfig.SYSTEM_DICT.key}:{data.dict_type}"
         try:
-            # 获取当前字典类型的所有字典数据，确保包含最新状态
-            dict_data_list = await DictDataCRUD(auth).get_obj_list_crud(
-                search={"dict_type": data.dict_type}
-            )
-            dict_data = [
-                DictDataOutSchema.model_validate(row).model_dump() for row in dict_data_list if row
-            ]
-
-            value = json.dumps(dict_data, ensure_ascii=False)
-            await RedisCURD(redis).set(
-                key=redis_key,
-                value=value,
+            # 获取当前字典类型的所有字典数据，确保包含最新状态；类型改名时同时清除旧类型缓存
+            cache_data = await DictDataService.load_dict_data_service(
+                auth=auth, dict_types=[data.dict_type]
             )
+            deleted = [exist_obj.dict_type] if exist_obj.dict_type != data.dict_type else []
+            await DictDataService.write_cache_service(redis=redis, data=cache_data, deleted=deleted)
             log.info(f"更新字典类型成功并刷新缓存: {new_obj_dict}")
         except Exception as e:
             log.error(f"更新字典类型缓存失败: {e}")
@@ -205,9 +194,10 @@ class DictTypeService:
                 # 如果有字典数据，不能删除
                 raise CustomException(msg="删除失败，该数据字典类型下存在字典数据")
             # 删除Redis缓存
-            redis_key = f"{RedisInitKeyConfig.SYSTEM_DICT.key}:{exist_obj.dict_type}"
             try:
-                await RedisCURD(redis).delete(redis_key)
+                await DictDataService.write_cache_service(
+                    redis=redis, data={}, deleted=[exist_obj.dict_type]
+                )
                 log.info(f"删除字典类型成功: {id}")
             except Exception as e:
                 log.error(f"删除字典类型失败: {e}")
@@ -270,6 +260,18 @@ class DictDataService:
     字典数据管理模块服务层
     """
 
+    # 进程内字典缓存的最长有效期(秒)，兜底直接删除 Redis 键而未递增版本号的情况
+    LOCAL_CACHE_TTL = 60
+
+    # 进程内字典缓存：{字典类型: 字典数据列表}，仅在 Redis 缓存版本号与 _local_version 一致时有效
+    _local_cache: dict[str, list[dict]] = {}
+    _local_version: str | None = None
+    _local_loaded_at: float = 0.0
+    # 单飞锁：同一字典类型同时只有一个协程回源重建
+    _rebuild_locks: dict[str, asyncio.Lock] = {}
+    # 正在使用(持有或排队等待)各把单飞锁的协程数
+    _rebuild_users: dict[str, int] = {}
+
     @classmethod
     async def get_obj_detail_service(cls, auth: AuthSchema, id: int) -> dict:
         """
@@ -308,11 +310,83 @@ class DictDataService:
         )
         return [DictDataOutSchema.model_validate(obj).model_dump() for obj in obj_list]
 
+    @classmethod
+    def _cache_key(cls, dict_type: str) -> str:
+        """
+        获取字典类型的 Redis 缓存键名。
+
+        参数:
+        - dict_type (str): 字典类型
+
+        返回:
+        - str: 缓存键名
+        """
+        return f"{RedisInitKeyConfig.SYSTEM_DICT.key}:{dict_type}"
+
+    @classmethod
+    async def load_dict_data_service(
+        cls, auth: AuthSchema, dict_types: list[str] | None = None
+    ) -> dict[str, list[dict]]:
+        """
+        一次查询加载字典数据并按字典类型分组
+
+        参数:
+        - auth (AuthSchema): 认证信息模型
+        - dict_types (list[str] | None): 需要加载的字典类型，None 表示全部
+
+        返回:
+        - dict[str, list[dict]]: {字典类型: 字典数据列表}，已存在但没有数据的类型对应空列表
+        """
+        type_search = {"dict_type": ("in", dict_types)} if dict_types else None
+        type_list = await DictTypeCRUD(auth).get_obj_list_crud(search=type_search)
+        grouped: dict[str, list[dict]] = {obj.dict_type: [] for obj in type_list}
+        if not grouped:
+            return grouped
+
+        data_list = await DictDataCRUD(auth).get_obj_list_crud(
+            search={"dict_type": ("in", list(grouped))} if dict_types else None,
+            order_by=[{"id": "asc"}],
+        )
+        for row in data_list:
+            if row and row.dict_type in grouped:
+                grouped[row.dict_type].append(DictDataOutSchema.model_validate(row).model_dump())
+        return grouped
+
+    @classmethod
+    async def write_cache_service(
+        cls,
+        redis: Redis,
+        data: dict[str, list[dict]],
+        deleted: list[str] | None = None,
+    ) -> None:
+        """
+        通过一个 Redis 管道写入/删除字典缓存并递增缓存版本
+
+        版本号变化后，各进程的本地字典缓存会在下次读取时失效。
+
+        参数:
+        - redis (Redis): Redis客户端
+        - data (dict[str, list[dict]]): {字典类型: 字典数据列表}
+        - deleted (list[str] | None): 需要删除缓存的字典类型
+
+        返回:
+        - None
+        """
+        async with redis.pipeline(transaction=True) as pipe:
+            for dict_type, rows in data.items():
+                pipe.set(cls._cache_key(dict_type), json.dumps(rows, ensure_ascii=False))
+            for dict_type in deleted or []:
+                pipe.delete(cls._cache_key(dict_type))
+            pipe.incr(RedisInitKeyConfig.SYSTEM_DICT_VERSION.key)
+            await pipe.execute()
+
     @classmethod
     async def init_dict_service(cls, redis: Redis) -> None:
         """
         应用初始化: 获取所有字典类型对应的字典数据信息并缓存service
 
+        一次查询加载全部字典数据，在内存中按类型分组后通过一个 Redis 管道写入。
+
         参数:
         - redis (Redis): Redis客户端
 
@@ -324,82 +398,146 @@ class DictDataService:
                 async with session.begin():
                     # 在初始化过程中，不需要检查数据权限
                     auth = AuthSchema(db=session, check_data_scope=False)
-                    obj_list = await DictTypeCRUD(auth).get_obj_list_crud()
-                    if not obj_list:
-                        log.warning("未找到任何字典类型数据")
-                        return
-
-                    for obj in obj_list:
-                        dict_type = obj.dict_type
-                        try:
-                            dict_data_list = await DictDataCRUD(auth).get_obj_list_crud(
-                                search={"dict_type": dict_type}
-                            )
-                            dict_data = [
-                                DictDataOutSchema.model_validate(row).model_dump()
-                                for row in dict_data_list
-                                if row
-                            ]
-                            # 保存到Redis并设置过期时间
-                            redis_key = f"{RedisInitKeyConfig.SYSTEM_DICT.key}:{dict_type}"
-                            value = json.dumps(dict_data, ensure_ascii=False)
-                            await RedisCURD(redis).set(
-                                key=redis_key,
-                                value=value,
-                            )
-                        except Exception as e:
-                            log.error(f"❌ 初始化字典数据失败 [{dict_type}]: {e}")
+                    cache_data = await cls.load_dict_data_service(auth=auth)
+            if not cache_data:
+                log.warning("未找到任何字典类型数据")
+                return
+            await cls.write_cache_service(redis=redis, data=cache_data)
 
         except Exception as e:
             log.error(f"字典初始化过程发生错误: {e}")
-            # 只在严重错误时抛出异常，允许单个字典加载失败
             raise CustomException(msg=f"字典数据初始化失败: {e!s}")
 
     @classmethod
-    async def get_init_dict_service(cls, redis: Redis, dict_type: str) -> list[dict]:
+    async def _rebuild_dict_service(cls, redis: Redis, dict_type: str) -> list[dict] | None:
         """
-        从缓存获取字典数据列表信息service
+        缓存未命中时回源重建单个字典类型的缓存（单飞：同一类型同时只有一个协程查询数据库）
 
         参数:
         - redis (Redis): Redis客户端
         - dict_type (str): 字典类型
 
         返回:
-        - list[dict]: 字典数据列表
+        - list[dict] | None: 字典数据列表，字典类型不存在时返回 None
         """
+        lock = cls._rebuild_locks.setdefault(dict_type, asyncio.Lock())
+        cls._rebuild_users[dict_type] = cls._rebuild_users.get(dict_type, 0) + 1
         try:
-            redis_key = f"{RedisInitKeyConfig.SYSTEM_DICT.key}:{dict_type}"
-            obj_list_dict = await RedisCURD(redis).get(redis_key)
-
-            # 确保返回数据正确序列化
-            if obj_list_dict:
-                if isinstance(obj_list_dict, str):
-                    try:
-                        return json.loads(obj_list_dict)
-                    except json.JSONDecodeError:
-                        log.warning(f"字典数据反序列化失败，尝试重新初始化缓存: {dict_type}")
-                elif isinstance(obj_list_dict, list):
-                    return obj_list_dict
-
-            # 缓存不存在或格式错误时重新初始化
-            await cls.init_dict_service(redis)
-            obj_list_dict = await RedisCURD(redis).get(redis_key)
-            if not obj_list_dict:
-                raise CustomException(msg="数据字典不存在")
-
-            # 再次确保返回数据正确序列化
-            if isinstance(obj_list_dict, str):
-                try:
-                    return json.loads(obj_list_dict)
-                except json.JSONDecodeError:
-                    raise CustomException(msg="字典数据格式错误")
-            return obj_list_dict
+            async with lock:
+                # 等待期间其他协程可能已完成重建
+                cached = cls._parse_cache_value(
+                    await RedisCURD(redis).get(cls._cache_key(dict_type))
+                )
+                if cached is not None:
+                    return cached
+
+                async with async_db_session() as session:
+                    async with session.begin():
+                        auth = AuthSchema(db=session, check_data_scope=False)
+                        cache_data = await cls.load_dict_data_service(
+                            auth=auth, dict_types=[dict_type]
+                        )
+                if dict_type not in cache_data:
+                    return None
+                # 仅补齐缺失的缓存，数据未变化，不递增版本号
+                await RedisCURD(redis).set(
+                    key=cls._cache_key(dict_type),
+                    value=json.dumps(cache_data[dict_type], ensure_ascii=False),
+                )
+                return cache_data[dict_type]
+        finally:
+            # 最后一个使用者退出时才移除锁，避免请求不存在的字典类型导致锁表无限增长；
+            # 仍有协程排队时保留，否则后来者会创建新锁，与排队者并发重建
+            cls._rebuild_users[dict_type] -= 1
+            if not cls._rebuild_users[dict_type]:
+                del cls._rebuild_users[dict_type]
+                cls._rebuild_locks.pop(dict_type, None)
+
+    @staticmethod
+    def _parse_cache_value(value: str | None) -> list[dict] | None:
+        """
+        解析 Redis 中的字典缓存值
+
+        参数:
+        - value (str | None): 缓存值
+
+        返回:
+        - list[dict] | None: 字典数据列表，缓存为空或格式错误时返回 None
+        """
+        if not value:
+            return None
+        try:
+            data = json.loads(value)
+        except json.JSONDecodeError:
+            return None
+        return data if isinstance(data, list) else None
+
+    @classmethod
+    async def get_init_dict_batch_service(
+        cls, redis: Redis, dict_types: list[str]
+    ) -> dict[str, list[dict]]:
+        """
+        批量获取多个字典类型的字典数据service
+
+        依次读取进程内缓存（Redis 版本号一致且未超过 LOCAL_CACHE_TTL 时有效）、
+        Redis（一次 MGET），仍缺失的类型逐个单飞回源重建。
+
+        参数:
+        - redis (Redis): Redis客户端
+        - dict_types (list[str]): 字典类型列表
+
+        返回:
+        - dict[str, list[dict]]: {字典类型: 字典数据列表}，不存在的字典类型不包含在结果中。
+          返回的列表为共享缓存，调用方不应修改。
+        """
+        try:
+            dict_types = list(dict.fromkeys(dict_types))
+            version = await RedisCURD(redis).get(RedisInitKeyConfig.SYSTEM_DICT_VERSION.key)
+            now = time.monotonic()
+            if version != cls._local_version or now - cls._local_loaded_at > cls.LOCAL_CACHE_TTL:
+                cls._local_cache = {}
+                cls._local_version = version
+                cls._local_loaded_at = now
+
+            result = {t: cls._local_cache[t] for t in dict_types if t in cls._local_cache}
+            missing = [t for t in dict_types if t not in result]
+            if missing:
+                values = await RedisCURD(redis).mget([cls._cache_key(t) for t in missing])
+                for dict_type, value in zip(missing, values or [None] * len(missing), strict=False):
+                    data = cls._parse_cache_value(value)
+                    if data is None:
+                        data = await cls._rebuild_dict_service(redis=redis, dict_type=dict_type)
+                    if data is None:
+                        log.warning(f"数据字典不存在: {dict_type}")
+                        continue
+                    result[dict_type] = data
+                    # 版本号未变化时才写入本地缓存，避免读到旧数据后覆盖
+                    if cls._local_version == version:
+                        cls._local_cache[dict_type] = data
+            return result
         except CustomException:
             raise
         except Exception as e:
             log.error(f"获取字典缓存失败: {e!s}")
             raise CustomException(msg=f"获取字典数据失败: {e!s}")
 
+    @classmethod
+    async def get_init_dict_service(cls, redis: Redis, dict_type: str) -> list[dict]:
+        """
+        从缓存获取字典数据列表信息service
+
+        参数:
+        - redis (Redis): Redis客户端
+        - dict_type (str): 字典类型
+
+        返回:
+        - list[dict]: 字典数据列表
+        """
+        result = await cls.get_init_dict_batch_service(redis=redis, dict_types=[dict_type])
+        if dict_type not in result:
+            raise CustomException(msg="数据字典不存在")
+        return result[dict_type]
+
     @classmethod
     async def create_obj_service(
         cls, auth: AuthSchema, redis: Redis, data: DictDataCreateSchema
@@ -431,21 +569,10 @@ class DictDataService:
 
         obj = await DictDataCRUD(auth).create_obj_crud(data=data)
 
-        redis_key = f"{RedisInitKeyConfig.SYSTEM_DICT.key}:{data.dict_type}"
         try:
             # 获取当前字典类型的所有字典数据
-            dict_data_list = await DictDataCRUD(auth).get_obj_list_crud(
-                search={"dict_type": data.dict_type}
-            )
-            dict_data = [
-                DictDataOutSchema.model_validate(row).model_dump() for row in dict_data_list if row
-            ]
-
-            value = json.dumps(dict_data, ensure_ascii=False)
-            await RedisCURD(redis).set(
-                key=redis_key,
-                value=value,
-            )
+            cache_data = await cls.load_dict_data_service(auth=auth, dict_types=[data.dict_type])
+            await cls.write_cache_service(redis=redis, data=cache_data)
             log.info(f"创建字典数据写入缓存成功: {obj}")
         except Exception as e:
             log.error(f"创建字典数据写入缓存失败: {e}")
@@ -497,44 +624,13 @@ class DictDataService:
                     msg=f'更新失败，该字典类型下的字典键值"{data.dict_value}"已存在'
                 )
 
-        # 如果字典类型变更，仅刷新旧类型缓存，不联动字典类型状态
-        if exist_obj.dict_type != data.dict_type:
-            dict_type = await DictTypeCRUD(auth).get(dict_type=exist_obj.dict_type)
-            if dict_type:
-                redis_key = f"{RedisInitKeyConfig.SYSTEM_DICT.key}:{dict_type.dict_type}"
-                try:
-                    dict_data_list = await DictDataCRUD(auth).get_obj_list_crud(
-                        search={"dict_type": dict_type.dict_type}
-                    )
-                    dict_data = [
-                        DictDataOutSchema.model_validate(row).model_dump()
-                        for row in dict_data_list
-                        if row
-                    ]
-                    value = json.dumps(dict_data, ensure_ascii=False)
-                    await RedisCURD(redis).set(
-                        key=redis_key,
-                        value=value,
-                    )
-                except Exception as e:
-                    log.error(f"更新字典数据类型变更时刷新旧缓存失败: {e}")
-
         obj = await DictDataCRUD(auth).update_obj_crud(id=id, data=data)
-        redis_key = f"{RedisInitKeyConfig.SYSTEM_DICT.key}:{data.dict_type}"
         try:
-            # 获取当前字典类型的所有字典数据
-            dict_data_list = await DictDataCRUD(auth).get_obj_list_crud(
-                search={"dict_type": data.dict_type}
-            )
-            dict_data = [
-                DictDataOutSchema.model_validate(row).model_dump() for row in dict_data_list if row
-            ]
-
-            value = json.dumps(dict_data, ensure_ascii=False)
-            await RedisCURD(redis).set(
-                key=redis_key,
-                value=value,
+            # 获取当前字典类型的所有字典数据；如果字典类型变更，一并刷新旧类型缓存，不联动字典类型状态
+            cache_data = await cls.load_dict_data_service(
+                auth=auth, dict_types=list({data.dict_type, exist_obj.dict_type})
             )
+            await cls.write_cache_service(redis=redis, data=cache_data)
             log.info(f"更新字典数据写入缓存成功: {obj}")
         except Exception as e:
             log.error(f"更新字典数据写入缓存失败: {e}")
@@ -578,15 +674,15 @@ class DictDataService:
             # 执行删除操作
             await DictDataCRUD(auth).delete_obj_crud(ids=ids)
 
-            # 清除缓存
-            for dict_type in dict_types_to_clear:
-                try:
-                    redis_key = f"{RedisInitKeyConfig.SYSTEM_DICT.key}:{dict_type}"
-                    await RedisCURD(redis).delete(redis_key)
-                    log.info(f"清除字典缓存成功: {dict_type}")
-                except Exception as e:
-                    log.warning(f"清除字典缓存失败: {e}")
-                    # 缓存清除失败不影响删除操作
+            # 清除缓存，下次读取时回源重建
+            try:
+                await cls.write_cache_service(
+                    redis=redis, data={}, deleted=list(dict_types_to_clear)
+                )
+                log.info(f"清除字典缓存成功: {dict_types_to_clear}")
+            except Exception as e:
+                log.warning(f"清除字典缓存失败: {e}")
+                # 缓存清除失败不影响删除操作
 
             log.info(f"删除字典数据成功，ID列表: {ids}")
 
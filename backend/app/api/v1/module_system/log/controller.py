@@ -4,7 +4,6 @@ from fastapi import APIRouter, Body, Depends, Path
 from fastapi.responses import JSONResponse, StreamingResponse
 
 from app.api.v1.module_system.auth.schema import AuthSchema
-from app.common.request import PaginationService
 from app.common.response import StreamResponse, SuccessResponse
 from app.core.base_params import PaginationQueryParam
 from app.core.dependencies import AuthPermission
@@ -43,16 +42,45 @@ async def get_obj_list_controller(
     order_by = [{"created_time": "desc"}]
     if page.order_by:
         order_by = page.order_by
-    result_dict_list = await OperationLogService.get_log_list_service(
-        search=search, auth=auth, order_by=order_by
-    )
-    result_dict = await PaginationService.paginate(
-        data_list=result_dict_list,
+    result_dict = await OperationLogService.get_log_page_service(
+        auth=auth,
+        search=search,
         page_no=page.page_no,
         page_size=page.page_size,
+        order_by=order_by,
     )
     log.info("查询日志成功")
-    return SuccessResponse(data=result_dict, msg="查询日志成功")
+    # 只校验当前页的 ORM 对象并直接序列化
+    return SuccessResponse(data=result_dict, msg="查询日志成功", schema=OperationLogOutSchema)
+
+
+@LogRouter.get(
+    "/archive",
+    summary="查询归档日志",
+    description="查询已归档的历史日志",
+    response_model=list[OperationLogOutSchema],
+)
+async def get_archive_list_controller(
+    page: Annotated[PaginationQueryParam, Depends()],
+    search: Annotated[OperationLogQueryParam, Depends()],
+    auth: Annotated[AuthSchema, Depends(AuthPermission(["module_system:log:query"]))],
+) -> JSONResponse:
+    """
+    查询归档日志
+
+    参数:
+    - page (PaginationQueryParam): 分页查询参数模型
+    - search (OperationLogQueryParam): 日志查询参数模型
+    - auth (AuthSchema): 认证信息模型
+
+    返回:
+    - JSONResponse: 包含分页归档日志的 JSON 响应模型
+    """
+    result_dict = await OperationLogService.get_archive_page_service(
+        auth=auth, search=search, page_no=page.page_no, page_size=page.page_size
+    )
+    log.info("查询归档日志成功")
+    return SuccessResponse(data=result_dict, msg="查询归档日志成功")
 
 
 @LogRouter.get(
@@ -1,8 +1,11 @@
 from app.api.v1.module_system.auth.schema import AuthSchema
+from app.common.request import PaginationService
 from app.core.exceptions import CustomException
+from app.core.log_archive import LogArchive
 from app.utils.excel_util import ExcelUtil
 
 from .crud import OperationLogCRUD
+from .model import OperationLogModel
 from .schema import (
     OperationLogCreateSchema,
     OperationLogOutSchema,
@@ -56,6 +59,64 @@ class OperationLogService:
         log_dict_list = [OperationLogOutSchema.model_validate(log).model_dump() for log in log_list]
         return log_dict_list
 
+    @classmethod
+    async def get_log_page_service(
+        cls,
+        auth: AuthSchema,
+        search: OperationLogQueryParam,
+        page_no: int,
+        page_size: int,
+        order_by: list | None = None,
+    ) -> dict:
+        """
+        分页查询日志
+
+        参数:
+        - auth (AuthSchema): 认证信息模型
+        - search (OperationLogQueryParam): 日志查询参数模型
+        - page_no (int): 页码
+        - page_size (int): 每页数量
+        - order_by (list | None): 排序字段列表
+
+        返回:
+        - dict: 分页数据，items 为 ORM 对象，由 SuccessResponse(schema=OperationLogOutSchema) 序列化
+        """
+        log_list = await OperationLogCRUD(auth).get_list_crud(
+            search=search.__dict__, order_by=order_by
+        )
+        return await PaginationService.paginate(
+            data_list=list(log_list), page_no=page_no, page_size=page_size
+        )
+
+    @classmethod
+    async def get_archive_page_service(
+        cls,
+        auth: AuthSchema,
+        search: OperationLogQueryParam,
+        page_no: int,
+        page_size: int,
+    ) -> dict:
+        """
+        分页查询已归档的历史日志
+
+        参数:
+        - auth (AuthSchema): 认证信息模型
+        - search (OperationLogQueryParam): 日志查询参数模型
+        - page_no (int): 页码
+        - page_size (int): 每页数量
+
+        返回:
+        - dict: 分页数据
+        """
+        return await LogArchive.page(
+            model=OperationLogModel,
+            auth=auth,
+            search=search.__dict__,
+            offset=(page_no - 1) * page_size,
+            limit=page_size,
+            out_schema=OperationLogOutSchema,
+        )
+
     @classmethod
     async def create_log_service(cls, auth: AuthSchema, data: OperationLogCreateSchema) -> dict:
         """
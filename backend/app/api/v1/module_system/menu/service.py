@@ -1,13 +1,11 @@
+from redis.asyncio.client import Redis
+from sqlalchemy.orm import noload
+
 from app.api.v1.module_system.auth.schema import AuthSchema
+from app.core.base_params import has_active_filter
 from app.core.base_schema import BatchSetAvailable
 from app.core.exceptions import CustomException
-from app.utils.common_util import (
-    get_child_id_map,
-    get_child_recursion,
-    get_parent_id_map,
-    get_parent_recursion,
-    traversal_to_tree,
-)
+from app.utils.tree_util import TreeIndex
 
 from .crud import MenuCRUD
 from .schema import (
@@ -16,6 +14,7 @@ from .schema import (
     MenuQueryParam,
     MenuUpdateSchema,
 )
+from .tools.menu_tree import MenuTreeCache
 
 
 class MenuService:
@@ -63,23 +62,34 @@ class MenuService:
         返回:
         - list[dict]: 菜单树形列表对象。
         """
-        # 使用树形结构查询，预加载children关系
-        menu_list = await MenuCRUD(auth).get_tree_list_crud(
-            search=search.__dict__, order_by=order_by
-        )
-        # 转换为字典列表
-        menu_dict_list = [MenuOutSchema.model_validate(menu).model_dump() for menu in menu_list]
-        # 使用traversal_to_tree构建树形结构
-        return traversal_to_tree(menu_dict_list)
+        crud = MenuCRUD(auth)
+        # 只加载本表字段，不通过 children 关系逐层预加载子树
+        menu_list = await crud.get_tree_list_crud(order_by=order_by, preload=[noload("*")])
+        # 转换为字典列表并一次性建立树形索引
+        index = TreeIndex([MenuOutSchema.model_validate(menu).model_dump() for menu in menu_list])
+        # 控制器总会构造查询对象，按是否有生效的过滤条件区分，无条件时直接返回整棵树
+        if not has_active_filter(search):
+            return index.to_tree(copy=False)
+        # 按条件查询命中的菜单，裁剪出命中节点及其全部祖先，搜索结果保留完整层级
+        matched = {
+            menu.id
+            for menu in await crud.get_tree_list_crud(
+                search=search.__dict__, order_by=order_by, preload=[noload("*")]
+            )
+        }
+        return index.prune(lambda node: node["id"] in matched, copy=False)
 
     @classmethod
-    async def create_menu_service(cls, auth: AuthSchema, data: MenuCreateSchema) -> dict:
+    async def create_menu_service(
+        cls, auth: AuthSchema, data: MenuCreateSchema, redis: Redis
+    ) -> dict:
         """
         创建菜单。
 
         参数:
         - auth (AuthSchema): 认证对象。
         - data (MenuCreateSchema): 创建参数对象。
+        - redis (Redis): Redis数据库连接。
 
         返回:
         - dict: 创建的菜单对象。
@@ -89,11 +99,14 @@ class MenuService:
             raise CustomException(msg="创建失败，该菜单已存在")
 
         new_menu = await MenuCRUD(auth).create(data=data)
+        MenuTreeCache.invalidate_on_commit(db=auth.db, redis=redis)
         new_menu_dict = MenuOutSchema.model_validate(new_menu).model_dump()
         return new_menu_dict
 
     @classmethod
-    async def update_menu_service(cls, auth: AuthSchema, id: int, data: MenuUpdateSchema) -> dict:
+    async def update_menu_service(
+        cls, auth: AuthSchema, id: int, data: MenuUpdateSchema, redis: Redis
+    ) -> dict:
         """
         更新菜单。
 
@@ -101,6 +114,7 @@ class MenuService:
         - auth (AuthSchema): 认证对象。
         - id (int): 菜单ID。
         - data (MenuUpdateSchema): 更新参数对象。
+        - redis (Redis): Redis数据库连接。
 
         返回:
         - dict: 更新的菜单对象。
@@ -120,20 +134,21 @@ class MenuService:
         new_menu = await MenuCRUD(auth).update(id=id, data=data)
 
         await cls.set_menu_available_service(
-            auth=auth, data=BatchSetAvailable(ids=[id], status=data.status)
+            auth=auth, data=BatchSetAvailable(ids=[id], status=data.status), redis=redis
         )
 
         new_menu_dict = MenuOutSchema.model_validate(new_menu).model_dump()
         return new_menu_dict
 
     @classmethod
-    async def delete_menu_service(cls, auth: AuthSchema, ids: list[int]) -> None:
+    async def delete_menu_service(cls, auth: AuthSchema, ids: list[int], redis: Redis) -> None:
         """
         删除菜单。
 
         参数:
         - auth (AuthSchema): 认证对象。
         - ids (list[int]): 菜单ID列表。
+        - redis (Redis): Redis数据库连接。
 
         返回:
         - None
@@ -141,52 +156,28 @@ class MenuService:
         if len(ids) < 1:
             raise CustomException(msg="删除失败，删除对象不能为空")
 
-        # 获取所有菜单列表，用于构建树形关系
-        all_menus = await MenuCRUD(auth).get_list_crud()
-
-        # 构建子菜单ID映射
-        child_id_map = get_child_id_map(model_list=all_menus)
-
         # 收集所有需要删除的菜单ID，包括直接指定的ID和它们的所有子菜单ID
-        delete_ids_set = set()
-
-        for id in ids:
-            # 递归获取该ID的所有子菜单ID
-            all_descendants = get_child_recursion(id=id, id_map=child_id_map)
-            delete_ids_set.update(all_descendants)
-
-        # 将集合转换为列表
-        delete_ids = list(delete_ids_set)
+        delete_ids = await MenuCRUD(auth).get_descendant_ids_crud(ids=ids)
 
         # 执行批量删除操作
         await MenuCRUD(auth).delete(ids=delete_ids)
+        MenuTreeCache.invalidate_on_commit(db=auth.db, redis=redis)
 
     @classmethod
-    async def set_menu_available_service(cls, auth: AuthSchema, data: BatchSetAvailable) -> None:
+    async def set_menu_available_service(
+        cls, auth: AuthSchema, data: BatchSetAvailable, redis: Redis
+    ) -> None:
         """
         递归获取所有父、子级菜单，然后批量修改菜单可用状态。
 
         参数:
         - auth (AuthSchema): 认证对象。
         - data (BatchSetAvailable): 批量设置可用参数对象。
+        - redis (Redis): Redis数据库连接。
 
         返回:
         - None
         """
-        menu_list = await MenuCRUD(auth).get_list_crud()
-        total_ids = []
-
-        if data.status == "0":
-            # 激活，则需要把所有父级菜单都激活
-            id_map = get_parent_id_map(model_list=menu_list)
-            for menu_id in data.ids:
-                enable_ids = get_parent_recursion(id=menu_id, id_map=id_map)
-                total_ids.extend(enable_ids)
-        else:
-            # 禁止，则需要把所有子级菜单都禁止
-            id_map = get_child_id_map(model_list=menu_list)
-            for menu_id in data.ids:
-                disable_ids = get_child_recursion(id=menu_id, id_map=id_map)
-                total_ids.extend(disable_ids)
-
-        await MenuCRUD(auth).set_available_crud(ids=total_ids, status=data.status)
+        # 启用时连同所有父级启用，停用时连同所有子级停用
+        await MenuCRUD(auth).set_tree_available_crud(ids=data.ids, status=data.status)
+        MenuTreeCache.invalidate_on_commit(db=auth.db, redis=redis)
@@ -0,0 +1,216 @@
+import asyncio
+import hashlib
+import time
+from collections.abc import Iterable
+
+from redis.asyncio.client import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.module_system.auth.schema import AuthSchema
+from app.common.enums import RedisInitKeyConfig
+from app.core.database import after_commit
+from app.core.logger import log
+from app.core.redis_crud import RedisCURD
+
+from ..crud import MenuCRUD
+from ..schema import MenuOutSchema
+
+
+class MenuTreeCache:
+    """
+    登录用户路由菜单树缓存
+
+    - 全量启用的目录/菜单/外链只在缓存版本变化时查询一次，按 (order, id) 排好序后常驻进程内；
+    - 按角色ID集合对全量菜单做ID掩码，线性构造该角色组合的菜单树，以排序后角色ID的哈希为键缓存；
+    - 菜单增删改、启停用以及角色权限调整后调用 invalidate_on_commit()，事务提交后递增 Redis 中的版本号，
+      各实例在下次读取时发现版本变化并丢弃本地缓存。
+    返回的菜单树在多个请求间共享，调用方只能读取，不能修改。
+    """
+
+    # 用户路由中包含的菜单类型(1:目录 2:菜单 4:外链)
+    ROUTE_MENU_TYPES = (1, 2, 4)
+    # 本地缓存最长有效期(秒)，兜底 Redis 版本键被手动清除等情况
+    LOCAL_CACHE_TTL = 60
+    # 角色组合树的最大缓存数量，超出后整体清空重新累积
+    MAX_ROLE_TREES = 512
+    # 超级管理员使用全量菜单树的缓存键
+    SUPERUSER_KEY = "*"
+
+    # 全量菜单：{菜单ID: 菜单字典(不含children)}，以及按显示顺序排列的菜单ID
+    _nodes: dict[int, dict] = {}
+    _order: tuple[int, ...] = ()
+    _version: str | None = None
+    _loaded_at: float = 0.0
+    _role_trees: dict[str, list[dict]] = {}
+    _load_lock: asyncio.Lock | None = None
+
+    @classmethod
+    def role_key(cls, role_ids: Iterable[int]) -> str:
+        """
+        生成角色组合的缓存键。
+
+        参数:
+        - role_ids (Iterable[int]): 角色ID集合。
+
+        返回:
+        - str: 排序去重后角色ID的 sha1 摘要。
+        """
+        raw = ",".join(str(role_id) for role_id in sorted(set(role_ids)))
+        return hashlib.sha1(raw.encode()).hexdigest()
+
+    @staticmethod
+    def build_tree(
+        nodes: dict[int, dict], order: Iterable[int], mask: set[int] | None = None
+    ) -> list[dict]:
+        """
+        按ID掩码从全量菜单线性构造菜单树（两遍遍历，O(n)）。
+
+        父菜单不在掩码内时该菜单挂到根节点，与按ID列表查询后再组装的结果一致；
+        叶子节点的 children 为 None。
+
+        参数:
+        - nodes (dict[int, dict]): 全量菜单字典。
+        - order (Iterable[int]): 按显示顺序排列的菜单ID。
+        - mask (set[int] | None): 保留的菜单ID集合，None 表示全部保留。
+
+        返回:
+        - list[dict]: 菜单树。
+        """
+        kept: dict[int, dict] = {}
+        for menu_id in order:
+            if mask is None or menu_id in mask:
+                kept[menu_id] = {**nodes[menu_id], "children": None}
+
+        tree: list[dict] = []
+        for node in kept.values():
+            parent = kept.get(node["parent_id"]) if node["parent_id"] is not None else None
+            if parent is None:
+                tree.append(node)
+            elif parent["children"] is None:
+                parent["children"] = [node]
+            else:
+                parent["children"].append(node)
+        return tree
+
+    @classmethod
+    async def _ensure_loaded(cls, auth: AuthSchema, redis: Redis) -> str | None:
+        """
+        确认本地全量菜单与 Redis 版本一致，不一致或超过有效期时重新加载。
+
+        参数:
+        - auth (AuthSchema): 认证信息模型。
+        - redis (Redis): Redis 连接。
+
+        返回:
+        - str | None: 当前缓存版本号。
+        """
+        version = await RedisCURD(redis).get(RedisInitKeyConfig.SYSTEM_MENU_VERSION.key)
+        if cls._is_current(version):
+            return version
+
+        if cls._load_lock is None:
+            cls._load_lock = asyncio.Lock()
+        async with cls._load_lock:
+            # 等待锁期间其他请求可能已完成加载
+            if cls._is_current(version):
+                return version
+            menus = await MenuCRUD(auth).get_list_crud(
+                search={"type": ("in", list(cls.ROUTE_MENU_TYPES)), "status": "0"},
+                order_by=[{"order": "asc"}, {"id": "asc"}],
+            )
+            nodes = {menu.id: MenuOutSchema.model_validate(menu).model_dump() for menu in menus}
+            cls._nodes = nodes
+            cls._order = tuple(nodes)
+            cls._role_trees = {}
+            cls._version = version
+            cls._loaded_at = time.monotonic()
+            log.info(f"菜单树缓存已加载: {len(nodes)} 个菜单, 版本 {version}")
+        return version
+
+    @classmethod
+    def _is_current(cls, version: str | None) -> bool:
+        """
+        本地缓存是否对应给定版本且未过期。
+
+        参数:
+        - version (str | None): Redis 中的版本号。
+
+        返回:
+        - bool: 可直接使用返回 True。
+        """
+        return (
+            cls._loaded_at > 0
+            and cls._version == version
+            and time.monotonic() - cls._loaded_at <= cls.LOCAL_CACHE_TTL
+        )
+
+    @classmethod
+    async def get_user_menu_tree(cls, auth: AuthSchema, redis: Redis) -> list[dict]:
+        """
+        获取当前用户的路由菜单树。
+
+        参数:
+        - auth (AuthSchema): 认证信息模型。
+        - redis (Redis): Redis 连接。
+
+        返回:
+        - list[dict]: 菜单树（共享对象，只读）。
+        """
+        if not auth.user:
+            return []
+        await cls._ensure_loaded(auth=auth, redis=redis)
+
+        roles = auth.user.roles or []
+        if auth.user.is_superuser:
+            key = cls.SUPERUSER_KEY
+        elif roles:
+            key = cls.role_key(role.id for role in roles)
+        else:
+            return []
+
+        tree = cls._role_trees.get(key)
+        if tree is not None:
+            return tree
+
+        if key == cls.SUPERUSER_KEY:
+            mask = None
+        else:
+            mask = {menu.id for role in roles for menu in role.menus}
+        tree = cls.build_tree(cls._nodes, cls._order, mask)
+
+        if len(cls._role_trees) >= cls.MAX_ROLE_TREES:
+            cls._role_trees = {}
+        cls._role_trees[key] = tree
+        return tree
+
+    @classmethod
+    async def invalidate(cls, redis: Redis) -> None:
+        """
+        菜单或角色权限变更后调用：递增缓存版本并清空本地缓存。
+
+        参数:
+        - redis (Redis): Redis 连接。
+
+        返回:
+        - None
+        """
+        cls._loaded_at = 0.0
+        cls._role_trees = {}
+        try:
+            await redis.incr(RedisInitKeyConfig.SYSTEM_MENU_VERSION.key)
+        except Exception as e:
+            log.error(f"更新菜单树缓存版本失败: {e!s}")
+
+    @classmethod
+    def invalidate_on_commit(cls, db: AsyncSession, redis: Redis) -> None:
+        """
+        在事务提交后使缓存失效；提交前失效会让并发请求把旧数据按新版本缓存。
+
+        参数:
+        - db (AsyncSession): 修改菜单或角色权限的数据库会话。
+        - redis (Redis): Redis 连接。
+
+        返回:
+        - None
+        """
+        after_commit(db, lambda: cls.invalidate(redis=redis))
@@ -303,18 +303,17 @@ class ParamsService:
                 if not config_obj:
                     raise CustomException(msg="系统配置不存在")
                 try:
-                    # 保存到Redis并设置过期时间
-                    for config in config_obj:
-                        redis_key = f"{RedisInitKeyConfig.SYSTEM_CONFIG.key}:{config.config_key}"
-                        config_obj_dict = ParamsOutSchema.model_validate(config).model_dump()
-                        value = json.dumps(config_obj_dict, ensure_ascii=False)
-                        result = await RedisCURD(redis).set(
-                            key=redis_key,
-                            value=value,
-                        )
-                        if not result:
-                            log.error(f"❌️ 初始化系统配置失败: {config_obj_dict}")
-                            raise CustomException(msg="初始化系统配置失败")
+                    # 通过一个 Redis 管道写入全部配置
+                    async with redis.pipeline(transaction=False) as pipe:
+                        for config in config_obj:
+                            redis_key = (
+                                f"{RedisInitKeyConfig.SYSTEM_CONFIG.key}:{config.config_key}"
+                            )
+                            config_obj_dict = ParamsOutSchema.model_validate(config).model_dump()
+                            pipe.set(redis_key, json.dumps(config_obj_dict, ensure_ascii=False))
+                        results = await pipe.execute()
+                    if not all(results):
+                        raise CustomException(msg="初始化系统配置失败")
                 except Exception as e:
                     log.error(f"❌️ 初始化系统配置失败: {e}")
                     raise CustomException(msg="初始化系统配置失败")
@@ -2,13 +2,14 @@ from typing import Annotated
 
 from fastapi import APIRouter, Body, Depends, Path
 from fastapi.responses import JSONResponse, StreamingResponse
+from redis.asyncio.client import Redis
 
 from app.api.v1.module_system.auth.schema import AuthSchema
 from app.common.request import PaginationService
 from app.common.response import StreamResponse, SuccessResponse
 from app.core.base_params import PaginationQueryParam
 from app.core.base_schema import BatchSetAvailable
-from app.core.dependencies import AuthPermission
+from app.core.dependencies import AuthPermission, redis_getter
 from app.core.logger import log
 from app.core.router_class import OperationLogRoute
 from app.utils.common_util import bytes2file_response
@@ -195,6 +196,7 @@ async def batch_set_available_obj_controller(
 async def set_role_permission_controller(
     data: RolePermissionSettingSchema,
     auth: Annotated[AuthSchema, Depends(AuthPermission(["module_system:role:permission"]))],
+    redis: Annotated[Redis, Depends(redis_getter)],
 ) -> JSONResponse:
     """
     角色授权
@@ -202,11 +204,12 @@ async def set_role_permission_controller(
     参数:
     - data (RolePermissionSettingSchema): 角色授权模型
     - auth (AuthSchema): 认证信息模型
+    - redis (Redis): Redis数据库连接
 
     返回:
     - JSONResponse: 角色授权JSON响应
     """
-    await RoleService.set_role_permission_service(data=data, auth=auth)
+    await RoleService.set_role_permission_service(data=data, auth=auth, redis=redis)
     log.info(f"设置角色权限成功: {data}")
     return SuccessResponse(msg="授权角色成功")
 
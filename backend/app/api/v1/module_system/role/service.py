@@ -1,6 +1,9 @@
 from typing import Any
 
+from redis.asyncio.client import Redis
+
 from app.api.v1.module_system.auth.schema import AuthSchema
+from app.api.v1.module_system.menu.tools.menu_tree import MenuTreeCache
 from app.core.base_schema import BatchSetAvailable
 from app.core.exceptions import CustomException
 from app.utils.excel_util import ExcelUtil
@@ -119,7 +122,7 @@ class RoleService:
 
     @classmethod
     async def set_role_permission_service(
-        cls, auth: AuthSchema, data: RolePermissionSettingSchema
+        cls, auth: AuthSchema, data: RolePermissionSettingSchema, redis: Redis
     ) -> None:
         """
         设置角色权限
@@ -127,6 +130,7 @@ class RoleService:
         参数:
         - auth (AuthSchema): 认证信息模型
         - data (RolePermissionSettingSchema): 角色权限设置模型
+        - redis (Redis): Redis数据库连接
 
         返回:
         - None
@@ -145,6 +149,9 @@ class RoleService:
         else:
             await RoleCRUD(auth).set_role_depts_crud(role_ids=data.role_ids, dept_ids=[])
 
+        # 角色菜单变更后使路由菜单树缓存失效
+        MenuTreeCache.invalidate_on_commit(db=auth.db, redis=redis)
+
     @classmethod
     async def set_role_available_service(cls, auth: AuthSchema, data: BatchSetAvailable) -> None:
         """
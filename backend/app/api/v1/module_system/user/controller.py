@@ -3,14 +3,14 @@ from typing import Annotated
 
 from fastapi import APIRouter, Body, Depends, Path, Request, UploadFile
 from fastapi.responses import JSONResponse, StreamingResponse
+from redis.asyncio.client import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.module_system.auth.schema import AuthSchema
-from app.common.request import PaginationService
 from app.common.response import StreamResponse, SuccessResponse
 from app.core.base_params import PaginationQueryParam
 from app.core.base_schema import BatchSetAvailable
-from app.core.dependencies import AuthPermission, db_getter, get_current_user
+from app.core.dependencies import AuthPermission, db_getter, get_current_user, redis_getter
 from app.core.logger import log
 from app.core.router_class import OperationLogRoute
 from app.utils.common_util import bytes2file_response
@@ -39,17 +39,19 @@ UserRouter = APIRouter(route_class=OperationLogRoute, prefix="/user", tags=["用
 )
 async def get_current_user_info_controller(
     auth: Annotated[AuthSchema, Depends(get_current_user)],
+    redis: Annotated[Redis, Depends(redis_getter)],
 ) -> JSONResponse:
     """
     查询当前用户信息
 
     参数:
     - auth (AuthSchema): 认证信息模型
+    - redis (Redis): Redis数据库连接
 
     返回:
     - JSONResponse: 当前用户信息JSON响应
     """
-    result_dict = await UserService.get_current_user_info_service(auth=auth)
+    result_dict = await UserService.get_current_user_info_service(auth=auth, redis=redis)
     log.info("获取当前用户信息成功")
     return SuccessResponse(data=result_dict, msg="获取当前用户信息成功")
 
@@ -225,16 +227,16 @@ async def get_obj_list_controller(
     返回:
     - JSONResponse: 分页查询结果JSON响应
     """
-    result_dict_list = await UserService.get_user_list_service(
-        search=search, auth=auth, order_by=page.order_by
-    )
-    result_dict = await PaginationService.paginate(
-        data_list=result_dict_list,
+    result_dict = await UserService.get_user_page_service(
+        auth=auth,
+        search=search,
         page_no=page.page_no,
         page_size=page.page_size,
+        order_by=page.order_by,
     )
     log.info("查询用户成功")
-    return SuccessResponse(data=result_dict, msg="查询用户成功")
+    # 只校验当前页的 ORM 对象并直接序列化
+    return SuccessResponse(data=result_dict, msg="查询用户成功", schema=UserOutSchema)
 
 
 @UserRouter.get(
@@ -1,19 +1,18 @@
 import io
 from typing import Any
 
-import pandas as pd
 from fastapi import UploadFile
+from redis.asyncio.client import Redis
 
 from app.api.v1.module_system.auth.schema import AuthSchema
 from app.api.v1.module_system.dept.crud import DeptCRUD
-from app.api.v1.module_system.menu.crud import MenuCRUD
-from app.api.v1.module_system.menu.schema import MenuOutSchema
+from app.api.v1.module_system.menu.tools.menu_tree import MenuTreeCache
 from app.api.v1.module_system.position.crud import PositionCRUD
 from app.api.v1.module_system.role.crud import RoleCRUD
+from app.common.request import PaginationService
 from app.core.base_schema import BatchSetAvailable, UploadResponseSchema
 from app.core.exceptions import CustomException
 from app.core.logger import log
-from app.utils.common_util import traversal_to_tree
 from app.utils.excel_util import ExcelUtil
 from app.utils.hash_bcrpy_util import PwdUtil
 from app.utils.upload_util import UploadUtil
@@ -86,6 +85,33 @@ class UserService:
 
         return user_dict_list
 
+    @classmethod
+    async def get_user_page_service(
+        cls,
+        auth: AuthSchema,
+        search: UserQueryParam,
+        page_no: int,
+        page_size: int,
+        order_by: list[dict[str, str]] | None = None,
+    ) -> dict:
+        """
+        分页查询用户
+
+        参数:
+        - auth (AuthSchema): 认证信息模型
+        - search (UserQueryParam): 查询参数对象。
+        - page_no (int): 页码
+        - page_size (int): 每页数量
+        - order_by (list[dict[str, str]] | None): 排序参数列表。
+
+        返回:
+        - dict: 分页数据，items 为 ORM 对象，由 SuccessResponse(schema=UserOutSchema) 序列化
+        """
+        user_list = await UserCRUD(auth).get_list_crud(search=search.__dict__, order_by=order_by)
+        return await PaginationService.paginate(
+            data_list=list(user_list), page_no=page_no, page_size=page_size
+        )
+
     @classmethod
     async def create_user_service(cls, data: UserCreateSchema, auth: AuthSchema) -> dict:
         """
@@ -245,12 +271,13 @@ class UserService:
         await UserCRUD(auth).delete(ids=ids)
 
     @classmethod
-    async def get_current_user_info_service(cls, auth: AuthSchema) -> dict:
+    async def get_current_user_info_service(cls, auth: AuthSchema, redis: Redis) -> dict:
         """
         获取当前用户信息
 
         参数:
         - auth (AuthSchema): 认证信息模型
+        - redis (Redis): Redis数据库连接
 
         返回:
         - Dict: 当前用户详情字典
@@ -264,37 +291,8 @@ class UserService:
             UserOutSchema.dept_name = user.dept.name
         user_dict = UserOutSchema.model_validate(user).model_dump()
 
-        # 获取菜单权限
-        if auth.user and auth.user.is_superuser:
-            # 使用树形结构查询，预加载children关系
-            menu_all = await MenuCRUD(auth).get_tree_list_crud(
-                search={"type": ("in", [1, 2, 4]), "status": "0"},
-                order_by=[{"order": "asc"}],
-            )
-            menus = [MenuOutSchema.model_validate(menu).model_dump() for menu in menu_all]
-
-        else:
-            # 收集用户所有角色的菜单ID，使用列表推导式优化代码
-            menu_ids = {
-                menu.id
-                for role in auth.user.roles or []
-                for menu in role.menus
-                if menu.status == "0" and menu.type in [1, 2, 4]
-            }
-
-            # 使用树形结构查询，预加载children关系
-            menus = (
-                [
-                    MenuOutSchema.model_validate(menu).model_dump()
-                    for menu in await MenuCRUD(auth).get_tree_list_crud(
-                        search={"id": ("in", list(menu_ids))},
-                        order_by=[{"order": "asc"}],
-                    )
-                ]
-                if menu_ids
-                else []
-            )
-        user_dict["menus"] = traversal_to_tree(menus)
+        # 获取菜单权限：超级管理员使用全量菜单树，其他用户按角色组合从缓存的全量菜单中掩码得到
+        user_dict["menus"] = await MenuTreeCache.get_user_menu_tree(auth=auth, redis=redis)
         return user_dict
 
     @classmethod
@@ -525,6 +523,9 @@ class UserService:
             "状态": "status",
         }
 
+        # pandas 导入耗时较长，读取 Excel 时才加载
+        import pandas as pd
+
         try:
             # 读取Excel文件
             contents = await file.read()
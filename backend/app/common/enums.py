@@ -44,11 +44,21 @@ class RedisInitKeyConfig(Enum):
     REFRESH_TOKEN = {"key": "refresh_token", "remark": "刷新令牌信息"}
     CAPTCHA_CODES = {"key": "captcha_codes", "remark": "图片验证码"}
     SYSTEM_CONFIG = {"key": "system_config", "remark": "系统配置"}
+    SYSTEM_CONFIG_WARMUP = {"key": "system_config_warmup", "remark": "系统配置缓存预热版本"}
     SYSTEM_DICT = {"key": "system_dict", "remark": "数据字典"}
+    SYSTEM_DICT_VERSION = {"key": "system_dict_version", "remark": "数据字典缓存版本"}
+    SYSTEM_DICT_WARMUP = {"key": "system_dict_warmup", "remark": "数据字典缓存预热版本"}
+    SYSTEM_MENU_VERSION = {"key": "system_menu_version", "remark": "菜单树缓存版本"}
+    GEN_SCHEMA_VERSION = {"key": "gen_schema_version", "remark": "代码生成表结构缓存版本"}
+    AI_CHAT_CACHE = {"key": "ai_chat_cache", "remark": "AI对话回答缓存"}
+    AI_CHAT_MEMORY = {"key": "ai_chat_memory", "remark": "AI对话会话上下文"}
     APSCHEDULER_LOCK_KEY = {
         "key": "scheduler_job_lock",
         "remark": "定时任务初始化锁",
     }
+    RESOURCE_INDEX = {"key": "resource_index", "remark": "静态资源索引版本与维护锁"}
+    RESOURCE_TASK = {"key": "resource_task", "remark": "资源后台任务状态与取消标记"}
+    LOG_PARTITION_LOCK = {"key": "log_partition_lock", "remark": "日志分区维护锁"}
 
     @property
     def key(self) -> str:
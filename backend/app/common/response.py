@@ -1,9 +1,11 @@
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
 from typing import Any
 
 from fastapi import status
 from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
+from pydantic_core import to_json
 from starlette.background import BackgroundTask
 
 from app.common.constant import RET
@@ -19,7 +21,67 @@ class ResponseSchema(BaseModel):
     success: bool = Field(default=True, description="操作是否成功")
 
 
-class SuccessResponse(JSONResponse):
+@lru_cache(maxsize=256)
+def _list_adapter(schema: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    """
+    获取（缓存）列表校验器。
+
+    参数:
+    - schema (type[BaseModel]): 数据模型。
+
+    返回:
+    - TypeAdapter[list[Any]]: list[schema] 校验器。
+    """
+    return TypeAdapter(list[schema])  # type: ignore[valid-type]
+
+
+def validate_data(data: Any, schema: type[BaseModel] | None = None) -> Any:
+    """
+    按数据模型校验响应数据（支持 ORM 对象），列表使用缓存的 TypeAdapter 一次性校验；
+    分页结果（含 items 的字典）只校验 items。
+
+    参数:
+    - data (Any): ORM 对象、字典、分页结果或其列表。
+    - schema (type[BaseModel] | None): 数据模型，为空时原样返回。
+
+    返回:
+    - Any: 模型实例、模型实例列表，或 items 已校验的分页结果。
+    """
+    if schema is None or data is None:
+        return data
+    if isinstance(data, Mapping) and "items" in data:
+        return {**data, "items": validate_data(data["items"], schema)}
+    if isinstance(data, Sequence) and not isinstance(data, (str, bytes, Mapping)):
+        return _list_adapter(schema).validate_python(data, from_attributes=True)
+    return schema.model_validate(data, from_attributes=True)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    单次序列化的 JSON 响应
+
+    使用 pydantic-core 直接把内容编码为 JSON 字节：内容中的 Pydantic 模型按其自身的序列化规则
+    （如 DateTimeStr）输出，datetime/date/Decimal/UUID/Enum 等原生支持，不再先 model_dump()
+    成字典再由 json.dumps 编码一遍。NaN/Infinity 输出为 null，保证是合法 JSON。
+    """
+
+    # 遇到无法识别的类型时是否输出其字符串形式（否则抛出异常）
+    serialize_unknown: bool = False
+
+    def render(self, content: Any) -> bytes:
+        """
+        编码响应内容。
+
+        参数:
+        - content (Any): 响应内容。
+
+        返回:
+        - bytes: JSON 字节。
+        """
+        return to_json(content, inf_nan_mode="null", serialize_unknown=self.serialize_unknown)
+
+
+class SuccessResponse(FastJSONResponse):
     """成功响应类"""
 
     def __init__(
@@ -29,33 +91,39 @@ class SuccessResponse(JSONResponse):
         code: int = RET.OK.code,
         status_code: int = status.HTTP_200_OK,
         success: bool = True,
+        schema: type[BaseModel] | None = None,
     ) -> None:
         """
         初始化成功响应类
 
         参数:
-        - data (Any | None): 响应数据。
+        - data (Any | None): 响应数据，可以是字典、Pydantic 模型，或配合 schema 传入 ORM 对象（列表）。
         - msg (str): 响应消息。
         - code (int): 业务状态码。
         - status_code (int): HTTP 状态码。
         - success (bool): 操作是否成功。
+        - schema (type[BaseModel] | None): 数据模型，传入时按该模型校验 data 后直接序列化。
 
         返回:
         - None
         """
-        content = ResponseSchema(
-            code=code,
-            msg=msg,
-            data=data,
-            status_code=status_code,
-            success=success,
-        ).model_dump()
+        # 信封字段与 ResponseSchema 一致，直接构造字典，避免对 data 做一次 model_dump 深拷贝
+        content = {
+            "code": code,
+            "msg": msg,
+            "data": validate_data(data, schema),
+            "status_code": status_code,
+            "success": success,
+        }
         super().__init__(content=content, status_code=status_code)
 
 
-class ErrorResponse(JSONResponse):
+class ErrorResponse(FastJSONResponse):
     """错误响应类"""
 
+    # 异常数据（如请求体）可能包含任意对象，不能因序列化失败掩盖原始错误
+    serialize_unknown = True
+
     def __init__(
         self,
         data: Any = None,
@@ -77,13 +145,13 @@ class ErrorResponse(JSONResponse):
         返回:
         - None
         """
-        content = ResponseSchema(
-            code=code,
-            msg=msg,
-            data=data,
-            status_code=status_code,
-            success=success,
-        ).model_dump()
+        content = {
+            "code": code,
+            "msg": msg,
+            "data": data,
+            "status_code": status_code,
+            "success": success,
+        }
         super().__init__(content=content, status_code=status_code)
 
 
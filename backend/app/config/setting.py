@@ -44,6 +44,8 @@ class Settings(BaseSettings):
     DOCS_URL: str = "/docs"  # Swagger UI路径
     REDOC_URL: str = "/redoc"  # ReDoc路径
     ROOT_PATH: str = "/api/v1"  # API路由前缀
+    ROUTE_MANIFEST_ENABLE: bool = True  # 是否缓存插件路由清单(插件目录无变化时跳过扫描)
+    ROUTE_MANIFEST_FILE: Path = BASE_DIR.joinpath(".route_manifest.json")  # 插件路由清单文件
 
     # ================================================= #
     # ******************** 日志配置 ******************** #
@@ -104,6 +106,7 @@ class Settings(BaseSettings):
     REDIS_DB_NAME: int = 1
     REDIS_USER: str = ""
     REDIS_PASSWORD: str = ""
+    STARTUP_WARMUP_TIMEOUT: int = 30  # 启动时等待其他 worker 完成缓存预热的最长时间(秒)
 
     # ================================================= #
     # ******************** 验证码配置 ******************* #
@@ -126,13 +129,44 @@ class Settings(BaseSettings):
         "HEAD",
         "OPTIONS",
     ]  # 需要记录的请求方法
-
-    # ================================================= #
-    # ******************* Gzip压缩配置 ******************* #
-    # ================================================= #
-    GZIP_ENABLE: bool = True  # 是否启用Gzip
-    GZIP_MIN_SIZE: int = 1000  # 最小压缩大小(字节)
-    GZIP_COMPRESS_LEVEL: int = 9  # 压缩级别(1-9)
+    LOG_PARTITION_ENABLE: bool = True  # 是否按月分区存储日志表
+    LOG_PARTITION_TABLES: dict[str, int] = {
+        "sys_log": 6,
+        "app_job_log": 3,
+    }  # 按月分区的日志表及保留月数(不含当月，0 表示不清理)
+    LOG_PARTITION_PREMAKE: int = 2  # 预先创建的未来月份分区数(MySQL/PostgreSQL)
+    LOG_PARTITION_INTERVAL: int = 86400  # 分区维护间隔(秒)
+    LOG_ARCHIVE_DIR: Path = BASE_DIR.joinpath("archive")  # 日志 Parquet 归档目录(不对外公开)
+    LOG_ARCHIVE_DAYS: int = 60  # 默认归档多少天之前的日志(应小于分区保留期，否则分区会先被删除)
+    LOG_ARCHIVE_BATCH_SIZE: int = 5000  # 归档时流式读取与写入的批大小
+    LOG_ARCHIVE_COMPRESSION: str = "zstd"  # Parquet 压缩算法
+
+    # ================================================= #
+    # ******************* 响应压缩配置 ******************* #
+    # ================================================= #
+    COMPRESS_ENABLE: bool = True  # 是否启用响应压缩
+    COMPRESS_MIN_SIZE: int = 1000  # 最小压缩大小(字节)
+    COMPRESS_ENCODINGS: list[str] = ["zstd", "br", "gzip"]  # 服务端优先顺序，未安装对应库的自动跳过
+    COMPRESS_SMALL_SIZE: int = 64 * 1024  # 不超过该大小使用较高压缩级别(字节)
+    COMPRESS_LARGE_SIZE: int = 1024 * 1024  # 超过该大小使用最快压缩级别，并在线程中压缩(字节)
+    COMPRESS_CPU_BUDGET: float = 0.25  # 每秒用于压缩的CPU时间上限(秒)，超出后降为最快级别
+    COMPRESS_EXCLUDE_TYPES: list[str] = [
+        "image/",
+        "video/",
+        "audio/",
+        "font/woff",
+        "text/event-stream",
+        "application/zip",
+        "application/gzip",
+        "application/x-7z-compressed",
+        "application/x-rar-compressed",
+        "application/vnd.openxmlformats-officedocument.",
+        "application/pdf",
+        "application/octet-stream",
+    ]  # 不压缩的媒体类型(前缀匹配，image/svg+xml 除外)
+    STATIC_PRECOMPRESS: bool = True  # 启动时为静态文本资源生成 .br/.gz 预压缩文件
+    STATIC_PRECOMPRESS_EXCLUDE: list[str] = ["upload"]  # 不预压缩的静态子目录
+    STATIC_PRECOMPRESS_DIR: Path = BASE_DIR.joinpath(".static_cache")  # 预压缩文件目录
 
     # ================================================= #
     # ***************** 静态文件配置 ***************** #
@@ -142,6 +176,13 @@ class Settings(BaseSettings):
     STATIC_DIR: str = "static"  # 目录名
     STATIC_ROOT: Path = BASE_DIR.joinpath(STATIC_DIR)  # 绝对路径
 
+    # ================================================= #
+    # ***************** 资源管理配置 ***************** #
+    # ================================================= #
+    RESOURCE_INDEX_ENABLE: bool = True  # 是否启用静态资源元数据索引
+    RESOURCE_INDEX_INTERVAL: int = 60  # 索引全量差异刷新间隔(秒)
+    RESOURCE_FS_WORKERS: int = 4  # 文件操作线程池大小
+
     # ================================================= #
     # ***************** 动态文件配置 ***************** #
     # ================================================= #
@@ -171,6 +212,10 @@ class Settings(BaseSettings):
         ".7z"
     ]
     MAX_FILE_SIZE: int = 200 * 1024 * 1024  # 最大文件大小(200MB)
+    UPLOAD_DEDUP_ENABLE: bool = True  # 是否按内容摘要去重存储上传文件
+    UPLOAD_BLOB_PATH: Path = BASE_DIR.joinpath("static/upload/blobs")  # 内容寻址(去重)存储目录
+    UPLOAD_TEMP_PATH: Path = BASE_DIR.joinpath(".upload_tmp")  # 上传临时目录(不在静态目录内)
+    UPLOAD_HASH_ALGORITHM: Literal["sha256", "blake2b"] = "sha256"  # 内容摘要算法
 
     # ================================================= #
     # ***************** Swagger配置 ***************** #
@@ -180,12 +225,59 @@ class Settings(BaseSettings):
     REDOC_JS_URL: str = "static/swagger/redoc/bundles/redoc.standalone.js"
     FAVICON_URL: str = "static/swagger/favicon.png"
 
+    # ================================================= #
+    # ***************** 外部HTTP请求配置 ***************** #
+    # ================================================= #
+    HTTP_TIMEOUT: float = 10.0  # 默认请求超时(秒)
+    HTTP_MAX_CONNECTIONS: int = 100  # 连接池最大连接数
+    HTTP_MAX_KEEPALIVE: int = 20  # 连接池最大空闲长连接数
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0  # 空闲长连接保持时间(秒)
+    HTTP_HOST_CONCURRENCY: int = 20  # 单个上游主机的最大并发请求数
+    HTTP_RETRY_TIMES: int = 2  # 幂等请求失败后的最大重试次数
+    HTTP_RETRY_BACKOFF: float = 0.2  # 重试退避基数(秒)，按 2^n 增长并加随机抖动
+    HTTP_RETRY_MAX_BACKOFF: float = 5.0  # 单次重试最大等待(秒)
+    HTTP_BREAKER_THRESHOLD: int = 5  # 连续失败多少次后熔断该上游
+    HTTP_BREAKER_COOLDOWN: float = 30.0  # 熔断持续时间(秒)，到期后放行试探请求
+
+    # ================================================= #
+    # ******************* 定时任务配置 ******************* #
+    # ================================================= #
+    SCHEDULER_INDEX_REFRESH: int = 300  # 任务状态索引全量刷新间隔(秒)，用于同步其他实例对任务的修改
+    JOB_LOCK_TTL: int = 30  # 任务执行锁租期(秒)，每 1/3 租期自动续约，失去租约时取消任务
+    JOB_EXECUTORS: dict[str, dict[str, Any]] = {
+        "default": {"type": "thread", "max_workers": 4, "max_queue": 100, "timeout": 3600},
+        "processpool": {"type": "process", "max_workers": 1, "max_queue": 10, "timeout": 7200},
+    }  # 同步任务执行池 {执行器名称: {类型 thread/process, 最大并发, 最大排队数, 单次执行超时(秒)}}
+
     # ================================================= #
     # ******************* AI大模型配置 ****************** #
     # ================================================= #
     OPENAI_BASE_URL: str = ""
     OPENAI_API_KEY: str = ""
     OPENAI_MODEL: str = ""
+    OPENAI_MAX_CONCURRENCY: int = 10  # 单个模型服务商的最大并发请求数
+    OPENAI_CACHE_ENABLE: bool = False  # 是否缓存相同提问的完整回答
+    OPENAI_CACHE_TTL: int = 60 * 60  # 回答缓存时间(秒)
+    AI_STREAM_FLUSH_INTERVAL: float = 0.03  # 流式输出合并发送的最长间隔(秒)
+    AI_STREAM_FLUSH_BYTES: int = 1024  # 流式输出缓冲达到该字节数时立即发送
+    AI_STREAM_QUEUE_SIZE: int = 256  # 待发送片段队列长度，满时暂停读取上游
+    AI_STREAM_SEND_TIMEOUT: float = 10.0  # 单帧发送超时(秒)，超时视为慢消费者并断开
+    AI_STREAM_MAX_PER_USER: int = 3  # 每个用户同时进行的对话连接数上限
+    AI_MEMORY_ENABLE: bool = True  # 是否保存多轮对话上下文(请求携带 session_id 时生效)
+    AI_MEMORY_TOKEN_BUDGET: int = 3000  # 每轮发送给模型的历史上下文(含摘要与本轮提问)token 上限
+    AI_MEMORY_TTL: int = 60 * 60 * 24  # 会话上下文在 Redis 中的保留时间(秒)
+    AI_MEMORY_LOAD_LIMIT: int = 100  # Redis 未命中时从数据库恢复的最近消息条数
+    AI_MEMORY_SUMMARY_ENABLE: bool = False  # 超出预算的早期消息是否由模型压缩为摘要(否则直接截断)
+    AI_MEMORY_SUMMARY_TOKENS: int = 500  # 摘要的 token 上限
+    MCP_CONNECT_TIMEOUT: float = 30.0  # 等待 MCP 服务器连接就绪的超时(秒)
+    MCP_CALL_TIMEOUT: float = 60.0  # 单次工具调用超时(秒)
+    MCP_MAX_CONCURRENCY: int = 8  # 单个 MCP 连接上同时进行的工具调用数上限
+    MCP_HEALTH_INTERVAL: float = 30.0  # 健康检查(ping)间隔(秒)
+    MCP_HEALTH_TIMEOUT: float = 10.0  # 健康检查超时(秒)，超时视为连接失效并重启
+    MCP_RESTART_BACKOFF: float = 1.0  # 连接失败后首次重启等待(秒)，按 2^n 增长
+    MCP_RESTART_MAX_BACKOFF: float = 60.0  # 重启最大等待(秒)
+    MCP_TOOLS_CACHE_TTL: int = 300  # list_tools 结果缓存时间(秒)
+    MCP_DRAIN_TIMEOUT: float = 30.0  # 重连/关闭时等待进行中调用完成的最长时间(秒)
 
     # ================================================= #
     # ******************* 请求限制配置 ****************** #
@@ -202,7 +294,7 @@ class Settings(BaseSettings):
         MIDDLEWARES: list[str | None] = [
             "app.core.middlewares.CustomCORSMiddleware" if self.CORS_ORIGIN_ENABLE else None,
             "app.core.middlewares.RequestLogMiddleware" if self.OPERATION_LOG_RECORD else None,
-            "app.core.middlewares.CustomGZipMiddleware" if self.GZIP_ENABLE else None,
+            "app.core.middlewares.CompressionMiddleware" if self.COMPRESS_ENABLE else None,
         ]
         return MIDDLEWARES
 
@@ -211,6 +303,13 @@ class Settings(BaseSettings):
         """获取事件列表"""
         EVENTS: list[str | None] = [
             "app.core.database.redis_connect" if self.REDIS_ENABLE else None,
+            "app.api.v1.module_monitor.resource.tools.resource_index.resource_index_event"
+            if self.REDIS_ENABLE and self.STATIC_ENABLE and self.RESOURCE_INDEX_ENABLE
+            else None,
+            "app.api.v1.module_monitor.resource.tools.resource_task.resource_task_event"
+            if self.STATIC_ENABLE
+            else None,
+            "app.core.partition.log_partition_event" if self.LOG_PARTITION_ENABLE else None,
         ]
         return EVENTS
 
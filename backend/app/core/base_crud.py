@@ -10,8 +10,11 @@ from sqlalchemy.sql.elements import ColumnElement
 
 from app.api.v1.module_system.auth.schema import AuthSchema
 from app.core.base_model import MappedBase
+from app.core.base_params import SortSpec
 from app.core.exceptions import CustomException
+from app.core.partition import LogPartition, period_bounds
 from app.core.permission import Permission
+from app.core.tree_path import TreePath
 
 if TYPE_CHECKING:
     from sqlalchemy.engine import Result
@@ -54,13 +57,14 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         - CustomException: 查询失败时抛出异常
         """
         try:
-            conditions = await self.__build_conditions(**kwargs)
-            sql = select(self.model).where(*conditions)
+            model = await LogPartition.source(self.auth.db, self.model, kwargs)
+            conditions = await self.__build_conditions(model, **kwargs)
+            sql = select(model).where(*conditions)
             # 应用可配置的预加载选项
-            for opt in self.__loader_options(preload):
+            for opt in self.__loader_options(preload, model):
                 sql = sql.options(opt)
 
-            sql = await self.__filter_permissions(sql)
+            sql = await self.__filter_permissions(sql, model)
 
             result: Result = await self.auth.db.execute(sql)
             obj = result.scalars().first()
@@ -89,13 +93,14 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         - CustomException: 查询失败时抛出异常
         """
         try:
-            conditions = await self.__build_conditions(**search) if search else []
+            model = await LogPartition.source(self.auth.db, self.model, search)
+            conditions = await self.__build_conditions(model, **search) if search else []
             order = order_by or [{"id": "asc"}]
-            sql = select(self.model).where(*conditions).order_by(*self.__order_by(order))
+            sql = select(model).where(*conditions).order_by(*self.__order_by(order, model))
             # 应用可配置的预加载选项
-            for opt in self.__loader_options(preload):
+            for opt in self.__loader_options(preload, model):
                 sql = sql.options(opt)
-            sql = await self.__filter_permissions(sql)
+            sql = await self.__filter_permissions(sql, model)
             result: Result = await self.auth.db.execute(sql)
             return result.scalars().all()
         except Exception as e:
@@ -124,9 +129,11 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         - CustomException: 查询失败时抛出异常
         """
         try:
-            conditions = await self.__build_conditions(**search) if search else []
+            conditions = await self.__build_conditions(self.model, **search) if search else []
             order = order_by or [{"id": "asc"}]
-            sql = select(self.model).where(*conditions).order_by(*self.__order_by(order))
+            sql = (
+                select(self.model).where(*conditions).order_by(*self.__order_by(order, self.model))
+            )
 
             # 处理预加载选项
             final_preload = preload
@@ -138,10 +145,10 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 final_preload = [*list(model_defaults), children_attr]
 
             # 应用预加载选项
-            for opt in self.__loader_options(final_preload):
+            for opt in self.__loader_options(final_preload, self.model):
                 sql = sql.options(opt)
 
-            sql = await self.__filter_permissions(sql)
+            sql = await self.__filter_permissions(sql, self.model)
             result: Result = await self.auth.db.execute(sql)
             return result.scalars().all()
         except Exception as e:
@@ -174,27 +181,29 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         - CustomException: 查询失败时抛出异常
         """
         try:
-            conditions = await self.__build_conditions(**search) if search else []
+            model = await LogPartition.source(self.auth.db, self.model, search)
+            conditions = await self.__build_conditions(model, **search) if search else []
             order = order_by or [{"id": "asc"}]
-            sql = select(self.model).where(*conditions).order_by(*self.__order_by(order))
+            sql = select(model).where(*conditions).order_by(*self.__order_by(order, model))
             # 应用预加载选项
-            for opt in self.__loader_options(preload):
+            for opt in self.__loader_options(preload, model):
                 sql = sql.options(opt)
-            sql = await self.__filter_permissions(sql)
+            sql = await self.__filter_permissions(sql, model)
 
             # 优化count查询：使用主键计数而非全表扫描
             mapper = sa_inspect(self.model)
             pk_cols = list(getattr(mapper, "primary_key", []))
             if pk_cols:
                 # 使用主键的第一列进行计数（主键必定非NULL，性能更好）
-                count_sql = select(func.count(pk_cols[0])).select_from(self.model)
+                pk_attr = getattr(model, mapper.get_property_by_column(pk_cols[0]).key)
+                count_sql = select(func.count(pk_attr)).select_from(model)
             else:
                 # 降级方案：使用count(*)
-                count_sql = select(func.count()).select_from(self.model)
+                count_sql = select(func.count()).select_from(model)
 
             if conditions:
                 count_sql = count_sql.where(*conditions)
-            count_sql = await self.__filter_permissions(count_sql)
+            count_sql = await self.__filter_permissions(count_sql, model)
 
             total_result = await self.auth.db.execute(count_sql)
             total = total_result.scalar() or 0
@@ -238,6 +247,9 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
             self.auth.db.add(obj)
             await self.auth.db.flush()
+            # 树形表维护物化路径
+            if hasattr(obj, "tree_path"):
+                await TreePath.on_create(self.auth.db, obj)
             await self.auth.db.refresh(obj)
             return obj
         except Exception as e:
@@ -272,11 +284,23 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             if self.auth.user and hasattr(obj, "updated_id"):
                 setattr(obj, "updated_id", self.auth.user.id)
 
+            # 树形表记录修改前的父级与路径
+            tree_state = (
+                (obj.parent_id, obj.tree_path)  # pyright: ignore[reportAttributeAccessIssue]
+                if hasattr(obj, "tree_path")
+                else None
+            )
+
             for key, value in obj_dict.items():
                 if hasattr(obj, key):
                     setattr(obj, key, value)
 
             await self.auth.db.flush()
+            if tree_state is not None and (
+                obj.parent_id != tree_state[0]  # pyright: ignore[reportAttributeAccessIssue]
+                or obj.tree_path is None  # pyright: ignore[reportAttributeAccessIssue]
+            ):
+                await TreePath.on_move(self.auth.db, obj, old_path=tree_state[1])
             # 刷新对象时不自动预加载关系
             await self.auth.db.refresh(obj)
 
@@ -313,6 +337,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             # 只删除有权限的数据
             sql = delete(self.model).where(pk_cols[0].in_(ids))
             await self.auth.db.execute(sql)
+            await LogPartition.delete_archived(self.auth.db, self.model, ids)
             await self.auth.db.flush()
         except Exception as e:
             raise CustomException(msg=f"删除失败: {e!s}")
@@ -327,6 +352,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         try:
             sql = delete(self.model)
             await self.auth.db.execute(sql)
+            await LogPartition.clear_archived(self.auth.db, self.model)
             await self.auth.db.flush()
         except Exception as e:
             raise CustomException(msg=f"清空失败: {e!s}")
@@ -359,18 +385,19 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         except Exception as e:
             raise CustomException(msg=f"批量更新失败: {e!s}")
 
-    async def __filter_permissions(self, sql: Select) -> Select:
+    async def __filter_permissions(self, sql: Select, model: Any) -> Select:
         """
         过滤数据权限（仅用于Select）。
         """
-        filter = Permission(model=self.model, auth=self.auth)
+        filter = Permission(model=model, auth=self.auth)
         return await filter.filter_query(sql)
 
-    async def __build_conditions(self, **kwargs) -> builtins.list[ColumnElement]:
+    async def __build_conditions(self, model: Any, /, **kwargs) -> builtins.list[ColumnElement]:
         """
         构建查询条件
 
         参数:
+        - model (Any): 查询实体（模型类，或分区日志表在 SQLite 下的联合别名）
         - **kwargs: 查询参数
 
         返回:
@@ -384,17 +411,20 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             if value is None or value == "":
                 continue
 
-            attr = getattr(self.model, key)
+            attr = getattr(model, key)
             if isinstance(value, tuple):
                 seq, val = value
                 if seq == "None":
                     conditions.append(attr.is_(None))
                 elif seq == "not None":
                     conditions.append(attr.isnot(None))
-                elif seq == "date" and val:
-                    conditions.append(func.date_format(attr, "%Y-%m-%d") == val)
-                elif seq == "month" and val:
-                    conditions.append(func.date_format(attr, "%Y-%m") == val)
+                elif seq in ("date", "month") and val:
+                    # 转换为区间条件，可走索引并让分区表裁剪分区
+                    bounds = period_bounds(seq, val)
+                    if bounds is None:
+                        raise CustomException(msg=f"日期格式错误: {val}")
+                    conditions.append(attr >= bounds[0])
+                    conditions.append(attr < bounds[1])
                 elif seq == "like" and val:
                     conditions.append(attr.like(f"%{val}%"))
                 elif seq == "in" and val:
@@ -417,12 +447,15 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 conditions.append(attr == value)
         return conditions
 
-    def __order_by(self, order_by: builtins.list[dict[str, str]]) -> builtins.list[ColumnElement]:
+    def __order_by(
+        self, order_by: builtins.list[dict[str, str]], model: Any
+    ) -> builtins.list[ColumnElement]:
         """
         获取排序字段
 
         参数:
         - order_by (List[Dict[str, str]]): 排序字段列表,格式为 [{'id': 'asc'}, {'name': 'desc'}]
+        - model (Any): 查询实体
 
         返回:
         - List[ColumnElement]: 排序字段列表
@@ -430,21 +463,24 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         异常:
         - CustomException: 排序字段不存在时抛出异常
         """
+        descriptors = sa_inspect(self.model).all_orm_descriptors
         columns = []
-        for order in order_by:
-            for field, direction in order.items():
-                column = getattr(self.model, field)
-                columns.append(desc(column) if direction.lower() == "desc" else asc(column))
+        for item in SortSpec.parse(order_by):
+            if item.field not in descriptors:
+                raise CustomException(msg=f"排序字段不存在: {item.field}")
+            column = getattr(model, item.field)
+            columns.append(desc(column) if item.descending else asc(column))
         return columns
 
     def __loader_options(
-        self, preload: builtins.list[str | Any] | None = None
+        self, preload: builtins.list[str | Any] | None = None, model: Any = None
     ) -> builtins.list[Any]:
         """
         构建预加载选项
 
         参数:
         - preload (Optional[List[Union[str, Any]]]): 预加载关系，支持关系名字符串或SQLAlchemy loader option
+        - model (Any): 查询实体，默认为模型类
 
         返回:
         - List[Any]: 预加载选项列表
@@ -492,10 +528,11 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                     options.append(opt)
         
         # 🔥 修复：确保所有字符串类型的关系都使用selectinload
+        entity = self.model if model is None else model
         for opt in all_preloads:
-            if hasattr(self.model, opt):
+            if hasattr(entity, opt):
                 # 获取关系的属性
-                rel_attr = getattr(self.model, opt)
+                rel_attr = getattr(entity, opt)
                 # 使用selectinload，这是异步环境中最安全的选择
                 options.append(selectinload(rel_attr))
 
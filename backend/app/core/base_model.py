@@ -112,6 +112,25 @@ class ModelMixin(MappedBase):
     )
 
 
+class TreePathMixin(MappedBase):
+    """
+    树形物化路径 Mixin
+
+    用于具有 parent_id 的树形表，tree_path 形如 "/1/4/9/"（根到自身的ID），
+    由 CRUDBase 在新建/修改父级时通过 TreePath 维护，子树过滤为单个前缀匹配。
+    """
+
+    __abstract__: bool = True
+
+    tree_path: Mapped[str | None] = mapped_column(
+        String(255),
+        default=None,
+        nullable=True,
+        index=True,
+        comment="物化路径(/根ID/.../自身ID/)",
+    )
+
+
 class UserMixin(MappedBase):
     """
     用户审计字段 Mixin
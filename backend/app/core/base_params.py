@@ -1,10 +1,125 @@
+import ast
 import json
+import re
+from collections.abc import Collection, Iterator
+from typing import Any, NamedTuple
 
 from fastapi import Query
 
+from app.core.exceptions import CustomException
 from app.core.validator import DateTimeStr
 
 
+class SortField(NamedTuple):
+    """单个排序字段"""
+
+    field: str
+    descending: bool = False
+
+
+class SortSpec:
+    """
+    排序规格
+
+    统一解析 order_by 参数（不执行任何代码），支持以下格式：
+    - [{'name': 'asc'}, {'size': 'desc'}]，可为列表或其 JSON / Python 字面量字符串
+    - [{'field': 'name', 'direction': 'desc'}]
+    - 'name,asc;size,desc'
+    """
+
+    FIELD_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+    def __init__(self, fields: list[SortField] | None = None) -> None:
+        """
+        初始化排序规格。
+
+        参数:
+        - fields (list[SortField] | None): 排序字段列表，按优先级排列。
+        """
+        self.fields = fields or []
+
+    def __iter__(self) -> Iterator[SortField]:
+        return iter(self.fields)
+
+    def __bool__(self) -> bool:
+        return bool(self.fields)
+
+    def __repr__(self) -> str:
+        return f"SortSpec({self.to_list()!r})"
+
+    @classmethod
+    def parse(
+        cls, order_by: str | list[Any] | None, allowed: Collection[str] | None = None
+    ) -> "SortSpec":
+        """
+        解析并校验排序参数。
+
+        参数:
+        - order_by (str | list[Any] | None): 排序参数，为空时返回空规格。
+        - allowed (Collection[str] | None): 允许的排序字段，None 表示只校验字段名格式。
+
+        返回:
+        - SortSpec: 排序规格。
+
+        异常:
+        - CustomException: 格式错误、排序方向非法或字段不被允许时抛出。
+        """
+        if not order_by:
+            return cls()
+
+        items: Any = order_by
+        if isinstance(order_by, str):
+            text = order_by.strip()
+            if text.startswith(("[", "{")):
+                try:
+                    items = json.loads(text)
+                except ValueError:
+                    try:
+                        items = ast.literal_eval(text)
+                    except (ValueError, SyntaxError):
+                        raise CustomException(msg=f"排序参数格式错误: {order_by}")
+            else:
+                items = [
+                    dict([part.split(",", 1) if "," in part else (part, "asc")])
+                    for part in text.split(";")
+                    if part.strip()
+                ]
+        if isinstance(items, dict):
+            items = [items]
+        if not isinstance(items, list):
+            raise CustomException(msg=f"排序参数格式错误: {order_by}")
+
+        fields = []
+        for item in items:
+            if not isinstance(item, dict):
+                raise CustomException(msg=f"排序参数格式错误: {item}")
+            pairs = (
+                [(item["field"], item.get("direction", "asc"))]
+                if "field" in item
+                else list(item.items())
+            )
+            for field, direction in pairs:
+                field = str(field).strip()
+                direction = str(direction).strip().lower()
+                if not cls.FIELD_PATTERN.match(field):
+                    raise CustomException(msg=f"排序字段不合法: {field}")
+                if allowed is not None and field not in allowed:
+                    raise CustomException(msg=f"不支持的排序字段: {field}")
+                if direction not in ("asc", "desc"):
+                    raise CustomException(msg=f"排序方向不合法: {direction}")
+                fields.append(SortField(field=field, descending=direction == "desc"))
+        return cls(fields)
+
+    def to_list(self) -> list[dict[str, str]]:
+        """
+        转换为 [{'field': 'asc'}] 格式。
+
+        返回:
+        - list[dict[str, str]]: 排序字段列表。
+        """
+        return [{item.field: "desc" if item.descending else "asc"} for item in self.fields]
+
+
 class PaginationQueryParam:
     """分页查询参数基类"""
 
@@ -31,14 +146,12 @@ class PaginationQueryParam:
         self.page_no = page_no
         self.page_size = page_size
         # 将字符串格式的order_by转换为服务层需要的List[Dict[str, str]]格式
-        if order_by:
-            try:
-                self.order_by = json.loads(order_by)
-            except ValueError:
-                # 如果解析失败，使用默认排序
-                self.order_by = [{"updated_time": "desc"}]
-        else:
-            self.order_by = [{"updated_time": "desc"}]
+        try:
+            spec = SortSpec.parse(order_by)
+        except CustomException:
+            # 如果解析失败，使用默认排序
+            spec = None
+        self.order_by = spec.to_list() if spec else [{"updated_time": "desc"}]
 
 
 class BaseQueryParam:
@@ -88,3 +201,26 @@ class CommonQueryParam:
             self.created_id = ("eq", created_id)
         if updated_id:
             self.updated_id = ("eq", updated_id)
+
+
+def has_active_filter(search: Any) -> bool:
+    """
+    判断查询参数对象是否包含生效的过滤条件（与 CRUDBase 构建查询条件时跳过空值的规则一致）。
+
+    参数:
+    - search (Any): 查询参数对象（如 DeptQueryParam），属性值为条件值或 (操作符, 值) 元组。
+
+    返回:
+    - bool: 至少有一个字段会生成查询条件时返回 True。
+    """
+    if search is None:
+        return False
+    for value in vars(search).values():
+        if value is None or value == "":
+            continue
+        if isinstance(value, tuple):
+            operator, val = value
+            if operator not in ("None", "not None") and val in (None, "", [], ()):
+                continue
+        return True
+    return False
@@ -0,0 +1,342 @@
+import gzip
+import mimetypes
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+from app.config.setting import settings
+from app.core.logger import log
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def _gzip_compress(data: bytes, level: int) -> bytes:
+    # mtime=0 保证同一内容的压缩结果稳定，便于缓存
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+def _brotli_compress(data: bytes, level: int) -> bytes:
+    return brotli.compress(data, quality=level)
+
+
+def _zstd_compress(data: bytes, level: int) -> bytes:
+    return zstandard.ZstdCompressor(level=level).compress(data)
+
+
+# {编码: 压缩函数}，未安装对应库的编码不可用
+CODECS: dict[str, Callable[[bytes, int], bytes]] = {"gzip": _gzip_compress}
+if brotli is not None:
+    CODECS["br"] = _brotli_compress
+if zstandard is not None:
+    CODECS["zstd"] = _zstd_compress
+
+# {编码: (小响应级别, 中等响应级别, 大响应/超出CPU预算时的级别)}
+LEVELS: dict[str, tuple[int, int, int]] = {
+    "gzip": (6, 4, 1),
+    "br": (5, 4, 1),
+    "zstd": (6, 3, 1),
+}
+
+# 预压缩静态文件使用的编码、文件后缀与级别（只在启动或部署时执行一次，使用最高级别）
+STATIC_ENCODINGS: dict[str, tuple[str, int]] = {"br": (".br", 11), "gzip": (".gz", 9)}
+
+# 值得预压缩的静态文件后缀
+STATIC_SUFFIXES = frozenset({
+    ".css",
+    ".csv",
+    ".htm",
+    ".html",
+    ".js",
+    ".json",
+    ".map",
+    ".md",
+    ".mjs",
+    ".svg",
+    ".txt",
+    ".wasm",
+    ".xml",
+})
+
+
+class _CpuBudget:
+    """
+    压缩耗时预算：统计最近 1 秒内用于压缩的时间，超过 COMPRESS_CPU_BUDGET 时后续响应降为最快级别
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._window = 0.0
+        self._used = 0.0
+
+    def exceeded(self) -> bool:
+        """当前窗口是否已超出预算"""
+        with self._lock:
+            if time.monotonic() - self._window >= 1.0:
+                return False
+            return self._used >= settings.COMPRESS_CPU_BUDGET
+
+    def record(self, seconds: float) -> None:
+        """
+        记录一次压缩耗时。
+
+        参数:
+        - seconds (float): 耗时(秒)。
+
+        返回:
+        - None
+        """
+        now = time.monotonic()
+        with self._lock:
+            if now - self._window >= 1.0:
+                self._window = now
+                self._used = 0.0
+            self._used += seconds
+
+
+cpu_budget = _CpuBudget()
+
+
+def negotiate_encoding(accept_encoding: str, encodings: Iterable[str] | None = None) -> str | None:
+    """
+    根据请求头 Accept-Encoding 选择编码：取客户端权重(q)最高者，权重相同时按服务端优先顺序。
+
+    参数:
+    - accept_encoding (str): Accept-Encoding 请求头。
+    - encodings (Iterable[str] | None): 候选编码（按服务端优先顺序），默认 COMPRESS_ENCODINGS 中已安装的编码。
+
+    返回:
+    - str | None: 选中的编码，客户端不接受任何候选编码时返回 None。
+    """
+    if not accept_encoding:
+        return None
+    if encodings is None:
+        encodings = [name for name in settings.COMPRESS_ENCODINGS if name in CODECS]
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.partition(";")
+        weight = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[name.strip().lower()] = weight
+    best, best_weight = None, 0.0
+    for name in encodings:
+        weight = weights.get(name, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = name, weight
+    return best
+
+
+def is_compressible(content_type: str) -> bool:
+    """
+    判断媒体类型是否值得压缩（图片、音视频、压缩包、Office 文档等本身已压缩的类型除外，SVG 除外）。
+
+    参数:
+    - content_type (str): Content-Type 响应头。
+
+    返回:
+    - bool: 是否压缩。
+    """
+    media_type = content_type.partition(";")[0].strip().lower()
+    if media_type == "image/svg+xml":
+        return True
+    return not media_type.startswith(tuple(settings.COMPRESS_EXCLUDE_TYPES))
+
+
+def choose_level(encoding: str, size: int) -> int:
+    """
+    按响应大小与 CPU 预算选择压缩级别。
+
+    参数:
+    - encoding (str): 编码。
+    - size (int): 响应体大小(字节)。
+
+    返回:
+    - int: 压缩级别。
+    """
+    small, medium, fast = LEVELS[encoding]
+    if size > settings.COMPRESS_LARGE_SIZE or cpu_budget.exceeded():
+        return fast
+    return small if size <= settings.COMPRESS_SMALL_SIZE else medium
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """
+    压缩响应体并计入 CPU 预算。
+
+    参数:
+    - data (bytes): 原始内容。
+    - encoding (str): 编码。
+
+    返回:
+    - bytes: 压缩后的内容。
+    """
+    started = time.perf_counter()
+    try:
+        return CODECS[encoding](data, choose_level(encoding, len(data)))
+    finally:
+        cpu_budget.record(time.perf_counter() - started)
+
+
+def precompressed_path(cache_dir: Path, relative: str, suffix: str) -> Path:
+    """
+    预压缩文件路径：缓存目录下与静态文件相同的相对路径加编码后缀。
+
+    参数:
+    - cache_dir (Path): 预压缩文件目录。
+    - relative (str): 静态文件相对静态根目录的路径。
+    - suffix (str): 编码后缀（.br/.gz）。
+
+    返回:
+    - Path: 预压缩文件路径。
+    """
+    return cache_dir / f"{relative}{suffix}"
+
+
+def precompress_static(
+    root: Path, cache_dir: Path | None = None, exclude: Iterable[str] | None = None
+) -> int:
+    """
+    为静态目录中的文本类资源生成 .br/.gz 预压缩文件（只处理新增或已修改的文件）。
+
+    预压缩文件写入 cache_dir，不修改静态目录本身。
+
+    参数:
+    - root (Path): 静态文件根目录。
+    - cache_dir (Path | None): 预压缩文件目录，默认 STATIC_PRECOMPRESS_DIR。
+    - exclude (Iterable[str] | None): 跳过的子目录（相对根目录），默认 STATIC_PRECOMPRESS_EXCLUDE。
+
+    返回:
+    - int: 新生成的预压缩文件数。
+    """
+    if cache_dir is None:
+        cache_dir = settings.STATIC_PRECOMPRESS_DIR
+    if exclude is None:
+        exclude = settings.STATIC_PRECOMPRESS_EXCLUDE
+    # 缓存目录配置在静态目录内时不压缩其中的文件
+    excluded = {(root / name).resolve() for name in exclude} | {cache_dir.resolve()}
+    encodings = [(name, *STATIC_ENCODINGS[name]) for name in STATIC_ENCODINGS if name in CODECS]
+    written = 0
+    for dirpath, dirnames, filenames in os.walk(root):
+        current = Path(dirpath)
+        dirnames[:] = [name for name in dirnames if (current / name).resolve() not in excluded]
+        for filename in filenames:
+            source = current / filename
+            if source.suffix.lower() not in STATIC_SUFFIXES:
+                continue
+            try:
+                stat_result = source.stat()
+                if stat_result.st_size < settings.COMPRESS_MIN_SIZE:
+                    continue
+                data = None
+                relative = source.relative_to(root).as_posix()
+                for name, suffix, level in encodings:
+                    target = precompressed_path(cache_dir, relative, suffix)
+                    if target.exists() and target.stat().st_mtime >= stat_result.st_mtime:
+                        continue
+                    if data is None:
+                        data = source.read_bytes()
+                    compressed = CODECS[name](data, level)
+                    if len(compressed) >= len(data):
+                        target.unlink(missing_ok=True)
+                        continue
+                    # 先写临时文件再替换，避免请求读到写了一半的文件
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+                    tmp.write_bytes(compressed)
+                    os.replace(tmp, target)
+                    written += 1
+            except OSError as e:
+                log.warning(f"预压缩静态文件 {source} 失败: {e!s}")
+    return written
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    静态文件服务：客户端支持时直接返回预压缩目录中的 .br/.gz 文件（需比原文件新），不在请求时压缩
+    """
+
+    def __init__(self, *args: Any, cache_dir: Path | None = None, **kwargs: Any) -> None:
+        """
+        初始化静态文件服务。
+
+        参数:
+        - cache_dir (Path | None): 预压缩文件目录，默认 STATIC_PRECOMPRESS_DIR。
+        - 其余参数同 StaticFiles。
+        """
+        super().__init__(*args, **kwargs)
+        self.cache_dir = settings.STATIC_PRECOMPRESS_DIR if cache_dir is None else cache_dir
+
+    def file_response(
+        self,
+        full_path: str | os.PathLike[str],
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        accept_encoding = request_headers.get("accept-encoding", "")
+        encodings = [name for name in STATIC_ENCODINGS if name in CODECS]
+        relative = self._relative_path(full_path)
+        while (
+            relative is not None
+            and (encoding := negotiate_encoding(accept_encoding, encodings)) is not None
+        ):
+            encodings.remove(encoding)
+            sibling = precompressed_path(self.cache_dir, relative, STATIC_ENCODINGS[encoding][0])
+            try:
+                sibling_stat = os.stat(sibling)
+            except OSError:
+                continue
+            # 原文件更新后、重新预压缩前，仍返回原文件
+            if sibling_stat.st_mtime < stat_result.st_mtime:
+                continue
+            response = FileResponse(
+                sibling,
+                status_code=status_code,
+                stat_result=sibling_stat,
+                media_type=mimetypes.guess_type(os.fspath(full_path))[0] or "text/plain",
+                headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"},
+            )
+            if self.is_not_modified(response.headers, request_headers):
+                return NotModifiedResponse(response.headers)
+            return response
+        return super().file_response(full_path, stat_result, scope, status_code)
+
+    def _relative_path(self, full_path: str | os.PathLike[str]) -> str | None:
+        """
+        计算文件相对静态根目录的路径（与 precompress_static 的相对路径一致）。
+
+        参数:
+        - full_path (str | os.PathLike[str]): 文件绝对路径。
+
+        返回:
+        - str | None: 相对路径，不在静态根目录（如 packages 目录）中时返回 None。
+        """
+        if self.directory is None:
+            return None
+        root = os.path.realpath(self.directory)
+        path = os.fspath(full_path)
+        if os.path.commonpath([root, path]) != root:
+            return None
+        return Path(os.path.relpath(path, root)).as_posix()
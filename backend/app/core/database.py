@@ -1,3 +1,6 @@
+from collections.abc import Awaitable, Callable
+from typing import Any
+
 from fastapi import FastAPI
 from redis import exceptions
 from redis.asyncio import Redis
@@ -107,6 +110,43 @@ engine, db_session = create_engine_and_session(settings.DB_URI)
 async_engine, async_db_session = create_async_engine_and_session(settings.ASYNC_DB_URI)
 
 
+# 会话 info 中登记提交后回调的键
+AFTER_COMMIT_KEY = "after_commit"
+
+
+def after_commit(session: AsyncSession, func: Callable[[], Awaitable[Any]]) -> None:
+    """
+    登记事务提交后执行的回调（删除文件、清除缓存等不可回滚的操作）。
+
+    由 db_getter 在事务成功提交后依次执行，事务回滚时丢弃。
+
+    参数:
+    - session (AsyncSession): 当前数据库会话。
+    - func (Callable[[], Awaitable[Any]]): 回调函数。
+
+    返回:
+    - None
+    """
+    session.info.setdefault(AFTER_COMMIT_KEY, []).append(func)
+
+
+async def run_after_commit(session: AsyncSession) -> None:
+    """
+    执行并清空会话中登记的提交后回调，单个回调失败只记录日志。
+
+    参数:
+    - session (AsyncSession): 已提交的数据库会话。
+
+    返回:
+    - None
+    """
+    for func in session.info.pop(AFTER_COMMIT_KEY, []):
+        try:
+            await func()
+        except Exception as e:
+            log.error(f"❌ 提交后回调执行失败: {e!s}")
+
+
 async def create_tables() -> None:
     """创建数据库表"""
     async with async_engine.begin() as coon:
@@ -10,7 +10,7 @@ from app.api.v1.module_system.auth.schema import AuthSchema
 from app.api.v1.module_system.user.crud import UserCRUD
 from app.api.v1.module_system.user.model import UserModel
 from app.common.enums import RedisInitKeyConfig
-from app.core.database import async_db_session
+from app.core.database import async_db_session, run_after_commit
 from app.core.exceptions import CustomException
 from app.core.logger import log
 from app.core.redis_crud import RedisCURD
@@ -26,6 +26,7 @@ async def db_getter() -> AsyncGenerator[AsyncSession, None]:
     async with async_db_session() as session:
         async with session.begin():
             yield session
+        await run_after_commit(session)
 
 
 async def redis_getter(request: Request) -> Redis:
@@ -40,22 +41,21 @@ async def redis_getter(request: Request) -> Redis:
     return request.app.state.redis
 
 
-async def get_current_user(
-    request: Request,
-    db: AsyncSession = Depends(db_getter),
-    redis: Redis = Depends(redis_getter),
-    token: str = Depends(OAuth2Schema),
-) -> AuthSchema:
-    """获取当前用户
+async def authenticate_token(token: str, db: AsyncSession, redis: Redis) -> AuthSchema:
+    """校验访问令牌并加载当前用户（HTTP 接口与 WebSocket 共用）
+
+    拒绝刷新令牌、已下线（退出登录、被强制下线）的会话，以及不存在或已停用的用户。
 
     参数:
-    - request (Request): 请求对象
+    - token (str): 访问令牌（可带 Bearer 前缀）
     - db (AsyncSession): 数据库会话
     - redis (Redis): Redis连接
-    - token (str): 访问令牌
 
     返回:
     - AuthSchema: 认证信息模型
+
+    异常:
+    - CustomException: 令牌无效或用户不可用
     """
     if not token:
         raise CustomException(msg="认证已失效", code=10401, status_code=401)
@@ -103,10 +103,6 @@ async def get_current_user(
     if user.status == "1":
         raise CustomException(msg="用户已被停用", code=10401, status_code=401)
 
-    # 设置请求上下文
-    request.scope["user_id"] = user.id
-    request.scope["user_username"] = user.username
-
     # 过滤可用的角色和职位
     if hasattr(user, "roles"):
         user.roles = [role for role in user.roles if role and role.status]
@@ -117,6 +113,31 @@ async def get_current_user(
     return auth
 
 
+async def get_current_user(
+    request: Request,
+    db: AsyncSession = Depends(db_getter),
+    redis: Redis = Depends(redis_getter),
+    token: str = Depends(OAuth2Schema),
+) -> AuthSchema:
+    """获取当前用户
+
+    参数:
+    - request (Request): 请求对象
+    - db (AsyncSession): 数据库会话
+    - redis (Redis): Redis连接
+    - token (str): 访问令牌
+
+    返回:
+    - AuthSchema: 认证信息模型
+    """
+    auth = await authenticate_token(token, db, redis)
+
+    # 设置请求上下文
+    request.scope["user_id"] = auth.user.id
+    request.scope["user_username"] = auth.user.username
+    return auth
+
+
 class AuthPermission:
     """权限验证类"""
 
@@ -5,18 +5,180 @@
 - 扫描 `app.plugin` 下所有以 `module_` 开头的顶级目录
 - 在各模块任意子目录下的 `controller.py` 中定义的 `APIRouter` 实例会自动被注册
 - 顶级目录 `module_xxx` 会映射为容器路由前缀 `/<xxx>`
+
+路由清单缓存：
+- 扫描结果（控制器模块、前缀、APIRouter 变量名）写入 ROUTE_MANIFEST_FILE，
+  同时记录插件目录与控制器文件的修改时间
+- 再次启动时只需检查这些修改时间，全部未变化则直接按清单导入，不再遍历目录与 dir() 扫描模块
+- 新增/删除目录或文件会改变所在目录的修改时间，清单随之失效并重新扫描
 """
 
 # 标准库导入
 import importlib
+import json
+import os
 from pathlib import Path
+from typing import Any
 
 # 第三方库导入
 from fastapi import APIRouter
 
 # 内部库导入
+from app.config.setting import settings
 from app.core.logger import log
 
+# 清单格式版本，结构变化时递增使旧清单失效
+MANIFEST_VERSION = 1
+
+
+def _snapshot(base_dir: Path, controller_files: list[Path]) -> dict[str, int]:
+    """
+    记录插件目录（不含 __pycache__）与控制器文件的修改时间。
+
+    参数:
+    - base_dir (Path): app.plugin 包目录。
+    - controller_files (list[Path]): 控制器文件。
+
+    返回:
+    - dict[str, int]: {相对路径: 修改时间(纳秒)}。
+    """
+    entries = {".": base_dir.stat().st_mtime_ns}
+    for top in sorted(base_dir.glob("module_*")):
+        if not top.is_dir():
+            continue
+        for dirpath, dirnames, _ in os.walk(top):
+            dirnames[:] = sorted(name for name in dirnames if name != "__pycache__")
+            current = Path(dirpath)
+            entries[current.relative_to(base_dir).as_posix()] = current.stat().st_mtime_ns
+    for file in controller_files:
+        entries[file.relative_to(base_dir).as_posix()] = file.stat().st_mtime_ns
+    return entries
+
+
+def _load_manifest(base_dir: Path) -> list[dict[str, Any]] | None:
+    """
+    读取路由清单，插件目录或控制器文件有变化时视为失效。
+
+    参数:
+    - base_dir (Path): app.plugin 包目录。
+
+    返回:
+    - list[dict[str, Any]] | None: 控制器清单，不可用时返回 None。
+    """
+    if not settings.ROUTE_MANIFEST_ENABLE:
+        return None
+    try:
+        manifest = json.loads(Path(settings.ROUTE_MANIFEST_FILE).read_text(encoding="utf-8"))
+        if manifest.get("version") != MANIFEST_VERSION:
+            return None
+        for rel_path, mtime in manifest["entries"].items():
+            if (base_dir / rel_path).stat().st_mtime_ns != mtime:
+                return None
+        return manifest["controllers"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        return None
+
+
+def _save_manifest(base_dir: Path, controllers: list[dict[str, Any]]) -> None:
+    """
+    写入路由清单（多个 worker 同时启动时先写临时文件再替换）。
+
+    参数:
+    - base_dir (Path): app.plugin 包目录。
+    - controllers (list[dict[str, Any]]): 控制器清单。
+
+    返回:
+    - None
+    """
+    if not settings.ROUTE_MANIFEST_ENABLE:
+        return
+    path = Path(settings.ROUTE_MANIFEST_FILE)
+    controller_files = [base_dir / item["file"] for item in controllers]
+    try:
+        manifest = {
+            "version": MANIFEST_VERSION,
+            # 在模块导入之后记录，__pycache__ 目录的创建不会让清单立即失效
+            "entries": _snapshot(base_dir, controller_files),
+            "controllers": controllers,
+        }
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError as e:
+        log.warning(f"⚠️ 写入路由清单失败: {e!s}")
+
+
+def _scan(base_dir: Path) -> tuple[list[dict[str, Any]], bool]:
+    """
+    遍历插件目录，导入全部控制器并找出其中的 APIRouter 实例。
+
+    参数:
+    - base_dir (Path): app.plugin 包目录。
+
+    返回:
+    - tuple[list[dict[str, Any]], bool]: (控制器清单, 是否全部导入成功)。
+    """
+    # 查找所有符合条件的controller.py文件
+    # 只扫描module_*目录下的文件，按路径排序，确保注册顺序一致
+    controller_files = sorted(base_dir.glob("module_*/**/controller.py"))
+
+    controllers: list[dict[str, Any]] = []
+    complete = True
+    for file in controller_files:
+        # 解析文件路径
+        path_parts = file.relative_to(base_dir).parts
+
+        # 生成模块导入路径
+        module_path = f"app.plugin.{'.'.join(path_parts[:-1])}.controller"
+
+        try:
+            # 动态导入模块
+            module = importlib.import_module(module_path)
+        except Exception as e:
+            complete = False
+            log.error(f"❌️ 处理模块 {module_path} 失败: {e!s}")
+            continue
+
+        # 查找所有APIRouter实例
+        routers = [
+            attr_name
+            for attr_name in dir(module)
+            if isinstance(getattr(module, attr_name, None), APIRouter)
+        ]
+        controllers.append({
+            "file": file.relative_to(base_dir).as_posix(),
+            "module": module_path,
+            # 生成路由前缀 (module_xxx -> /xxx)
+            "prefix": f"/{path_parts[0][7:]}",
+            "routers": routers,
+        })
+    return controllers, complete
+
+
+def _resolve(controllers: list[dict[str, Any]]) -> list[tuple[str, str, APIRouter]] | None:
+    """
+    按清单导入控制器模块并取出 APIRouter 实例。
+
+    参数:
+    - controllers (list[dict[str, Any]]): 控制器清单。
+
+    返回:
+    - list[tuple[str, str, APIRouter]] | None: [(前缀, 变量名, 路由)]，清单与代码不一致时返回 None。
+    """
+    resolved = []
+    for item in controllers:
+        try:
+            module = importlib.import_module(item["module"])
+        except Exception as e:
+            log.error(f"❌️ 处理模块 {item['module']} 失败: {e!s}")
+            return None
+        for attr_name in item["routers"]:
+            attr_value = getattr(module, attr_name, None)
+            if not isinstance(attr_value, APIRouter):
+                return None
+            resolved.append((item["prefix"], attr_name, attr_value))
+    return resolved
+
 
 def get_dynamic_router() -> APIRouter:
     """
@@ -30,61 +192,39 @@ def get_dynamic_router() -> APIRouter:
     # 创建根路由实例
     root_router = APIRouter()
 
-    # 已注册的路由ID集合，用于避免重复注册
-    seen_router_ids: set[int] = set()
-
     try:
         # 获取app.plugin包的路径
         base_package = importlib.import_module("app.plugin")
         base_dir = Path(next(iter(base_package.__path__)))
 
-        # 查找所有符合条件的controller.py文件
-        # 只扫描module_*目录下的文件
-        controller_files = list(base_dir.glob("module_*/**/controller.py"))
-
-        # 按路径排序，确保注册顺序一致
-        controller_files.sort()
+        controllers = _load_manifest(base_dir)
+        resolved = _resolve(controllers) if controllers is not None else None
+        if resolved is None:
+            controllers, complete = _scan(base_dir)
+            resolved = _resolve(controllers) or []
+            # 有模块导入失败时不写清单，下次启动重新扫描
+            if complete:
+                _save_manifest(base_dir, controllers)
+        else:
+            log.info(f"⚡ 使用路由清单: {len(controllers)} 个控制器")
 
         # 容器路由映射 {prefix: container_router}
         container_routers: dict[str, APIRouter] = {}
 
-        for file in controller_files:
-            # 解析文件路径
-            rel_path = file.relative_to(base_dir)
-            path_parts = rel_path.parts
-
-            # 获取顶级模块名
-            top_module = path_parts[0]
-
-            # 生成路由前缀 (module_xxx -> /xxx)
-            prefix = f"/{top_module[7:]}"
+        # 已注册的路由ID集合，用于避免重复注册
+        seen_router_ids: set[int] = set()
 
+        for prefix, attr_name, router in resolved:
             # 获取或创建容器路由
             if prefix not in container_routers:
                 container_routers[prefix] = APIRouter(prefix=prefix)
-            container_router = container_routers[prefix]
-
-            # 生成模块导入路径
-            module_path = f"app.plugin.{'.'.join(path_parts[:-1])}.controller"
-
-            try:
-                # 动态导入模块
-                module = importlib.import_module(module_path)
-
-                # 查找并注册所有APIRouter实例
-                for attr_name in dir(module):
-                    attr_value = getattr(module, attr_name, None)
-
-                    # 只注册APIRouter实例，且避免重复注册
-                    if isinstance(attr_value, APIRouter):
-                        router_id = id(attr_value)
-                        if router_id not in seen_router_ids:
-                            seen_router_ids.add(router_id)
-                            container_router.include_router(attr_value)
-                            log.debug(f"📌 注册路由 {attr_name} 到容器 {prefix}")
 
-            except Exception as e:
-                log.error(f"❌️ 处理模块 {module_path} 失败: {e!s}")
+            # 避免同一个APIRouter被重复注册（如被其他控制器导入）
+            if id(router) in seen_router_ids:
+                continue
+            seen_router_ids.add(id(router))
+            container_routers[prefix].include_router(router)
+            log.debug(f"📌 注册路由 {attr_name} 到容器 {prefix}")
 
         # 将所有容器路由注册到根路由
         for prefix, container_router in sorted(container_routers.items()):
@@ -0,0 +1,301 @@
+import asyncio
+import importlib.util
+import random
+import time
+from typing import Any
+
+import httpx
+
+from app.config.setting import settings
+from app.core.logger import log
+
+
+class CircuitOpenError(Exception):
+    """上游已熔断，请求未发出"""
+
+
+class _UpstreamState:
+    """
+    单个上游主机的并发控制、熔断状态与统计数据
+    """
+
+    __slots__ = (
+        "failures",
+        "in_flight",
+        "latency_max",
+        "latency_total",
+        "opened_at",
+        "probing",
+        "requests",
+        "retries",
+        "semaphore",
+        "short_circuits",
+        "total_failures",
+    )
+
+    def __init__(self) -> None:
+        self.semaphore = asyncio.Semaphore(settings.HTTP_HOST_CONCURRENCY)
+        # 连续失败次数，成功后清零
+        self.failures = 0
+        # 熔断开始时间，0 表示未熔断
+        self.opened_at = 0.0
+        # 熔断到期后是否已有试探请求在进行
+        self.probing = False
+        self.in_flight = 0
+        self.requests = 0
+        self.retries = 0
+        self.total_failures = 0
+        self.short_circuits = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+
+
+class HttpClient:
+    """
+    应用级共享的外部 HTTP 客户端
+
+    - 整个进程复用一个 httpx.AsyncClient，按上游（协议+主机+端口）维护长连接池，
+      安装了 h2 时启用 HTTP/2；应用启动时创建，关闭时释放，脚本等场景首次使用时自动创建；
+    - 每个上游主机单独限制并发数（HTTP_HOST_CONCURRENCY），避免单个慢上游占满连接池；
+    - 幂等请求遇到网络错误或 429/502/503/504 时按指数退避加随机抖动重试；
+    - 上游连续失败 HTTP_BREAKER_THRESHOLD 次后熔断，熔断期内直接抛出 CircuitOpenError，
+      到期后放行一个试探请求，成功则恢复，失败则继续熔断；
+    - stats() 返回各上游的请求数、失败数、重试数与耗时统计。
+    需要流式读取或由第三方 SDK 接管的请求可通过 client() 直接使用共享连接池。
+    """
+
+    # 可重试的响应状态码
+    RETRY_STATUS = frozenset({429, 502, 503, 504})
+    # 默认允许重试的幂等方法
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+    _client: httpx.AsyncClient | None = None
+    _upstreams: dict[str, _UpstreamState] = {}
+
+    @staticmethod
+    def http2_enabled() -> bool:
+        """是否启用 HTTP/2（需要安装 h2）"""
+        return importlib.util.find_spec("h2") is not None
+
+    @classmethod
+    def client(cls) -> httpx.AsyncClient:
+        """
+        获取（必要时创建）共享的 httpx 异步客户端。
+
+        返回:
+        - httpx.AsyncClient: 共享客户端。
+        """
+        if cls._client is None or cls._client.is_closed:
+            cls._client = httpx.AsyncClient(
+                http2=cls.http2_enabled(),
+                timeout=httpx.Timeout(settings.HTTP_TIMEOUT),
+                limits=httpx.Limits(
+                    max_connections=settings.HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE,
+                    keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+                ),
+                follow_redirects=True,
+            )
+        return cls._client
+
+    @classmethod
+    async def startup(cls) -> None:
+        """
+        应用启动时创建共享客户端。
+
+        返回:
+        - None
+        """
+        cls.client()
+        log.info(f"外部HTTP客户端已创建(HTTP/2: {'是' if cls.http2_enabled() else '否'})")
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """
+        应用关闭时释放连接池。
+
+        返回:
+        - None
+        """
+        if cls._client is not None:
+            await cls._client.aclose()
+            cls._client = None
+        cls._upstreams = {}
+
+    @classmethod
+    def _upstream(cls, url: httpx.URL) -> tuple[str, _UpstreamState]:
+        """
+        获取上游主机的状态对象。
+
+        参数:
+        - url (httpx.URL): 请求地址。
+
+        返回:
+        - tuple[str, _UpstreamState]: (上游标识, 状态对象)。
+        """
+        key = f"{url.scheme}://{url.host}:{url.port or (443 if url.scheme == 'https' else 80)}"
+        state = cls._upstreams.get(key)
+        if state is None:
+            state = cls._upstreams[key] = _UpstreamState()
+        return key, state
+
+    @classmethod
+    def _acquire_circuit(cls, key: str, state: _UpstreamState) -> bool:
+        """
+        检查熔断状态，熔断期内拒绝请求。
+
+        参数:
+        - key (str): 上游标识。
+        - state (_UpstreamState): 上游状态。
+
+        返回:
+        - bool: 本次请求是否为熔断到期后的试探请求。
+
+        异常:
+        - CircuitOpenError: 上游处于熔断期或已有试探请求在进行。
+        """
+        if not state.opened_at:
+            return False
+        if time.monotonic() - state.opened_at < settings.HTTP_BREAKER_COOLDOWN or state.probing:
+            state.short_circuits += 1
+            raise CircuitOpenError(f"上游 {key} 已熔断")
+        state.probing = True
+        return True
+
+    @classmethod
+    def _record(cls, key: str, state: _UpstreamState, ok: bool, elapsed: float) -> None:
+        """
+        记录一次请求结果并更新熔断状态。
+
+        参数:
+        - key (str): 上游标识。
+        - state (_UpstreamState): 上游状态。
+        - ok (bool): 请求是否成功。
+        - elapsed (float): 耗时(秒)。
+
+        返回:
+        - None
+        """
+        state.requests += 1
+        state.latency_total += elapsed
+        state.latency_max = max(state.latency_max, elapsed)
+        if ok:
+            if state.opened_at:
+                log.info(f"上游 {key} 已恢复，解除熔断")
+            state.failures = 0
+            state.opened_at = 0.0
+            return
+        state.total_failures += 1
+        state.failures += 1
+        if state.opened_at or state.failures >= settings.HTTP_BREAKER_THRESHOLD:
+            if not state.opened_at:
+                log.warning(
+                    f"上游 {key} 连续失败 {state.failures} 次，熔断 {settings.HTTP_BREAKER_COOLDOWN} 秒"
+                )
+            state.opened_at = time.monotonic()
+
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        """
+        计算第 attempt 次重试前的等待时间（指数退避 + 全随机抖动）。
+
+        参数:
+        - attempt (int): 重试序号，从 0 开始。
+
+        返回:
+        - float: 等待秒数。
+        """
+        ceiling = min(settings.HTTP_RETRY_MAX_BACKOFF, settings.HTTP_RETRY_BACKOFF * 2**attempt)
+        return random.uniform(0, ceiling)
+
+    @classmethod
+    async def request(
+        cls, method: str, url: str, retries: int | None = None, **kwargs: Any
+    ) -> httpx.Response:
+        """
+        发送请求（读取完整响应体）。
+
+        参数:
+        - method (str): 请求方法。
+        - url (str): 请求地址。
+        - retries (int | None): 最大重试次数；未指定时幂等方法使用 HTTP_RETRY_TIMES，其余方法不重试。
+        - **kwargs (Any): 透传给 httpx 的参数（params、json、headers、timeout 等）。
+
+        返回:
+        - httpx.Response: 响应对象；重试耗尽时返回最后一次的响应。
+
+        异常:
+        - CircuitOpenError: 上游处于熔断期。
+        - httpx.HTTPError: 网络错误且重试耗尽。
+        """
+        method = method.upper()
+        if retries is None:
+            retries = settings.HTTP_RETRY_TIMES if method in cls.IDEMPOTENT_METHODS else 0
+        client = cls.client()
+        key, state = cls._upstream(httpx.URL(url))
+        probing = cls._acquire_circuit(key, state)
+        try:
+            attempt = 0
+            while True:
+                started = time.perf_counter()
+                try:
+                    async with state.semaphore:
+                        state.in_flight += 1
+                        try:
+                            response = await client.request(method, url, **kwargs)
+                        finally:
+                            state.in_flight -= 1
+                except httpx.TransportError:
+                    cls._record(key, state, False, time.perf_counter() - started)
+                    if attempt >= retries or state.opened_at:
+                        raise
+                else:
+                    ok = response.status_code < 500 and response.status_code != 429
+                    cls._record(key, state, ok, time.perf_counter() - started)
+                    if (
+                        response.status_code not in cls.RETRY_STATUS
+                        or attempt >= retries
+                        or state.opened_at
+                    ):
+                        return response
+                state.retries += 1
+                await asyncio.sleep(cls._backoff(attempt))
+                attempt += 1
+        finally:
+            if probing:
+                state.probing = False
+
+    @classmethod
+    async def get(cls, url: str, **kwargs: Any) -> httpx.Response:
+        """发送 GET 请求，参数同 request()"""
+        return await cls.request("GET", url, **kwargs)
+
+    @classmethod
+    async def post(cls, url: str, **kwargs: Any) -> httpx.Response:
+        """发送 POST 请求，参数同 request()"""
+        return await cls.request("POST", url, **kwargs)
+
+    @classmethod
+    def stats(cls) -> list[dict[str, Any]]:
+        """
+        获取各上游的请求统计。
+
+        返回:
+        - list[dict[str, Any]]: 每个上游一项，包含请求数、失败数、重试数、熔断拒绝数、耗时与熔断状态。
+        """
+        result = []
+        for key, state in cls._upstreams.items():
+            result.append({
+                "upstream": key,
+                "requests": state.requests,
+                "failures": state.total_failures,
+                "retries": state.retries,
+                "short_circuits": state.short_circuits,
+                "in_flight": state.in_flight,
+                "avg_ms": round(state.latency_total / state.requests * 1000, 2)
+                if state.requests
+                else 0.0,
+                "max_ms": round(state.latency_max * 1000, 2),
+                "circuit_open": bool(state.opened_at),
+            })
+        return result
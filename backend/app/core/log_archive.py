@@ -0,0 +1,408 @@
+import asyncio
+import os
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+from sqlalchemy import Table, delete, func, select
+from sqlalchemy import inspect as sa_inspect
+
+from app.api.v1.module_system.auth.schema import AuthSchema
+from app.config.setting import settings
+from app.core.database import async_db_session, async_engine
+from app.core.exceptions import CustomException
+from app.core.logger import log
+from app.core.partition import LogPartition, period_bounds
+from app.core.permission import Permission
+
+
+def _pyarrow() -> Any:
+    """
+    延迟导入 pyarrow（只在归档与查询归档时需要）。
+
+    返回:
+    - Any: pyarrow 模块。
+
+    异常:
+    - CustomException: 未安装 pyarrow。
+    """
+    try:
+        import pyarrow
+
+        # 子模块需显式导入后才能通过 pyarrow.xxx 访问
+        import pyarrow.compute  # noqa: F401
+        import pyarrow.dataset  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        raise CustomException(msg="日志归档需要安装 pyarrow")
+    return pyarrow
+
+
+class LogArchive:
+    """
+    日志列式归档
+
+    - archive() 把 N 天前的日志按天流式读出（服务端游标，每批 LOG_ARCHIVE_BATCH_SIZE 行），
+      写入 {LOG_ARCHIVE_DIR}/{表名}/date=YYYY-MM-DD/part-{起始ID}-{结束ID}.parquet，
+      文件落盘后再删除数据库中当天的记录；中途失败重跑时同一天生成同名文件覆盖，不会重复归档；
+    - page() 按与 CRUDBase 相同格式的查询条件读取归档：created_time 范围先裁剪 date= 目录，
+      其余条件下推到 Parquet 扫描（行组统计信息过滤），按天倒序读取直到凑够一页。
+    """
+
+    @staticmethod
+    def root(model: Any) -> Path:
+        """
+        获取表的归档目录。
+
+        参数:
+        - model (Any): 数据模型类。
+
+        返回:
+        - Path: 归档目录。
+        """
+        return Path(settings.LOG_ARCHIVE_DIR) / model.__tablename__
+
+    @staticmethod
+    def _schema(table: Table) -> Any:
+        """
+        按表结构生成 Parquet schema。
+
+        参数:
+        - table (Table): 表。
+
+        返回:
+        - Any: pyarrow.Schema。
+        """
+        pa = _pyarrow()
+        types = {
+            int: pa.int64(),
+            float: pa.float64(),
+            bool: pa.bool_(),
+            datetime: pa.timestamp("us"),
+        }
+        fields = []
+        for column in table.columns:
+            try:
+                python_type = column.type.python_type
+            except NotImplementedError:
+                python_type = str
+            fields.append(pa.field(column.name, types.get(python_type, pa.string())))
+        return pa.schema(fields)
+
+    @classmethod
+    async def archive(cls, model: Any, days: int | None = None) -> dict[str, int]:
+        """
+        归档 N 天前的日志。
+
+        参数:
+        - model (Any): 日志模型类（OperationLogModel、JobLogModel）。
+        - days (int | None): 归档多少天之前的日志，默认 LOG_ARCHIVE_DAYS。
+
+        返回:
+        - dict[str, int]: 归档的天数与行数。
+        """
+        pa = _pyarrow()
+        days = settings.LOG_ARCHIVE_DAYS if days is None else days
+        cutoff = datetime.combine(date.today() - timedelta(days=days), datetime.min.time())
+        table: Table = model.__table__
+        schema = cls._schema(table)
+        root = cls.root(model)
+
+        async with async_db_session() as session:
+            # SQLite 滚动表需同时读取历史月份表
+            entity = await LogPartition.source(session, model, {"created_time": ("<", cutoff)})
+            source = table if entity is model else sa_inspect(entity).selectable
+            first = (
+                await session.execute(
+                    select(func.min(source.c.created_time)).where(source.c.created_time < cutoff)
+                )
+            ).scalar()
+        if first is None:
+            return {"days": 0, "rows": 0}
+        if isinstance(first, str):
+            first = datetime.fromisoformat(first)
+
+        archived_days = archived_rows = 0
+        day = first.date()
+        while day < cutoff.date():
+            start = datetime.combine(day, datetime.min.time())
+            end = start + timedelta(days=1)
+            stmt = (
+                select(source)
+                .where(source.c.created_time >= start, source.c.created_time < end)
+                .order_by(source.c.id)
+                .execution_options(yield_per=settings.LOG_ARCHIVE_BATCH_SIZE)
+            )
+            target = root / f"date={day.isoformat()}"
+            tmp = target / f".part-{os.getpid()}.parquet.tmp"
+            writer = None
+            first_id = last_id = None
+            rows = 0
+            try:
+                async with async_engine.connect() as conn:
+                    result = await conn.stream(stmt)
+                    async for batch in result.partitions():
+                        records = [dict(row._mapping) for row in batch]
+                        if writer is None:
+                            target.mkdir(parents=True, exist_ok=True)
+                            writer = pa.parquet.ParquetWriter(
+                                tmp, schema, compression=settings.LOG_ARCHIVE_COMPRESSION
+                            )
+                            first_id = records[0]["id"]
+                        last_id = records[-1]["id"]
+                        rows += len(records)
+                        await asyncio.to_thread(
+                            writer.write_table, pa.Table.from_pylist(records, schema=schema)
+                        )
+                if writer is not None:
+                    writer.close()
+                    writer = None
+                    # 文件名由当天的ID范围决定，重跑时覆盖而不是追加
+                    os.replace(tmp, target / f"part-{first_id}-{last_id}.parquet")
+            finally:
+                if writer is not None:
+                    writer.close()
+                    tmp.unlink(missing_ok=True)
+
+            if rows:
+                async with async_db_session() as session:
+                    async with session.begin():
+                        await cls._delete_day(session, model, source, start, end, first_id, last_id)
+                archived_days += 1
+                archived_rows += rows
+            day += timedelta(days=1)
+
+        log.info(f"日志表 {table.name} 归档完成: {archived_days} 天，共 {archived_rows} 行")
+        return {"days": archived_days, "rows": archived_rows}
+
+    @classmethod
+    async def _delete_day(
+        cls,
+        session: Any,
+        model: Any,
+        source: Any,
+        start: datetime,
+        end: datetime,
+        first_id: Any,
+        last_id: Any,
+    ) -> None:
+        """
+        删除已归档的一天记录（限定在已写入文件的ID范围内）。
+
+        参数:
+        - session (Any): 数据库会话。
+        - model (Any): 数据模型类。
+        - source (Any): 读取时使用的表或联合子查询。
+        - start (datetime): 当天起始时间。
+        - end (datetime): 次日起始时间。
+        - first_id (Any): 已归档的最小ID。
+        - last_id (Any): 已归档的最大ID。
+
+        返回:
+        - None
+        """
+        if not LogPartition.is_rolling(model):
+            table = model.__table__
+            await session.execute(
+                delete(table).where(
+                    table.c.created_time >= start,
+                    table.c.created_time < end,
+                    table.c.id.between(first_id, last_id),
+                )
+            )
+            return
+        # SQLite 滚动表：记录分布在主表与历史月份表中，按ID分批删除
+        while True:
+            ids = (
+                (
+                    await session.execute(
+                        select(source.c.id)
+                        .where(
+                            source.c.created_time >= start,
+                            source.c.created_time < end,
+                            source.c.id.between(first_id, last_id),
+                        )
+                        .limit(settings.LOG_ARCHIVE_BATCH_SIZE)
+                    )
+                )
+                .scalars()
+                .all()
+            )
+            if not ids:
+                return
+            await session.execute(delete(model).where(model.id.in_(ids)))
+            await LogPartition.delete_archived(session, model, list(ids))
+
+    @classmethod
+    def _expression(cls, search: dict, names: set[str]) -> Any:
+        """
+        把 CRUDBase 格式的查询条件转换为 pyarrow 过滤表达式。
+
+        参数:
+        - search (dict): 查询条件。
+        - names (set[str]): 归档文件中的列名。
+
+        返回:
+        - Any: pyarrow.compute.Expression，无条件时返回 None。
+
+        异常:
+        - CustomException: 查询字段不存在。
+        """
+        pa = _pyarrow()
+        pc, ds = pa.compute, pa.dataset
+        conditions = []
+        for key, value in search.items():
+            if value is None or value == "":
+                continue
+            if key not in names:
+                raise CustomException(msg=f"查询字段不存在: {key}")
+            field = ds.field(key)
+            if not isinstance(value, tuple):
+                conditions.append(field == value)
+                continue
+            seq, val = value
+            if seq == "None":
+                conditions.append(field.is_null())
+            elif seq == "not None":
+                conditions.append(field.is_valid())
+            elif seq in ("date", "month") and val:
+                bounds = period_bounds(seq, val)
+                if bounds is None:
+                    raise CustomException(msg=f"日期格式错误: {val}")
+                conditions += [field >= bounds[0], field < bounds[1]]
+            elif seq == "like" and val:
+                conditions.append(pc.match_substring(field, str(val).strip("%")))
+            elif seq == "in" and val:
+                conditions.append(field.isin(list(val)))
+            elif seq == "between" and isinstance(val, (list, tuple)) and len(val) == 2:
+                conditions += [field >= val[0], field <= val[1]]
+            elif seq == "!=" or (seq == "ne" and val):
+                conditions.append(field != val)
+            elif seq == ">" or (seq == "gt" and val):
+                conditions.append(field > val)
+            elif seq == ">=" or (seq == "ge" and val):
+                conditions.append(field >= val)
+            elif seq == "<" or (seq == "lt" and val):
+                conditions.append(field < val)
+            elif seq == "<=" or (seq == "le" and val):
+                conditions.append(field <= val)
+            elif seq == "==" or (seq == "eq" and val):
+                conditions.append(field == val)
+
+        # created_time 范围同时作用于 date= 目录，扫描前即可跳过无关日期
+        start, end = LogPartition.time_range(search.get("created_time"))
+        if start is not None:
+            conditions.append(ds.field("date") >= start.date().isoformat())
+        if end is not None:
+            conditions.append(ds.field("date") <= end.date().isoformat())
+
+        expression = None
+        for condition in conditions:
+            expression = condition if expression is None else expression & condition
+        return expression
+
+    @staticmethod
+    def _scope(auth: AuthSchema, names: set[str]) -> dict:
+        """
+        数据权限：归档中没有部门信息，除全部数据权限外一律只能查看本人创建的记录。
+
+        参数:
+        - auth (AuthSchema): 认证信息。
+        - names (set[str]): 归档文件中的列名。
+
+        返回:
+        - dict: 追加的查询条件。
+        """
+        user = auth.user
+        if not user or not auth.check_data_scope or user.is_superuser or "created_id" not in names:
+            return {}
+        roles = getattr(user, "roles", []) or []
+        if any(role.data_scope == Permission.DATA_SCOPE_ALL for role in roles):
+            return {}
+        return {"created_id": user.id}
+
+    @classmethod
+    def _page(cls, model: Any, search: dict, offset: int, limit: int) -> tuple[int, list[dict]]:
+        """
+        同步读取一页归档记录（在线程中执行）。
+
+        返回:
+        - tuple[int, list[dict]]: (总数, 当前页记录)。
+        """
+        pa = _pyarrow()
+        root = cls.root(model)
+        if not root.is_dir():
+            return 0, []
+        dataset = pa.dataset.dataset(
+            root,
+            format="parquet",
+            partitioning=pa.dataset.partitioning(pa.schema([("date", pa.string())]), flavor="hive"),
+            exclude_invalid_files=True,
+        )
+        names = set(dataset.schema.names) - {"date"}
+        expression = cls._expression(search, names)
+        total = dataset.count_rows(filter=expression)
+        if not total or offset >= total:
+            return total, []
+
+        # 按天倒序读取，凑够 offset + limit 行即停止
+        days: dict[str, list[Any]] = {}
+        for fragment in dataset.get_fragments(filter=expression):
+            day = pa.dataset.get_partition_keys(fragment.partition_expression).get("date", "")
+            days.setdefault(day, []).append(fragment)
+        tables, collected = [], 0
+        for day in sorted(days, reverse=True):
+            parts = [
+                fragment.to_table(filter=expression, schema=dataset.schema)
+                for fragment in days[day]
+            ]
+            table = pa.concat_tables(parts).sort_by([("created_time", "descending")])
+            if table.num_rows:
+                tables.append(table)
+                collected += table.num_rows
+            if collected >= offset + limit:
+                break
+        rows = pa.concat_tables(tables).slice(offset, limit).drop_columns(["date"]).to_pylist()
+        return total, rows
+
+    @classmethod
+    async def page(
+        cls,
+        model: Any,
+        auth: AuthSchema,
+        search: dict,
+        offset: int,
+        limit: int,
+        out_schema: type[BaseModel],
+    ) -> dict:
+        """
+        分页查询归档日志（按创建时间倒序）。
+
+        参数:
+        - model (Any): 日志模型类。
+        - auth (AuthSchema): 认证信息（用于数据权限）。
+        - search (dict): 查询条件，格式与 CRUDBase 相同。
+        - offset (int): 偏移量。
+        - limit (int): 每页数量。
+        - out_schema (type[BaseModel]): 输出数据模型。
+
+        返回:
+        - dict: 分页数据，格式与 CRUDBase.page 相同。
+        """
+        pa = _pyarrow()
+        root = cls.root(model)
+        if root.is_dir():
+            names = set(cls._schema(model.__table__).names)
+            search = {**search, **cls._scope(auth, names)}
+        try:
+            total, rows = await asyncio.to_thread(cls._page, model, search, offset, limit)
+        except (pa.ArrowException, OSError) as e:
+            raise CustomException(msg=f"查询归档日志失败: {e!s}")
+        return {
+            "page_no": offset // limit + 1 if limit else 1,
+            "page_size": limit or 10,
+            "total": total,
+            "has_next": offset + limit < total,
+            "items": [out_schema.model_validate(row).model_dump() for row in rows],
+        }
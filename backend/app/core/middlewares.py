@@ -1,19 +1,21 @@
 import json
 import time
 
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
 from starlette.middleware.base import (
     BaseHTTPMiddleware,
     RequestResponseEndpoint,
 )
 from starlette.middleware.cors import CORSMiddleware
-from starlette.middleware.gzip import GZipMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.api.v1.module_system.params.service import ParamsService
 from app.common.response import ErrorResponse
 from app.config.setting import settings
+from app.core.compression import compress, is_compressible, negotiate_encoding
 from app.core.exceptions import CustomException
 from app.core.logger import log
 from app.core.security import decode_access_token
@@ -189,12 +191,75 @@ class RequestLogMiddleware(BaseHTTPMiddleware):
             return ErrorResponse(msg="系统异常，请联系管理员", data=str(e))
 
 
-class CustomGZipMiddleware(GZipMiddleware):
-    """GZip压缩中间件"""
+class CompressionMiddleware:
+    """
+    响应压缩中间件（纯 ASGI）
+
+    - 按 Accept-Encoding 协商 zstd/br/gzip（见 COMPRESS_ENCODINGS，未安装对应库的编码自动跳过）；
+    - 按响应大小与最近 1 秒的压缩耗时选择级别，超过 COMPRESS_LARGE_SIZE 的响应在线程中压缩；
+    - 流式响应、已编码响应、断点续传、附件下载与已压缩的媒体类型（图片、压缩包、Office 文档等）原样返回；
+    - 压缩后体积没有变小时返回原内容。
+    """
 
     def __init__(self, app: ASGIApp) -> None:
-        super().__init__(
-            app,
-            minimum_size=settings.GZIP_MIN_SIZE,
-            compresslevel=settings.GZIP_COMPRESS_LEVEL,
-        )
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Message | None = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, passthrough
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                content_length = headers.get("content-length")
+                passthrough = (
+                    message["status"] < 200
+                    or message["status"] in (204, 206, 304)
+                    or "content-encoding" in headers
+                    or "attachment" in headers.get("content-disposition", "").lower()
+                    or not is_compressible(headers.get("content-type", ""))
+                    or (
+                        content_length is not None
+                        and int(content_length) < settings.COMPRESS_MIN_SIZE
+                    )
+                )
+                if passthrough:
+                    await send(message)
+                else:
+                    # 等到第一段响应体才能判断是否为流式响应
+                    start_message = message
+                return
+            if passthrough or start_message is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            start, start_message = start_message, None
+            body = message.get("body", b"")
+            if message.get("more_body", False) or len(body) < settings.COMPRESS_MIN_SIZE:
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+            if len(body) > settings.COMPRESS_LARGE_SIZE:
+                compressed = await anyio.to_thread.run_sync(compress, body, encoding)
+            else:
+                compressed = compress(body, encoding)
+            if len(compressed) < len(body):
+                headers = MutableHeaders(raw=start["headers"])
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(compressed))
+                headers.add_vary_header("Accept-Encoding")
+                body = compressed
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,870 @@
+import asyncio
+import re
+from datetime import datetime, timedelta
+from typing import Any
+
+from fastapi import FastAPI
+from redis.asyncio.client import Redis
+from sqlalchemy import Table, column, delete, func, insert, select, table, text, union_all
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from sqlalchemy.orm import aliased
+from sqlalchemy.schema import AddConstraint
+
+from app.common.enums import RedisInitKeyConfig
+from app.config.setting import settings
+from app.core.base_model import MappedBase
+from app.core.database import async_engine
+from app.core.logger import log
+from app.core.redis_crud import RedisCURD
+
+# 分区（或滚动表）名称后缀中的月份，如 p202610
+_MONTH_PATTERN = re.compile(r"p(\d{6})$")
+
+
+def month_start(value: datetime) -> datetime:
+    """
+    取时间所在月份的第一天零点。
+
+    参数:
+    - value (datetime): 时间。
+
+    返回:
+    - datetime: 月初时间。
+    """
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(month: datetime, count: int) -> datetime:
+    """
+    月份加减（入参须为月初）。
+
+    参数:
+    - month (datetime): 月初时间。
+    - count (int): 加减的月数。
+
+    返回:
+    - datetime: 结果月份的月初时间。
+    """
+    index = month.year * 12 + month.month - 1 + count
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def period_bounds(seq: str, value: Any) -> tuple[datetime, datetime] | None:
+    """
+    把按日("date", "2025-01-05")、按月("month", "2025-01")查询转换为左闭右开的时间区间。
+
+    参数:
+    - seq (str): date 或 month。
+    - value (Any): 日期字符串或 date/datetime。
+
+    返回:
+    - tuple[datetime, datetime] | None: (起始, 结束)，无法解析时返回 None。
+    """
+    try:
+        if isinstance(value, datetime):
+            start = value
+        elif seq == "month" and isinstance(value, str):
+            start = datetime.strptime(value[:7], "%Y-%m")
+        else:
+            start = datetime.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+    if seq == "month":
+        start = month_start(start)
+        return start, add_months(start, 1)
+    start = start.replace(hour=0, minute=0, second=0, microsecond=0)
+    return start, start + timedelta(days=1)
+
+
+class LogPartition:
+    """
+    日志表按月分区与保留策略（LOG_PARTITION_TABLES 中配置的表，分区键为 created_time）
+
+    - MySQL：RANGE (TO_DAYS(created_time)) 原生分区，每月一个分区 pYYYYMM，外加 pmax 兜底；
+    - PostgreSQL：声明式分区，每月一张分区表 {表名}_pYYYYMM，外加 {表名}_default 兜底；
+    - SQLite：不支持分区，已结束的月份从主表滚动到 {表名}_pYYYYMM，CRUDBase 查询时按
+      created_time 条件只联合(UNION ALL)相关月份的表；超出保留期的行同样先滚动到月份表，
+      再随月份表整块删除，主表中的数据不会被直接删除；
+    - 维护任务预先创建未来 LOG_PARTITION_PREMAKE 个月的分区，并整块删除超出保留月数的分区，
+      不再执行大范围 DELETE；
+    - created_time 作为区间条件（between、比较、按日/按月）时，MySQL/PostgreSQL 由数据库自动裁剪分区。
+
+    MySQL 分区表要求主键与唯一索引包含分区键、且不支持外键，因此转换时主键改为 (id, created_time)、
+    唯一索引改为普通索引并删除外键；模型元数据保持不变，ORM 仍按 id 识别对象。
+    已有数据的普通表不会在启动时自动转换，需执行 python main.py partition --convert；
+    SQLite 同样如此（以存在月份表作为已转换的标记，空表转换时创建当月的月份表）。
+    """
+
+    # 维护锁过期时间(秒)
+    LOCK_EXPIRE = 600
+
+    redis_instance: Redis | None = None
+    _task: asyncio.Task | None = None
+
+    @staticmethod
+    def is_partitioned(name: str) -> bool:
+        """
+        判断表是否配置了按月分区。
+
+        参数:
+        - name (str): 表名。
+
+        返回:
+        - bool: 是否分区。
+        """
+        return settings.LOG_PARTITION_ENABLE and name in settings.LOG_PARTITION_TABLES
+
+    @classmethod
+    def is_rolling(cls, model: Any) -> bool:
+        """
+        判断模型是否使用 SQLite 滚动表（查询、删除需要同时处理历史月份表）。
+
+        参数:
+        - model (Any): 数据模型类。
+
+        返回:
+        - bool: 是否使用滚动表。
+        """
+        name = getattr(model, "__tablename__", None)
+        return settings.DATABASE_TYPE == "sqlite" and name is not None and cls.is_partitioned(name)
+
+    @staticmethod
+    def parse_month(name: str) -> datetime | None:
+        """
+        从分区名或滚动表名中解析月份。
+
+        参数:
+        - name (str): 分区名或表名。
+
+        返回:
+        - datetime | None: 月初时间，不是按月命名时返回 None。
+        """
+        matched = _MONTH_PATTERN.search(name)
+        if not matched:
+            return None
+        return datetime.strptime(matched.group(1), "%Y%m")
+
+    @staticmethod
+    def time_range(value: Any) -> tuple[datetime | None, datetime | None]:
+        """
+        从 created_time 查询条件中提取时间范围（闭区间，None 表示不限）。
+
+        参数:
+        - value (Any): 查询条件，格式与 CRUDBase 的 search 相同。
+
+        返回:
+        - tuple[datetime | None, datetime | None]: (起始, 结束)。
+        """
+
+        def to_datetime(item: Any) -> datetime | None:
+            if isinstance(item, datetime):
+                return item
+            try:
+                return datetime.fromisoformat(str(item))
+            except ValueError:
+                return None
+
+        if value is None or value == "":
+            return None, None
+        if not isinstance(value, tuple):
+            moment = to_datetime(value)
+            return moment, moment
+        seq, val = value
+        if seq in ("date", "month") and val:
+            bounds = period_bounds(seq, val)
+            return bounds if bounds else (None, None)
+        if seq == "between" and isinstance(val, (list, tuple)) and len(val) == 2:
+            return to_datetime(val[0]), to_datetime(val[1])
+        if seq in (">", ">=", "gt", "ge"):
+            return to_datetime(val), None
+        if seq in ("<", "<=", "lt", "le"):
+            return None, to_datetime(val)
+        if seq in ("==", "eq"):
+            moment = to_datetime(val)
+            return moment, moment
+        return None, None
+
+    # ------------------------------------------------------------------ #
+    # SQLite 滚动表：查询与删除
+    # ------------------------------------------------------------------ #
+
+    @classmethod
+    async def _sqlite_archives(
+        cls, conn: AsyncSession | AsyncConnection, name: str
+    ) -> list[tuple[datetime, str]]:
+        """
+        列出 SQLite 中某张表的历史月份表。
+
+        参数:
+        - conn (AsyncSession | AsyncConnection): 数据库会话或连接。
+        - name (str): 主表名。
+
+        返回:
+        - list[tuple[datetime, str]]: [(月份, 表名)]，按月份升序。
+        """
+        result = await conn.execute(
+            text("SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE :pattern"),
+            {"pattern": f"{name}_p%"},
+        )
+        archives = []
+        for table_name in result.scalars():
+            month = cls.parse_month(table_name)
+            if month is not None and table_name == f"{name}_p{month:%Y%m}":
+                archives.append((month, table_name))
+        return sorted(archives)
+
+    @staticmethod
+    def _clone(base: Table, name: str) -> Any:
+        """
+        构造与主表列相同的表达式（用于查询、写入历史月份表）。
+
+        参数:
+        - base (Table): 主表。
+        - name (str): 表名。
+
+        返回:
+        - Any: TableClause。
+        """
+        return table(name, *(column(col.name, col.type) for col in base.columns))
+
+    @classmethod
+    async def source(cls, db: AsyncSession, model: Any, search: dict | None) -> Any:
+        """
+        获取查询实体：SQLite 滚动表返回主表与相关月份表联合后的别名实体，其余情况返回模型本身。
+
+        参数:
+        - db (AsyncSession): 数据库会话。
+        - model (Any): 数据模型类。
+        - search (dict | None): 查询条件，按其中的 created_time 裁剪月份表。
+
+        返回:
+        - Any: 模型类或 AliasedClass。
+        """
+        if not cls.is_rolling(model):
+            return model
+        start, end = cls.time_range((search or {}).get("created_time"))
+        base: Table = model.__table__
+        names = [
+            name
+            for month, name in await cls._sqlite_archives(db, base.name)
+            if (start is None or start < add_months(month, 1)) and (end is None or end >= month)
+        ]
+        if not names:
+            return model
+        # 主表中可能还有未滚动的早期数据，始终参与查询
+        parts = [select(base), *(select(cls._clone(base, name)) for name in names)]
+        return aliased(model, union_all(*parts).subquery(f"{base.name}_all"))
+
+    @classmethod
+    async def delete_archived(cls, db: AsyncSession, model: Any, ids: list[int]) -> None:
+        """
+        SQLite 滚动表：从历史月份表中删除指定ID的记录。
+
+        参数:
+        - db (AsyncSession): 数据库会话。
+        - model (Any): 数据模型类。
+        - ids (list[int]): 对象ID列表。
+
+        返回:
+        - None
+        """
+        if not cls.is_rolling(model):
+            return
+        for _, name in await cls._sqlite_archives(db, model.__tablename__):
+            archive = cls._clone(model.__table__, name)
+            await db.execute(delete(archive).where(archive.c.id.in_(ids)))
+
+    @classmethod
+    async def clear_archived(cls, db: AsyncSession, model: Any) -> None:
+        """
+        SQLite 滚动表：删除全部历史月份表。
+
+        参数:
+        - db (AsyncSession): 数据库会话。
+        - model (Any): 数据模型类。
+
+        返回:
+        - None
+        """
+        if not cls.is_rolling(model):
+            return
+        for _, name in await cls._sqlite_archives(db, model.__tablename__):
+            await db.execute(text(f'DROP TABLE IF EXISTS "{name}"'))
+
+    # ------------------------------------------------------------------ #
+    # 分区维护
+    # ------------------------------------------------------------------ #
+
+    @staticmethod
+    def _quote(conn: AsyncConnection, name: str) -> str:
+        return conn.dialect.identifier_preparer.quote(name)
+
+    @staticmethod
+    def _cutoff(retention: int) -> datetime | None:
+        """
+        计算保留期起点：保留当月及之前 retention 个完整月份。
+
+        参数:
+        - retention (int): 保留月数，0 表示不清理。
+
+        返回:
+        - datetime | None: 早于该月份的分区将被删除。
+        """
+        if retention <= 0:
+            return None
+        return add_months(month_start(datetime.now()), -retention)
+
+    @staticmethod
+    def _upcoming() -> list[datetime]:
+        """当月及未来 LOG_PARTITION_PREMAKE 个月"""
+        current = month_start(datetime.now())
+        return [add_months(current, i) for i in range(settings.LOG_PARTITION_PREMAKE + 1)]
+
+    @staticmethod
+    def _months_between(first: datetime, last: datetime) -> list[datetime]:
+        """first 到 last（均为月初）之间的全部月份"""
+        months = []
+        while first <= last:
+            months.append(first)
+            first = add_months(first, 1)
+        return months
+
+    @staticmethod
+    async def _first_month(conn: AsyncConnection, name: str) -> datetime:
+        """表中最早数据所在月份，空表时为当月"""
+        earliest = (
+            await conn.execute(select(func.min(column("created_time"))).select_from(table(name)))
+        ).scalar()
+        if isinstance(earliest, str):
+            earliest = datetime.fromisoformat(earliest)
+        return month_start(earliest or datetime.now())
+
+    @staticmethod
+    async def _is_empty(conn: AsyncConnection, name: str) -> bool:
+        row = (await conn.execute(select(column("id")).select_from(table(name)).limit(1))).first()
+        return row is None
+
+    # MySQL -------------------------------------------------------------
+
+    @staticmethod
+    async def _mysql_partitions(conn: AsyncConnection, name: str) -> list[str] | None:
+        """
+        列出 MySQL 表的分区。
+
+        返回:
+        - list[str] | None: 分区名列表，未分区时返回 None。
+        """
+        result = await conn.execute(
+            text(
+                "SELECT PARTITION_NAME FROM information_schema.PARTITIONS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :name "
+                "ORDER BY PARTITION_ORDINAL_POSITION"
+            ),
+            {"name": name},
+        )
+        partitions = [item for item in result.scalars() if item]
+        return partitions or None
+
+    @staticmethod
+    def _mysql_definition(month: datetime) -> str:
+        return (
+            f"PARTITION p{month:%Y%m} VALUES LESS THAN (TO_DAYS('{add_months(month, 1):%Y-%m-%d}'))"
+        )
+
+    @classmethod
+    async def _convert_mysql(cls, conn: AsyncConnection, table_obj: Table) -> None:
+        """
+        把 MySQL 普通表原地转换为按月分区表。
+
+        参数:
+        - conn (AsyncConnection): 数据库连接。
+        - table_obj (Table): 表。
+
+        返回:
+        - None
+        """
+        name = cls._quote(conn, table_obj.name)
+        params = {"name": table_obj.name}
+        foreign_keys = await conn.execute(
+            text(
+                "SELECT CONSTRAINT_NAME FROM information_schema.TABLE_CONSTRAINTS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :name "
+                "AND CONSTRAINT_TYPE = 'FOREIGN KEY'"
+            ),
+            params,
+        )
+        for constraint in foreign_keys.scalars():
+            await conn.execute(
+                text(f"ALTER TABLE {name} DROP FOREIGN KEY {cls._quote(conn, constraint)}")
+            )
+
+        unique_columns: dict[str, list[str]] = {}
+        unique_indexes = await conn.execute(
+            text(
+                "SELECT INDEX_NAME, COLUMN_NAME FROM information_schema.STATISTICS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :name "
+                "AND NON_UNIQUE = 0 AND INDEX_NAME <> 'PRIMARY' "
+                "ORDER BY INDEX_NAME, SEQ_IN_INDEX"
+            ),
+            params,
+        )
+        for index_name, column_name in unique_indexes:
+            unique_columns.setdefault(index_name, []).append(column_name)
+        alters = ["DROP PRIMARY KEY", "ADD PRIMARY KEY (id, created_time)"]
+        for index_name, columns in unique_columns.items():
+            quoted = cls._quote(conn, index_name)
+            alters += [
+                f"DROP INDEX {quoted}",
+                f"ADD INDEX {quoted} ({', '.join(cls._quote(conn, c) for c in columns)})",
+            ]
+        await conn.execute(text(f"ALTER TABLE {name} {', '.join(alters)}"))
+
+        months = cls._months_between(
+            await cls._first_month(conn, table_obj.name), cls._upcoming()[-1]
+        )
+        definitions = [cls._mysql_definition(month) for month in months]
+        definitions.append("PARTITION pmax VALUES LESS THAN MAXVALUE")
+        await conn.execute(
+            text(
+                f"ALTER TABLE {name} PARTITION BY RANGE (TO_DAYS(created_time)) "
+                f"({', '.join(definitions)})"
+            )
+        )
+
+    @classmethod
+    async def _maintain_mysql(
+        cls, conn: AsyncConnection, table_obj: Table, retention: int
+    ) -> dict[str, list[str]]:
+        name = cls._quote(conn, table_obj.name)
+        partitions = await cls._mysql_partitions(conn, table_obj.name) or []
+        months = {month for p in partitions if (month := cls.parse_month(p))}
+        # 新分区只能从 pmax 中拆分，因此只补齐已有最大月份之后的月份
+        missing = [m for m in cls._upcoming() if not months or m > max(months)]
+        created = []
+        if missing and "pmax" in partitions:
+            definitions = [cls._mysql_definition(month) for month in missing]
+            definitions.append("PARTITION pmax VALUES LESS THAN MAXVALUE")
+            await conn.execute(
+                text(
+                    f"ALTER TABLE {name} REORGANIZE PARTITION pmax INTO ({', '.join(definitions)})"
+                )
+            )
+            created = [f"p{month:%Y%m}" for month in missing]
+
+        cutoff = cls._cutoff(retention)
+        dropped = [
+            p for p in partitions if cutoff and (month := cls.parse_month(p)) and month < cutoff
+        ]
+        if dropped:
+            await conn.execute(text(f"ALTER TABLE {name} DROP PARTITION {', '.join(dropped)}"))
+        return {"created": created, "dropped": dropped}
+
+    # PostgreSQL --------------------------------------------------------
+
+    @staticmethod
+    async def _postgres_kind(conn: AsyncConnection, name: str) -> str | None:
+        """表类型：p 为分区表，r 为普通表，None 为不存在"""
+        return (
+            await conn.execute(
+                text(
+                    "SELECT CAST(relkind AS text) FROM pg_class "
+                    "WHERE oid = to_regclass(CAST(:name AS text))"
+                ),
+                {"name": name},
+            )
+        ).scalar()
+
+    @staticmethod
+    async def _postgres_partitions(conn: AsyncConnection, name: str) -> list[str]:
+        result = await conn.execute(
+            text(
+                "SELECT CAST(c.relname AS text) FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = to_regclass(CAST(:name AS text))"
+            ),
+            {"name": name},
+        )
+        return list(result.scalars())
+
+    @classmethod
+    async def _create_postgres_partition(
+        cls, conn: AsyncConnection, name: str, month: datetime
+    ) -> bool:
+        """
+        创建月份分区（默认分区中已有该月数据时创建会失败，记录错误后跳过）。
+
+        返回:
+        - bool: 是否创建成功。
+        """
+        try:
+            async with conn.begin_nested():
+                await conn.execute(
+                    text(
+                        f"CREATE TABLE IF NOT EXISTS {cls._quote(conn, f'{name}_p{month:%Y%m}')} "
+                        f"PARTITION OF {cls._quote(conn, name)} FOR VALUES "
+                        f"FROM ('{month:%Y-%m-%d}') TO ('{add_months(month, 1):%Y-%m-%d}')"
+                    )
+                )
+            return True
+        except Exception as e:
+            log.error(f"创建分区 {name}_p{month:%Y%m} 失败: {e!s}")
+            return False
+
+    @classmethod
+    async def _convert_postgres(cls, conn: AsyncConnection, table_obj: Table) -> None:
+        """
+        把 PostgreSQL 普通表转换为声明式分区表（重建表并复制数据）。
+
+        参数:
+        - conn (AsyncConnection): 数据库连接。
+        - table_obj (Table): 表。
+
+        返回:
+        - None
+        """
+        name = cls._quote(conn, table_obj.name)
+        legacy_name = f"{table_obj.name}_legacy"
+        legacy = cls._quote(conn, legacy_name)
+        await conn.execute(text(f"ALTER TABLE {name} RENAME TO {legacy}"))
+        await conn.execute(
+            text(
+                f"CREATE TABLE {name} (LIKE {legacy} INCLUDING DEFAULTS INCLUDING COMMENTS) "
+                "PARTITION BY RANGE (created_time)"
+            )
+        )
+        # 自增序列归属新表，删除旧表时不会被一并删除
+        sequence = (
+            await conn.execute(
+                text("SELECT pg_get_serial_sequence(:name, 'id')"), {"name": legacy_name}
+            )
+        ).scalar()
+        if sequence:
+            await conn.execute(text(f"ALTER SEQUENCE {sequence} OWNED BY {name}.id"))
+        if table_obj.comment:
+            # DDL 语句不支持绑定参数
+            comment = table_obj.comment.replace("'", "''")
+            await conn.execute(text(f"COMMENT ON TABLE {name} IS '{comment}'"))
+
+        months = cls._months_between(await cls._first_month(conn, legacy_name), cls._upcoming()[-1])
+        for month in months:
+            await cls._create_postgres_partition(conn, table_obj.name, month)
+        default = cls._quote(conn, f"{table_obj.name}_default")
+        await conn.execute(text(f"CREATE TABLE {default} PARTITION OF {name} DEFAULT"))
+        await conn.execute(text(f"INSERT INTO {name} SELECT * FROM {legacy}"))
+        await conn.execute(text(f"DROP TABLE {legacy}"))
+
+        # 旧表的约束与索引随旧表删除后再按模型重建（唯一索引须包含分区键，改为普通索引）
+        await conn.execute(text(f"ALTER TABLE {name} ADD PRIMARY KEY (id, created_time)"))
+        for index in table_obj.indexes:
+            columns = ", ".join(cls._quote(conn, col.name) for col in index.columns)
+            await conn.execute(
+                text(f"CREATE INDEX {cls._quote(conn, str(index.name))} ON {name} ({columns})")
+            )
+        for constraint in table_obj.foreign_key_constraints:
+            await conn.execute(AddConstraint(constraint))
+
+    @classmethod
+    async def _maintain_postgres(
+        cls, conn: AsyncConnection, table_obj: Table, retention: int
+    ) -> dict[str, list[str]]:
+        partitions = set(await cls._postgres_partitions(conn, table_obj.name))
+        created = []
+        for month in cls._upcoming():
+            partition = f"{table_obj.name}_p{month:%Y%m}"
+            if partition not in partitions and await cls._create_postgres_partition(
+                conn, table_obj.name, month
+            ):
+                created.append(partition)
+
+        cutoff = cls._cutoff(retention)
+        dropped = sorted(
+            p for p in partitions if cutoff and (month := cls.parse_month(p)) and month < cutoff
+        )
+        for partition in dropped:
+            await conn.execute(text(f"DROP TABLE IF EXISTS {cls._quote(conn, partition)}"))
+        return {"created": created, "dropped": dropped}
+
+    # SQLite ------------------------------------------------------------
+
+    @classmethod
+    async def _create_sqlite_archive(
+        cls, conn: AsyncConnection, table_obj: Table, month: datetime
+    ) -> str:
+        """
+        创建 SQLite 月份表（列与主表相同，带 created_time 与 id 索引）。
+
+        参数:
+        - conn (AsyncConnection): 数据库连接。
+        - table_obj (Table): 主表。
+        - month (datetime): 月份。
+
+        返回:
+        - str: 月份表名。
+        """
+        name = f"{table_obj.name}_p{month:%Y%m}"
+        quoted = cls._quote(conn, name)
+        await conn.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {quoted} AS SELECT * FROM "
+                f"{cls._quote(conn, table_obj.name)} WHERE 0"
+            )
+        )
+        await conn.execute(
+            text(f'CREATE INDEX IF NOT EXISTS "ix_{name}_created_time" ON {quoted} (created_time)')
+        )
+        await conn.execute(text(f'CREATE INDEX IF NOT EXISTS "ix_{name}_id" ON {quoted} (id)'))
+        return name
+
+    @classmethod
+    async def _maintain_sqlite(
+        cls, conn: AsyncConnection, table_obj: Table, retention: int
+    ) -> dict[str, list[str]]:
+        current = month_start(datetime.now())
+        cutoff = cls._cutoff(retention)
+        created_time = table_obj.c.created_time
+        # 保留 id 最大的一行：主表未声明 AUTOINCREMENT，清空后 SQLite 会复用已滚动出去的 id
+        max_id = select(func.max(table_obj.c.id)).correlate(None).scalar_subquery()
+        movable = (created_time < current) & (table_obj.c.id < max_id)
+
+        archives = {name: month for month, name in await cls._sqlite_archives(conn, table_obj.name)}
+        months = (
+            await conn.execute(
+                select(func.strftime("%Y-%m", created_time)).where(movable).distinct()
+            )
+        ).scalars()
+        created, dropped = [], []
+        # 超出保留期的行也先滚动到月份表，随后与月份表一起删除并记录，主表中不直接 DELETE
+        for item in sorted(months):
+            month = datetime.strptime(item, "%Y-%m")
+            in_month = movable & (created_time >= month) & (created_time < add_months(month, 1))
+            name = f"{table_obj.name}_p{month:%Y%m}"
+            if name not in archives:
+                await cls._create_sqlite_archive(conn, table_obj, month)
+                archives[name] = month
+                created.append(name)
+            archive = cls._clone(table_obj, name)
+            await conn.execute(
+                insert(archive).from_select(
+                    [col.name for col in table_obj.columns], select(table_obj).where(in_month)
+                )
+            )
+            await conn.execute(delete(table_obj).where(in_month))
+
+        for name, month in sorted(archives.items()):
+            if cutoff and month < cutoff:
+                rows = (await conn.execute(select(func.count()).select_from(table(name)))).scalar()
+                await conn.execute(text(f"DROP TABLE IF EXISTS {cls._quote(conn, name)}"))
+                log.warning(f"日志表 {table_obj.name} 删除超出保留期的月份表 {name}（{rows} 行）")
+                dropped.append(name)
+        return {"created": created, "dropped": dropped}
+
+    # 入口 --------------------------------------------------------------
+
+    @classmethod
+    def _tables(cls) -> list[tuple[Table, int]]:
+        """已配置且已注册到元数据中的分区表及其保留月数"""
+        tables = []
+        for name, retention in settings.LOG_PARTITION_TABLES.items():
+            table_obj = MappedBase.metadata.tables.get(name)
+            if table_obj is None:
+                log.warning(f"日志分区表 {name} 未找到对应模型，已跳过")
+                continue
+            tables.append((table_obj, retention))
+        return tables
+
+    @classmethod
+    async def convert(cls, force: bool = False) -> list[str]:
+        """
+        把未分区的表转换为按月分区表（MySQL/PostgreSQL；SQLite 为启用月份表滚动）。
+
+        参数:
+        - force (bool): 为 False 时只转换空表，有数据的表记录警告后跳过。
+
+        返回:
+        - list[str]: 已转换的表名。
+        """
+        if not settings.LOG_PARTITION_ENABLE or settings.DATABASE_TYPE not in (
+            "mysql",
+            "postgres",
+            "sqlite",
+        ):
+            return []
+        converted = []
+        for table_obj, _ in cls._tables():
+            async with async_engine.begin() as conn:
+                if settings.DATABASE_TYPE == "mysql":
+                    if await cls._mysql_partitions(conn, table_obj.name) is not None:
+                        continue
+                elif settings.DATABASE_TYPE == "sqlite":
+                    if await cls._sqlite_archives(conn, table_obj.name):
+                        continue
+                elif await cls._postgres_kind(conn, table_obj.name) != "r":
+                    continue
+                if not force and not await cls._is_empty(conn, table_obj.name):
+                    log.warning(
+                        f"日志表 {table_obj.name} 尚未分区且已有数据，"
+                        "请在维护窗口执行 python main.py partition --convert"
+                    )
+                    continue
+                log.info(f"🔧 开始将 {table_obj.name} 转换为按月分区表...")
+                if settings.DATABASE_TYPE == "mysql":
+                    await cls._convert_mysql(conn, table_obj)
+                elif settings.DATABASE_TYPE == "sqlite":
+                    # 当月的月份表作为已启用滚动的标记，下个月起接收滚动出来的行
+                    await cls._create_sqlite_archive(conn, table_obj, month_start(datetime.now()))
+                else:
+                    await cls._convert_postgres(conn, table_obj)
+                converted.append(table_obj.name)
+        return converted
+
+    @classmethod
+    async def maintain(cls) -> dict[str, dict[str, list[str]]]:
+        """
+        执行一次分区维护：预建未来月份分区（SQLite 为滚动已结束月份）并删除超出保留期的分区。
+
+        返回:
+        - dict[str, dict[str, list[str]]]: {表名: {"created": [...], "dropped": [...]}}。
+        """
+        if not settings.LOG_PARTITION_ENABLE:
+            return {}
+        handlers = {
+            "mysql": cls._maintain_mysql,
+            "postgres": cls._maintain_postgres,
+            "sqlite": cls._maintain_sqlite,
+        }
+        handler = handlers.get(settings.DATABASE_TYPE)
+        if handler is None:
+            return {}
+        await cls.convert()
+        result = {}
+        for table_obj, retention in cls._tables():
+            try:
+                async with async_engine.begin() as conn:
+                    if settings.DATABASE_TYPE == "mysql" and not await cls._mysql_partitions(
+                        conn, table_obj.name
+                    ):
+                        continue
+                    if settings.DATABASE_TYPE == "postgres" and (
+                        await cls._postgres_kind(conn, table_obj.name) != "p"
+                    ):
+                        continue
+                    # SQLite 未转换（尚无月份表）的表不滚动、不删除任何数据
+                    if settings.DATABASE_TYPE == "sqlite" and not await cls._sqlite_archives(
+                        conn, table_obj.name
+                    ):
+                        continue
+                    result[table_obj.name] = await handler(conn, table_obj, retention)
+            except Exception as e:
+                log.error(f"维护日志表 {table_obj.name} 分区失败: {e!s}")
+                continue
+            changes = result[table_obj.name]
+            if changes["created"] or changes["dropped"]:
+                log.info(
+                    f"日志表 {table_obj.name} 分区维护完成: 新建 {changes['created']}，"
+                    f"删除 {changes['dropped']}"
+                )
+        return result
+
+    @staticmethod
+    def include_object(
+        obj: Any, name: str | None, type_: str, reflected: bool, compare_to: Any
+    ) -> bool:
+        """
+        Alembic 自动迁移过滤：忽略分区子表，以及分区表上因分区而调整过的索引与外键。
+
+        返回:
+        - bool: 是否参与比较。
+        """
+        if type_ == "table":
+            return not (
+                reflected
+                and name
+                and any(
+                    name == f"{table_name}_default"
+                    or name == f"{table_name}_legacy"
+                    or re.fullmatch(rf"{re.escape(table_name)}_p\d{{6}}", name)
+                    for table_name in settings.LOG_PARTITION_TABLES
+                )
+            )
+        if type_ in ("index", "unique_constraint", "foreign_key_constraint"):
+            parent = getattr(obj, "table", None)
+            return parent is None or not LogPartition.is_partitioned(parent.name)
+        return True
+
+    @classmethod
+    async def _run(cls) -> None:
+        """
+        后台维护循环：启动时执行一次，之后每 LOG_PARTITION_INTERVAL 秒执行一次。
+
+        返回:
+        - None
+        """
+        lock_key = RedisInitKeyConfig.LOG_PARTITION_LOCK.key
+        while True:
+            try:
+                if cls.redis_instance is None:
+                    await cls.maintain()
+                else:
+                    redis_client = RedisCURD(cls.redis_instance)
+                    acquired, value = await redis_client.lock(lock_key, cls.LOCK_EXPIRE)
+                    # 其他实例正在维护时跳过本轮
+                    if acquired:
+                        try:
+                            await cls.maintain()
+                        finally:
+                            await redis_client.unlock(lock_key, value)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.error(f"日志分区维护失败: {e!s}")
+            await asyncio.sleep(settings.LOG_PARTITION_INTERVAL)
+
+    @classmethod
+    def start(cls, redis: Redis | None) -> None:
+        """
+        启动后台分区维护任务。
+
+        参数:
+        - redis (Redis | None): Redis 连接，用于多实例间互斥。
+
+        返回:
+        - None
+        """
+        cls.redis_instance = redis
+        if cls._task is None or cls._task.done():
+            cls._task = asyncio.create_task(cls._run(), name="log-partition")
+
+    @classmethod
+    async def stop(cls) -> None:
+        """
+        停止后台分区维护任务。
+
+        返回:
+        - None
+        """
+        if cls._task and not cls._task.done():
+            cls._task.cancel()
+            try:
+                await cls._task
+            except asyncio.CancelledError:
+                pass
+        cls._task = None
+
+
+async def log_partition_event(app: FastAPI, status: bool) -> None:
+    """
+    全局事件：启动或停止日志表分区维护。
+
+    参数:
+    - app (FastAPI): FastAPI应用实例。
+    - status (bool): True 为启动，False 为停止。
+
+    返回:
+    - None
+    """
+    if status:
+        LogPartition.start(redis=getattr(app.state, "redis", None))
+        log.info("✅️ 日志分区维护已启动")
+    else:
+        await LogPartition.stop()
+        log.info("✅️ 日志分区维护已停止")
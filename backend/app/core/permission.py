@@ -1,12 +1,11 @@
 from typing import Any
 
-from sqlalchemy import select
 from sqlalchemy.sql.elements import ColumnElement
 
 from app.api.v1.module_system.auth.schema import AuthSchema
 from app.api.v1.module_system.dept.model import DeptModel
 from app.api.v1.module_system.user.model import UserModel
-from app.utils.common_util import get_child_id_map, get_child_recursion
+from app.core.tree_path import TreePath
 
 
 class Permission:
@@ -117,13 +116,10 @@ class Permission:
         # 处理本部门及以下数据权限（3）
         if self.DATA_SCOPE_DEPT_AND_CHILD in data_scopes and user_dept_id is not None:
             try:
-                # 查询所有部门并递归获取子部门
-                dept_sql = select(DeptModel)
-                dept_result = await self.auth.db.execute(dept_sql)
-                dept_objs = dept_result.scalars().all()
-                id_map = get_child_id_map(dept_objs)
-                # get_child_recursion返回的结果已包含自身ID和所有子部门ID
-                dept_with_children_ids = get_child_recursion(id=user_dept_id, id_map=id_map)
+                # 按部门物化路径前缀查询本部门及所有子部门ID（结果已包含自身ID）
+                dept_with_children_ids = await TreePath.descendant_ids(
+                    self.auth.db, DeptModel, [user_dept_id]
+                )
                 accessible_dept_ids.update(dept_with_children_ids)
             except Exception:
                 # 查询失败时降级到本部门
@@ -1,5 +1,9 @@
+import asyncio
+import contextlib
 import json
-from collections.abc import Awaitable
+import time
+import uuid
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from redis.asyncio.client import Redis
@@ -341,3 +345,171 @@ class RedisCURD:
         except Exception as e:
             log.error(f"获取哈希缓存失败: {e!s}")
             return []
+
+
+class RedisLock:
+    """
+    分布式租约锁
+
+    - 获取、续约、释放各为一次服务端 Lua 脚本调用（EVALSHA，单次往返、原子执行）；
+    - 每次获取成功时从计数器 {key}:fencing 取得单调递增的 fencing token，锁值为 "token:持有者ID"，
+      下游可据此拒绝已失去租约的旧持有者的迟到写入；
+    - 获取后由后台任务每 ttl/3 续约一次；续约被拒绝（锁已过期并被其他实例获取），
+      或连续续约失败直到本地租期到期（网络中断、进程长时间停顿）时视为失去租约，调用 on_lost 回调。
+    """
+
+    ACQUIRE_SCRIPT = """
+    if redis.call('exists', KEYS[1]) == 1 then
+        return 0
+    end
+    local token = redis.call('incr', KEYS[2])
+    redis.call('set', KEYS[1], token .. ':' .. ARGV[1], 'PX', ARGV[2])
+    return token
+    """
+    RENEW_SCRIPT = """
+    if redis.call('get', KEYS[1]) == ARGV[1] then
+        return redis.call('pexpire', KEYS[1], ARGV[2])
+    end
+    return 0
+    """
+    RELEASE_SCRIPT = """
+    if redis.call('get', KEYS[1]) == ARGV[1] then
+        return redis.call('del', KEYS[1])
+    end
+    return 0
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        key: str,
+        ttl: float,
+        on_lost: Callable[[], Any] | None = None,
+    ) -> None:
+        """
+        初始化锁（不会立即获取）。
+
+        参数:
+        - redis (Redis): Redis 连接。
+        - key (str): 锁键名。
+        - ttl (float): 租期(秒)。
+        - on_lost (Callable[[], Any] | None): 失去租约时的回调（如取消正在执行的任务）。
+        """
+        self.redis = redis
+        self.key = key
+        self.ttl = ttl
+        self.on_lost = on_lost
+        self.owner = uuid.uuid4().hex
+        self.token: int | None = None
+        self.value = ""
+        self.lost = False
+        self._expires_at = 0.0
+        self._task: asyncio.Task[None] | None = None
+        self._acquire = redis.register_script(self.ACQUIRE_SCRIPT)
+        self._renew = redis.register_script(self.RENEW_SCRIPT)
+        self._release = redis.register_script(self.RELEASE_SCRIPT)
+
+    @property
+    def renew_interval(self) -> float:
+        """续约间隔(秒)，为租期的 1/3，续约失败时到期前还有两次重试机会"""
+        return self.ttl / 3
+
+    @property
+    def valid(self) -> bool:
+        """是否仍持有租约（按本地时钟保守估计）"""
+        return bool(self.value) and not self.lost and time.monotonic() < self._expires_at
+
+    async def acquire(self) -> bool:
+        """
+        获取锁，成功后开始自动续约。
+
+        返回:
+        - bool: 是否获取成功，成功时 token 为本次的 fencing token。
+        """
+        # 以发起请求的时间计算本地租期，保证不晚于服务端过期
+        started = time.monotonic()
+        try:
+            token = await self._acquire(
+                keys=[self.key, f"{self.key}:fencing"],
+                args=[self.owner, int(self.ttl * 1000)],
+            )
+        except Exception as e:
+            log.error(f"获取分布式锁失败: {e!s}")
+            return False
+        if not token:
+            return False
+        self.token = int(token)
+        self.value = f"{self.token}:{self.owner}"
+        self.lost = False
+        self._expires_at = started + self.ttl
+        self._task = asyncio.create_task(self._keepalive())
+        return True
+
+    async def _keepalive(self) -> None:
+        """
+        自动续约，直到释放或失去租约。
+
+        返回:
+        - None
+        """
+        while True:
+            await asyncio.sleep(
+                min(self.renew_interval, max(self._expires_at - time.monotonic(), 0))
+            )
+            started = time.monotonic()
+            if started >= self._expires_at:
+                self._mark_lost("续约超时，本地租期已到期")
+                return
+            try:
+                renewed = await asyncio.wait_for(
+                    self._renew(keys=[self.key], args=[self.value, int(self.ttl * 1000)]),
+                    self._expires_at - started,
+                )
+            except asyncio.TimeoutError:
+                continue
+            except Exception as e:
+                log.warning(f"分布式锁 {self.key} 续约失败，稍后重试: {e!s}")
+                continue
+            if not renewed:
+                self._mark_lost("锁已过期或被其他实例获取")
+                return
+            self._expires_at = started + self.ttl
+
+    def _mark_lost(self, reason: str) -> None:
+        """
+        标记失去租约并调用回调。
+
+        参数:
+        - reason (str): 原因。
+
+        返回:
+        - None
+        """
+        self.lost = True
+        log.warning(f"分布式锁 {self.key} 失去租约(fencing token: {self.token}): {reason}")
+        if self.on_lost is not None:
+            try:
+                self.on_lost()
+            except Exception as e:
+                log.error(f"分布式锁 {self.key} 失去租约回调执行失败: {e!s}")
+
+    async def release(self) -> bool:
+        """
+        停止续约并释放锁（只删除自己持有的锁）。
+
+        返回:
+        - bool: 是否释放成功，已失去租约时返回 False。
+        """
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        if not self.value:
+            return False
+        value, self.value = self.value, ""
+        try:
+            return await self._release(keys=[self.key], args=[value]) == 1
+        except Exception as e:
+            log.error(f"释放分布式锁失败: {e!s}")
+            return False
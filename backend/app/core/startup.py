@@ -0,0 +1,181 @@
+import asyncio
+import hashlib
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from redis.asyncio.client import Redis
+from sqlalchemy import func, select
+
+from app.config.setting import settings
+from app.core.database import async_db_session
+from app.core.logger import log
+from app.core.redis_crud import RedisCURD
+
+
+class StartupGraph:
+    """
+    启动步骤依赖图
+
+    - 每个步骤声明其依赖的步骤，依赖全部完成后立即开始，互不依赖的步骤并发执行；
+    - 任一步骤失败时取消其余步骤并抛出该异常，应用启动失败。
+    """
+
+    def __init__(self) -> None:
+        # {步骤名: (执行函数, 依赖的步骤名, 描述)}
+        self._steps: dict[str, tuple[Callable[[], Awaitable[Any]], tuple[str, ...], str]] = {}
+
+    def add(
+        self,
+        name: str,
+        func: Callable[[], Awaitable[Any]],
+        desc: str,
+        after: tuple[str, ...] = (),
+    ) -> None:
+        """
+        添加启动步骤。
+
+        参数:
+        - name (str): 步骤名。
+        - func (Callable[[], Awaitable[Any]]): 执行函数。
+        - desc (str): 完成时输出的描述。
+        - after (tuple[str, ...]): 依赖的步骤名。
+
+        返回:
+        - None
+        """
+        self._steps[name] = (func, after, desc)
+
+    def _check(self) -> None:
+        """
+        检查依赖是否存在且无环。
+
+        异常:
+        - ValueError: 依赖不存在或存在循环依赖。
+        """
+        state: dict[str, int] = {}
+
+        def visit(name: str) -> None:
+            if state.get(name) == 2:
+                return
+            if state.get(name) == 1:
+                raise ValueError(f"启动步骤存在循环依赖: {name}")
+            state[name] = 1
+            for dependency in self._steps[name][1]:
+                if dependency not in self._steps:
+                    raise ValueError(f"启动步骤 {name} 依赖的步骤不存在: {dependency}")
+                visit(dependency)
+            state[name] = 2
+
+        for name in self._steps:
+            visit(name)
+
+    async def run(self) -> dict[str, float]:
+        """
+        按依赖关系并发执行全部步骤。
+
+        返回:
+        - dict[str, float]: {步骤名: 耗时(秒)}。
+        """
+        self._check()
+        tasks: dict[str, asyncio.Task[None]] = {}
+        costs: dict[str, float] = {}
+
+        async def run_step(name: str) -> None:
+            func, after, desc = self._steps[name]
+            if after:
+                await asyncio.gather(*(tasks[dependency] for dependency in after))
+            started = time.perf_counter()
+            await func()
+            costs[name] = time.perf_counter() - started
+            log.info(f"✅ {desc} ({costs[name] * 1000:.0f} ms)")
+
+        # 先创建全部任务再开始等待，依赖的任务总能在 tasks 中找到
+        for name in self._steps:
+            tasks[name] = asyncio.create_task(run_step(name), name=f"startup:{name}")
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+        return costs
+
+
+class CacheWarmup:
+    """
+    缓存预热版本标记
+
+    - 预热完成后在 Redis 中记录数据版本（表结构 + 行数 + 最近更新时间 + 应用版本），
+      其他 worker 或重启后的进程发现版本一致时直接跳过预热；
+    - 多个 worker 同时启动时只有拿到锁的一个执行预热，其余等待其完成；
+    - 标记键以缓存名称为前缀，在缓存监控中按名称清空缓存时会一并清除。
+    """
+
+    @classmethod
+    async def version(cls, *models: Any) -> str:
+        """
+        计算缓存数据版本。
+
+        参数:
+        - *models (Any): 缓存数据来源的模型类（需包含 updated_time 字段）。
+
+        返回:
+        - str: 版本摘要。
+        """
+        parts: list[Any] = [settings.VERSION]
+        async with async_db_session() as session:
+            for model in models:
+                table = model.__table__
+                row = (
+                    await session.execute(
+                        select(func.count(), func.max(table.c.updated_time)).select_from(table)
+                    )
+                ).one()
+                parts.append([
+                    table.name,
+                    [(column.name, repr(column.type)) for column in table.columns],
+                    row[0],
+                    str(row[1]),
+                ])
+        return hashlib.sha1(repr(parts).encode()).hexdigest()
+
+    @classmethod
+    async def run(
+        cls, redis: Redis, key: str, version: str, func: Callable[[], Awaitable[Any]]
+    ) -> bool:
+        """
+        版本变化时执行预热。
+
+        参数:
+        - redis (Redis): Redis 客户端。
+        - key (str): 版本标记键名。
+        - version (str): 当前数据版本。
+        - func (Callable[[], Awaitable[Any]]): 预热函数。
+
+        返回:
+        - bool: 本进程是否执行了预热。
+        """
+        redis_client = RedisCURD(redis)
+        if await redis_client.get(key) == version:
+            return False
+
+        lock_key = f"{key}:lock"
+        acquired, lock_value = await redis_client.lock(lock_key, settings.STARTUP_WARMUP_TIMEOUT)
+        if not acquired:
+            # 其他 worker 正在预热：等待其写入版本标记，锁过期或释放后仍未完成则自行预热
+            deadline = time.monotonic() + settings.STARTUP_WARMUP_TIMEOUT
+            while time.monotonic() < deadline:
+                await asyncio.sleep(0.2)
+                if await redis_client.get(key) == version:
+                    return False
+                if not await redis_client.exists(lock_key):
+                    break
+        try:
+            await func()
+            await redis_client.set(key, version)
+        finally:
+            if acquired:
+                await redis_client.unlock(lock_key, lock_value)
+        return True
@@ -0,0 +1,380 @@
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import String, bindparam, func, inspect, literal, or_, select, text, update
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.core.exceptions import CustomException
+from app.core.logger import log
+from app.utils.tree_util import TreeIndex
+
+
+class TreePath:
+    """
+    物化路径维护（配合 TreePathMixin 使用）
+
+    每个节点的 tree_path 形如 "/1/4/9/"，依次为根到自身的ID，写入时维护：
+    - 新建节点：父节点路径 + 自身ID；
+    - 修改父节点：一条 UPDATE 语句按前缀替换整棵子树的路径；
+    - 子树查询为单个前缀匹配 `tree_path LIKE '/1/4/%'`（可走索引），祖先ID直接由路径解析，无需查询。
+    路径缺失（存量数据或绕过 CRUD 写入）时，查询回退为只读取 id/parent_id 的内存计算，
+    并可通过 rebuild() 全量重建。
+    """
+
+    SEPARATOR = "/"
+
+    @classmethod
+    def join(cls, parent_path: str | None, node_id: int) -> str:
+        """
+        拼接节点路径。
+
+        参数:
+        - parent_path (str | None): 父节点路径，根节点为 None。
+        - node_id (int): 节点ID。
+
+        返回:
+        - str: 节点路径。
+        """
+        return f"{parent_path or cls.SEPARATOR}{node_id}{cls.SEPARATOR}"
+
+    @classmethod
+    def split(cls, path: str) -> list[int]:
+        """
+        解析路径中的节点ID。
+
+        参数:
+        - path (str): 节点路径。
+
+        返回:
+        - list[int]: 从根到自身的ID列表。
+        """
+        return [int(part) for part in path.split(cls.SEPARATOR) if part]
+
+    @staticmethod
+    def _keep_updated_time(model: Any) -> dict[str, Any]:
+        """
+        路径维护不属于业务修改，UPDATE 时保持 updated_time 不变（避免触发 onupdate）。
+
+        参数:
+        - model (Any): 模型类。
+
+        返回:
+        - dict[str, Any]: 附加到 UPDATE 的值。
+        """
+        if hasattr(model, "updated_time"):
+            return {"updated_time": model.updated_time}
+        return {}
+
+    @classmethod
+    async def _get_path(cls, db: AsyncSession, model: Any, node_id: int | None) -> str | None:
+        """
+        查询节点路径。
+
+        参数:
+        - db (AsyncSession): 数据库会话。
+        - model (Any): 模型类。
+        - node_id (int | None): 节点ID。
+
+        返回:
+        - str | None: 节点路径，节点不存在或路径缺失时返回 None。
+        """
+        if node_id is None:
+            return None
+        result = await db.execute(select(model.tree_path).where(model.id == node_id))
+        return result.scalar_one_or_none()
+
+    @classmethod
+    async def on_create(cls, db: AsyncSession, obj: Any) -> None:
+        """
+        新建节点后写入路径（需已 flush 获得ID）。
+
+        参数:
+        - db (AsyncSession): 数据库会话。
+        - obj (Any): 新建的模型对象。
+
+        返回:
+        - None
+        """
+        model = type(obj)
+        parent_path = await cls._get_path(db, model, obj.parent_id)
+        if obj.parent_id is not None and parent_path is None:
+            # 父节点路径缺失，整表重建后即包含本节点
+            await cls.rebuild(db, model)
+            return
+        obj.tree_path = cls.join(parent_path, obj.id)
+        await db.flush()
+
+    @classmethod
+    async def on_move(cls, db: AsyncSession, obj: Any, old_path: str | None) -> None:
+        """
+        节点父级变更后更新自身及整棵子树的路径（单条 UPDATE）。
+
+        参数:
+        - db (AsyncSession): 数据库会话。
+        - obj (Any): 已更新 parent_id 的模型对象。
+        - old_path (str | None): 变更前的节点路径。
+
+        返回:
+        - None
+
+        异常:
+        - CustomException: 新的父节点是自身或自身的子孙节点。
+        """
+        model = type(obj)
+        parent_path = await cls._get_path(db, model, obj.parent_id)
+        if old_path is None or (obj.parent_id is not None and parent_path is None):
+            await cls.rebuild(db, model)
+            return
+        if parent_path is not None and parent_path.startswith(old_path):
+            raise CustomException(msg="上级不能是自身或其下级")
+
+        new_path = cls.join(parent_path, obj.id)
+        if new_path == old_path:
+            return
+        await db.execute(
+            update(model)
+            .where(model.tree_path.like(f"{old_path}%"))
+            .values(
+                tree_path=literal(new_path, String)
+                + func.substr(model.tree_path, len(old_path) + 1),
+                **cls._keep_updated_time(model),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        obj.tree_path = new_path
+        await db.flush()
+
+    @classmethod
+    async def rebuild(cls, db: AsyncSession, model: Any) -> int:
+        """
+        按 parent_id 全量重建路径，只写入发生变化的行。
+
+        参数:
+        - db (AsyncSession): 数据库会话。
+        - model (Any): 模型类。
+
+        返回:
+        - int: 更新的行数。
+        """
+        rows = (await db.execute(select(model.id, model.parent_id, model.tree_path))).all()
+        index = TreeIndex([{"id": row.id, "parent_id": row.parent_id} for row in rows])
+        paths: list[str | None] = [None] * len(rows)
+        changed: list[dict[str, Any]] = []
+        for i in index.preorder():
+            parent = index.parents[i]
+            paths[i] = cls.join(paths[parent] if parent != -1 else None, index.ids[i])
+            if paths[i] != rows[i].tree_path:
+                changed.append({"b_id": index.ids[i], "b_path": paths[i]})
+
+        if changed:
+            table = model.__table__
+            stmt = (
+                update(table)
+                .where(table.c.id == bindparam("b_id"))
+                .values(tree_path=bindparam("b_path"), **cls._keep_updated_time(table.c))
+            )
+            await db.execute(stmt, changed)
+            await db.flush()
+            log.info(f"已重建 {model.__tablename__} 物化路径: {len(changed)} 行")
+        return len(changed)
+
+    @classmethod
+    async def ensure(cls, db: AsyncSession, model: Any) -> int:
+        """
+        存在路径缺失的行时全量重建。
+
+        参数:
+        - db (AsyncSession): 数据库会话。
+        - model (Any): 模型类。
+
+        返回:
+        - int: 更新的行数。
+        """
+        missing = await db.execute(select(model.id).where(model.tree_path.is_(None)).limit(1))
+        if missing.first() is None:
+            return 0
+        return await cls.rebuild(db, model)
+
+    @classmethod
+    async def add_column(cls, conn: AsyncConnection, model: Any) -> bool:
+        """
+        为升级前已存在的表补齐 tree_path 列及其索引（create_all 不会给已有表加列），可重复执行。
+
+        新增的列为空，由 ensure() 回填路径。
+
+        参数:
+        - conn (AsyncConnection): 数据库连接。
+        - model (Any): 模型类。
+
+        返回:
+        - bool: 是否新增了列。
+        """
+        table = model.__table__
+        column = table.c.tree_path
+        existing = await conn.run_sync(
+            lambda sync_conn: {item["name"] for item in inspect(sync_conn).get_columns(table.name)}
+        )
+        if column.name in existing:
+            return False
+
+        preparer = conn.dialect.identifier_preparer
+        table_name = preparer.format_table(table)
+        column_name = preparer.quote(column.name)
+        definition = f"{column_name} {column.type.compile(dialect=conn.dialect)} NULL"
+        if conn.dialect.name == "mysql":
+            definition += f" COMMENT '{column.comment}'"
+        await conn.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {definition}"))
+        if conn.dialect.name == "postgresql":
+            await conn.execute(
+                text(f"COMMENT ON COLUMN {table_name}.{column_name} IS '{column.comment}'")
+            )
+        for index in table.indexes:
+            if index.columns.contains_column(column):
+                await conn.run_sync(index.create)
+        log.info(f"已为 {table.name} 新增 {column.name} 列")
+        return True
+
+    @classmethod
+    async def descendant_ids(
+        cls, db: AsyncSession, model: Any, ids: Iterable[int], include_self: bool = True
+    ) -> list[int]:
+        """
+        查询节点的所有子孙ID（单条前缀匹配查询）。
+
+        参数:
+        - db (AsyncSession): 数据库会话。
+        - model (Any): 模型类。
+        - ids (Iterable[int]): 节点ID。
+        - include_self (bool): 是否包含传入的节点本身。
+
+        返回:
+        - list[int]: 子孙节点ID列表（去重）。
+        """
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return []
+        rows = (await db.execute(select(model.id, model.tree_path).where(model.id.in_(ids)))).all()
+        if not rows:
+            return []
+        if any(row.tree_path is None for row in rows):
+            return await cls._fallback_descendants(db, model, ids, include_self)
+
+        result = await db.execute(
+            select(model.id).where(
+                or_(*(model.tree_path.like(f"{row.tree_path}%") for row in rows))
+            )
+        )
+        found = list(result.scalars().all())
+        if not include_self:
+            own = set(ids)
+            found = [node_id for node_id in found if node_id not in own]
+        return found
+
+    @classmethod
+    async def update_subtree(
+        cls, db: AsyncSession, model: Any, ids: Iterable[int], **values
+    ) -> None:
+        """
+        批量更新节点及其所有子孙（单条 UPDATE，按路径前缀匹配）。
+
+        参数:
+        - db (AsyncSession): 数据库会话。
+        - model (Any): 模型类。
+        - ids (Iterable[int]): 子树根节点ID。
+        - **values: 更新的字段及值。
+
+        返回:
+        - None
+        """
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return
+        rows = (await db.execute(select(model.id, model.tree_path).where(model.id.in_(ids)))).all()
+        if not rows:
+            return
+        if any(row.tree_path is None for row in rows):
+            condition = model.id.in_(await cls._fallback_descendants(db, model, ids, True))
+        else:
+            condition = or_(*(model.tree_path.like(f"{row.tree_path}%") for row in rows))
+        await db.execute(
+            update(model)
+            .where(condition)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        await db.flush()
+
+    @classmethod
+    async def ancestor_ids(
+        cls, db: AsyncSession, model: Any, ids: Iterable[int], include_self: bool = True
+    ) -> list[int]:
+        """
+        获取节点的所有祖先ID（读取节点路径后直接解析，无需逐级查询）。
+
+        参数:
+        - db (AsyncSession): 数据库会话。
+        - model (Any): 模型类。
+        - ids (Iterable[int]): 节点ID。
+        - include_self (bool): 是否包含传入的节点本身。
+
+        返回:
+        - list[int]: 祖先节点ID列表（去重）。
+        """
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return []
+        rows = (await db.execute(select(model.id, model.tree_path).where(model.id.in_(ids)))).all()
+        if any(row.tree_path is None for row in rows):
+            index = await cls._load_index(db, model)
+            chains = [index.ancestor_ids(node_id) for node_id in ids if node_id in index]
+        else:
+            chains = [cls.split(row.tree_path) for row in rows]
+
+        result: dict[int, None] = {}
+        for chain in chains:
+            result.update(dict.fromkeys(chain))
+        if not include_self:
+            for node_id in ids:
+                result.pop(node_id, None)
+        return list(result)
+
+    @classmethod
+    async def _load_index(cls, db: AsyncSession, model: Any) -> TreeIndex:
+        """
+        只读取 id/parent_id 构建内存树索引（路径缺失时的回退方案）。
+
+        参数:
+        - db (AsyncSession): 数据库会话。
+        - model (Any): 模型类。
+
+        返回:
+        - TreeIndex: 树形索引。
+        """
+        rows = (await db.execute(select(model.id, model.parent_id))).all()
+        return TreeIndex([{"id": row.id, "parent_id": row.parent_id} for row in rows])
+
+    @classmethod
+    async def _fallback_descendants(
+        cls, db: AsyncSession, model: Any, ids: list[int], include_self: bool
+    ) -> list[int]:
+        """
+        路径缺失时在内存中计算子孙ID。
+
+        参数:
+        - db (AsyncSession): 数据库会话。
+        - model (Any): 模型类。
+        - ids (list[int]): 节点ID。
+        - include_self (bool): 是否包含节点自身。
+
+        返回:
+        - list[int]: 子孙节点ID列表（去重）。
+        """
+        index = await cls._load_index(db, model)
+        result: dict[int, None] = {}
+        for node_id in ids:
+            if node_id in index:
+                result.update(dict.fromkeys(index.descendant_ids(node_id, include_self)))
+        if not include_self:
+            for node_id in ids:
+                result.pop(node_id, None)
+        return list(result)
@@ -11,10 +11,7 @@ from app.core.exceptions import CustomException
 DateTimeStr = Annotated[
     datetime,
     AfterValidator(lambda x: datetime_validator(x)),
-    PlainSerializer(
-        lambda x: x.strftime("%Y-%m-%d %H:%M:%S") if isinstance(x, datetime) else str(x),
-        return_type=str,
-    ),
+    PlainSerializer(lambda x: datetime_serializer(x), return_type=str),
     WithJsonSchema({"type": "string"}, mode="serialization"),
 ]
 
@@ -55,6 +52,25 @@ Email = Annotated[
 ]
 
 
+def datetime_serializer(value: Any) -> str:
+    """
+    日期时间序列化为 "%Y-%m-%d %H:%M:%S" 字符串。
+
+    列表响应中每行都会调用，无时区且年份为四位数时使用更快的 isoformat（结果与 strftime 一致）。
+
+    参数:
+    - value (Any): 日期时间值。
+
+    返回:
+    - str: 格式化后的字符串。
+    """
+    if isinstance(value, datetime):
+        if value.tzinfo is None and value.year >= 1000:
+            return value.isoformat(" ", "seconds")
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    return str(value)
+
+
 def datetime_validator(value: str | datetime) -> datetime:
     """
     日期格式验证器。
@@ -1,3 +1,4 @@
+import asyncio
 from collections.abc import AsyncGenerator
 from typing import Any
 
@@ -9,14 +10,16 @@ from fastapi.openapi.docs import (
     get_swagger_ui_oauth2_redirect_html,
 )
 from fastapi.responses import HTMLResponse
-from fastapi.staticfiles import StaticFiles
 from fastapi_limiter import FastAPILimiter
 from fastapi_limiter.depends import RateLimiter, WebSocketRateLimiter
 
 from app.config.setting import settings
+from app.core.compression import PrecompressedStaticFiles, precompress_static
 from app.core.exceptions import handle_exception
+from app.core.http_client import HttpClient
 from app.core.http_limit import http_limit_callback, ws_limit_callback
 from app.core.logger import log
+from app.core.startup import CacheWarmup, StartupGraph
 from app.scripts.initialize import InitializeData
 from app.utils.common_util import import_module, import_modules_async
 from app.utils.console import console_close, console_run
@@ -33,35 +36,76 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[Any, Any]:
     返回:
     - AsyncGenerator[Any, Any]: 生命周期上下文生成器。
     """
+    from app.api.v1.module_system.dict.model import DictDataModel, DictTypeModel
     from app.api.v1.module_system.dict.service import DictDataService
+    from app.api.v1.module_system.params.model import ParamsModel
     from app.api.v1.module_system.params.service import ParamsService
+    from app.common.enums import RedisInitKeyConfig
+    from app.plugin.module_application.ai.tools.mcp_manager import McpManager
     from app.plugin.module_application.job.tools.ap_scheduler import SchedulerUtil
 
-    try:
-        await InitializeData().init_db()
-        log.info(f"✅ {settings.DATABASE_TYPE}数据库初始化完成")
+    async def init_static() -> None:
+        if settings.STATIC_ENABLE and settings.STATIC_PRECOMPRESS:
+            count = await asyncio.to_thread(precompress_static, settings.STATIC_ROOT)
+            log.info(f"静态资源预压缩新生成 {count} 个文件")
+
+    async def init_events() -> None:
         await import_modules_async(
             modules=settings.EVENT_LIST, desc="全局事件", app=app, status=True
         )
-        log.info("✅ 全局事件模块加载完成")
-        await ParamsService().init_config_service(redis=app.state.redis)
-        log.info("✅ Redis系统配置初始化完成")
-        await DictDataService().init_dict_service(redis=app.state.redis)
-        log.info("✅ Redis数据字典初始化完成")
-        await SchedulerUtil.init_system_scheduler(redis=app.state.redis)
-        log.info("✅ 定时任务调度器初始化完成")
+
+    async def init_config() -> None:
+        # 其他 worker 已按当前数据版本预热过时跳过
+        warmed = await CacheWarmup.run(
+            redis=app.state.redis,
+            key=RedisInitKeyConfig.SYSTEM_CONFIG_WARMUP.key,
+            version=await CacheWarmup.version(ParamsModel),
+            func=lambda: ParamsService.init_config_service(redis=app.state.redis),
+        )
+        if not warmed:
+            log.info("Redis系统配置已是最新版本，跳过预热")
+
+    async def init_dict() -> None:
+        warmed = await CacheWarmup.run(
+            redis=app.state.redis,
+            key=RedisInitKeyConfig.SYSTEM_DICT_WARMUP.key,
+            version=await CacheWarmup.version(DictTypeModel, DictDataModel),
+            func=lambda: DictDataService.init_dict_service(redis=app.state.redis),
+        )
+        if not warmed:
+            log.info("Redis数据字典已是最新版本，跳过预热")
+
+    async def init_limiter() -> None:
         await FastAPILimiter.init(
             redis=app.state.redis,
             prefix=settings.REQUEST_LIMITER_REDIS_PREFIX,
             http_callback=http_limit_callback,
             ws_callback=ws_limit_callback,
         )
-        log.info("✅ 请求限流器初始化完成")
+
+    # 互不依赖的步骤并发执行；全局事件中包含 Redis 连接与依赖数据表的后台维护任务
+    startup = StartupGraph()
+    startup.add("database", InitializeData().init_db, f"{settings.DATABASE_TYPE}数据库初始化完成")
+    startup.add("http_client", HttpClient.startup, "外部HTTP客户端初始化完成")
+    startup.add("static", init_static, "静态资源预压缩完成")
+    startup.add("events", init_events, "全局事件模块加载完成", after=("database",))
+    startup.add("config", init_config, "Redis系统配置初始化完成", after=("events",))
+    startup.add("dict", init_dict, "Redis数据字典初始化完成", after=("events",))
+    startup.add(
+        "scheduler",
+        lambda: SchedulerUtil.init_system_scheduler(redis=app.state.redis),
+        "定时任务调度器初始化完成",
+        after=("events",),
+    )
+    startup.add("limiter", init_limiter, "请求限流器初始化完成", after=("events",))
+
+    try:
+        await startup.run()
 
         # 导入并显示最终的启动信息面板
         from app.common.enums import EnvironmentEnum
 
-        scheduler_jobs_count = len(SchedulerUtil.get_all_jobs())
+        scheduler_jobs_count = len(SchedulerUtil.list_job_states())
         scheduler_status = SchedulerUtil.get_job_status()
         console_run(
             host=settings.SERVER_HOST,
@@ -87,6 +131,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[Any, Any]:
         log.info("✅ 定时任务调度器已关闭")
         await FastAPILimiter.close()
         log.info("✅ 请求限制器已关闭")
+        await McpManager.shutdown()
+        log.info("✅ MCP 服务器连接已关闭")
+        await HttpClient.shutdown()
+        log.info("✅ 外部HTTP客户端已关闭")
         console_close()
 
     except Exception as e:
@@ -173,7 +221,7 @@ def register_files(app: FastAPI) -> None:
         settings.STATIC_ROOT.mkdir(parents=True, exist_ok=True)
         app.mount(
             path=settings.STATIC_URL,
-            app=StaticFiles(directory=settings.STATIC_ROOT),
+            app=PrecompressedStaticFiles(directory=settings.STATIC_ROOT),
             name=settings.STATIC_DIR,
         )
 
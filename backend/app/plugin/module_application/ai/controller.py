@@ -1,13 +1,15 @@
+import contextlib
 from typing import Annotated
 
 from fastapi import APIRouter, Body, Depends, Path
 from fastapi.responses import JSONResponse, StreamingResponse
+from redis.asyncio.client import Redis
 
 from app.api.v1.module_system.auth.schema import AuthSchema
 from app.common.request import PaginationService
 from app.common.response import StreamResponse, SuccessResponse
 from app.core.base_params import PaginationQueryParam
-from app.core.dependencies import AuthPermission
+from app.core.dependencies import AuthPermission, redis_getter
 from app.core.logger import log
 from app.core.router_class import OperationLogRoute
 
@@ -15,9 +17,11 @@ from .schema import (
     ChatQuerySchema,
     McpCreateSchema,
     McpQueryParam,
+    McpToolCallSchema,
     McpUpdateSchema,
 )
 from .service import McpService
+from .tools.stream_util import StreamLimiter, batch_tokens
 
 AIRouter = APIRouter(route_class=OperationLogRoute, prefix="/ai", tags=["MCP智能助手"])
 
@@ -26,12 +30,14 @@ AIRouter = APIRouter(route_class=OperationLogRoute, prefix="/ai", tags=["MCP智
 async def chat_controller(
     query: ChatQuerySchema,
     auth: Annotated[AuthSchema, Depends(AuthPermission(["module_application:ai:chat"]))],
+    redis: Annotated[Redis, Depends(redis_getter)],
 ) -> StreamingResponse:
     """
     智能对话接口
 
     参数:
     - query (ChatQuerySchema): 聊天查询模型
+    - redis (Redis): Redis数据库连接
 
     返回:
     - StreamingResponse: 流式响应,每次返回一个聊天响应
@@ -39,19 +45,80 @@ async def chat_controller(
     user_name = auth.user.name if auth.user else "未知用户"
     log.info(f"用户 {user_name} 发起智能对话: {query.message[:50]}...")
 
+    # 与 WebSocket 聊天共用每个用户的并发连接数限制
+    limit_key = f"user:{auth.user.username}" if auth.user else "user:-"
+
     async def generate_response():
+        if not StreamLimiter.acquire(limit_key):
+            yield "当前进行中的对话过多，请稍后再试".encode()
+            return
         try:
-            async for chunk in McpService.chat_query(query=query):
-                # 确保返回的是字节串
-                if chunk:
-                    yield (chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+            # token 按时间/大小合并后输出；客户端断开时取消生成
+            source = McpService.chat_query(
+                query=query, redis=redis, user_id=auth.user.id if auth.user else None
+            )
+            async with contextlib.aclosing(batch_tokens(source)) as chunks:
+                async for chunk in chunks:
+                    yield chunk.encode("utf-8")
         except Exception as e:
             log.error(f"流式响应出错: {e!s}")
             yield f"抱歉，处理您的请求时出现了错误: {e!s}".encode()
+        finally:
+            StreamLimiter.release(limit_key)
 
     return StreamResponse(generate_response(), media_type="text/plain; charset=utf-8")
 
 
+@AIRouter.get(
+    "/chat/history/{session_id}",
+    summary="获取对话历史",
+    description="获取当前用户某个会话的历史消息",
+)
+async def chat_history_controller(
+    session_id: Annotated[str, Path(max_length=64, description="会话ID")],
+    auth: Annotated[AuthSchema, Depends(AuthPermission(["module_application:ai:chat"]))],
+) -> JSONResponse:
+    """
+    获取对话历史接口
+
+    参数:
+    - session_id (str): 会话ID
+    - auth (AuthSchema): 认证信息模型
+
+    返回:
+    - JSONResponse: 包含历史消息列表的 JSON 响应
+    """
+    result_dict_list = await McpService.chat_history_service(auth=auth, session_id=session_id)
+    log.info(f"获取对话历史成功: {session_id}")
+    return SuccessResponse(data=result_dict_list, msg="获取对话历史成功")
+
+
+@AIRouter.delete(
+    "/chat/history/{session_id}",
+    summary="清空对话历史",
+    description="清空当前用户某个会话的上下文与历史消息",
+)
+async def chat_clear_controller(
+    session_id: Annotated[str, Path(max_length=64, description="会话ID")],
+    auth: Annotated[AuthSchema, Depends(AuthPermission(["module_application:ai:chat"]))],
+    redis: Annotated[Redis, Depends(redis_getter)],
+) -> JSONResponse:
+    """
+    清空对话历史接口
+
+    参数:
+    - session_id (str): 会话ID
+    - auth (AuthSchema): 认证信息模型
+    - redis (Redis): Redis数据库连接
+
+    返回:
+    - JSONResponse: 包含清空结果的 JSON 响应
+    """
+    await McpService.chat_clear_service(auth=auth, session_id=session_id, redis=redis)
+    log.info(f"清空对话历史成功: {session_id}")
+    return SuccessResponse(msg="清空对话历史成功")
+
+
 @AIRouter.get(
     "/detail/{id}",
     summary="获取 MCP 服务器详情",
@@ -75,6 +142,56 @@ async def detail_controller(
     return SuccessResponse(data=result_dict, msg="获取 MCP 服务器详情成功")
 
 
+@AIRouter.get(
+    "/tools/{id}",
+    summary="获取 MCP 服务器工具列表",
+    description="获取 MCP 服务器提供的工具列表(连接复用，结果缓存)",
+)
+async def tools_controller(
+    id: Annotated[int, Path(description="MCP ID")],
+    auth: Annotated[AuthSchema, Depends(AuthPermission(["module_application:ai:query"]))],
+) -> JSONResponse:
+    """
+    获取 MCP 服务器工具列表接口
+
+    参数:
+    - id (int): MCP 服务器ID
+    - auth (AuthSchema): 认证信息模型
+
+    返回:
+    - JSONResponse: 包含连接状态与工具列表的 JSON 响应
+    """
+    result_dict = await McpService.tools_service(auth=auth, id=id)
+    log.info(f"获取 MCP 服务器工具列表成功 {id}")
+    return SuccessResponse(data=result_dict, msg="获取 MCP 服务器工具列表成功")
+
+
+@AIRouter.post(
+    "/tools/{id}/call",
+    summary="调用 MCP 服务器工具",
+    description="通过复用的连接调用 MCP 服务器工具",
+)
+async def call_tool_controller(
+    id: Annotated[int, Path(description="MCP ID")],
+    data: McpToolCallSchema,
+    auth: Annotated[AuthSchema, Depends(AuthPermission(["module_application:ai:chat"]))],
+) -> JSONResponse:
+    """
+    调用 MCP 服务器工具接口
+
+    参数:
+    - id (int): MCP 服务器ID
+    - data (McpToolCallSchema): 工具调用参数
+    - auth (AuthSchema): 认证信息模型
+
+    返回:
+    - JSONResponse: 包含工具调用结果的 JSON 响应
+    """
+    result_dict = await McpService.call_tool_service(auth=auth, id=id, data=data)
+    log.info(f"调用 MCP 服务器工具成功 {id}: {data.name}")
+    return SuccessResponse(data=result_dict, msg="调用 MCP 服务器工具成功")
+
+
 @AIRouter.get("/list", summary="查询 MCP 服务器列表", description="查询 MCP 服务器列表")
 async def list_controller(
     page: Annotated[PaginationQueryParam, Depends()],
@@ -1,11 +1,13 @@
 from collections.abc import Sequence
 from typing import Any
 
+from sqlalchemy import delete, select
+
 from app.api.v1.module_system.auth.schema import AuthSchema
 from app.core.base_crud import CRUDBase
 
-from .model import McpModel
-from .schema import McpCreateSchema, McpUpdateSchema
+from .model import ChatMessageModel, McpModel
+from .schema import ChatMessageOutSchema, McpCreateSchema, McpUpdateSchema
 
 
 class McpCRUD(CRUDBase[McpModel, McpCreateSchema, McpUpdateSchema]):
@@ -110,3 +112,138 @@ class McpCRUD(CRUDBase[McpModel, McpCreateSchema, McpUpdateSchema]):
         - None
         """
         return await self.delete(ids=ids)
+
+
+class ChatMessageCRUD(CRUDBase[ChatMessageModel, ChatMessageOutSchema, ChatMessageOutSchema]):
+    """AI对话消息数据层"""
+
+    def __init__(self, auth: AuthSchema) -> None:
+        """
+        初始化CRUD
+
+        参数:
+        - auth (AuthSchema): 认证信息模型
+        """
+        self.auth = auth
+        super().__init__(model=ChatMessageModel, auth=auth)
+
+    async def recent_crud(
+        self, user_id: int, session_id: str, limit: int
+    ) -> list[ChatMessageModel]:
+        """
+        获取会话最近的问答消息（不含摘要，按时间正序）
+
+        参数:
+        - user_id (int): 用户ID
+        - session_id (str): 会话ID
+        - limit (int): 最多读取的消息条数
+
+        返回:
+        - list[ChatMessageModel]: 消息列表
+        """
+        sql = (
+            select(ChatMessageModel)
+            .where(
+                ChatMessageModel.created_id == user_id,
+                ChatMessageModel.session_id == session_id,
+                ChatMessageModel.role != "summary",
+            )
+            .order_by(ChatMessageModel.id.desc())
+            .limit(limit)
+        )
+        rows = list((await self.auth.db.execute(sql)).scalars().all())
+        rows.reverse()
+        return rows
+
+    async def latest_summary_crud(self, user_id: int, session_id: str) -> ChatMessageModel | None:
+        """
+        获取会话最近一次生成的摘要
+
+        参数:
+        - user_id (int): 用户ID
+        - session_id (str): 会话ID
+
+        返回:
+        - ChatMessageModel | None: 摘要消息
+        """
+        sql = (
+            select(ChatMessageModel)
+            .where(
+                ChatMessageModel.created_id == user_id,
+                ChatMessageModel.session_id == session_id,
+                ChatMessageModel.role == "summary",
+            )
+            .order_by(ChatMessageModel.id.desc())
+            .limit(1)
+        )
+        return (await self.auth.db.execute(sql)).scalars().first()
+
+    async def list_by_session_crud(
+        self, user_id: int, session_id: str
+    ) -> Sequence[ChatMessageModel]:
+        """
+        获取会话的全部问答消息（不含摘要）
+
+        参数:
+        - user_id (int): 用户ID
+        - session_id (str): 会话ID
+
+        返回:
+        - Sequence[ChatMessageModel]: 消息列表
+        """
+        sql = (
+            select(ChatMessageModel)
+            .where(
+                ChatMessageModel.created_id == user_id,
+                ChatMessageModel.session_id == session_id,
+                ChatMessageModel.role != "summary",
+            )
+            .order_by(ChatMessageModel.id.asc())
+        )
+        return (await self.auth.db.execute(sql)).scalars().all()
+
+    async def create_batch_crud(
+        self, user_id: int, session_id: str, messages: list[dict[str, Any]]
+    ) -> None:
+        """
+        批量写入消息
+
+        参数:
+        - user_id (int): 用户ID
+        - session_id (str): 会话ID
+        - messages (list[dict[str, Any]]): 消息列表，每项包含 role、content、tokens
+
+        返回:
+        - None
+        """
+        self.auth.db.add_all([
+            ChatMessageModel(
+                session_id=session_id,
+                role=message["role"],
+                content=message["content"],
+                tokens=message["tokens"],
+                created_id=user_id,
+                updated_id=user_id,
+            )
+            for message in messages
+        ])
+        await self.auth.db.flush()
+
+    async def delete_session_crud(self, user_id: int, session_id: str) -> None:
+        """
+        删除会话的全部消息
+
+        参数:
+        - user_id (int): 用户ID
+        - session_id (str): 会话ID
+
+        返回:
+        - None
+        """
+        await self.auth.db.execute(
+            delete(ChatMessageModel).where(
+                ChatMessageModel.created_id == user_id,
+                ChatMessageModel.session_id == session_id,
+            )
+        )
+        await self.auth.db.flush()
@@ -1,4 +1,4 @@
-from sqlalchemy import JSON, Integer, String
+from sqlalchemy import JSON, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.base_model import ModelMixin, UserMixin
@@ -22,3 +22,21 @@ class McpModel(ModelMixin, UserMixin):
     command: Mapped[str | None] = mapped_column(String(255), default=None, comment="MCP 命令")
     args: Mapped[str | None] = mapped_column(String(255), default=None, comment="MCP 命令参数")
     env: Mapped[dict[str, str] | None] = mapped_column(JSON(), default=None, comment="MCP 环境变量")
+
+
+class ChatMessageModel(ModelMixin, UserMixin):
+    """
+    AI对话消息归档表（按创建人+会话ID区分会话）
+    消息角色:
+    - user: 用户提问
+    - assistant: 模型回答
+    - summary: 早期消息的压缩摘要
+    """
+
+    __tablename__: str = "app_ai_chat_message"
+    __table_args__: dict[str, str] = {"comment": "AI对话消息表"}
+
+    session_id: Mapped[str] = mapped_column(String(64), index=True, comment="会话ID")
+    role: Mapped[str] = mapped_column(String(16), comment="消息角色(user/assistant/summary)")
+    content: Mapped[str] = mapped_column(Text, comment="消息内容")
+    tokens: Mapped[int] = mapped_column(Integer, default=0, comment="估算 token 数")
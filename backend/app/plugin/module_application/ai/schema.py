@@ -1,3 +1,5 @@
+from typing import Any
+
 from fastapi import Query
 from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
@@ -10,6 +12,25 @@ class ChatQuerySchema(BaseModel):
     """聊天查询模型"""
 
     message: str = Field(..., min_length=1, max_length=4000, description="聊天消息")
+    session_id: str | None = Field(
+        None,
+        max_length=64,
+        pattern=r"^[A-Za-z0-9_-]+$",
+        description="会话ID，携带时保存并使用多轮对话上下文",
+    )
+
+
+class ChatMessageOutSchema(BaseModel):
+    """对话消息详情"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int = Field(..., description="消息ID")
+    session_id: str = Field(..., description="会话ID")
+    role: str = Field(..., description="消息角色(user/assistant/summary)")
+    content: str = Field(..., description="消息内容")
+    tokens: int = Field(0, description="估算 token 数")
+    created_time: DateTimeStr | None = Field(None, description="创建时间")
 
 
 class McpCreateSchema(BaseModel):
@@ -34,6 +55,13 @@ class McpOutSchema(McpCreateSchema, BaseSchema, UserBySchema):
     model_config = ConfigDict(from_attributes=True)
 
 
+class McpToolCallSchema(BaseModel):
+    """MCP 工具调用参数"""
+
+    name: str = Field(..., min_length=1, max_length=128, description="工具名称")
+    arguments: dict[str, Any] | None = Field(None, description="工具参数")
+
+
 class McpQueryParam:
     """MCP 服务器查询参数"""
 
@@ -1,19 +1,28 @@
 from collections.abc import AsyncGenerator
+from functools import partial
 from typing import Any
 
+from redis.asyncio.client import Redis
+
 from app.api.v1.module_system.auth.schema import AuthSchema
+from app.config.setting import settings
+from app.core.database import after_commit
 from app.core.exceptions import CustomException
 from app.core.logger import log
 
-from .crud import McpCRUD
+from .crud import ChatMessageCRUD, McpCRUD
 from .schema import (
+    ChatMessageOutSchema,
     ChatQuerySchema,
     McpCreateSchema,
     McpOutSchema,
     McpQueryParam,
+    McpToolCallSchema,
     McpUpdateSchema,
 )
 from .tools.ai_util import AIClient
+from .tools.mcp_manager import McpManager
+from .tools.memory_util import ChatMemory
 
 
 class McpService:
@@ -98,7 +107,10 @@ class McpService:
         if exist_obj and exist_obj.id != id:
             raise CustomException(msg="更新失败，MCP 服务器名称重复")
         obj = await McpCRUD(auth).update_crud(id=id, data=data)
-        return McpOutSchema.model_validate(obj).model_dump()
+        config = McpOutSchema.model_validate(obj)
+        # 事务提交后，已建立的连接再按新参数平滑重连
+        after_commit(auth.db, partial(McpManager.reload, config))
+        return config.model_dump()
 
     @classmethod
     async def delete_service(cls, auth: AuthSchema, ids: list[int]) -> None:
@@ -119,26 +131,137 @@ class McpService:
             if not obj:
                 raise CustomException(msg="删除失败，该数据不存在")
         await McpCRUD(auth).delete_crud(ids=ids)
+        after_commit(auth.db, partial(McpManager.remove, ids))
+
+    @classmethod
+    async def tools_service(cls, auth: AuthSchema, id: int) -> dict[str, Any]:
+        """
+        获取MCP服务器提供的工具列表
+
+        参数:
+        - auth (AuthSchema): 认证信息模型
+        - id (int): MCP服务器ID
+
+        返回:
+        - dict[str, Any]: 连接状态与工具列表
+        """
+        obj = await McpCRUD(auth).get_by_id_crud(id=id)
+        if not obj:
+            raise CustomException(msg="MCP 服务器不存在")
+        conn = McpManager.get(McpOutSchema.model_validate(obj))
+        tools = await conn.list_tools()
+        return {
+            "status": conn.stats(),
+            "tools": [
+                {
+                    "name": tool.name,
+                    "description": tool.description,
+                    "input_schema": tool.inputSchema,
+                }
+                for tool in tools
+            ],
+        }
+
+    @classmethod
+    async def call_tool_service(
+        cls, auth: AuthSchema, id: int, data: McpToolCallSchema
+    ) -> dict[str, Any]:
+        """
+        调用MCP服务器的工具
+
+        参数:
+        - auth (AuthSchema): 认证信息模型
+        - id (int): MCP服务器ID
+        - data (McpToolCallSchema): 工具调用参数
+
+        返回:
+        - dict[str, Any]: 工具调用结果
+        """
+        obj = await McpCRUD(auth).get_by_id_crud(id=id)
+        if not obj:
+            raise CustomException(msg="MCP 服务器不存在")
+        conn = McpManager.get(McpOutSchema.model_validate(obj))
+        try:
+            result = await conn.call_tool(data.name, data.arguments)
+        except CustomException:
+            raise
+        except Exception as e:
+            raise CustomException(msg=f"MCP 工具调用失败: {e!s}")
+        return result.model_dump(mode="json", exclude_none=True)
 
     @classmethod
-    async def chat_query(cls, query: ChatQuerySchema) -> AsyncGenerator[str, Any]:
+    async def chat_query(
+        cls, query: ChatQuerySchema, redis: Redis | None = None, user_id: int | None = None
+    ) -> AsyncGenerator[str, Any]:
         """
         处理聊天查询
 
         参数:
         - query (ChatQuerySchema): 聊天查询模型
+        - redis (Redis | None): Redis 连接，用于回答缓存与会话上下文
+        - user_id (int | None): 用户ID，与 query.session_id 同时提供时使用多轮对话上下文
 
         返回:
         - AsyncGenerator[str, None]: 异步生成器,每次返回一个聊天响应
         """
-        # 创建MCP客户端实例
+        # 获取MCP客户端实例（模型实例在进程内复用）
         mcp_client = AIClient()
+        memory = None
+        history = None
+        if settings.AI_MEMORY_ENABLE and user_id and query.session_id:
+            memory = ChatMemory(redis=redis, user_id=user_id, session_id=query.session_id)
+            await memory.load()
+            history = memory.build_messages(query.message)
         try:
             # 处理消息
-            async for response in mcp_client.process(query.message):
+            chunks: list[str] = []
+            async for response in mcp_client.process(query.message, redis=redis, history=history):
+                chunks.append(response)
                 yield response
         except Exception as e:
             log.debug(f"关闭AIClient时发生异常(预期行为，服务可能正在关闭): {e}")
             raise CustomException(
                 msg=f"关闭AIClient时发生异常(预期行为，服务可能正在关闭), 异常信息: {e}"
             )
+        # 完整回答结束后保存本轮问答（中途取消或上游失败时不保存）
+        if memory is not None and mcp_client.error is None and chunks:
+            memory.save_turn(query.message, "".join(chunks))
+
+    @classmethod
+    async def chat_history_service(cls, auth: AuthSchema, session_id: str) -> list[dict[str, Any]]:
+        """
+        获取当前用户某个会话的历史消息
+
+        参数:
+        - auth (AuthSchema): 认证信息模型
+        - session_id (str): 会话ID
+
+        返回:
+        - list[dict[str, Any]]: 消息详情字典列表
+        """
+        if not auth.user:
+            raise CustomException(msg="用户未登录")
+        obj_list = await ChatMessageCRUD(auth).list_by_session_crud(
+            user_id=auth.user.id, session_id=session_id
+        )
+        return [ChatMessageOutSchema.model_validate(obj).model_dump() for obj in obj_list]
+
+    @classmethod
+    async def chat_clear_service(
+        cls, auth: AuthSchema, session_id: str, redis: Redis | None = None
+    ) -> None:
+        """
+        清空当前用户某个会话的上下文与历史消息
+
+        参数:
+        - auth (AuthSchema): 认证信息模型
+        - session_id (str): 会话ID
+        - redis (Redis | None): Redis 连接
+
+        返回:
+        - None
+        """
+        if not auth.user:
+            raise CustomException(msg="用户未登录")
+        await ChatMemory(redis=redis, user_id=auth.user.id, session_id=session_id).clear()
+        await ChatMessageCRUD(auth).delete_session_crud(user_id=auth.user.id, session_id=session_id)
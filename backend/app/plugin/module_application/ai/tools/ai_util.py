@@ -1,56 +1,213 @@
+import asyncio
+import contextlib
+import hashlib
 from collections.abc import AsyncGenerator
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_openai import ChatOpenAI
+from redis.asyncio.client import Redis
 
+from app.common.enums import RedisInitKeyConfig
 from app.config.setting import settings
 from app.core.exceptions import CustomException
+from app.core.http_client import HttpClient
 from app.core.logger import log
+from app.core.redis_crud import RedisCURD
+
+if TYPE_CHECKING:
+    from langchain_core.messages import BaseMessage
+    from langchain_openai import ChatOpenAI
 
 
 class AIClient:
     """
     AI客户端类，用于与OpenAI API交互。
+
+    - 同一模型与服务地址的 ChatOpenAI 在进程内只创建一次，并复用共享 HTTP 连接池，
+      构造 AIClient 只是一次字典查找；
+    - 每个服务商（服务地址）用信号量限制并发请求数（OPENAI_MAX_CONCURRENCY）；
+    - 开启 OPENAI_CACHE_ENABLE 后，系统提示词+提问完全相同的完整回答缓存到 Redis，
+      命中时不再请求上游；
+    - 相同提问并发到达时只向上游发起一次请求，其余请求等待其完成后直接返回完整回答；
+    - 携带多轮对话上下文时回答依赖上下文，不使用回答缓存与并发合并。
     """
 
-    def __init__(self) -> None:
-        # 使用LangChain的ChatOpenAI类
-        self.model = ChatOpenAI(
-            api_key=lambda: settings.OPENAI_API_KEY,
-            model=settings.OPENAI_MODEL,
-            base_url=settings.OPENAI_BASE_URL,
-            temperature=0.7,
-            streaming=True,
-        )
-
-    async def process(self, query: str) -> AsyncGenerator[str, Any]:
+    SYSTEM_PROMPT = "你是一个有用的AI助手，可以帮助用户回答问题和提供帮助。请用中文回答用户的问题。"
+
+    # {(模型, 服务地址): ChatOpenAI}
+    _models: dict[tuple[str, str], "ChatOpenAI"] = {}
+    # {服务地址: 并发信号量}
+    _semaphores: dict[str, asyncio.Semaphore] = {}
+    # {提问摘要: 进行中请求的完整回答，失败时为 None}
+    _inflight: dict[str, asyncio.Future[str | None]] = {}
+
+    def __init__(self, model: str | None = None, base_url: str | None = None) -> None:
+        """
+        初始化AI客户端（从进程级注册表获取模型实例）。
+
+        参数:
+        - model (str | None): 模型名称，默认使用 OPENAI_MODEL。
+        - base_url (str | None): 服务地址，默认使用 OPENAI_BASE_URL。
+        """
+        self.model_name = model or settings.OPENAI_MODEL
+        self.base_url = base_url or settings.OPENAI_BASE_URL
+        self.model = self.get_model(self.model_name, self.base_url)
+        # 最近一次 process() 调用中上游请求的异常，成功时为 None
+        self.error: Exception | None = None
+
+    @classmethod
+    def get_model(cls, model: str, base_url: str) -> "ChatOpenAI":
+        """
+        获取（必要时创建）模型实例。
+
+        参数:
+        - model (str): 模型名称。
+        - base_url (str): 服务地址。
+
+        返回:
+        - ChatOpenAI: 共享的模型实例。
+        """
+        instance = cls._models.get((model, base_url))
+        if instance is None:
+            # langchain/openai 导入耗时较长，首次使用时再导入
+            from langchain_openai import ChatOpenAI
+
+            # 使用LangChain的ChatOpenAI类
+            instance = ChatOpenAI(
+                api_key=lambda: settings.OPENAI_API_KEY,
+                model=model,
+                base_url=base_url,
+                temperature=0.7,
+                streaming=True,
+                # 复用应用级共享连接池，避免每次对话新建连接
+                http_async_client=HttpClient.client(),
+            )
+            cls._models[(model, base_url)] = instance
+        return instance
+
+    @classmethod
+    def _semaphore(cls, base_url: str) -> asyncio.Semaphore:
+        """
+        获取服务商的并发信号量。
+
+        参数:
+        - base_url (str): 服务地址。
+
+        返回:
+        - asyncio.Semaphore: 信号量。
+        """
+        semaphore = cls._semaphores.get(base_url)
+        if semaphore is None:
+            semaphore = cls._semaphores[base_url] = asyncio.Semaphore(
+                settings.OPENAI_MAX_CONCURRENCY
+            )
+        return semaphore
+
+    def _cache_key(self, query: str) -> str:
+        """
+        计算回答缓存键。
+
+        参数:
+        - query (str): 用户查询。
+
+        返回:
+        - str: Redis 键名。
+        """
+        raw = "\n".join((self.model_name, self.base_url, self.SYSTEM_PROMPT, query))
+        digest = hashlib.sha256(raw.encode()).hexdigest()
+        return f"{RedisInitKeyConfig.AI_CHAT_CACHE.key}:{digest}"
+
+    async def process(
+        self,
+        query: str,
+        redis: Redis | None = None,
+        history: list["BaseMessage"] | None = None,
+    ) -> AsyncGenerator[str, Any]:
         """
         处理查询并返回流式响应
 
         参数:
         - query (str): 用户查询。
+        - redis (Redis | None): Redis 连接，开启回答缓存时用于读写缓存。
+        - history (list[BaseMessage] | None): 多轮对话上下文（位于系统提示词与本轮提问之间）。
+
+        返回:
+        - AsyncGenerator[str, Any]: 流式响应内容。
+        """
+        self.error = None
+        if history:
+            async with contextlib.aclosing(self._stream(query, history)) as stream:
+                async for text in stream:
+                    yield text
+            return
+
+        key = self._cache_key(query)
+        use_cache = settings.OPENAI_CACHE_ENABLE and redis is not None
+        if use_cache:
+            cached = await RedisCURD(redis).get(key)  # type: ignore[arg-type]
+            if cached:
+                yield cached
+                return
+
+        # 相同提问正在请求中，等待其完成后直接返回
+        pending = self._inflight.get(key)
+        if pending is not None:
+            answer = await asyncio.shield(pending)
+            if answer is not None:
+                yield answer
+                return
+
+        future: asyncio.Future[str | None] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        chunks: list[str] = []
+        try:
+            async with contextlib.aclosing(self._stream(query)) as stream:
+                async for text in stream:
+                    chunks.append(text)
+                    yield text
+
+            answer = "".join(chunks)
+            if self.error is None:
+                future.set_result(answer)
+                if use_cache and answer:
+                    await RedisCURD(redis).set(key, answer, expire=settings.OPENAI_CACHE_TTL)  # type: ignore[arg-type]
+        finally:
+            if not future.done():
+                # 失败或被取消：等待中的请求各自重新发起
+                future.set_result(None)
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    async def _stream(
+        self, query: str, history: list["BaseMessage"] | None = None
+    ) -> AsyncGenerator[str, Any]:
+        """
+        请求上游并流式返回内容，失败时记录到 self.error 并返回友好提示。
+
+        参数:
+        - query (str): 用户查询。
+        - history (list[BaseMessage] | None): 多轮对话上下文。
 
         返回:
         - AsyncGenerator[str, Any]: 流式响应内容。
         """
-        system_prompt = (
-            """你是一个有用的AI助手，可以帮助用户回答问题和提供帮助。请用中文回答用户的问题。"""
-        )
+        from langchain_core.messages import HumanMessage, SystemMessage
 
         try:
             # 使用LangChain的异步流式生成
             messages = [
-                SystemMessage(content=system_prompt),
+                SystemMessage(content=self.SYSTEM_PROMPT),
+                *(history or []),
                 HumanMessage(content=query),
             ]
 
             # 使用LangChain的流式响应
-            async for chunk in self.model.astream(messages):
-                yield chunk.text
+            async with self._semaphore(self.base_url):
+                async for chunk in self.model.astream(messages):
+                    yield chunk.text
 
         except Exception as e:
             # 记录详细错误，返回友好提示
+            self.error = e
             log.error(f"AI处理查询失败: {e!s}")
             yield self._friendly_error_message(e)
 
@@ -0,0 +1,410 @@
+import asyncio
+import contextlib
+import shlex
+import time
+from collections.abc import AsyncIterator, Iterable
+from datetime import timedelta
+from typing import Any
+
+from app.common.enums import McpType
+from app.config.setting import settings
+from app.core.exceptions import CustomException
+from app.core.logger import log
+
+from ..schema import McpOutSchema
+
+
+class McpConnection:
+    """
+    单个 MCP 服务器的长连接
+
+    - 由一个监督任务持有传输层与 ClientSession 的完整生命周期（stdio 子进程只启动一次，
+      sse 只建立一次长连接），连接建立后按 MCP_HEALTH_INTERVAL 发送 ping 做健康检查；
+    - 连接失败、进程退出或 ping 超时后按指数退避自动重启；
+    - ClientSession 按请求ID复用同一连接，多个工具调用可并发进行，并发数受 MCP_MAX_CONCURRENCY 限制；
+    - list_tools 结果缓存 MCP_TOOLS_CACHE_TTL 秒，重连或收到 tools/list_changed 通知时失效。
+    """
+
+    def __init__(self, config: McpOutSchema) -> None:
+        """
+        初始化连接（不会立即连接，需调用 start()）。
+
+        参数:
+        - config (McpOutSchema): MCP 服务器配置。
+        """
+        self.config = config
+        self.fingerprint = self.get_fingerprint(config)
+        self._session: Any = None
+        self._ready = asyncio.Event()
+        self._stop = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._semaphore = asyncio.Semaphore(settings.MCP_MAX_CONCURRENCY)
+        self._task: asyncio.Task[None] | None = None
+        self._tools: list[Any] | None = None
+        self._tools_loaded_at = 0.0
+        self.in_flight = 0
+        self.calls = 0
+        self.restarts = 0
+        self.connected_at = 0.0
+        self.last_error: str | None = None
+
+    @staticmethod
+    def get_fingerprint(config: McpOutSchema) -> str:
+        """
+        计算连接参数指纹，参数变化时需要重连。
+
+        参数:
+        - config (McpOutSchema): MCP 服务器配置。
+
+        返回:
+        - str: 指纹。
+        """
+        return config.model_dump_json(include={"type", "url", "command", "args", "env"})
+
+    @property
+    def connected(self) -> bool:
+        """连接是否就绪"""
+        return self._ready.is_set()
+
+    def start(self) -> None:
+        """
+        启动监督任务。
+
+        返回:
+        - None
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._supervise(), name=f"mcp:{self.config.name}")
+
+    @contextlib.asynccontextmanager
+    async def _open(self) -> AsyncIterator[Any]:
+        """
+        建立传输层并初始化 ClientSession。
+
+        返回:
+        - AsyncIterator[Any]: 已初始化的 ClientSession。
+        """
+        from mcp import ClientSession
+        from mcp.client.sse import sse_client
+        from mcp.client.stdio import StdioServerParameters, stdio_client
+
+        config = self.config
+        if config.type == McpType.sse:
+            if not config.url:
+                raise CustomException(msg="MCP 服务器未配置 SSE 地址")
+            transport = sse_client(str(config.url))
+        else:
+            if not config.command:
+                raise CustomException(msg="MCP 服务器未配置启动命令")
+            transport = stdio_client(
+                StdioServerParameters(
+                    command=config.command,
+                    args=shlex.split(config.args or ""),
+                    env=config.env or None,
+                )
+            )
+        async with transport as (read_stream, write_stream):
+            async with ClientSession(
+                read_stream, write_stream, message_handler=self._on_message
+            ) as session:
+                await session.initialize()
+                yield session
+
+    async def _on_message(self, message: Any) -> None:
+        """
+        处理服务器推送的消息：工具列表变化时使缓存失效。
+
+        参数:
+        - message (Any): 服务器请求、通知或异常。
+
+        返回:
+        - None
+        """
+        from mcp import types
+
+        if isinstance(message, types.ServerNotification) and isinstance(
+            message.root, types.ToolListChangedNotification
+        ):
+            self._tools = None
+
+    async def _supervise(self) -> None:
+        """
+        监督任务：建立连接、健康检查，失败后按指数退避重启，直到 close()。
+
+        返回:
+        - None
+        """
+        delay = settings.MCP_RESTART_BACKOFF
+        while not self._stop.is_set():
+            try:
+                async with self._open() as session:
+                    self._session = session
+                    self._tools = None
+                    self.connected_at = time.monotonic()
+                    self.last_error = None
+                    self._ready.set()
+                    log.info(f"MCP 服务器 {self.config.name} 已连接")
+                    delay = settings.MCP_RESTART_BACKOFF
+                    await self._health_check(session)
+            except Exception as e:
+                self.last_error = str(e) or type(e).__name__
+                log.error(f"MCP 服务器 {self.config.name} 连接异常: {self.last_error}")
+            finally:
+                self._ready.clear()
+                self._session = None
+            if self._stop.is_set():
+                break
+            self.restarts += 1
+            log.info(f"MCP 服务器 {self.config.name} 将在 {delay:.1f} 秒后重启")
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._stop.wait(), delay)
+            delay = min(delay * 2, settings.MCP_RESTART_MAX_BACKOFF)
+
+    async def _health_check(self, session: Any) -> None:
+        """
+        定期 ping，直到 close() 或 ping 失败。
+
+        参数:
+        - session (Any): ClientSession。
+
+        返回:
+        - None
+
+        异常:
+        - asyncio.TimeoutError: ping 超时。
+        """
+        while True:
+            try:
+                await asyncio.wait_for(self._stop.wait(), settings.MCP_HEALTH_INTERVAL)
+                return
+            except asyncio.TimeoutError:
+                pass
+            await asyncio.wait_for(session.send_ping(), settings.MCP_HEALTH_TIMEOUT)
+
+    async def _get_session(self) -> Any:
+        """
+        等待连接就绪并返回 ClientSession。
+
+        返回:
+        - Any: ClientSession。
+
+        异常:
+        - CustomException: 等待超时或连接已关闭。
+        """
+        if self._stop.is_set():
+            raise CustomException(msg=f"MCP 服务器 {self.config.name} 连接已关闭")
+        self.start()
+        try:
+            await asyncio.wait_for(self._ready.wait(), settings.MCP_CONNECT_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise CustomException(
+                msg=f"MCP 服务器 {self.config.name} 连接失败: {self.last_error or '连接超时'}"
+            )
+        return self._session
+
+    async def list_tools(self) -> list[Any]:
+        """
+        获取工具列表（带缓存）。
+
+        返回:
+        - list[Any]: mcp.types.Tool 列表。
+        """
+        if self._tools is not None and (
+            time.monotonic() - self._tools_loaded_at <= settings.MCP_TOOLS_CACHE_TTL
+        ):
+            return self._tools
+        session = await self._get_session()
+        tools: list[Any] = []
+        cursor = None
+        while True:
+            result = await asyncio.wait_for(
+                session.list_tools(cursor=cursor), settings.MCP_CALL_TIMEOUT
+            )
+            tools.extend(result.tools)
+            cursor = result.nextCursor
+            if not cursor:
+                break
+        self._tools = tools
+        self._tools_loaded_at = time.monotonic()
+        return tools
+
+    async def call_tool(self, name: str, arguments: dict[str, Any] | None = None) -> Any:
+        """
+        调用工具。
+
+        参数:
+        - name (str): 工具名称。
+        - arguments (dict[str, Any] | None): 工具参数。
+
+        返回:
+        - Any: mcp.types.CallToolResult。
+        """
+        async with self._semaphore:
+            self.in_flight += 1
+            self._idle.clear()
+            try:
+                session = await self._get_session()
+                self.calls += 1
+                return await session.call_tool(
+                    name,
+                    arguments,
+                    read_timeout_seconds=timedelta(seconds=settings.MCP_CALL_TIMEOUT),
+                )
+            finally:
+                self.in_flight -= 1
+                if self.in_flight == 0:
+                    self._idle.set()
+
+    async def close(self, drain: bool = True) -> None:
+        """
+        关闭连接。
+
+        参数:
+        - drain (bool): 是否先等待进行中的调用完成（最长 MCP_DRAIN_TIMEOUT 秒）。
+
+        返回:
+        - None
+        """
+        if drain:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._idle.wait(), settings.MCP_DRAIN_TIMEOUT)
+        self._stop.set()
+        task, self._task = self._task, None
+        if task is None:
+            return
+        try:
+            await asyncio.wait_for(task, settings.MCP_HEALTH_TIMEOUT)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            pass
+        except Exception as e:
+            log.warning(f"关闭 MCP 服务器 {self.config.name} 连接时发生异常: {e!s}")
+
+    def stats(self) -> dict[str, Any]:
+        """
+        获取连接状态。
+
+        返回:
+        - dict[str, Any]: 连接状态与统计。
+        """
+        return {
+            "id": self.config.id,
+            "name": self.config.name,
+            "connected": self.connected,
+            "uptime": round(time.monotonic() - self.connected_at, 1) if self.connected else 0.0,
+            "in_flight": self.in_flight,
+            "calls": self.calls,
+            "restarts": self.restarts,
+            "tools_cached": self._tools is not None,
+            "last_error": self.last_error,
+        }
+
+
+class McpManager:
+    """
+    MCP 连接管理器（进程级）
+
+    每个 MCP 服务器（app_ai_mcp 的一行）对应一个 McpConnection，首次使用时建立并一直保持；
+    修改连接参数后 reload() 平滑切换：新调用立即使用新连接，旧连接在进行中的调用完成后关闭；
+    删除或应用关闭时断开。
+    """
+
+    _connections: dict[int, McpConnection] = {}
+    # 平滑切换时正在关闭的旧连接，持有引用避免被回收
+    _closing: set[asyncio.Task[None]] = set()
+
+    @classmethod
+    def get(cls, config: McpOutSchema) -> McpConnection:
+        """
+        获取（必要时建立）MCP 服务器连接，连接参数变化时自动切换。
+
+        参数:
+        - config (McpOutSchema): MCP 服务器配置。
+
+        返回:
+        - McpConnection: 连接。
+        """
+        conn = cls._connections.get(config.id)
+        if conn is not None and conn.fingerprint == McpConnection.get_fingerprint(config):
+            conn.config = config
+            return conn
+        return cls._replace(config)
+
+    @classmethod
+    def _replace(cls, config: McpOutSchema) -> McpConnection:
+        """
+        建立新连接替换旧连接，旧连接在后台排空后关闭。
+
+        参数:
+        - config (McpOutSchema): MCP 服务器配置。
+
+        返回:
+        - McpConnection: 新连接。
+        """
+        conn = McpConnection(config)
+        conn.start()
+        old = cls._connections.get(config.id)
+        cls._connections[config.id] = conn
+        if old is not None:
+            task = asyncio.create_task(old.close(drain=True))
+            cls._closing.add(task)
+            task.add_done_callback(cls._closing.discard)
+        return conn
+
+    @classmethod
+    async def reload(cls, config: McpOutSchema) -> None:
+        """
+        MCP 服务器被修改：已建立的连接在连接参数变化时平滑重连，否则只更新名称等信息。
+
+        参数:
+        - config (McpOutSchema): 修改后的 MCP 服务器配置。
+
+        返回:
+        - None
+        """
+        conn = cls._connections.get(config.id)
+        if conn is None:
+            return
+        if conn.fingerprint == McpConnection.get_fingerprint(config):
+            conn.config = config
+            return
+        log.info(f"MCP 服务器 {config.name} 连接参数已修改，重新连接")
+        cls._replace(config)
+
+    @classmethod
+    async def remove(cls, ids: Iterable[int]) -> None:
+        """
+        MCP 服务器被删除：断开连接。
+
+        参数:
+        - ids (Iterable[int]): MCP 服务器ID。
+
+        返回:
+        - None
+        """
+        conns = [conn for id in ids if (conn := cls._connections.pop(id, None)) is not None]
+        await asyncio.gather(*(conn.close(drain=False) for conn in conns))
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """
+        应用关闭时断开全部连接。
+
+        返回:
+        - None
+        """
+        conns = list(cls._connections.values())
+        cls._connections = {}
+        await asyncio.gather(*(conn.close(drain=False) for conn in conns))
+        if cls._closing:
+            await asyncio.gather(*cls._closing, return_exceptions=True)
+
+    @classmethod
+    def stats(cls) -> list[dict[str, Any]]:
+        """
+        获取全部连接的状态。
+
+        返回:
+        - list[dict[str, Any]]: 每个连接一项。
+        """
+        return [conn.stats() for conn in cls._connections.values()]
@@ -0,0 +1,298 @@
+import asyncio
+import json
+import weakref
+from typing import TYPE_CHECKING, Any
+
+from redis.asyncio.client import Redis
+
+from app.api.v1.module_system.auth.schema import AuthSchema
+from app.common.enums import RedisInitKeyConfig
+from app.config.setting import settings
+from app.core.database import async_db_session
+from app.core.logger import log
+from app.core.redis_crud import RedisCURD
+
+from ..crud import ChatMessageCRUD
+
+if TYPE_CHECKING:
+    from langchain_core.messages import BaseMessage
+
+SUMMARY_PROMPT = (
+    "请把以下对话压缩为一段简洁的中文摘要，保留用户的目标、关键事实、已达成的结论和未解决的问题，"
+    "不要添加对话中没有的信息。"
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    估算文本的 token 数（中文等非 ASCII 字符按 1 个计，ASCII 按 4 个字符 1 个计，另加单条消息开销）。
+
+    参数:
+    - text (str): 文本。
+
+    返回:
+    - int: 估算的 token 数。
+    """
+    non_ascii = sum(1 for ch in text if ord(ch) > 127)
+    return non_ascii + (len(text) - non_ascii + 3) // 4 + 4
+
+
+class ChatMemory:
+    """
+    多轮对话上下文（按用户+会话ID区分）
+
+    - 热数据存放在 Redis：摘要 + 最近消息，每条消息写入时计算一次 token 数并累计，
+      裁剪时只需从头部弹出消息、扣减计数，不重复计算历史；
+    - 全部消息归档到数据库（app_ai_chat_message），Redis 过期或丢失时从最近一条摘要开始恢复；
+    - 每轮发送给模型的摘要+历史+提问不超过 AI_MEMORY_TOKEN_BUDGET，超出预算的早期消息
+      在开启 AI_MEMORY_SUMMARY_ENABLE 时由模型合并进摘要，否则直接截断（数据库中仍保留）；
+    - 保存（含摘要生成）在回答结束后于后台进行，不占用本轮响应时间；同一会话的读取会等待
+      上一轮保存完成，保证上下文连续。
+    """
+
+    # {会话键: 读写锁}，会话结束后随引用释放
+    _locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
+    # 后台保存任务，持有引用避免被回收
+    _tasks: set[asyncio.Task[None]] = set()
+
+    def __init__(self, redis: Redis | None, user_id: int, session_id: str) -> None:
+        """
+        初始化会话上下文。
+
+        参数:
+        - redis (Redis | None): Redis 连接，为空时每轮从数据库恢复。
+        - user_id (int): 用户ID。
+        - session_id (str): 会话ID。
+        """
+        self.redis = redis
+        self.user_id = user_id
+        self.session_id = session_id
+        self.key = f"{RedisInitKeyConfig.AI_CHAT_MEMORY.key}:{user_id}:{session_id}"
+        self.state: dict[str, Any] = self._empty_state()
+
+    @staticmethod
+    def _empty_state() -> dict[str, Any]:
+        """
+        空的会话状态：messages 每项为 [角色, 内容, token 数]，tokens 为消息 token 总数。
+
+        返回:
+        - dict[str, Any]: 会话状态。
+        """
+        return {"summary": "", "summary_tokens": 0, "messages": [], "tokens": 0}
+
+    def _lock(self) -> asyncio.Lock:
+        """
+        获取会话的读写锁。
+
+        返回:
+        - asyncio.Lock: 锁。
+        """
+        lock = self._locks.get(self.key)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[self.key] = lock
+        return lock
+
+    async def load(self) -> None:
+        """
+        加载会话状态（Redis 优先，未命中时从数据库恢复）。
+
+        返回:
+        - None
+        """
+        async with self._lock():
+            if self.redis is not None:
+                cached = await RedisCURD(self.redis).get(self.key)
+                if cached:
+                    self.state = json.loads(cached)
+                    return
+            self.state = await self._load_archive()
+            self._trim(self.state, 0)
+            await self._save_hot()
+
+    async def _load_archive(self) -> dict[str, Any]:
+        """
+        从数据库恢复最近一次摘要与最近的消息（随后按预算裁剪，与摘要重叠的早期消息会被优先移除）。
+
+        返回:
+        - dict[str, Any]: 会话状态。
+        """
+        state = self._empty_state()
+        async with async_db_session() as session:
+            crud = ChatMessageCRUD(AuthSchema(db=session))
+            summary = await crud.latest_summary_crud(
+                user_id=self.user_id, session_id=self.session_id
+            )
+            rows = await crud.recent_crud(
+                user_id=self.user_id,
+                session_id=self.session_id,
+                limit=settings.AI_MEMORY_LOAD_LIMIT,
+            )
+        if summary is not None:
+            state["summary"] = summary.content
+            state["summary_tokens"] = summary.tokens
+        for row in rows:
+            state["messages"].append([row.role, row.content, row.tokens])
+            state["tokens"] += row.tokens
+        return state
+
+    @staticmethod
+    def _trim(state: dict[str, Any], reserve: int) -> list[list[Any]]:
+        """
+        从最早的消息开始按整轮移除，直到摘要+消息+预留不超过预算。
+
+        参数:
+        - state (dict[str, Any]): 会话状态（原地修改）。
+        - reserve (int): 需要预留的 token 数（本轮提问）。
+
+        返回:
+        - list[list[Any]]: 被移除的消息。
+        """
+        budget = settings.AI_MEMORY_TOKEN_BUDGET - reserve - state["summary_tokens"]
+        evicted = []
+        messages = state["messages"]
+        while messages and (state["tokens"] > budget or messages[0][0] != "user"):
+            # 按整轮移除，保证上下文总是以用户提问开头
+            message = messages.pop(0)
+            state["tokens"] -= message[2]
+            evicted.append(message)
+        return evicted
+
+    def build_messages(self, query: str) -> list["BaseMessage"]:
+        """
+        构造本轮发送给模型的上下文（摘要+历史，不含系统提示词与本轮提问），总量不超过预算。
+
+        参数:
+        - query (str): 本轮提问。
+
+        返回:
+        - list[BaseMessage]: 上下文消息。
+        """
+        from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+        state = {**self.state, "messages": list(self.state["messages"])}
+        self._trim(state, estimate_tokens(query))
+        messages: list[BaseMessage] = []
+        if state["summary"]:
+            messages.append(SystemMessage(content=f"此前对话的摘要：{state['summary']}"))
+        for role, content, _ in state["messages"]:
+            messages.append(
+                HumanMessage(content=content) if role == "user" else AIMessage(content=content)
+            )
+        return messages
+
+    def save_turn(self, query: str, answer: str) -> None:
+        """
+        在后台保存本轮问答（更新 Redis、归档数据库，必要时生成摘要）。
+
+        参数:
+        - query (str): 本轮提问。
+        - answer (str): 完整回答。
+
+        返回:
+        - None
+        """
+        task = asyncio.create_task(self._save_turn(query, answer, self._lock()))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _save_turn(self, query: str, answer: str, lock: asyncio.Lock) -> None:
+        """
+        保存本轮问答。
+
+        参数:
+        - query (str): 本轮提问。
+        - answer (str): 完整回答。
+        - lock (asyncio.Lock): 会话锁（由调用方取得并持有引用）。
+
+        返回:
+        - None
+        """
+        async with lock:
+            try:
+                new_messages = [
+                    ["user", query, estimate_tokens(query)],
+                    ["assistant", answer, estimate_tokens(answer)],
+                ]
+                # 以 Redis 中的最新状态为准，避免同一会话并发对话时互相覆盖
+                cached = await RedisCURD(self.redis).get(self.key) if self.redis else None
+                state = self.state = json.loads(cached) if cached else self.state
+                state["messages"].extend(new_messages)
+                state["tokens"] += sum(message[2] for message in new_messages)
+                evicted = self._trim(state, 0)
+
+                archive = [{"role": r, "content": c, "tokens": t} for r, c, t in new_messages]
+                if evicted and settings.AI_MEMORY_SUMMARY_ENABLE:
+                    summary = await self._summarize(state["summary"], evicted)
+                    if summary:
+                        state["summary"] = summary
+                        state["summary_tokens"] = estimate_tokens(summary)
+                        # 摘要本身可能挤占预算，再裁剪一次（不再递归摘要）
+                        self._trim(state, 0)
+                        archive.append({
+                            "role": "summary",
+                            "content": summary,
+                            "tokens": state["summary_tokens"],
+                        })
+
+                await self._save_hot()
+                async with async_db_session() as session:
+                    async with session.begin():
+                        await ChatMessageCRUD(AuthSchema(db=session)).create_batch_crud(
+                            user_id=self.user_id, session_id=self.session_id, messages=archive
+                        )
+            except Exception as e:
+                log.error(f"保存对话上下文失败({self.key}): {e!s}")
+
+    async def _summarize(self, summary: str, evicted: list[list[Any]]) -> str:
+        """
+        把原摘要与被移除的消息合并为新摘要。
+
+        参数:
+        - summary (str): 原摘要。
+        - evicted (list[list[Any]]): 被移除的消息。
+
+        返回:
+        - str: 新摘要，失败时返回空字符串（保留原摘要）。
+        """
+        from langchain_core.messages import HumanMessage, SystemMessage
+
+        from .ai_util import AIClient
+
+        lines = [f"此前摘要：{summary}"] if summary else []
+        lines += [
+            f"{'用户' if role == 'user' else '助手'}：{content}" for role, content, _ in evicted
+        ]
+        client = AIClient()
+        try:
+            async with client._semaphore(client.base_url):
+                result = await client.model.ainvoke(
+                    [SystemMessage(content=SUMMARY_PROMPT), HumanMessage(content="\n".join(lines))],
+                    max_tokens=settings.AI_MEMORY_SUMMARY_TOKENS,
+                )
+            return result.text.strip()
+        except Exception as e:
+            log.warning(f"生成对话摘要失败，早期消息将被截断: {e!s}")
+            return ""
+
+    async def _save_hot(self) -> None:
+        """
+        写入 Redis。
+
+        返回:
+        - None
+        """
+        if self.redis is not None:
+            await RedisCURD(self.redis).set(self.key, self.state, expire=settings.AI_MEMORY_TTL)
+
+    async def clear(self) -> None:
+        """
+        清除 Redis 中的会话状态。
+
+        返回:
+        - None
+        """
+        async with self._lock():
+            self.state = self._empty_state()
+            if self.redis is not None:
+                await RedisCURD(self.redis).delete(self.key)
@@ -0,0 +1,288 @@
+import asyncio
+import contextlib
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+from fastapi import WebSocket
+from redis.asyncio.client import Redis
+from starlette.websockets import WebSocketDisconnect, WebSocketState
+
+from app.config.setting import settings
+from app.core.database import async_db_session
+from app.core.dependencies import authenticate_token
+from app.core.logger import log
+
+_END = object()
+
+
+async def batch_tokens(
+    source: AsyncIterator[str],
+    interval: float | None = None,
+    max_bytes: int | None = None,
+) -> AsyncIterator[str]:
+    """
+    把逐 token 的流合并为较大的片段：缓冲内容达到 max_bytes，或首个 token 缓冲超过 interval 秒时输出。
+
+    上游在后台任务中读取并写入有界队列；消费方发送变慢时队列写满，上游读取随之暂停（背压），
+    积压的 token 在下次读取时合并为一个片段。消费方停止迭代时取消后台任务，上游生成随之终止。
+
+    参数:
+    - source (AsyncIterator[str]): 上游 token 流。
+    - interval (float | None): 最长合并间隔(秒)，默认 AI_STREAM_FLUSH_INTERVAL。
+    - max_bytes (int | None): 缓冲字节数上限，默认 AI_STREAM_FLUSH_BYTES。
+
+    返回:
+    - AsyncIterator[str]: 合并后的片段。
+    """
+    interval = settings.AI_STREAM_FLUSH_INTERVAL if interval is None else interval
+    max_bytes = settings.AI_STREAM_FLUSH_BYTES if max_bytes is None else max_bytes
+    queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=settings.AI_STREAM_QUEUE_SIZE)
+
+    async def pump() -> None:
+        try:
+            async for chunk in source:
+                if chunk:
+                    await queue.put(chunk)
+        except Exception as e:
+            await queue.put(e)
+        else:
+            await queue.put(_END)
+
+    loop = asyncio.get_running_loop()
+    task = asyncio.create_task(pump())
+    buffer: list[str] = []
+    size = 0
+    deadline = 0.0
+    try:
+        while True:
+            timeout = max(deadline - loop.time(), 0) if buffer else None
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                yield "".join(buffer)
+                buffer, size = [], 0
+                continue
+            if item is _END:
+                break
+            if isinstance(item, Exception):
+                if buffer:
+                    yield "".join(buffer)
+                    buffer, size = [], 0
+                raise item
+            if not buffer:
+                deadline = loop.time() + interval
+            buffer.append(item)
+            size += len(item.encode("utf-8"))
+            if size >= max_bytes:
+                yield "".join(buffer)
+                buffer, size = [], 0
+        if buffer:
+            yield "".join(buffer)
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+
+class StreamLimiter:
+    """
+    每个用户同时进行的对话连接数限制（WebSocket 连接与 HTTP 流式对话共用计数）
+    """
+
+    _active: dict[str, int] = {}
+
+    @classmethod
+    def acquire(cls, key: str) -> bool:
+        """
+        占用一个连接名额。
+
+        参数:
+        - key (str): 用户标识。
+
+        返回:
+        - bool: 未超过上限返回 True，调用方结束后必须 release()。
+        """
+        count = cls._active.get(key, 0)
+        if count >= settings.AI_STREAM_MAX_PER_USER:
+            return False
+        cls._active[key] = count + 1
+        return True
+
+    @classmethod
+    def release(cls, key: str) -> None:
+        """
+        释放一个连接名额。
+
+        参数:
+        - key (str): 用户标识。
+
+        返回:
+        - None
+        """
+        count = cls._active.get(key, 0) - 1
+        if count > 0:
+            cls._active[key] = count
+        else:
+            cls._active.pop(key, None)
+
+    @staticmethod
+    async def websocket_user(websocket: WebSocket) -> dict[str, Any] | None:
+        """
+        校验 WebSocket 连接查询参数中的 token（与 HTTP 接口的 get_current_user 校验规则相同）。
+
+        参数:
+        - websocket (WebSocket): WebSocket 连接。
+
+        返回:
+        - dict[str, Any] | None: 用户信息（user_id、user_name），token 缺失或校验未通过时返回 None。
+        """
+        token = websocket.query_params.get("token")
+        redis = getattr(websocket.app.state, "redis", None)
+        if not token or redis is None:
+            return None
+        try:
+            async with async_db_session() as db:
+                auth = await authenticate_token(token, db, redis)
+                return {"user_id": auth.user.id, "user_name": auth.user.username}
+        except Exception:
+            return None
+
+    @staticmethod
+    def websocket_key(user: dict[str, Any] | None) -> str | None:
+        """
+        根据 WebSocket 连接的会话信息生成限流标识（与 HTTP 流式对话相同，按用户名）。
+
+        参数:
+        - user (dict[str, Any] | None): websocket_user() 解析出的会话信息。
+
+        返回:
+        - str | None: 用户标识，未登录（token 缺失或无效）时返回 None。
+        """
+        if user and user.get("user_name"):
+            return f"user:{user['user_name']}"
+        return None
+
+
+class ChatSocketSession:
+    """
+    单个 WebSocket 聊天连接
+
+    接收循环与生成任务并发运行：
+    - 普通文本或 {"type": "chat", "message": "...", "session_id": "..."} 为提问，新提问会取消仍在进行的生成，
+      携带 session_id 且连接已登录（token）时使用多轮对话上下文；
+    - {"type": "cancel"} 取消当前生成；
+    - 生成结果经 batch_tokens 合并后发送，单帧发送超过 AI_STREAM_SEND_TIMEOUT 视为慢消费者，断开连接。
+    """
+
+    def __init__(
+        self, websocket: WebSocket, redis: Redis | None, user_id: int | None = None
+    ) -> None:
+        self.websocket = websocket
+        self.redis = redis
+        self.user_id = user_id
+        self._task: asyncio.Task[None] | None = None
+
+    async def run(self) -> None:
+        """
+        运行接收循环，直到客户端断开。
+
+        返回:
+        - None
+        """
+        try:
+            # 生成任务因慢消费者关闭连接后不再继续接收
+            while self.websocket.application_state == WebSocketState.CONNECTED:
+                data = await self.websocket.receive_text()
+                message = self._parse(data)
+                if message is None:
+                    await self.cancel()
+                elif message[0]:
+                    await self.cancel()
+                    self._task = asyncio.create_task(self._generate(*message))
+        except WebSocketDisconnect:
+            pass
+        except Exception as e:
+            # 服务端已关闭连接时进行中的接收失败属预期行为
+            if self.websocket.application_state != WebSocketState.DISCONNECTED:
+                log.error(f"WebSocket聊天出错: {e!s}")
+        finally:
+            await self.cancel()
+
+    @staticmethod
+    def _parse(data: str) -> tuple[str, str | None] | None:
+        """
+        解析客户端消息。
+
+        参数:
+        - data (str): 原始文本。
+
+        返回:
+        - tuple[str, str | None] | None: (提问内容, 会话ID)；取消指令返回 None。
+        """
+        if data.startswith("{"):
+            try:
+                payload = json.loads(data)
+            except ValueError:
+                return data, None
+            if isinstance(payload, dict) and payload.get("type") == "cancel":
+                return None
+            if isinstance(payload, dict) and payload.get("type") == "chat":
+                return str(payload.get("message") or ""), payload.get("session_id")
+        return data, None
+
+    async def cancel(self) -> None:
+        """
+        取消进行中的生成。
+
+        返回:
+        - None
+        """
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _send(self, text: str) -> None:
+        """
+        发送一帧，超时视为慢消费者。
+
+        参数:
+        - text (str): 发送内容。
+
+        异常:
+        - asyncio.TimeoutError: 发送超时。
+        """
+        await asyncio.wait_for(self.websocket.send_text(text), settings.AI_STREAM_SEND_TIMEOUT)
+
+    async def _generate(self, message: str, session_id: str | None = None) -> None:
+        """
+        生成并发送一次回答。
+
+        参数:
+        - message (str): 提问内容。
+        - session_id (str | None): 会话ID。
+
+        返回:
+        - None
+        """
+        from ..schema import ChatQuerySchema
+        from ..service import McpService
+
+        try:
+            query = ChatQuerySchema(message=message, session_id=session_id)
+            source = McpService.chat_query(query=query, redis=self.redis, user_id=self.user_id)
+            async with contextlib.aclosing(batch_tokens(source)) as frames:
+                async for frame in frames:
+                    await self._send(frame)
+        except asyncio.TimeoutError:
+            log.warning("WebSocket聊天客户端接收过慢，断开连接")
+            if self.websocket.application_state != WebSocketState.DISCONNECTED:
+                await self.websocket.close(code=1013, reason="接收过慢")
+        except WebSocketDisconnect:
+            pass
+        except Exception as e:
+            log.error(f"处理聊天查询出错: {e!s}")
+            with contextlib.suppress(Exception):
+                await self._send(f"抱歉，处理您的请求时出现了错误: {e!s}")
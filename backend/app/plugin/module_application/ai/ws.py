@@ -1,10 +1,10 @@
 from fastapi import APIRouter, WebSocket
+from starlette.websockets import WebSocketState
 
 from app.core.logger import log
 from app.core.router_class import OperationLogRoute
 
-from .schema import ChatQuerySchema
-from .service import McpService
+from .tools.stream_util import ChatSocketSession, StreamLimiter
 
 WS_AI = APIRouter(
     route_class=OperationLogRoute,
@@ -20,26 +20,34 @@ async def websocket_chat_controller(
     """
     WebSocket聊天接口
 
-    ws://127.0.0.1:8001/api/v1/application/ai/ws
+    ws://127.0.0.1:8001/api/v1/application/ai/ws?token=访问令牌
+
+    - 未携带有效 token 的连接以 1008 关闭；
+    - 发送文本即提问，回答按时间/大小合并后分帧推送；新提问会取消仍在进行的回答；
+    - 发送 {"type": "chat", "message": "...", "session_id": "..."} 时使用多轮对话上下文；
+    - 发送 {"type": "cancel"} 取消当前回答；
+    - 每个用户同时在线的连接数受 AI_STREAM_MAX_PER_USER 限制（与 HTTP 流式对话共用计数）。
     """
+    user = await StreamLimiter.websocket_user(websocket)
+    key = StreamLimiter.websocket_key(user)
     await websocket.accept()
+    if user is None or key is None:
+        log.warning("WebSocket聊天连接未携带有效token，拒绝连接")
+        await websocket.close(code=1008, reason="未登录或登录已过期")
+        return
+    if not StreamLimiter.acquire(key):
+        log.warning(f"WebSocket聊天连接数超过限制: {key}")
+        await websocket.close(code=1008, reason="连接数超过限制")
+        return
     try:
-        while True:
-            data = await websocket.receive_text()
-            # 流式发送响应
-            try:
-                async for chunk in McpService.chat_query(query=ChatQuerySchema(message=data)):
-                    if chunk:
-                        await websocket.send_text(chunk)
-            except Exception as e:
-                log.error(f"处理聊天查询出错: {e!s}")
-                await websocket.send_text(f"抱歉，处理您的请求时出现了错误: {e!s}")
-    except Exception as e:
-        log.error(f"WebSocket聊天出错: {e!s}")
+        await ChatSocketSession(
+            websocket, getattr(websocket.app.state, "redis", None), user_id=user.get("user_id")
+        ).run()
     finally:
+        StreamLimiter.release(key)
         try:
             # 检查WebSocket连接状态，避免重复关闭已关闭的连接
-            if websocket.client_state != websocket.client_state.DISCONNECTED:
+            if websocket.application_state != WebSocketState.DISCONNECTED:
                 await websocket.close()
         except Exception as e:
             log.debug(f"WebSocket关闭时发生异常(预期行为，服务可能正在关闭): {e!s}")
@@ -20,6 +20,7 @@ from .schema import (
 )
 from .service import JobLogService, JobService
 from .tools.ap_scheduler import SchedulerUtil
+from .tools.job_executor import JobPools
 
 JobRouter = APIRouter(route_class=OperationLogRoute, prefix="/job", tags=["定时任务"])
 
@@ -218,28 +219,27 @@ async def get_job_log_controller():
     返回:
     - JSONResponse: 获取定时任务日志的JSON响应
     """
-    data = [
-        {
-            "id": i.id,
-            "name": i.name,
-            "trigger": i.trigger.__class__.__name__,
-            "executor": i.executor,
-            "func": i.func,
-            "func_ref": i.func_ref,
-            "args": i.args,
-            "kwargs": i.kwargs,
-            "misfire_grace_time": i.misfire_grace_time,
-            "coalesce": i.coalesce,
-            "max_instances": i.max_instances,
-            "next_run_time": i.next_run_time,
-            "state": SchedulerUtil.get_single_job_status(job_id=i.id),
-        }
-        for i in SchedulerUtil.get_all_jobs()
-    ]
+    data = SchedulerUtil.list_job_states()
 
     return SuccessResponse(msg="获取定时任务日志成功", data=data)
 
 
+@JobRouter.get(
+    "/executor",
+    summary="获取任务执行池状态",
+    description="获取同步任务执行池的并发、排队、超时与耗时统计",
+    dependencies=[Depends(AuthPermission(["module_application:job:query"]))],
+)
+async def get_job_executor_controller() -> JSONResponse:
+    """
+    获取任务执行池状态
+
+    返回:
+    - JSONResponse: 包含各执行池统计的JSON响应
+    """
+    return SuccessResponse(msg="获取任务执行池状态成功", data=JobPools.stats())
+
+
 # 定时任务日志管理接口
 @JobRouter.get(
     "/log/detail/{id}",
@@ -295,6 +295,32 @@ async def get_job_log_list_controller(
     return SuccessResponse(data=result_dict, msg="查询定时任务日志列表成功")
 
 
+@JobRouter.get(
+    "/log/archive", summary="查询归档定时任务日志", description="查询已归档的历史定时任务日志"
+)
+async def get_job_log_archive_controller(
+    page: Annotated[PaginationQueryParam, Depends()],
+    search: Annotated[JobLogQueryParam, Depends()],
+    auth: Annotated[AuthSchema, Depends(AuthPermission(["module_application:job:query"]))],
+) -> JSONResponse:
+    """
+    查询归档定时任务日志
+
+    参数:
+    - page (PaginationQueryParam): 分页查询参数模型
+    - search (JobLogQueryParam): 查询参数模型
+    - auth (AuthSchema): 认证信息模型
+
+    返回:
+    - JSONResponse: 分页归档日志的JSON响应
+    """
+    result_dict = await JobLogService.get_job_log_archive_page_service(
+        auth=auth, search=search, page_no=page.page_no, page_size=page.page_size
+    )
+    log.info("查询归档定时任务日志成功")
+    return SuccessResponse(data=result_dict, msg="查询归档定时任务日志成功")
+
+
 @JobRouter.delete("/log/delete", summary="删除定时任务日志", description="删除定时任务日志")
 async def delete_job_log_controller(
     ids: Annotated[list[int], Body(description="ID列表")],
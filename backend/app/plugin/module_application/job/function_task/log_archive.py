@@ -0,0 +1,22 @@
+from app.api.v1.module_system.log.model import OperationLogModel
+from app.core.log_archive import LogArchive
+from app.core.logger import log
+from app.plugin.module_application.job.model import JobLogModel
+
+
+async def archive_logs(days: int | str | None = None, *args, **kwargs) -> None:
+    """
+    定时任务：把 N 天前的系统日志与定时任务日志归档为 Parquet 文件并从数据库中删除
+
+    参数:
+    - days (int | str | None): 归档多少天之前的日志，默认 LOG_ARCHIVE_DAYS。
+    - args: 位置参数。
+    - kwargs: 关键字参数。
+    """
+    days = int(days) if days not in (None, "") else None
+    for model in (OperationLogModel, JobLogModel):
+        try:
+            await LogArchive.archive(model, days=days)
+        except Exception as e:
+            log.error(f"归档日志表 {model.__tablename__} 失败: {e}")
+            raise
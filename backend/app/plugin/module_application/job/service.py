@@ -1,9 +1,11 @@
 from app.api.v1.module_system.auth.schema import AuthSchema
 from app.core.exceptions import CustomException
+from app.core.log_archive import LogArchive
 from app.utils.cron_util import CronUtil
 from app.utils.excel_util import ExcelUtil
 
 from .crud import JobCRUD, JobLogCRUD
+from .model import JobLogModel
 from .schema import (
     JobCreateSchema,
     JobLogOutSchema,
@@ -260,6 +262,35 @@ class JobLogService:
         )
         return [JobLogOutSchema.model_validate(obj).model_dump() for obj in obj_list]
 
+    @classmethod
+    async def get_job_log_archive_page_service(
+        cls,
+        auth: AuthSchema,
+        search: JobLogQueryParam,
+        page_no: int,
+        page_size: int,
+    ) -> dict:
+        """
+        分页查询已归档的定时任务日志
+
+        参数:
+        - auth (AuthSchema): 认证信息模型
+        - search (JobLogQueryParam): 查询参数模型
+        - page_no (int): 页码
+        - page_size (int): 每页数量
+
+        返回:
+        - dict: 分页数据
+        """
+        return await LogArchive.page(
+            model=JobLogModel,
+            auth=auth,
+            search=search.__dict__,
+            offset=(page_no - 1) * page_size,
+            limit=page_size,
+            out_schema=JobLogOutSchema,
+        )
+
     @classmethod
     async def delete_job_log_service(cls, auth: AuthSchema, ids: list[int]) -> None:
         """
@@ -285,11 +316,8 @@ class JobLogService:
         参数:
         - auth (AuthSchema): 认证信息模型
         """
-        # 获取所有日志ID并批量删除
-        all_logs = await JobLogCRUD(auth).get_obj_log_list_crud()
-        if all_logs:
-            ids = [log.id for log in all_logs]
-            await JobLogCRUD(auth).delete_obj_log_crud(ids=ids)
+        # 直接清空日志表，不再逐条加载后按ID删除
+        await JobLogCRUD(auth).clear_obj_log_crud()
 
     @classmethod
     async def export_job_log_service(cls, data_list: list[dict]) -> bytes:
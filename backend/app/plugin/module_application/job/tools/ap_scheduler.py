@@ -1,18 +1,33 @@
 import importlib
+import inspect
 import json
+import time
 from asyncio import iscoroutinefunction
 from collections.abc import Callable
 from datetime import datetime
 from typing import Any
 
-from apscheduler.events import EVENT_ALL, JobEvent, JobExecutionEvent
+from apscheduler.events import (
+    EVENT_ALL,
+    EVENT_ALL_JOBS_REMOVED,
+    EVENT_JOB_ADDED,
+    EVENT_JOB_ERROR,
+    EVENT_JOB_EXECUTED,
+    EVENT_JOB_MAX_INSTANCES,
+    EVENT_JOB_MODIFIED,
+    EVENT_JOB_REMOVED,
+    EVENT_JOB_SUBMITTED,
+    JobEvent,
+    JobExecutionEvent,
+    SchedulerEvent,
+)
 from apscheduler.executors.asyncio import AsyncIOExecutor
-from apscheduler.executors.pool import ProcessPoolExecutor
 from apscheduler.job import Job
 from apscheduler.jobstores.memory import MemoryJobStore
 from apscheduler.jobstores.redis import RedisJobStore
 from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.schedulers.base import STATE_STOPPED
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.date import DateTrigger
 from apscheduler.triggers.interval import IntervalTrigger
@@ -23,10 +38,12 @@ from app.config.setting import settings
 from app.core.database import async_db_session, db_session, engine
 from app.core.exceptions import CustomException
 from app.core.logger import log
-from app.core.redis_crud import RedisCURD
+from app.core.redis_crud import RedisCURD, RedisLock
 from app.plugin.module_application.job.model import JobModel
 from app.utils.cron_util import CronUtil
 
+from .job_executor import JobPools
+
 job_stores = {
     "default": MemoryJobStore(),
     "sqlalchemy": SQLAlchemyJobStore(url=settings.DB_URI, engine=engine),
@@ -38,11 +55,9 @@ job_stores = {
         db=int(settings.REDIS_DB_NAME),
     ),
 }
-# 配置执行器
-executors = {
-    "default": AsyncIOExecutor(),
-    "processpool": ProcessPoolExecutor(max_workers=1),  # 减少进程数量以减少资源消耗
-}
+# 配置执行器：所有任务都以协程 _task_wrapper 在事件循环中调度，执行器名称只用于
+# 选择同步函数的执行池（JobPools，见 JOB_EXECUTORS），因此每个名称都注册为 AsyncIOExecutor
+executors = {name: AsyncIOExecutor() for name in {"default", *settings.JOB_EXECUTORS}}
 # 配置默认参数
 job_defaults = {
     "coalesce": True,  # 合并执行错过的任务
@@ -58,6 +73,236 @@ scheduler.configure(
 )
 
 
+class JobStateIndex:
+    """
+    定时任务状态索引（进程内）
+
+    redis/sqlalchemy 存储器的 get_jobs() 每次都要反序列化全部任务，任务控制台轮询时开销很大。
+    索引由调度器事件维护（新增、修改、暂停/恢复、删除、提交执行、执行完成），每个任务只保存
+    ID、名称、触发器、下次执行时间等可直接返回的字段，列表查询只读索引、不反序列化；
+    提交执行时按触发器推算下次执行时间（与调度器更新存储器的算法一致），不依赖存储器的写入时机；
+    其他实例对共享存储器的修改通过每 SCHEDULER_INDEX_REFRESH 秒一次的全量刷新同步。
+    """
+
+    # {任务ID: 任务状态}
+    _jobs: dict[str, dict[str, Any]] = {}
+    # {任务ID: 触发器}，用于提交执行后推算下次执行时间
+    _triggers: dict[str, Any] = {}
+    # 上次全量刷新时间，0 表示尚未加载
+    _loaded_at = 0.0
+
+    # 任务定义可能变化的事件，需要重新读取该任务
+    REFRESH_EVENTS = EVENT_JOB_ADDED | EVENT_JOB_MODIFIED
+    # 到期处理过的事件（含因实例数已满跳过的），按触发器推算下次执行时间
+    ADVANCE_EVENTS = EVENT_JOB_SUBMITTED | EVENT_JOB_MAX_INSTANCES
+
+    @staticmethod
+    def snapshot(job: Job) -> dict[str, Any]:
+        """
+        提取任务的可展示字段。
+
+        参数:
+        - job (Job): 任务对象。
+
+        返回:
+        - dict[str, Any]: 任务状态（不含运行状态 state，由 list() 按调度器状态计算）。
+        """
+        # add_job 包装为 _task_wrapper(实际函数, 任务ID, *参数)
+        target = job.args[0] if job.args else None
+        func = (
+            f"{getattr(target, '__module__', '')}.{getattr(target, '__name__', '')}"
+            if callable(target)
+            else job.func_ref
+        )
+        return {
+            "id": job.id,
+            "name": job.name,
+            "trigger": job.trigger.__class__.__name__,
+            "trigger_args": str(job.trigger),
+            "jobstore": job._jobstore_alias,
+            "executor": job.executor,
+            "func": func,
+            "func_ref": job.func_ref,
+            "args": [str(arg) for arg in job.args[2:]],
+            "kwargs": dict(job.kwargs),
+            "misfire_grace_time": job.misfire_grace_time,
+            "coalesce": job.coalesce,
+            "max_instances": job.max_instances,
+            "next_run_time": getattr(job, "next_run_time", None),
+            "last_run_time": None,
+            "last_status": None,
+        }
+
+    @classmethod
+    def rebuild(cls) -> None:
+        """
+        从全部存储器全量加载（启动时与定期刷新时调用）。
+
+        返回:
+        - None
+        """
+        jobs = {}
+        triggers = {}
+        for job in scheduler.get_jobs():
+            item = cls.snapshot(job)
+            previous = cls._jobs.get(job.id)
+            if previous is not None:
+                item["last_run_time"] = previous["last_run_time"]
+                item["last_status"] = previous["last_status"]
+            jobs[job.id] = item
+            triggers[job.id] = job.trigger
+        cls._jobs = jobs
+        cls._triggers = triggers
+        cls._loaded_at = time.monotonic()
+
+    @classmethod
+    def refresh(cls, job_id: str, jobstore: str | None = None) -> None:
+        """
+        重新读取单个任务（只反序列化这一个任务）。
+
+        参数:
+        - job_id (str): 任务ID。
+        - jobstore (str | None): 存储器别名。
+
+        返回:
+        - None
+        """
+        job = scheduler.get_job(job_id=job_id, jobstore=jobstore)
+        if job is None:
+            cls.discard(job_id)
+            return
+        item = cls.snapshot(job)
+        previous = cls._jobs.get(job_id)
+        if previous is not None:
+            item["last_run_time"] = previous["last_run_time"]
+            item["last_status"] = previous["last_status"]
+        cls._jobs[job_id] = item
+        cls._triggers[job_id] = job.trigger
+
+    @classmethod
+    def discard(cls, job_id: str) -> None:
+        """
+        从索引中移除任务。
+
+        参数:
+        - job_id (str): 任务ID。
+
+        返回:
+        - None
+        """
+        cls._jobs.pop(job_id, None)
+        cls._triggers.pop(job_id, None)
+
+    @classmethod
+    def advance(cls, job_id: str, run_times: list[datetime], jobstore: str | None = None) -> None:
+        """
+        任务到期处理后推算下次执行时间（与调度器的 _process_jobs 相同：从最后一个计划执行时间往后推）。
+
+        参数:
+        - job_id (str): 任务ID。
+        - run_times (list[datetime]): 本次处理的计划执行时间。
+        - jobstore (str | None): 存储器别名。
+
+        返回:
+        - None
+        """
+        item = cls._jobs.get(job_id)
+        trigger = cls._triggers.get(job_id)
+        if item is None or trigger is None or not run_times:
+            cls.refresh(job_id, jobstore)
+            return
+        # 没有下次执行时间的任务会被调度器删除，由 EVENT_JOB_REMOVED 移出索引
+        item["next_run_time"] = trigger.get_next_fire_time(
+            run_times[-1], datetime.now(scheduler.timezone)
+        )
+
+    @classmethod
+    def on_event(cls, event: SchedulerEvent) -> None:
+        """
+        调度器事件监听：同步索引。
+
+        参数:
+        - event (SchedulerEvent): 调度器事件。
+
+        返回:
+        - None
+        """
+        try:
+            if event.code & cls.REFRESH_EVENTS:
+                cls.refresh(event.job_id, event.jobstore)
+            elif event.code & cls.ADVANCE_EVENTS:
+                cls.advance(event.job_id, event.scheduled_run_times, event.jobstore)
+            elif event.code == EVENT_JOB_REMOVED:
+                cls.discard(event.job_id)
+            elif event.code == EVENT_ALL_JOBS_REMOVED:
+                cls._jobs = {
+                    job_id: item
+                    for job_id, item in cls._jobs.items()
+                    if event.alias is not None and item["jobstore"] != event.alias
+                }
+                cls._triggers = {
+                    job_id: trigger
+                    for job_id, trigger in cls._triggers.items()
+                    if job_id in cls._jobs
+                }
+            elif event.code & (EVENT_JOB_EXECUTED | EVENT_JOB_ERROR):
+                item = cls._jobs.get(event.job_id)
+                if item is not None:
+                    item["last_run_time"] = event.scheduled_run_time
+                    item["last_status"] = "1" if event.exception else "0"
+        except Exception as e:
+            log.error(f"更新任务状态索引失败: {e!s}")
+
+    @classmethod
+    def list(cls) -> list[dict[str, Any]]:
+        """
+        获取全部任务状态（超过刷新间隔时先全量刷新一次）。
+
+        返回:
+        - list[dict[str, Any]]: 任务状态列表，state 为 'running' | 'paused' | 'stopped'。
+        """
+        if (
+            not cls._loaded_at
+            or time.monotonic() - cls._loaded_at > settings.SCHEDULER_INDEX_REFRESH
+        ):
+            cls.rebuild()
+        stopped = scheduler.state == STATE_STOPPED
+        return [
+            {**item, "state": cls.get_state(item, stopped)} for item in list(cls._jobs.values())
+        ]
+
+    @classmethod
+    def get(cls, job_id: str | int) -> dict[str, Any] | None:
+        """
+        获取单个任务状态。
+
+        参数:
+        - job_id (str | int): 任务ID。
+
+        返回:
+        - dict[str, Any] | None: 任务状态，索引中不存在时返回 None。
+        """
+        if not cls._loaded_at:
+            cls.rebuild()
+        return cls._jobs.get(str(job_id))
+
+    @staticmethod
+    def get_state(item: dict[str, Any], stopped: bool) -> str:
+        """
+        计算任务运行状态：调度器已停止为 stopped，暂停的任务没有下次执行时间。
+
+        参数:
+        - item (dict[str, Any]): 任务状态。
+        - stopped (bool): 调度器是否已停止。
+
+        返回:
+        - str: 'running' | 'paused' | 'stopped'。
+        """
+        if stopped:
+            return "stopped"
+        return "paused" if item["next_run_time"] is None else "running"
+
+
 class SchedulerUtil:
     """
     定时任务相关方法
@@ -219,6 +464,8 @@ class SchedulerUtil:
         log.info("🔎 开始启动定时任务...")
         # 保存Redis连接到类变量
         cls.redis_instance = redis
+        # 任务状态索引需在任务添加前开始监听
+        scheduler.add_listener(JobStateIndex.on_event, EVENT_ALL)
         # 启动调度器
         scheduler.start()
         # 添加事件监听器
@@ -254,6 +501,8 @@ class SchedulerUtil:
 
                     await asyncio.sleep(2)
                     log.info("✅️ 定时任务已由其他实例初始化完成")
+        # 加载其他实例添加到共享存储器中的任务
+        JobStateIndex.rebuild()
 
     @classmethod
     async def close_system_scheduler(cls) -> None:
@@ -268,6 +517,8 @@ class SchedulerUtil:
             scheduler.remove_all_jobs()
             # 等待所有任务完成后再关闭
             scheduler.shutdown(wait=True)
+            # 不再等待执行池中的同步任务，未开始的任务直接取消
+            JobPools.shutdown(wait=False)
             log.info("✅️ 关闭定时任务成功")
         except Exception as e:
             log.error(f"关闭定时任务失败: {e!s}")
@@ -295,9 +546,53 @@ class SchedulerUtil:
         """
         return scheduler.get_jobs()
 
+    @classmethod
+    def list_job_states(cls) -> list[dict[str, Any]]:
+        """
+        获取全部任务的状态（读取任务状态索引，不反序列化任务）。
+
+        返回:
+        - list[dict[str, Any]]: 任务状态列表。
+        """
+        return JobStateIndex.list()
+
+    @classmethod
+    def _get_executor_name(cls, job_id: str | int) -> str | None:
+        """
+        获取任务的执行器名称（优先读取任务状态索引，索引中没有时读取该任务并补充索引）。
+
+        参数:
+        - job_id (str | int): 任务ID。
+
+        返回:
+        - str | None: 执行器名称。
+        """
+        item = JobStateIndex.get(job_id)
+        if item is None:
+            JobStateIndex.refresh(str(job_id))
+            item = JobStateIndex.get(job_id)
+        return item["executor"] if item else None
+
     @classmethod
     async def _task_wrapper(cls, func: Callable, job_id: str | int, *args, **kwargs):
-        """任务执行包装器，添加分布式锁防止并发执行"""
+        """
+        任务执行包装器：持有分布式租约锁期间执行任务，防止多实例并发执行。
+
+        锁每 1/3 租期自动续约；任务函数声明了 fencing_token 参数时传入本次的 fencing token，
+        供下游拒绝旧持有者的迟到写入；失去租约时取消任务，本次执行记为失败。
+
+        参数:
+        - func (Callable): 实际执行的任务函数。
+        - job_id (str | int): 任务ID。
+        - *args: 位置参数。
+        - **kwargs: 关键字参数。
+
+        返回:
+        - Any: 任务函数返回值，未获取到锁时返回 None。
+
+        异常:
+        - CustomException: 执行期间失去租约。
+        """
         import asyncio
 
         # 使用类变量中的Redis连接
@@ -305,71 +600,60 @@ class SchedulerUtil:
             log.error(f"任务 {job_id} 执行失败：Redis连接未初始化")
             return None
 
-        redis_client = RedisCURD(redis=cls.redis_instance)
-        lock_key = f"{RedisInitKeyConfig.APSCHEDULER_LOCK_KEY.key}:{job_id}"
-        lock_acquired = False
-        lock_value = ""
-        renewal_task = None
-
-        # 定义锁续约函数
-        async def renew_lock() -> None:
-            """定期续约锁的过期时间"""
-            try:
-                while True:
-                    # 等待锁过期时间的2/3后进行续约
-                    await asyncio.sleep(20)  # 30秒的2/3
-                    # 使用redis_client.renew_lock续约锁，验证锁持有者
-                    success = await redis_client.renew_lock(lock_key, 30, lock_value)
-                    if success:
-                        log.info(f"任务 {job_id} 锁续约成功")
-                    else:
-                        log.warning(f"任务 {job_id} 锁续约失败：锁可能已被其他实例获取")
-                        break
-            except asyncio.CancelledError:
-                log.info(f"任务 {job_id} 锁续约任务已取消")
-            except Exception as e:
-                log.error(f"任务 {job_id} 锁续约失败: {e!s}")
-
+        lock = RedisLock(
+            redis=cls.redis_instance,
+            key=f"{RedisInitKeyConfig.APSCHEDULER_LOCK_KEY.key}:{job_id}",
+            ttl=settings.JOB_LOCK_TTL,
+        )
+        if not await lock.acquire():
+            # 获取锁失败，记录日志
+            log.info(f"任务 {job_id} 获取执行锁失败，跳过本次执行")
+            return None
+        # 获取锁之后的全部步骤都放在 try 中，任何一步出错（含被取消）都会释放锁
         try:
-            # 获取分布式锁，使用原子性的lock方法
-            lock_acquired, lock_value = await redis_client.lock(lock_key, 30)
-            if lock_acquired:
-                log.info(f"任务 {job_id} 获取执行锁成功")
-                # 启动锁续约任务
-                renewal_task = asyncio.create_task(renew_lock())
-
-                # 执行任务
-                if iscoroutinefunction(func):
-                    return await func(*args, **kwargs)
-                # 对于同步函数，使用线程池执行
-                log.info(f"任务 {job_id} 开始执行同步函数: {func.__name__}, 参数: {args}-{kwargs}")
-                try:
-                    loop = asyncio.get_running_loop()
-                    # 使用lambda包装函数调用，以支持关键字参数
-                    result = await loop.run_in_executor(None, lambda: func(*args, **kwargs))
-                    log.info(f"任务 {job_id} 同步函数执行完成，结果: {result}")
-                    return result
-                except Exception as e:
-                    log.error(f"任务 {job_id} 同步函数执行失败: {e!s}")
-                    raise
-            else:
-                # 获取锁失败，记录日志
-                log.info(f"任务 {job_id} 获取执行锁失败，跳过本次执行")
-                return None
+            log.info(f"任务 {job_id} 获取执行锁成功(fencing token: {lock.token})")
+            if "fencing_token" in inspect.signature(func).parameters:
+                kwargs = {**kwargs, "fencing_token": lock.token}
+            task = asyncio.create_task(cls._run_job(func, job_id, *args, **kwargs))
+            lock.on_lost = task.cancel
+            return await task
+        except asyncio.CancelledError:
+            if lock.lost:
+                raise CustomException(msg=f"任务 {job_id} 执行锁租约已丢失，已取消本次执行")
+            raise
         finally:
-            # 取消锁续约任务
-            if renewal_task and not renewal_task.done():
-                renewal_task.cancel()
-                try:
-                    await renewal_task
-                except asyncio.CancelledError:
-                    pass
-
             # 释放锁
-            if lock_acquired:
-                await redis_client.unlock(lock_key, lock_value)
+            if await lock.release():
                 log.info(f"任务 {job_id} 释放执行锁")
 
+    @classmethod
+    async def _run_job(cls, func: Callable, job_id: str | int, *args, **kwargs):
+        """
+        执行任务函数：协程在事件循环中执行，同步函数在任务执行器对应的独立执行池中执行。
+
+        参数:
+        - func (Callable): 任务函数。
+        - job_id (str | int): 任务ID。
+        - *args: 位置参数。
+        - **kwargs: 关键字参数。
+
+        返回:
+        - Any: 任务函数返回值。
+        """
+        if iscoroutinefunction(func):
+            return await func(*args, **kwargs)
+        pool = JobPools.get(cls._get_executor_name(job_id))
+        log.info(
+            f"任务 {job_id} 开始在执行池 {pool.name} 中执行同步函数: {func.__name__}, 参数: {args}-{kwargs}"
+        )
+        try:
+            result = await pool.run(func, *args, **kwargs)
+            log.info(f"任务 {job_id} 同步函数执行完成，结果: {result}")
+            return result
+        except Exception as e:
+            log.error(f"任务 {job_id} 同步函数执行失败: {e!s}")
+            raise
+
     @classmethod
     def add_job(cls, job_info: JobModel) -> Job:
         """
@@ -398,7 +682,10 @@ class SchedulerUtil:
             if job_executor is None:
                 job_executor = "default"
 
-            # 异步函数必须使用默认执行器
+            if job_executor not in executors:
+                raise ValueError(f"无效的执行器：{job_executor}")
+
+            # 异步函数在事件循环中执行，使用默认执行器
             if iscoroutinefunction(job_func):
                 job_executor = "default"
 
@@ -617,19 +904,10 @@ class SchedulerUtil:
         返回:
         - str: 任务状态（'running' | 'paused' | 'stopped' | 'unknown'）
         """
-        job = cls.get_job(job_id=str(job_id))
-        if not job:
+        item = JobStateIndex.get(job_id)
+        if item is None:
             return "unknown"
-
-        # 检查任务是否在暂停列表中
-        if job_id in scheduler._jobstores[job._jobstore_alias]._paused_jobs:
-            return "paused"
-
-        # 检查调度器状态
-        if scheduler.state == 0:  # STATE_STOPPED
-            return "stopped"
-
-        return "running"
+        return JobStateIndex.get_state(item, scheduler.state == STATE_STOPPED)
 
     @classmethod
     def print_jobs(cls, jobstore: Any | None = None, out: Any | None = None) -> None:
@@ -0,0 +1,261 @@
+import asyncio
+import multiprocessing
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any
+
+from app.config.setting import settings
+from app.core.exceptions import CustomException
+from app.core.logger import log
+
+
+class JobPool:
+    """
+    同步任务执行池
+
+    - thread 类型为独立的有界线程池，适合 IO 型任务；process 类型为进程池，适合 CPU 密集型任务，
+      二者都不占用应用默认线程池与事件循环，耗时任务不会拖慢请求处理；
+    - 并发数等于 max_workers，超出的任务在事件循环中排队等待（不占用工作线程/进程），
+      排队数超过 max_queue 时直接拒绝；
+    - 单次执行超过 timeout 秒视为失败：进程池会终止全部工作进程并重建（同池中正在执行的其他任务一并失败），
+      线程无法被强制终止，线程池中超时的任务会继续占用一个并发名额直到函数返回。
+    """
+
+    def __init__(
+        self, name: str, type: str, max_workers: int, max_queue: int, timeout: float
+    ) -> None:
+        """
+        初始化执行池（工作线程/进程在首次执行时创建）。
+
+        参数:
+        - name (str): 执行器名称（对应 JobModel.executor）。
+        - type (str): 池类型，thread 或 process。
+        - max_workers (int): 最大并发数。
+        - max_queue (int): 最大排队数。
+        - timeout (float): 单次执行超时(秒)，0 表示不限制。
+        """
+        if type not in ("thread", "process"):
+            raise ValueError(f"无效的执行池类型: {type}")
+        self.name = name
+        self.type = type
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self._executor: Executor | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self.running = 0
+        self.queued = 0
+        self.completed = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.rejected = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.run_total = 0.0
+
+    def _get_executor(self) -> Executor:
+        """
+        获取（必要时创建）底层线程池/进程池。
+
+        返回:
+        - Executor: 线程池或进程池。
+        """
+        if self._executor is None:
+            if self.type == "process":
+                # spawn 启动的子进程不继承父进程的事件循环、线程与连接
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix=f"job-{self.name}"
+                )
+        return self._executor
+
+    def _release(self, future: asyncio.Future[Any] | None = None) -> None:
+        """底层任务结束后归还并发名额"""
+        if future is not None and not future.cancelled():
+            # 超时后无人等待结果，在此取走异常避免 "exception was never retrieved" 告警
+            future.exception()
+        self.running -= 1
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        在执行池中执行同步函数。
+
+        参数:
+        - func (Callable[..., Any]): 同步函数（进程池要求函数与参数可被 pickle）。
+        - *args (Any): 位置参数。
+        - **kwargs (Any): 关键字参数。
+
+        返回:
+        - Any: 函数返回值。
+
+        异常:
+        - CustomException: 排队已满。
+        - TimeoutError: 执行超时。
+        """
+        if self.queued >= self.max_queue:
+            self.rejected += 1
+            raise CustomException(msg=f"执行池 {self.name} 排队任务已满({self.max_queue})")
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_workers)
+
+        queued_at = time.monotonic()
+        self.queued += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.queued -= 1
+        waited = time.monotonic() - queued_at
+        self.wait_total += waited
+        self.wait_max = max(self.wait_max, waited)
+
+        self.running += 1
+        loop = asyncio.get_running_loop()
+        started = time.monotonic()
+        try:
+            future = loop.run_in_executor(self._get_executor(), partial(func, *args, **kwargs))
+        except BaseException:
+            self._release()
+            raise
+        # 名额在底层任务真正结束时归还，超时或取消都不会让池超额运行
+        future.add_done_callback(self._release)
+        try:
+            result = await asyncio.wait_for(asyncio.shield(future), self.timeout or None)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            self.failed += 1
+            self._on_timeout()
+            raise TimeoutError(f"执行池 {self.name} 中的任务执行超过 {self.timeout} 秒")
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.run_total += time.monotonic() - started
+        self.completed += 1
+        return result
+
+    def _on_timeout(self) -> None:
+        """
+        任务超时：进程池终止工作进程并在下次执行时重建，线程池只能等待函数返回。
+
+        返回:
+        - None
+        """
+        if self.type != "process" or self._executor is None:
+            log.warning(f"执行池 {self.name} 中的任务已超时，线程将在函数返回后释放")
+            return
+        executor, self._executor = self._executor, None
+        processes = list(getattr(executor, "_processes", {}).values())
+        executor.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        log.warning(f"执行池 {self.name} 中的任务已超时，已终止 {len(processes)} 个工作进程")
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        关闭执行池。
+
+        参数:
+        - wait (bool): 是否等待执行中的任务完成。
+
+        返回:
+        - None
+        """
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        获取执行池统计。
+
+        返回:
+        - dict[str, Any]: 并发、排队、完成、失败、超时、拒绝次数与等待/执行耗时。
+        """
+        finished = self.completed + self.failed
+        return {
+            "name": self.name,
+            "type": self.type,
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "timeout": self.timeout,
+            "running": self.running,
+            "queued": self.queued,
+            "completed": self.completed,
+            "failed": self.failed,
+            "timeouts": self.timeouts,
+            "rejected": self.rejected,
+            "avg_wait_ms": round(self.wait_total / finished * 1000, 2) if finished else 0.0,
+            "max_wait_ms": round(self.wait_max * 1000, 2),
+            "avg_run_ms": round(self.run_total / finished * 1000, 2) if finished else 0.0,
+        }
+
+
+class JobPools:
+    """
+    按执行器名称（JobModel.executor）管理同步任务执行池，配置见 JOB_EXECUTORS
+    """
+
+    _pools: dict[str, JobPool] = {}
+
+    @classmethod
+    def names(cls) -> list[str]:
+        """
+        获取全部执行器名称。
+
+        返回:
+        - list[str]: 执行器名称。
+        """
+        return list(settings.JOB_EXECUTORS)
+
+    @classmethod
+    def get(cls, name: str | None) -> JobPool:
+        """
+        获取执行池，未配置的名称使用 default。
+
+        参数:
+        - name (str | None): 执行器名称。
+
+        返回:
+        - JobPool: 执行池。
+        """
+        if not name or name not in settings.JOB_EXECUTORS:
+            name = "default"
+        pool = cls._pools.get(name)
+        if pool is None:
+            pool = cls._pools[name] = JobPool(name=name, **settings.JOB_EXECUTORS[name])
+        return pool
+
+    @classmethod
+    def shutdown(cls, wait: bool = True) -> None:
+        """
+        关闭全部执行池。
+
+        参数:
+        - wait (bool): 是否等待执行中的任务完成。
+
+        返回:
+        - None
+        """
+        pools = list(cls._pools.values())
+        cls._pools = {}
+        for pool in pools:
+            pool.shutdown(wait=wait)
+
+    @classmethod
+    def stats(cls) -> list[dict[str, Any]]:
+        """
+        获取全部执行池统计（未使用过的执行池也会列出）。
+
+        返回:
+        - list[dict[str, Any]]: 每个执行池一项。
+        """
+        return [cls.get(name).stats() for name in cls.names()]
@@ -1,7 +1,6 @@
 import io
 from typing import Any
 
-import pandas as pd
 from fastapi import UploadFile
 
 from app.api.v1.module_system.auth.schema import AuthSchema
@@ -231,6 +230,9 @@ class DemoService:
 
         header_dict = {"名称": "name", "状态": "status", "描述": "description"}
 
+        # pandas 导入耗时较长，读取 Excel 时才加载
+        import pandas as pd
+
         try:
             # 读取Excel文件
             contents = await file.read()
@@ -2,15 +2,15 @@ from typing import Annotated
 
 from fastapi import APIRouter, Body, Depends, Path
 from fastapi.responses import JSONResponse
+from redis.asyncio.client import Redis
 
 from app.api.v1.module_system.auth.schema import AuthSchema
 from app.common.request import PaginationService
 from app.common.response import StreamResponse, SuccessResponse
 from app.core.base_params import PaginationQueryParam
-from app.core.dependencies import AuthPermission
+from app.core.dependencies import AuthPermission, redis_getter
 from app.core.logger import log
 from app.core.router_class import OperationLogRoute
-from app.utils.common_util import bytes2file_response
 
 from .schema import GenTableQueryParam, GenTableSchema
 from .service import GenTableService
@@ -54,6 +54,7 @@ async def get_gen_db_table_list_controller(
     page: Annotated[PaginationQueryParam, Depends()],
     search: Annotated[GenTableQueryParam, Depends()],
     auth: Annotated[AuthSchema, Depends(AuthPermission(["module_generator:dblist:query"]))],
+    redis: Annotated[Redis, Depends(redis_getter)],
 ) -> JSONResponse:
     """
     查询数据库表列表
@@ -62,11 +63,14 @@ async def get_gen_db_table_list_controller(
     - page (PaginationQueryParam): 分页查询参数
     - search (GenTableQueryParam): 搜索参数
     - auth (AuthSchema): 认证信息模型
+    - redis (Redis): Redis数据库连接
 
     返回:
     - JSONResponse: 包含查询结果和分页信息的JSON响应
     """
-    result_dict_list = await GenTableService.get_gen_db_table_list_service(auth=auth, search=search)
+    result_dict_list = await GenTableService.get_gen_db_table_list_service(
+        auth=auth, search=search, redis=redis
+    )
     result_dict = await PaginationService.paginate(
         data_list=result_dict_list,
         page_no=page.page_no,
@@ -83,6 +87,7 @@ async def import_gen_table_controller(
         AuthSchema,
         Depends(AuthPermission(["module_generator:gencode:import"])),
     ],
+    redis: Annotated[Redis, Depends(redis_getter)],
 ) -> JSONResponse:
     """
     导入表结构
@@ -90,14 +95,15 @@ async def import_gen_table_controller(
     参数:
     - table_names (List[str]): 表名列表
     - auth (AuthSchema): 认证信息模型
+    - redis (Redis): Redis数据库连接
 
     返回:
     - JSONResponse: 包含导入结果和导入的表结构列表的JSON响应
     """
     add_gen_table_list = await GenTableService.get_gen_db_table_list_by_name_service(
-        auth, table_names
+        auth, table_names, redis
     )
-    result = await GenTableService.import_gen_table_service(auth, add_gen_table_list)
+    result = await GenTableService.import_gen_table_service(auth, add_gen_table_list, redis)
     log.info("导入表结构成功")
     return SuccessResponse(msg="导入表结构成功", data=result)
 
@@ -133,6 +139,7 @@ async def create_table_controller(
         AuthSchema,
         Depends(AuthPermission(["module_generator:gencode:create"])),
     ],
+    redis: Annotated[Redis, Depends(redis_getter)],
 ) -> JSONResponse:
     """
     创建表结构
@@ -140,11 +147,12 @@ async def create_table_controller(
     参数:
     - sql (str): SQL语句，用于创建表结构
     - auth (AuthSchema): 认证信息模型
+    - redis (Redis): Redis数据库连接
 
     返回:
     - JSONResponse: 包含创建结果的JSON响应
     """
-    result = await GenTableService.create_table_service(auth, sql)
+    result = await GenTableService.create_table_service(auth, sql, redis)
     log.info("创建表结构成功")
     return SuccessResponse(msg="创建表结构成功", data=result)
 
@@ -219,7 +227,7 @@ async def batch_gen_code_controller(
     batch_gen_code_result = await GenTableService.batch_gen_code_service(auth, table_names)
     log.info(f"批量生成代码成功,表名列表：{table_names}")
     return StreamResponse(
-        data=bytes2file_response(batch_gen_code_result),
+        data=batch_gen_code_result,
         media_type="application/zip",
         headers={"Content-Disposition": "attachment; filename=code.zip"},
     )
@@ -233,6 +241,7 @@ async def batch_gen_code_controller(
 async def gen_code_local_controller(
     table_name: Annotated[str, Path(description="表名")],
     auth: Annotated[AuthSchema, Depends(AuthPermission(["module_generator:gencode:code"]))],
+    redis: Annotated[Redis, Depends(redis_getter)],
 ) -> JSONResponse:
     """
     生成代码到指定路径
@@ -240,11 +249,12 @@ async def gen_code_local_controller(
     参数:
     - table_name (str): 表名
     - auth (AuthSchema): 认证信息模型
+    - redis (Redis): Redis数据库连接
 
     返回:
     - JSONResponse: 包含生成结果的JSON响应
     """
-    result = await GenTableService.generate_code_service(auth, table_name)
+    result = await GenTableService.generate_code_service(auth, table_name, redis)
     log.info(f"生成代码,表名：{table_name},到指定路径成功")
     return SuccessResponse(msg="生成代码到指定路径成功", data=result)
 
@@ -273,6 +283,7 @@ async def preview_code_controller(
 async def sync_db_controller(
     table_name: Annotated[str, Path(description="表名")],
     auth: Annotated[AuthSchema, Depends(AuthPermission(["module_generator:db:sync"]))],
+    redis: Annotated[Redis, Depends(redis_getter)],
 ) -> JSONResponse:
     """
     同步数据库
@@ -280,10 +291,11 @@ async def sync_db_controller(
     参数:
     - table_name (str): 表名
     - auth (AuthSchema): 认证信息模型
+    - redis (Redis): Redis数据库连接
 
     返回:
     - JSONResponse: 包含同步数据库结果的JSON响应
     """
-    result = await GenTableService.sync_db_service(auth, table_name)
+    result = await GenTableService.sync_db_service(auth, table_name, redis)
     log.info(f"同步数据库,表名：{table_name},成功")
     return SuccessResponse(msg="同步数据库成功", data=result)
@@ -1,7 +1,6 @@
 from collections.abc import Sequence
-from typing import TYPE_CHECKING
 
-from sqlalchemy import Inspector, inspect, select, text
+from sqlalchemy import select, text
 
 from app.api.v1.module_system.auth.schema import AuthSchema
 from app.config.setting import settings
@@ -16,9 +15,7 @@ from .schema import (
     GenTableQueryParam,
     GenTableSchema,
 )
-
-if TYPE_CHECKING:
-    from sqlalchemy.engine.reflection import Inspector
+from .tools.schema_inspector import SchemaInspector
 
 
 class GenTableCRUD(CRUDBase[GenTableModel, GenTableSchema, GenTableSchema]):
@@ -63,6 +60,23 @@ class GenTableCRUD(CRUDBase[GenTableModel, GenTableSchema, GenTableSchema]):
         """
         return await self.get(table_name=table_name, preload=preload)
 
+    async def get_gen_table_by_names(
+        self, table_names: list[str], preload: list | None = None
+    ) -> Sequence[GenTableModel]:
+        """
+        根据业务表名称列表一次查询多个业务表信息。
+
+        参数:
+        - table_names (list[str]): 业务表名称列表。
+        - preload (list | None): 预加载关系，未提供时使用模型默认项
+
+        返回:
+        - Sequence[GenTableModel]: 业务表信息列表。
+        """
+        if not table_names:
+            return []
+        return await self.list(search={"table_name": ("in", table_names)}, preload=preload)
+
     async def get_gen_table_all(self, preload: list | None = None) -> Sequence[GenTableModel]:
         """
         获取所有业务表信息。
@@ -147,25 +161,8 @@ class GenTableCRUD(CRUDBase[GenTableModel, GenTableSchema, GenTableSchema]):
         database_name = settings.DATABASE_NAME
         database_type = settings.DATABASE_TYPE
 
-        from app.core.database import engine
-
-        inspector: Inspector = inspect(engine)
-        table_names = inspector.get_table_names()
-
         dict_data = []
-        for table_name in table_names:
-            try:
-                table_comment = inspector.get_table_comment(table_name)
-                comment = (
-                    table_comment.get("text", "")
-                    if isinstance(table_comment, dict)
-                    else table_comment
-                )
-                table_comment = comment or ""
-            except Exception as e:
-                log.warning(f"获取表 {table_name} 的注释失败: {e}")
-                table_comment = ""
-
+        for table_name, table_comment in await SchemaInspector.get_tables():
             # 统一处理 search 为 None 的情况，避免重复判断
             if search:
                 # 表名过滤：忽略大小写，支持模糊匹配
@@ -199,19 +196,20 @@ class GenTableCRUD(CRUDBase[GenTableModel, GenTableSchema, GenTableSchema]):
         # 处理空列表情况
         if not table_names:
             return []
-        # 调用get_db_table_list获取所有表信息
-        all_tables = await self.get_db_table_list()
 
-        # 过滤出指定名称的表
+        # 从缓存的表列表中过滤出指定名称的表
         table_names_set = set(table_names)  # 转换为集合以提高查找效率
-        filtered_tables = [
-            GenDBTableSchema(**table)
-            for table in all_tables
-            if table["table_name"] in table_names_set
+        return [
+            GenDBTableSchema(
+                database_name=settings.DATABASE_NAME,
+                table_name=table_name,
+                table_type=settings.DATABASE_TYPE,
+                table_comment=table_comment,
+            )
+            for table_name, table_comment in await SchemaInspector.get_tables()
+            if table_name in table_names_set
         ]
 
-        return filtered_tables
-
     async def check_table_exists(self, table_name: str) -> bool:
         """
         检查数据库中是否已存在指定表名的表。
@@ -222,10 +220,7 @@ class GenTableCRUD(CRUDBase[GenTableModel, GenTableSchema, GenTableSchema]):
         返回:
         - bool: 如果表存在返回True，否则返回False。
         """
-        from app.core.database import engine
-
-        inspector: Inspector = inspect(engine)
-        return inspector.has_table(table_name)
+        return await SchemaInspector.has_table(table_name)
 
     async def execute_sql(self, sql: str) -> bool:
         """
@@ -258,82 +253,6 @@ class GenTableColumnCRUD(CRUDBase[GenTableColumnModel, GenTableColumnSchema, Gen
         """
         super().__init__(model=GenTableColumnModel, auth=auth)
 
-    @staticmethod
-    def _sync_get_table_columns(database_type: str, table_name: str) -> list[dict]:
-        """
-        同步函数：获取数据库表的列信息
-
-        参数:
-        - database_type: 数据库类型
-        - table_name: 表名
-
-        返回:
-        - list: 列信息列表
-        """
-        # 使用SQLAlchemy Inspector获取表列信息
-        from app.core.database import engine
-
-        inspector: Inspector = inspect(engine)
-
-        # 获取列信息
-        columns = inspector.get_columns(table_name)
-
-        # 获取主键信息
-        try:
-            pk_constraint = inspector.get_pk_constraint(table_name)
-            primary_keys = (
-                set(pk_constraint.get("constrained_columns", [])) if pk_constraint else set()
-            )
-        except Exception:
-            primary_keys = set()
-
-        # 获取唯一约束信息
-        unique_columns = set()
-        unique_constraints = inspector.get_unique_constraints(table_name)
-        for constraint in unique_constraints:
-            unique_columns.update(constraint.get("column_names", []))
-
-        # 处理列信息
-        columns_list = []
-        for idx, column in enumerate(columns):
-            # 获取列的基本信息
-            column_name = column["name"]
-            column_type = str(column["type"])
-            is_nullable = column.get("nullable", True)
-            column_default = column.get("default", None)
-            # 获取列注释（如果有的话）
-            column_comment = column.get("comment", "")
-            # 判断是否为主键
-            is_pk = column_name in primary_keys
-            # 判断是否为唯一约束
-            is_unique = column_name in unique_columns
-            # 判断是否为自增列（基于数据库类型和列类型）
-            is_increment = column.get("autoincrement", False) in (True, "auto")
-            # 获取列长度（如果适用）
-            column_length = None
-            # 使用getattr安全地获取length属性，避免访问不存在时抛出AttributeError
-            column_length = getattr(column["type"], "length", None)
-            if column_length is not None:
-                column_length = str(getattr(column["type"], "length", ""))
-
-            # 构造列信息字典
-            column_info = {
-                "column_name": column_name,
-                "column_comment": column_comment or "",
-                "column_type": column_type,
-                "column_length": column_length or "",
-                "column_default": str(column_default) if column_default is not None else "",
-                "sort": idx + 1,  # 序号从1开始
-                "is_pk": 1 if is_pk else 0,
-                "is_increment": 1 if is_increment else 0,
-                "is_nullable": 1 if is_nullable else 0,
-                "is_unique": 1 if is_unique else 0,
-            }
-
-            columns_list.append(column_info)
-
-        return columns_list
-
     async def get_gen_table_column_by_id(
         self, id: int, preload: list | None = None
     ) -> GenTableColumnModel | None:
@@ -395,21 +314,30 @@ class GenTableColumnCRUD(CRUDBase[GenTableColumnModel, GenTableColumnSchema, Gen
         # 检查表名是否为空
         if not table_name:
             raise ValueError("数据表名称不能为空")
+        columns_map = await self.get_gen_db_table_columns_by_names([table_name])
+        return columns_map[table_name]
 
-        try:
-            # 直接调用同步方法获取列信息
-            columns_info = GenTableColumnCRUD._sync_get_table_columns(
-                settings.DATABASE_TYPE, table_name
-            )
+    async def get_gen_db_table_columns_by_names(
+        self, table_names: list[str]
+    ) -> dict[str, list[GenTableColumnOutSchema]]:
+        """
+        批量获取多个数据库表的字段列表信息（一次反射）。
 
-            # 转换为GenTableColumnOutSchema对象列表
-            columns_list = [GenTableColumnOutSchema(**column_info) for column_info in columns_info]
+        参数:
+        - table_names (list[str]): 数据表名称列表。
 
-            return columns_list
+        返回:
+        - dict[str, list[GenTableColumnOutSchema]]: {表名: 字段列表信息对象}。
+        """
+        try:
+            columns_map = await SchemaInspector.get_columns(table_names)
         except Exception as e:
-            log.error(f"获取表{table_name}的字段列表时出错: {e!s}")
-            # 确保即使出错也返回空列表而不是None
+            log.error(f"获取表{table_names}的字段列表时出错: {e!s}")
             raise
+        return {
+            table_name: [GenTableColumnOutSchema(**column_info) for column_info in columns_info]
+            for table_name, columns_info in columns_map.items()
+        }
 
     async def list_gen_table_column_crud(
         self,
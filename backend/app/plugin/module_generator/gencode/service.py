@@ -1,28 +1,18 @@
-import io
 import os
-import zipfile
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
+from functools import partial
 from typing import Any
 
 import anyio
-import sqlglot
-from sqlglot.expressions import (
-    Add,
-    Alter,
-    Create,
-    Delete,
-    Drop,
-    Insert,
-    Table,
-    TruncateTable,
-    Update,
-)
+from redis.asyncio.client import Redis
 
 from app.api.v1.module_system.auth.schema import AuthSchema
 from app.config.path_conf import BASE_DIR
 from app.config.setting import settings
+from app.core.database import after_commit
 from app.core.exceptions import CustomException
 from app.core.logger import log
+from app.utils.zip_util import stream_zip
 
 from .crud import GenTableColumnCRUD, GenTableCRUD
 from .schema import (
@@ -34,6 +24,7 @@ from .schema import (
 )
 from .tools.gen_util import GenUtils
 from .tools.jinja2_template_util import Jinja2TemplateUtil
+from .tools.schema_inspector import SchemaInspector
 
 
 def handle_service_exception(func: Callable) -> Callable:
@@ -103,34 +94,38 @@ class GenTableService:
     @classmethod
     @handle_service_exception
     async def get_gen_db_table_list_service(
-        cls, auth: AuthSchema, search: GenTableQueryParam
+        cls, auth: AuthSchema, search: GenTableQueryParam, redis: Redis
     ) -> list[Any]:
         """获取数据库表列表。
 
         参数:
         - auth (AuthSchema): 认证信息。
         - search (GenTableQueryParam): 查询参数模型。
+        - redis (Redis): Redis数据库连接。
 
         返回:
         - list[Any]: 包含数据库表列表信息的任意类型列表。
         """
+        await SchemaInspector.sync_version(redis)
         gen_db_table_list_result = await GenTableCRUD(auth=auth).get_db_table_list(search)
         return gen_db_table_list_result
 
     @classmethod
     @handle_service_exception
     async def get_gen_db_table_list_by_name_service(
-        cls, auth: AuthSchema, table_names: list[str]
+        cls, auth: AuthSchema, table_names: list[str], redis: Redis
     ) -> list[GenTableOutSchema]:
         """根据表名称组获取数据库表信息。
 
         参数:
         - auth (AuthSchema): 认证信息。
         - table_names (list[str]): 业务表名称列表。
+        - redis (Redis): Redis数据库连接。
 
         返回:
         - list[GenTableOutSchema]: 包含业务表详细信息的模型列表。
         """
+        await SchemaInspector.sync_version(redis)
         gen_db_table_list_result = await GenTableCRUD(auth).get_db_table_list_by_names(table_names)
 
         # 修复：将GenDBTableSchema对象转换为字典后再传递给GenTableOutSchema
@@ -143,13 +138,14 @@ class GenTableService:
     @classmethod
     @handle_service_exception
     async def import_gen_table_service(
-        cls, auth: AuthSchema, gen_table_list: list[GenTableOutSchema]
+        cls, auth: AuthSchema, gen_table_list: list[GenTableOutSchema], redis: Redis
     ) -> bool:
         """导入表结构到生成器。
 
         参数:
         - auth (AuthSchema): 认证信息。
         - gen_table_list (list[GenTableOutSchema]): 包含业务表详细信息的模型列表。
+        - redis (Redis): Redis数据库连接。
 
         返回:
         - bool: 成功时返回True，失败时抛出异常。
@@ -157,7 +153,12 @@ class GenTableService:
         # 检查是否有表需要导入
         if not gen_table_list:
             raise CustomException(msg="导入的表结构不能为空")
+        await SchemaInspector.sync_version(redis)
         try:
+            # 一次反射所有待导入表的字段信息
+            columns_map = await GenTableColumnCRUD(auth).get_gen_db_table_columns_by_names([
+                table.table_name for table in gen_table_list if table.table_name
+            ])
             for table in gen_table_list:
                 table_name = table.table_name
                 # 检查表是否已存在
@@ -170,9 +171,7 @@ class GenTableService:
                 add_gen_table = await GenTableCRUD(auth).add_gen_table(
                     GenTableSchema.model_validate(table.model_dump())
                 )
-                gen_table_columns = await GenTableColumnCRUD(auth).get_gen_db_table_columns_by_name(
-                    table_name
-                )
+                gen_table_columns = columns_map.get(table_name or "", [])
                 if len(gen_table_columns) > 0:
                     table.id = add_gen_table.id
                     for column in gen_table_columns:
@@ -199,12 +198,13 @@ class GenTableService:
 
     @classmethod
     @handle_service_exception
-    async def create_table_service(cls, auth: AuthSchema, sql: str) -> bool | None:
+    async def create_table_service(cls, auth: AuthSchema, sql: str, redis: Redis) -> bool | None:
         """创建表结构并导入至代码生成模块。
 
         参数:
         - auth (AuthSchema): 认证信息。
         - sql (str): 包含`CREATE TABLE`语句的SQL字符串。
+        - redis (Redis): Redis数据库连接。
 
         返回:
         - bool | None: 成功时返回True，失败时抛出异常。
@@ -212,6 +212,21 @@ class GenTableService:
         # 验证SQL非空
         if not sql or not sql.strip():
             raise CustomException(msg="SQL语句不能为空")
+
+        # sqlglot 解析器导入耗时较长，只在建表时导入
+        import sqlglot
+        from sqlglot.expressions import (
+            Add,
+            Alter,
+            Create,
+            Delete,
+            Drop,
+            Insert,
+            Table,
+            TruncateTable,
+            Update,
+        )
+
         try:
             # 解析SQL语句
             sql_statements = sqlglot.parse(sql, dialect=settings.DATABASE_TYPE)
@@ -265,6 +280,8 @@ class GenTableService:
                 log.info(f"执行SQL语句: {exc_sql}")
                 if not await gen_table_crud.execute_sql(exc_sql):
                     raise CustomException(msg=f"执行SQL语句 {exc_sql} 失败，请检查数据库")
+            # 表结构已变化，事务提交后使各实例的数据库表缓存失效
+            after_commit(auth.db, partial(SchemaInspector.invalidate, redis, table_names))
             return True
 
         except Exception as e:
@@ -391,29 +408,28 @@ class GenTableService:
             await GenTableCRUD(auth).get_gen_table_by_id(table_id)
         )
         await cls.set_pk_column(gen_table)
-        env = Jinja2TemplateUtil.get_env()
-        context = Jinja2TemplateUtil.prepare_context(gen_table)
-        template_list = Jinja2TemplateUtil.get_template_list()
+        # 业务表定义未变化时复用上次的渲染结果
+        contents, errors = await Jinja2TemplateUtil.render_all(gen_table)
         preview_code_result = {}
-        for template in template_list:
-            try:
-                render_content = await env.get_template(template).render_async(**context)
-                preview_code_result[template] = render_content
-            except Exception as e:
-                log.error(f"渲染模板 {template} 时出错: {e!s}")
+        for template in Jinja2TemplateUtil.get_template_list():
+            if template in errors:
+                log.error(f"渲染模板 {template} 时出错: {errors[template]}")
                 # 即使某个模板渲染失败，也继续处理其他模板
-                preview_code_result[template] = f"渲染错误: {e!s}"
+                preview_code_result[template] = f"渲染错误: {errors[template]}"
+            else:
+                preview_code_result[template] = contents[template]
         return preview_code_result
 
     @classmethod
     @handle_service_exception
-    async def generate_code_service(cls, auth: AuthSchema, table_name: str) -> bool:
+    async def generate_code_service(cls, auth: AuthSchema, table_name: str, redis: Redis) -> bool:
         """生成代码至指定路径（安全写入+可跳过覆盖）。
         - 安全：限制写入在项目根目录内；越界路径自动回退到项目根目录。
 
         参数:
         - auth (AuthSchema): 认证信息。
         - table_name (str): 业务表名。
+        - redis (Redis): Redis数据库连接。
 
         返回:
         - bool: 生成是否成功。
@@ -421,12 +437,11 @@ class GenTableService:
         # 验证表名非空
         if not table_name or not table_name.strip():
             raise CustomException(msg="表名不能为空")
-        env = Jinja2TemplateUtil.get_env()
-        render_info = await cls.__get_gen_render_info(auth, table_name)
-        gen_table_schema: GenTableOutSchema = render_info[3]
+        gen_table_schema = await cls.__get_gen_table(auth, table_name)
 
         from app.api.v1.module_system.menu.crud import MenuCRUD
         from app.api.v1.module_system.menu.schema import MenuCreateSchema
+        from app.api.v1.module_system.menu.tools.menu_tree import MenuTreeCache
         from app.utils.common_util import CamelCaseUtil
 
         # 构建权限前缀
@@ -577,12 +592,17 @@ class GenTableService:
             )
             log.info(f"成功创建按钮权限: {button['name']}")
         log.info(f"成功创建{gen_table_schema.function_name}菜单及按钮权限")
+        MenuTreeCache.invalidate_on_commit(db=auth.db, redis=redis)
 
         # 2. 菜单创建成功后，再生成页面代码
-        for template in render_info[0]:
+        contents, errors = await Jinja2TemplateUtil.render_all(gen_table_schema)
+        if errors:
+            raise CustomException(
+                msg=f"渲染模板失败，表名：{gen_table_schema.table_name}，"
+                f"详细错误信息：{next(iter(errors.values()))}"
+            )
+        for template in Jinja2TemplateUtil.get_template_list():
             try:
-                render_content = await env.get_template(template).render_async(**render_info[2])
-
                 file_name = Jinja2TemplateUtil.get_file_name(template, gen_table_schema)
                 full_path = BASE_DIR.parent.joinpath(file_name)
                 gen_path = str(full_path)
@@ -593,7 +613,7 @@ class GenTableService:
                 # 确保目录存在
                 os.makedirs(os.path.dirname(gen_path), exist_ok=True)
 
-                await anyio.Path(gen_path).write_text(render_content, encoding="utf-8")
+                await anyio.Path(gen_path).write_text(contents[template], encoding="utf-8")
 
                 module_init_path = BASE_DIR.parent.joinpath(
                     f"backend/app/api/v1/{gen_table_schema.module_name}/__init__.py"
@@ -613,53 +633,63 @@ class GenTableService:
 
     @classmethod
     @handle_service_exception
-    async def batch_gen_code_service(cls, auth: AuthSchema, table_names: list[str]) -> bytes:
+    async def batch_gen_code_service(
+        cls, auth: AuthSchema, table_names: list[str]
+    ) -> AsyncIterator[bytes]:
         """
         批量生成代码并打包为ZIP。
-        - 备注：内存生成并压缩，兼容多模板类型；供下载使用。
+        - 备注：一次查询取回全部业务表，渲染结果按表定义指纹缓存；ZIP 边渲染边输出，不在内存中拼装整个压缩包。
 
         参数:
         - auth (AuthSchema): 认证信息。
         - table_names (list[str]): 业务表名列表。
 
         返回:
-        - bytes: 包含所有生成代码的ZIP文件内容。
+        - AsyncIterator[bytes]: ZIP 文件字节流。
         """
         # 验证表名列表非空
         if not table_names:
             raise CustomException(msg="表名列表不能为空")
-        zip_buffer = io.BytesIO()
-        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-            for table_name in table_names:
-                if not table_name.strip():
-                    continue
-                try:
-                    env = Jinja2TemplateUtil.get_env()
-                    render_info = await cls.__get_gen_render_info(auth, table_name)
-                    for template_file, output_file in zip(
-                        render_info[0], render_info[1], strict=False
-                    ):
-                        render_content = await env.get_template(template_file).render_async(
-                            **render_info[2]
-                        )
-                        zip_file.writestr(output_file, render_content)
-                except Exception as e:
-                    log.error(f"批量生成代码时处理表 {table_name} 出错: {e!s}")
+        names = list(dict.fromkeys(name for name in table_names if name.strip()))
+        # 数据库查询在返回流之前完成，流式输出阶段不再访问数据库会话
+        gen_table_models = {
+            gen_table.table_name: gen_table
+            for gen_table in await GenTableCRUD(auth).get_gen_table_by_names(
+                names, preload=["columns"]
+            )
+        }
+        gen_tables: list[GenTableOutSchema] = []
+        for table_name in names:
+            gen_table_model = gen_table_models.get(table_name)
+            if gen_table_model is None:
+                log.error(f"批量生成代码时处理表 {table_name} 出错: 业务表不存在")
+                continue
+            gen_table = GenTableOutSchema.model_validate(gen_table_model)
+            await cls.set_pk_column(gen_table)
+            gen_tables.append(gen_table)
+
+        async def entries() -> AsyncIterator[tuple[str, str]]:
+            for gen_table in gen_tables:
+                contents, errors = await Jinja2TemplateUtil.render_all(gen_table)
+                if errors:
+                    log.error(f"批量生成代码时处理表 {gen_table.table_name} 出错: {errors}")
                     # 继续处理其他表，不中断整个过程
                     continue
-        zip_data = zip_buffer.getvalue()
-        zip_buffer.close()
-        return zip_data
+                for template in Jinja2TemplateUtil.get_template_list():
+                    yield Jinja2TemplateUtil.get_file_name(template, gen_table), contents[template]
+
+        return stream_zip(entries())
 
     @classmethod
     @handle_service_exception
-    async def sync_db_service(cls, auth: AuthSchema, table_name: str) -> None:
+    async def sync_db_service(cls, auth: AuthSchema, table_name: str, redis: Redis) -> None:
         """
         同步数据库表结构到业务表。
 
         参数:
         - auth (AuthSchema): 认证信息。
         - table_name (str): 业务表名。
+        - redis (Redis): Redis数据库连接。
 
         返回:
         - None
@@ -675,6 +705,8 @@ class GenTableService:
             raise CustomException(msg="业务表ID不能为空")
         table_columns = table.columns or []
         table_column_map = {column.column_name: column for column in table_columns}
+        # 同步需要读取最新表结构，先使该表的缓存失效
+        await SchemaInspector.invalidate(redis, [table_name])
         # 确保db_table_columns始终是列表类型，避免None值
         db_table_columns = (
             await GenTableColumnCRUD(auth).get_gen_db_table_columns_by_name(table_name) or []
@@ -751,16 +783,16 @@ class GenTableService:
             gen_table.pk_column = gen_table.columns[0]
 
     @classmethod
-    async def __get_gen_render_info(cls, auth: AuthSchema, table_name: str) -> list[Any]:
+    async def __get_gen_table(cls, auth: AuthSchema, table_name: str) -> GenTableOutSchema:
         """
-        获取生成代码渲染模板相关信息。
+        获取生成代码所需的业务表对象（已设置主键列）。
 
         参数:
         - auth (AuthSchema): 认证对象。
         - table_name (str): 业务表名称。
 
         返回:
-        - list[Any]: [模板列表, 输出文件名列表, 渲染上下文, 业务表对象]。
+        - GenTableOutSchema: 业务表对象。
 
         异常:
         - CustomException: 当业务表不存在或数据转换失败时抛出。
@@ -771,12 +803,7 @@ class GenTableService:
             raise CustomException(msg=f"业务表 {table_name} 不存在")
         gen_table = GenTableOutSchema.model_validate(gen_table_model)
         await cls.set_pk_column(gen_table)
-        context = Jinja2TemplateUtil.prepare_context(gen_table)
-        template_list = Jinja2TemplateUtil.get_template_list()
-        output_files = [
-            Jinja2TemplateUtil.get_file_name(template, gen_table) for template in template_list
-        ]
-        return [template_list, output_files, context, gen_table]
+        return gen_table
 
 
 class GenTableColumnService:
@@ -1,7 +1,7 @@
+import hashlib
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any
-
-from jinja2 import Environment, FileSystemLoader, Template
+from typing import TYPE_CHECKING, Any
 
 from app.common.constant import GenConstant
 from app.config.path_conf import TEMPLATE_DIR
@@ -13,6 +13,9 @@ from app.plugin.module_generator.gencode.schema import (
 from app.utils.common_util import CamelCaseUtil, SnakeCaseUtil
 from app.utils.string_util import StringUtil
 
+if TYPE_CHECKING:
+    from jinja2 import Template
+
 
 class Jinja2TemplateUtil:
     """
@@ -26,6 +29,11 @@ class Jinja2TemplateUtil:
     # 环境对象
     _env = None
 
+    # 渲染结果缓存数量上限（按业务表定义指纹缓存，最近最少使用的先淘汰）
+    RENDER_CACHE_SIZE = 64
+    # 渲染结果缓存：{业务表指纹: {模板路径: 渲染内容}}
+    _render_cache: OrderedDict[str, dict[str, str]] = OrderedDict()
+
     @classmethod
     def get_env(cls):
         """
@@ -39,6 +47,9 @@ class Jinja2TemplateUtil:
         """
         try:
             if cls._env is None:
+                # 只有代码生成用到 jinja2，首次渲染时再导入
+                from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
                 cls._env = Environment(
                     loader=FileSystemLoader(TEMPLATE_DIR),
                     autoescape=False,  # 自动转义HTML
@@ -46,6 +57,8 @@ class Jinja2TemplateUtil:
                     lstrip_blocks=True,  # 删除行首空格
                     keep_trailing_newline=True,  # 保留行尾换行符
                     enable_async=True,  # 开启异步支持
+                    # 编译后的模板字节码缓存到临时目录，进程重启后无需重新编译
+                    bytecode_cache=FileSystemBytecodeCache(),
                 )
                 cls._env.filters.update({
                     "camel_to_snake": SnakeCaseUtil.camel_to_snake,
@@ -57,7 +70,7 @@ class Jinja2TemplateUtil:
             raise RuntimeError(f"初始化Jinja2模板引擎失败: {e}")
 
     @classmethod
-    def get_template(cls, template_path: str) -> Template:
+    def get_template(cls, template_path: str) -> "Template":
         """
         获取模板。
 
@@ -119,6 +132,58 @@ class Jinja2TemplateUtil:
 
         return context
 
+    @classmethod
+    def get_fingerprint(cls, gen_table: GenTableOutSchema) -> str:
+        """
+        计算业务表定义（表及全部字段配置）的指纹，作为渲染结果的缓存键。
+
+        参数:
+        - gen_table (GenTableOutSchema): 生成表的配置信息。
+
+        返回:
+        - str: sha256 摘要。
+        """
+        raw = f"{settings.DATABASE_TYPE}:{gen_table.model_dump_json()}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    @classmethod
+    async def render_all(
+        cls, gen_table: GenTableOutSchema
+    ) -> tuple[dict[str, str], dict[str, str]]:
+        """
+        渲染全部模板，业务表定义未变化时直接返回缓存的渲染结果。
+
+        渲染失败的模板不会中断其他模板，存在失败时结果不缓存。
+        缓存结果在多个请求间共享，调用方只能读取，不能修改。
+
+        参数:
+        - gen_table (GenTableOutSchema): 生成表的配置信息（需已设置主键列）。
+
+        返回:
+        - tuple[dict[str, str], dict[str, str]]: ({模板路径: 渲染内容}, {模板路径: 错误信息})。
+        """
+        key = cls.get_fingerprint(gen_table)
+        cached = cls._render_cache.get(key)
+        if cached is not None:
+            cls._render_cache.move_to_end(key)
+            return cached, {}
+
+        env = cls.get_env()
+        context = cls.prepare_context(gen_table)
+        contents: dict[str, str] = {}
+        errors: dict[str, str] = {}
+        for template in cls.get_template_list():
+            try:
+                contents[template] = await env.get_template(template).render_async(**context)
+            except Exception as e:
+                errors[template] = str(e)
+
+        if not errors:
+            cls._render_cache[key] = contents
+            if len(cls._render_cache) > cls.RENDER_CACHE_SIZE:
+                cls._render_cache.popitem(last=False)
+        return contents, errors
+
     @classmethod
     def get_template_list(cls):
         """
@@ -0,0 +1,284 @@
+import asyncio
+import time
+from collections.abc import Iterable
+from typing import Any
+
+from redis.asyncio.client import Redis
+from sqlalchemy import Connection, inspect, text
+
+from app.common.enums import RedisInitKeyConfig
+from app.config.setting import settings
+from app.core.exceptions import CustomException
+from app.core.logger import log
+from app.core.redis_crud import RedisCURD
+
+
+class SchemaInspector:
+    """
+    代码生成器数据库结构反射
+
+    - 通过异步引擎的 run_sync 在单个连接上完成反射，不阻塞事件循环；
+    - 表名与表注释一次取回：MySQL 直接查询 information_schema.TABLES，其余方言使用
+      Inspector.get_multi_table_comment（PostgreSQL 为单条查询）；
+    - 多个表的列、主键、唯一约束通过 get_multi_* 批量反射；
+    - 结果缓存在进程内，读取前调用 sync_version() 与 Redis 中的版本号比对；建表、同步表结构后
+      调用 invalidate() 递增版本号，各实例在下次读取时发现版本变化并丢弃本地缓存。
+    返回的缓存对象在多个请求间共享，调用方只能读取，不能修改。
+    """
+
+    # 缓存有效期(秒)，兜底通过迁移等外部途径修改表结构、Redis 版本键被手动清除等情况
+    CACHE_TTL = 300
+
+    # 表列表：[(表名, 表注释)]
+    _tables: list[tuple[str, str]] | None = None
+    _tables_loaded_at: float = 0.0
+    # 列信息：{表名: (加载时间, 列信息字典列表)}
+    _columns: dict[str, tuple[float, list[dict[str, Any]]]] = {}
+    _version: str | None = None
+    _lock: asyncio.Lock | None = None
+
+    @classmethod
+    def _get_lock(cls) -> asyncio.Lock:
+        """
+        获取（必要时创建）加载锁，避免并发请求重复反射。
+
+        返回:
+        - asyncio.Lock: 加载锁。
+        """
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+        return cls._lock
+
+    @classmethod
+    def _is_fresh(cls, loaded_at: float) -> bool:
+        """
+        缓存是否仍在有效期内。
+
+        参数:
+        - loaded_at (float): 加载时间（time.monotonic）。
+
+        返回:
+        - bool: 有效返回 True。
+        """
+        return loaded_at > 0 and time.monotonic() - loaded_at <= cls.CACHE_TTL
+
+    @classmethod
+    def _clear(cls, table_names: Iterable[str] | None = None) -> None:
+        """
+        清空本地缓存：表列表总是清空，列信息按表名清空，未传表名时全部清空。
+
+        参数:
+        - table_names (Iterable[str] | None): 需要清空列信息的表名。
+
+        返回:
+        - None
+        """
+        cls._tables = None
+        cls._tables_loaded_at = 0.0
+        if table_names is None:
+            cls._columns = {}
+            return
+        for name in table_names:
+            cls._columns.pop(name, None)
+
+    @staticmethod
+    async def _run(func: Any, *args: Any) -> Any:
+        """
+        在异步引擎的连接上执行同步反射函数。
+
+        参数:
+        - func (Any): 以同步 Connection 为第一个参数的函数。
+        - *args (Any): 其余参数。
+
+        返回:
+        - Any: 函数返回值。
+        """
+        from app.core.database import async_engine
+
+        async with async_engine.connect() as conn:
+            return await conn.run_sync(func, *args)
+
+    @staticmethod
+    def _load_tables(conn: Connection) -> list[tuple[str, str]]:
+        """
+        同步函数：查询当前库的全部表名及注释。
+
+        参数:
+        - conn (Connection): 同步连接。
+
+        返回:
+        - list[tuple[str, str]]: [(表名, 表注释)]。
+        """
+        if settings.DATABASE_TYPE == "mysql":
+            rows = conn.execute(
+                text(
+                    "SELECT TABLE_NAME, TABLE_COMMENT FROM information_schema.TABLES "
+                    "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_TYPE = 'BASE TABLE' "
+                    "ORDER BY TABLE_NAME"
+                )
+            ).all()
+            return [(row[0], row[1] or "") for row in rows]
+
+        inspector = inspect(conn)
+        table_names = inspector.get_table_names()
+        try:
+            comments = inspector.get_multi_table_comment(filter_names=table_names)
+        except NotImplementedError:
+            # SQLite 等不支持表注释的方言
+            comments = {}
+        result = []
+        for table_name in table_names:
+            comment = comments.get((None, table_name)) or {}
+            result.append((table_name, comment.get("text") or ""))
+        return result
+
+    @staticmethod
+    def _load_columns(conn: Connection, table_names: list[str]) -> dict[str, list[dict[str, Any]]]:
+        """
+        同步函数：批量反射多个表的列信息。
+
+        参数:
+        - conn (Connection): 同步连接。
+        - table_names (list[str]): 表名列表。
+
+        返回:
+        - dict[str, list[dict[str, Any]]]: {表名: 列信息字典列表}，不存在的表不出现在结果中。
+        """
+        inspector = inspect(conn)
+        multi_columns = inspector.get_multi_columns(filter_names=table_names)
+        try:
+            multi_pk = inspector.get_multi_pk_constraint(filter_names=table_names)
+        except Exception:
+            multi_pk = {}
+        multi_unique = inspector.get_multi_unique_constraints(filter_names=table_names)
+
+        result: dict[str, list[dict[str, Any]]] = {}
+        for (_, table_name), columns in multi_columns.items():
+            pk_constraint = multi_pk.get((None, table_name)) or {}
+            primary_keys = set(pk_constraint.get("constrained_columns") or [])
+            unique_columns = set()
+            for constraint in multi_unique.get((None, table_name)) or []:
+                unique_columns.update(constraint.get("column_names") or [])
+
+            columns_list = []
+            for idx, column in enumerate(columns):
+                column_name = column["name"]
+                column_default = column.get("default")
+                column_length = getattr(column["type"], "length", None)
+                columns_list.append({
+                    "column_name": column_name,
+                    "column_comment": column.get("comment") or "",
+                    "column_type": str(column["type"]),
+                    "column_length": str(column_length) if column_length is not None else "",
+                    "column_default": str(column_default) if column_default is not None else "",
+                    "sort": idx + 1,  # 序号从1开始
+                    "is_pk": 1 if column_name in primary_keys else 0,
+                    "is_increment": 1 if column.get("autoincrement") in (True, "auto") else 0,
+                    "is_nullable": 1 if column.get("nullable", True) else 0,
+                    "is_unique": 1 if column_name in unique_columns else 0,
+                })
+            result[table_name] = columns_list
+        return result
+
+    @classmethod
+    async def get_tables(cls) -> list[tuple[str, str]]:
+        """
+        获取当前库的全部表名及注释（带缓存）。
+
+        返回:
+        - list[tuple[str, str]]: [(表名, 表注释)]。
+        """
+        if cls._tables is not None and cls._is_fresh(cls._tables_loaded_at):
+            return cls._tables
+        async with cls._get_lock():
+            if cls._tables is not None and cls._is_fresh(cls._tables_loaded_at):
+                return cls._tables
+            tables = await cls._run(cls._load_tables)
+            cls._tables = tables
+            cls._tables_loaded_at = time.monotonic()
+            log.info(f"已加载数据库表结构: {len(tables)} 张表")
+        return tables
+
+    @classmethod
+    async def get_columns(cls, table_names: Iterable[str]) -> dict[str, list[dict[str, Any]]]:
+        """
+        批量获取表的列信息（带缓存，未命中的表一次性反射）。
+
+        参数:
+        - table_names (Iterable[str]): 表名。
+
+        返回:
+        - dict[str, list[dict[str, Any]]]: {表名: 列信息字典列表}。
+
+        异常:
+        - CustomException: 表不存在。
+        """
+        names = list(dict.fromkeys(table_names))
+        result: dict[str, list[dict[str, Any]]] = {}
+        missing = []
+        for name in names:
+            cached = cls._columns.get(name)
+            if cached is not None and cls._is_fresh(cached[0]):
+                result[name] = cached[1]
+            else:
+                missing.append(name)
+
+        if missing:
+            async with cls._get_lock():
+                loaded = await cls._run(cls._load_columns, missing)
+                loaded_at = time.monotonic()
+                for name, columns in loaded.items():
+                    cls._columns[name] = (loaded_at, columns)
+                result.update(loaded)
+
+        not_found = [name for name in names if name not in result]
+        if not_found:
+            raise CustomException(msg=f"数据表不存在: {', '.join(not_found)}")
+        return result
+
+    @classmethod
+    async def has_table(cls, table_name: str) -> bool:
+        """
+        检查表是否存在（直接查询数据库，不使用缓存）。
+
+        参数:
+        - table_name (str): 表名。
+
+        返回:
+        - bool: 存在返回 True。
+        """
+        return await cls._run(lambda conn: inspect(conn).has_table(table_name))
+
+    @classmethod
+    async def sync_version(cls, redis: Redis) -> None:
+        """
+        读取缓存前调用：Redis 中的版本号与本地不一致时丢弃本地缓存。
+
+        参数:
+        - redis (Redis): Redis 连接。
+
+        返回:
+        - None
+        """
+        version = await RedisCURD(redis).get(RedisInitKeyConfig.GEN_SCHEMA_VERSION.key)
+        if version != cls._version:
+            cls._clear()
+            cls._version = version
+
+    @classmethod
+    async def invalidate(cls, redis: Redis, table_names: Iterable[str] | None = None) -> None:
+        """
+        表结构变化后调用：清空本地缓存并递增 Redis 中的版本号，使其他实例的缓存一并失效。
+
+        参数:
+        - redis (Redis): Redis 连接。
+        - table_names (Iterable[str] | None): 结构发生变化的表名，未传时清空全部列信息。
+
+        返回:
+        - None
+        """
+        cls._clear(table_names)
+        try:
+            await redis.incr(RedisInitKeyConfig.GEN_SCHEMA_VERSION.key)
+        except Exception as e:
+            log.error(f"更新表结构缓存版本失败: {e!s}")
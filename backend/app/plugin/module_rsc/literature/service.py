@@ -2,7 +2,6 @@
 
 import io
 from fastapi import UploadFile
-import pandas as pd
 
 from app.core.base_schema import BatchSetAvailable
 from app.core.exceptions import CustomException
@@ -144,6 +143,9 @@ class RscLiteratureService:
             '更新人ID': 'updated_id',
         }
 
+        # pandas 导入耗时较长，读取 Excel 时才加载
+        import pandas as pd
+
         try:
             contents = await file.read()
             df = pd.read_excel(io.BytesIO(contents))
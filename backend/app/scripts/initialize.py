@@ -1,8 +1,7 @@
 import asyncio
-import json
-from typing import Any
+from functools import partial
 
-from sqlalchemy import func, select
+from sqlalchemy import literal_column, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.module_system.dept.model import DeptModel
@@ -12,9 +11,10 @@ from app.api.v1.module_system.params.model import ParamsModel
 from app.api.v1.module_system.position.model import PositionModel
 from app.api.v1.module_system.role.model import RoleModel
 from app.api.v1.module_system.user.model import UserModel, UserRolesModel
-from app.config.path_conf import SCRIPT_DIR
-from app.core.database import async_db_session, create_tables
+from app.core.database import async_db_session, async_engine, create_tables
 from app.core.logger import log
+from app.core.tree_path import TreePath
+from app.scripts.seed_loader import SeedLoader
 
 
 class InitializeData:
@@ -47,6 +47,10 @@ class InitializeData:
             # 使用引擎创建所有表
             # await drop_tables()
             await create_tables()
+            # create_all 不会给已有表加列：补齐升级前创建的部门/菜单表的物化路径列
+            async with async_engine.begin() as conn:
+                for model in (DeptModel, MenuModel):
+                    await TreePath.add_column(conn, model)
         except asyncio.exceptions.TimeoutError:
             log.error("❌️ 数据库表结构初始化超时")
             raise
@@ -56,120 +60,61 @@ class InitializeData:
 
     async def __init_data(self, db: AsyncSession) -> None:
         """
-        初始化基础数据
+        初始化基础数据（只写入空表）
 
         参数:
         - db (AsyncSession): 异步数据库会话。
         """
-        # 存储字典类型数据的映射，用于后续字典数据的初始化
-        dict_type_mapping = {}
+        # 一次查询判断全部表是否已有数据（EXISTS 读到首行即返回，无需 COUNT 全表）
+        checks = [
+            select(literal_column("1")).select_from(model).exists().label(model.__tablename__)
+            for model in self.prepare_init_models
+        ]
+        existing = (await db.execute(select(*checks))).one()._mapping
 
+        loader = SeedLoader(db)
         for model in self.prepare_init_models:
             table_name = model.__tablename__
-
-            # 检查表中是否已经有数据
-            count_result = await db.execute(select(func.count()).select_from(model))
-            existing_count = count_result.scalar()
-            if existing_count and existing_count > 0:
-                log.warning(
-                    f"⚠️  跳过 {table_name} 表数据初始化（表已存在 {existing_count} 条记录）"
-                )
+            if existing[table_name]:
+                log.warning(f"⚠️  跳过 {table_name} 表数据初始化（表中已有数据）")
                 continue
 
-            data = await self.__get_data(table_name)
-            if not data:
-                log.warning(f"⚠️  跳过 {table_name} 表，无初始化数据")
-                continue
+            transform = None
+            if table_name == "sys_dict_data":
+                # 字典数据按 dict_type 关联字典类型ID
+                dict_type_mapping = dict(
+                    (await db.execute(select(DictTypeModel.dict_type, DictTypeModel.id))).all()
+                )
+                transform = partial(self.__link_dict_type, mapping=dict_type_mapping)
 
             try:
-                # 特殊处理具有嵌套 children 数据的表
-                if table_name in ["sys_dept", "sys_menu"]:
-                    # 获取对应的模型类
-                    model_class = DeptModel if table_name == "sys_dept" else MenuModel
-                    objs = self.__create_objects_with_children(data, model_class)
-                # 处理字典类型表，保存类型映射
-                elif table_name == "sys_dict_type":
-                    objs = []
-                    for item in data:
-                        obj = model(**item)
-                        objs.append(obj)
-                        dict_type_mapping[item["dict_type"]] = obj
-                # 处理字典数据表，添加dict_type_id关联
-                elif table_name == "sys_dict_data":
-                    objs = []
-                    for item in data:
-                        dict_type = item.get("dict_type")
-                        if dict_type in dict_type_mapping:
-                            # 添加dict_type_id关联
-                            item["dict_type_id"] = dict_type_mapping[dict_type].id
-                        else:
-                            log.warning(f"⚠️  未找到字典类型 {dict_type}，跳过该字典数据")
-                            continue
-                        objs.append(model(**item))
-                else:
-                    # 表为空，直接插入全部数据
-                    objs = [model(**item) for item in data]
-
-                db.add_all(objs)
-                await db.flush()
-                log.info(f"✅️ 已向 {table_name} 表写入初始化数据")
-
+                count = await loader.load(model, transform=transform)
             except Exception as e:
                 log.error(f"❌️ 初始化 {table_name} 表数据失败: {e!s}")
                 raise
+            if count:
+                log.info(f"✅️ 已向 {table_name} 表写入 {count} 条初始化数据")
+            else:
+                log.warning(f"⚠️  跳过 {table_name} 表，无初始化数据")
 
-    def __create_objects_with_children(self, data: list[dict], model_class: type) -> list:
-        """
-        通用递归创建对象函数，处理嵌套的 children 数据
-
-        参数:
-        - data (list[dict]): 包含嵌套 children 数据的列表。
-        - model_class: 对应的 SQLAlchemy 模型类。
-
-        返回:
-        - list: 包含创建的对象的列表。
-        """
-
-        def create_object(obj_data: dict) -> Any:
-            # 分离 children 数据
-            children_data = obj_data.pop("children", [])
-
-            # 创建当前对象
-            obj = model_class(**obj_data)
-
-            # 递归处理子对象
-            if children_data:
-                obj.children = [create_object(child) for child in children_data]
-
-            return obj
-
-        objs = [create_object(item) for item in data]
-
-        return objs
-
-    async def __get_data(self, filename: str) -> list[dict]:
+    @staticmethod
+    def __link_dict_type(item: dict, mapping: dict[str, int]) -> dict | None:
         """
-        读取初始化数据文件
+        为字典数据填写 dict_type_id
 
         参数:
-        - filename (str): 文件名（不包含扩展名）。
+        - item (dict): 字典数据行。
+        - mapping (dict[str, int]): {字典类型: 字典类型ID}。
 
         返回:
-        - list[dict]: 解析后的 JSON 数据列表。
+        - dict | None: 关联后的数据行，字典类型不存在时返回 None（跳过）。
         """
-        json_path = SCRIPT_DIR / f"{filename}.json"
-        if not json_path.exists():
-            return []
-
-        try:
-            with open(json_path, encoding="utf-8") as f:
-                return json.loads(f.read())
-        except json.JSONDecodeError as e:
-            log.error(f"❌️ 解析 {json_path} 失败: {e!s}")
-            raise
-        except Exception as e:
-            log.error(f"❌️ 读取 {json_path} 失败: {e!s}")
-            raise
+        dict_type = item.get("dict_type")
+        if dict_type not in mapping:
+            log.warning(f"⚠️  未找到字典类型 {dict_type}，跳过该字典数据")
+            return None
+        item["dict_type_id"] = mapping[dict_type]
+        return item
 
     async def init_db(self) -> None:
         """
@@ -182,6 +127,9 @@ class InitializeData:
         async with async_db_session() as session:
             async with session.begin():
                 await self.__init_data(session)
+                # 补齐部门/菜单的物化路径（初始化数据及升级前的存量数据）
+                for model in (DeptModel, MenuModel):
+                    await TreePath.ensure(session, model)
                 # session.add_all(objs)
                 # 确保提交事务
                 await session.commit()
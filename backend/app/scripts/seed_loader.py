@@ -0,0 +1,288 @@
+import asyncio
+import json
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import Table, func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config.path_conf import SCRIPT_DIR
+from app.config.setting import settings
+from app.core.tree_path import TreePath
+
+
+class SeedLoader:
+    """
+    初始化数据批量导入
+
+    - 数据文件为 {表名}.json（对象数组）或 {表名}.ndjson（每行一个对象），在线程中流式解析，
+      不会整体读入内存；
+    - 嵌套 children 的树形数据按层序展开为扁平行：预先分配ID并填写 parent_id/tree_path，
+      父节点总在子节点之前写入；
+    - 每批 BATCH_SIZE 行通过 Core insert() 以 executemany 写入（SQLAlchemy 会合并为多行 VALUES），
+      PostgreSQL(asyncpg) 使用 COPY 写入；
+    - 只用于空表，显式写入ID后同步 PostgreSQL 的自增序列。
+    """
+
+    # 每批写入的行数
+    BATCH_SIZE = 1000
+    # 流式读取 JSON 数组时每次读取的字符数
+    CHUNK_SIZE = 1 << 16
+
+    def __init__(self, db: AsyncSession) -> None:
+        """
+        初始化导入器。
+
+        参数:
+        - db (AsyncSession): 异步数据库会话（由调用方管理事务）。
+        """
+        self.db = db
+
+    @staticmethod
+    def find(table_name: str) -> Path | None:
+        """
+        查找表的初始化数据文件。
+
+        参数:
+        - table_name (str): 表名。
+
+        返回:
+        - Path | None: 数据文件，不存在时返回 None。
+        """
+        for suffix in (".ndjson", ".json"):
+            path = SCRIPT_DIR / f"{table_name}{suffix}"
+            if path.exists():
+                return path
+        return None
+
+    @classmethod
+    def iter_rows(cls, path: Path) -> Iterator[dict[str, Any]]:
+        """
+        流式读取数据文件中的对象。
+
+        参数:
+        - path (Path): 数据文件。
+
+        返回:
+        - Iterator[dict[str, Any]]: 数据行。
+
+        异常:
+        - ValueError: 文件格式错误。
+        """
+        with open(path, encoding="utf-8") as f:
+            if path.suffix == ".ndjson":
+                for line in f:
+                    if line.strip():
+                        yield cls._check_row(json.loads(line), path)
+                return
+
+            decoder = json.JSONDecoder()
+            buffer = ""
+            while not buffer:
+                chunk = f.read(cls.CHUNK_SIZE)
+                if not chunk:
+                    return
+                buffer = chunk.lstrip()
+            if not buffer.startswith("["):
+                raise ValueError(f"{path.name} 的顶层必须是数组")
+            buffer = buffer[1:]
+            while True:
+                buffer = buffer.lstrip()
+                if buffer.startswith(","):
+                    buffer = buffer[1:].lstrip()
+                if buffer.startswith("]"):
+                    return
+                try:
+                    item, end = decoder.raw_decode(buffer)
+                except json.JSONDecodeError:
+                    # 当前元素不完整，继续读取
+                    chunk = f.read(cls.CHUNK_SIZE)
+                    if not chunk:
+                        raise
+                    buffer += chunk
+                    continue
+                buffer = buffer[end:]
+                yield cls._check_row(item, path)
+
+    @staticmethod
+    def _check_row(item: Any, path: Path) -> dict[str, Any]:
+        """校验数据行必须是对象"""
+        if not isinstance(item, dict):
+            raise ValueError(f"{path.name} 中的数据行必须是对象: {item!r}")
+        return item
+
+    @staticmethod
+    def flatten(rows: Iterable[dict[str, Any]], table: Table) -> Iterator[dict[str, Any]]:
+        """
+        把嵌套 children 的树形数据按层序展开，分配ID并填写 parent_id/tree_path。
+
+        ID 按层分配（先全部顶层节点，再逐层分配子节点），与逐个 add 对象后 flush 时的写入顺序一致，
+        已有数据中的菜单/部门ID保持不变。
+
+        参数:
+        - rows (Iterable[dict[str, Any]]): 顶层节点。
+        - table (Table): 目标表。
+
+        返回:
+        - Iterator[dict[str, Any]]: 扁平行（父节点在前）。
+        """
+        has_path = "tree_path" in table.c
+        next_id = 1
+        level: list[tuple[dict[str, Any], Any, str | None]] = [
+            (root, root.get("parent_id"), None) for root in rows
+        ]
+        while level:
+            children: list[tuple[dict[str, Any], Any, str | None]] = []
+            for node, parent_id, parent_path in level:
+                row = {key: value for key, value in node.items() if key != "children"}
+                row.setdefault("id", next_id)
+                next_id = max(next_id, row["id"] + 1)
+                row["parent_id"] = parent_id
+                path = (
+                    TreePath.join(parent_path, row["id"])
+                    if parent_id is None or parent_path
+                    else None
+                )
+                if has_path:
+                    row["tree_path"] = path
+                children.extend((child, row["id"], path) for child in node.get("children") or [])
+                yield row
+            level = children
+
+    @staticmethod
+    def _prepare(row: dict[str, Any], table: Table) -> dict[str, Any]:
+        """
+        校验字段并补齐 Python 端默认值（uuid、创建时间等，COPY 不会执行这些默认值）。
+
+        参数:
+        - row (dict[str, Any]): 数据行。
+        - table (Table): 目标表。
+
+        返回:
+        - dict[str, Any]: 可直接写入的数据行。
+
+        异常:
+        - ValueError: 包含表中不存在的字段。
+        """
+        unknown = set(row) - set(table.c.keys())
+        if unknown:
+            raise ValueError(f"{table.name} 初始化数据包含未知字段: {sorted(unknown)}")
+        for column in table.columns:
+            default = column.default
+            if column.key in row or default is None:
+                continue
+            if default.is_scalar:
+                row[column.key] = default.arg
+            elif default.is_callable:
+                row[column.key] = default.arg(None)
+        return row
+
+    async def load(
+        self,
+        model: Any,
+        transform: Callable[[dict[str, Any]], dict[str, Any] | None] | None = None,
+    ) -> int:
+        """
+        导入一张表的初始化数据。
+
+        参数:
+        - model (Any): 模型类。
+        - transform (Callable | None): 行转换函数，返回 None 时跳过该行。
+
+        返回:
+        - int: 写入的行数，没有数据文件时返回 0。
+        """
+        table: Table = model.__table__
+        path = self.find(table.name)
+        if path is None:
+            return 0
+
+        rows: Iterable[dict[str, Any]] = self.iter_rows(path)
+        tree = "parent_id" in table.c
+        if tree:
+            rows = self.flatten(rows, table)
+        if transform is not None:
+            rows = (row for row in map(transform, rows) if row is not None)
+        rows = (self._prepare(row, table) for row in rows)
+
+        total = 0
+        while batch := await asyncio.to_thread(lambda: list(islice(rows, self.BATCH_SIZE))):
+            await self._insert(table, batch)
+            total += len(batch)
+        if total:
+            await self._sync_sequence(table)
+        return total
+
+    async def _insert(self, table: Table, rows: list[dict[str, Any]]) -> None:
+        """
+        写入一批数据（字段相同的连续行合并为一次写入）。
+
+        参数:
+        - table (Table): 目标表。
+        - rows (list[dict[str, Any]]): 数据行。
+
+        返回:
+        - None
+        """
+        groups: list[list[dict[str, Any]]] = []
+        for row in rows:
+            if groups and groups[-1][0].keys() == row.keys():
+                groups[-1].append(row)
+            else:
+                groups.append([row])
+        for group in groups:
+            if settings.DATABASE_TYPE == "postgres":
+                await self._copy(table, group)
+            else:
+                await self.db.execute(insert(table), group)
+
+    async def _copy(self, table: Table, rows: list[dict[str, Any]]) -> None:
+        """
+        PostgreSQL 使用 COPY 写入（在当前事务中执行）。
+
+        参数:
+        - table (Table): 目标表。
+        - rows (list[dict[str, Any]]): 字段相同的数据行。
+
+        返回:
+        - None
+        """
+        dialect = self.db.get_bind().dialect
+        columns = list(rows[0])
+        # COPY 绕过了 SQLAlchemy 的参数处理，需手动执行类型的绑定转换（如 JSON 序列化）
+        processors = [
+            table.c[name].type.dialect_impl(dialect).bind_processor(dialect) for name in columns
+        ]
+        records = [
+            tuple(
+                processor(row[name]) if processor else row[name]
+                for name, processor in zip(columns, processors, strict=True)
+            )
+            for row in rows
+        ]
+        connection = await self.db.connection()
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            table.name, records=records, columns=columns, schema_name=table.schema
+        )
+
+    async def _sync_sequence(self, table: Table) -> None:
+        """
+        显式写入ID后，把 PostgreSQL 的自增序列推进到当前最大ID（MySQL/SQLite 会自动调整）。
+
+        参数:
+        - table (Table): 目标表。
+
+        返回:
+        - None
+        """
+        # 关联表（如 sys_user_roles）没有自增ID
+        if settings.DATABASE_TYPE != "postgres" or "id" not in table.c:
+            return
+        max_id = (await self.db.execute(select(func.max(table.c.id)))).scalar()
+        await self.db.execute(
+            text("SELECT setval(pg_get_serial_sequence(:name, 'id'), :value)"),
+            {"name": table.fullname, "value": max_id},
+        )
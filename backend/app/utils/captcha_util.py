@@ -3,14 +3,12 @@ import random
 import string
 from io import BytesIO
 
-from PIL import Image, ImageDraw, ImageFont
-
 from app.config.setting import settings
 
 
 class CaptchaUtil:
     """
-    验证码工具类
+    验证码工具类（Pillow 在首次生成验证码时导入）
     """
 
     @classmethod
@@ -21,6 +19,8 @@ class CaptchaUtil:
         返回:
         - Tuple[str, str]: [base64图片字符串, 验证码值]。
         """
+        from PIL import Image, ImageDraw, ImageFont
+
         # 生成4位随机验证码
         chars = string.digits + string.ascii_letters
         captcha_value = "".join(random.sample(chars, 4))
@@ -87,6 +87,8 @@ class CaptchaUtil:
         返回:
         - Tuple[str, int]: [base64图片字符串, 计算结果]。
         """
+        from PIL import Image, ImageDraw, ImageFont
+
         # 创建空白图像,使用随机浅色背景
         background_color = tuple(random.randint(230, 255) for _ in range(3))
         image = Image.new("RGB", (160, 60), color=background_color)
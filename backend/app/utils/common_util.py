@@ -14,6 +14,7 @@ from sqlalchemy.sql.expression import null
 from app.config.setting import settings
 from app.core.exceptions import CustomException
 from app.core.logger import log
+from app.utils.tree_util import TreeIndex
 
 
 def import_module(module: str, desc: str) -> Any:
@@ -99,7 +100,7 @@ def get_parent_recursion(
     id: int, id_map: dict[int, int], ids: list[int] | None = None
 ) -> list[int]:
     """
-    递归获取所有父级 ID
+    获取自身及所有父级 ID（迭代实现，层级深度不受递归限制）
 
     参数:
     - id (int): 当前 ID。
@@ -107,15 +108,20 @@ def get_parent_recursion(
     - ids (list[int] | None): 已收集的 ID 列表。
 
     返回:
-    - list[int]: 所有父级 ID 列表。
+    - list[int]: 自身及所有父级 ID 列表，由近及远。
+
+    异常:
+    - CustomException: 父级链路出现自引用或环。
     """
     ids = ids or []
-    if id in ids:
-        raise CustomException(msg="递归获取父级ID失败,不可以自引用")
-    ids.append(id)
-    parent_id = id_map.get(id)
-    if parent_id:
-        get_parent_recursion(parent_id, id_map, ids)
+    seen = set(ids)
+    current: int | None = id
+    while current:
+        if current in seen:
+            raise CustomException(msg="递归获取父级ID失败,不可以自引用")
+        seen.add(current)
+        ids.append(current)
+        current = id_map.get(current)
     return ids
 
 
@@ -143,7 +149,7 @@ def get_child_recursion(
     id: int, id_map: dict[int, list[int]], ids: list[int] | None = None
 ) -> list[int]:
     """
-    递归获取所有子级 ID
+    获取自身及所有子级 ID（迭代先序遍历，层级深度不受递归限制）
 
     参数:
     - id (int): 当前 ID。
@@ -151,18 +157,26 @@ def get_child_recursion(
     - ids (list[int] | None): 已收集的 ID 列表。
 
     返回:
-    - list[int]: 所有子级 ID 列表。
+    - list[int]: 自身及所有子级 ID 列表。
     """
     ids = ids or []
-    ids.append(id)
-    for child in id_map.get(id, []):
-        get_child_recursion(child, id_map, ids)
+    seen = set(ids)
+    stack = [id]
+    while stack:
+        current = stack.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        ids.append(current)
+        stack.extend(reversed(id_map.get(current, [])))
     return ids
 
 
 def traversal_to_tree(nodes: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """
-    通过遍历算法构造树形结构
+    通过遍历算法构造树形结构，O(n)
+
+    父节点不在列表中的节点作为根节点，叶子节点的 children 为 None；直接在输入字典上写入 children。
 
     参数:
     - nodes (list[dict[str, Any]]): 树节点列表。
@@ -170,41 +184,17 @@ def traversal_to_tree(nodes: list[dict[str, Any]]) -> list[dict[str, Any]]:
     返回:
     - list[dict[str, Any]]: 构造后的树形结构列表。
     """
-    tree: list[dict[str, Any]] = []
-    node_dict = {node["id"]: node for node in nodes}
-
-    for node in nodes:
-        # 确保每个节点都有children字段，即使没有子节点也设置为null
-        if "children" not in node:
-            node["children"] = None
-
-        parent_id = node["parent_id"]
-        if parent_id is None:
-            tree.append(node)
-        else:
-            parent_node = node_dict.get(parent_id)
-            if parent_node is not None:
-                if "children" not in parent_node or parent_node["children"] is None:
-                    parent_node["children"] = []
-                if node not in parent_node["children"]:
-                    parent_node["children"].append(node)
-            else:
-                if node not in tree:
-                    tree.append(node)
-
-    # 确保所有节点都有children字段
-    for node in tree:
-        if "children" not in node:
-            node["children"] = None
-
-    return tree
+    return TreeIndex(nodes).to_tree(copy=False)
 
 
 def recursive_to_tree(
     nodes: list[dict[str, Any]], *, parent_id: int | None = None
 ) -> list[dict[str, Any]]:
     """
-    通过递归算法构造树形结构（性能影响较大）
+    构造从指定父节点开始的树形结构，O(n)
+
+    只包含从 parent_id 可达的节点，有子节点时才写入 children 字段；
+    按父ID分组后迭代挂载，不再逐层递归扫描全部节点。
 
     参数:
     - nodes (list[dict[str, Any]]): 树节点列表。
@@ -213,13 +203,22 @@ def recursive_to_tree(
     返回:
     - list[dict[str, Any]]: 构造后的树形结构列表。
     """
-    tree: list[dict[str, Any]] = []
+    groups: dict[Any, list[dict[str, Any]]] = {}
     for node in nodes:
-        if node["parent_id"] == parent_id:
-            child_nodes = recursive_to_tree(nodes, parent_id=node["id"])
-            if child_nodes:
-                node["children"] = child_nodes
-            tree.append(node)
+        groups.setdefault(node["parent_id"], []).append(node)
+
+    tree = groups.get(parent_id, [])
+    visited = {parent_id}
+    stack = list(tree)
+    while stack:
+        node = stack.pop()
+        if node["id"] in visited:
+            continue
+        visited.add(node["id"])
+        children = groups.get(node["id"])
+        if children:
+            node["children"] = children
+            stack.extend(children)
     return tree
 
 
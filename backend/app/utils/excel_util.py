@@ -1,15 +1,9 @@
 import io
 from typing import Any
 
-import pandas as pd
-from openpyxl import Workbook
-from openpyxl.styles import Alignment, PatternFill
-from openpyxl.utils import get_column_letter
-from openpyxl.worksheet.datavalidation import DataValidation
-
 
 class ExcelUtil:
-    """Excel文件处理工具类"""
+    """Excel文件处理工具类（pandas/openpyxl 导入耗时较长，在导出时才导入）"""
 
     @classmethod
     def __mapping_list(cls, list_data: list[dict[str, Any]], mapping_dict: dict) -> list:
@@ -47,6 +41,11 @@ class ExcelUtil:
         返回:
         - bytes: Excel 文件的二进制数据。
         """
+        from openpyxl import Workbook
+        from openpyxl.styles import Alignment, PatternFill
+        from openpyxl.utils import get_column_letter
+        from openpyxl.worksheet.datavalidation import DataValidation
+
         wb = Workbook()
         ws = wb.active
         if not ws:
@@ -100,6 +99,8 @@ class ExcelUtil:
         返回:
         - bytes: Excel 文件的二进制数据。
         """
+        import pandas as pd
+
         mapping_data = cls.__mapping_list(list_data, mapping_dict)
         df = pd.DataFrame(mapping_data)
         buffer = io.BytesIO()
@@ -1,6 +1,9 @@
 import importlib
 import inspect
 import os
+import re
+import subprocess
+import sys
 from functools import lru_cache
 from pathlib import Path
 from typing import Any
@@ -188,3 +191,48 @@ class ImportUtil:
                     pass
         except Exception as e:
             raise CustomException(f"❗️ 查找APScheduler模型时出错: {e}")
+
+    @classmethod
+    def profile_imports(cls, statement: str, env: dict[str, str] | None = None) -> dict[str, Any]:
+        """
+        在子进程中以 -X importtime 执行语句，汇总各模块与各顶级包的导入耗时
+
+        :param statement: 要执行的 Python 语句（如创建应用）
+        :param env: 子进程环境变量，默认继承当前进程
+        :return: {"total": 总耗时(微秒), "modules": [(模块, 自身耗时, 累计耗时)], "packages": [(顶级包, 自身耗时, 模块数)]}
+        """
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", statement],
+            cwd=BASE_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            raise CustomException(f"❌️ 执行导入统计失败: {result.stderr.strip()[-500:]}")
+
+        pattern = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| *(\S+)")
+        modules: list[tuple[str, int, int]] = []
+        packages: dict[str, list[int]] = {}
+        for line in result.stderr.splitlines():
+            match = pattern.match(line)
+            if not match:
+                continue
+            self_us, cumulative_us, name = int(match[1]), int(match[2]), match[3]
+            modules.append((name, self_us, cumulative_us))
+            # 应用内按二级包汇总（如 app.plugin），便于定位具体模块
+            parts = name.split(".")
+            package = ".".join(parts[:2]) if parts[0] == "app" else parts[0]
+            stats = packages.setdefault(package, [0, 0])
+            stats[0] += self_us
+            stats[1] += 1
+
+        return {
+            "total": sum(item[1] for item in modules),
+            "modules": sorted(modules, key=lambda item: item[2], reverse=True),
+            "packages": sorted(
+                ((name, stats[0], stats[1]) for name, stats in packages.items()),
+                key=lambda item: item[1],
+                reverse=True,
+            ),
+        }
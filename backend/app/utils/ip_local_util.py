@@ -2,6 +2,7 @@ import re
 
 import httpx
 
+from app.core.http_client import HttpClient
 from app.core.logger import log
 
 
@@ -61,47 +62,41 @@ class IpLocalUtil:
             return "内网IP"
 
         try:
-            # 使用ip-api.com API获取IP归属地信息
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                # 尝试使用 ip9.com.cn API
-                url = f"https://ip9.com.cn/get?ip={ip}"
-                response = await cls._make_api_request(client, url)
-                if response and response.json().get("ret") == 200:
-                    result = response.json().get("data", {})
-                    return f"{result.get('country', '')}-{result.get('prov', '')}-{result.get('city', '')}-{result.get('area', '')}-{result.get('isp', '')}"
-
-                # 尝试使用百度 API
-                url = f"https://qifu-api.baidubce.com/ip/geo/v1/district?ip={ip}"
-                response = await cls._make_api_request(client, url)
-                if response and response.json().get("code") == "Success":
-                    data = response.json().get("data", {})
-                    # 修正原代码中的格式错误
-                    return f"{data.get('country', '')}-{data.get('prov', '')}-{data.get('city', '')}-{data.get('district', '')}-{data.get('isp', '')}"
+            # 尝试使用 ip9.com.cn API
+            url = f"https://ip9.com.cn/get?ip={ip}"
+            response = await cls._make_api_request(url)
+            if response and response.json().get("ret") == 200:
+                result = response.json().get("data", {})
+                return f"{result.get('country', '')}-{result.get('prov', '')}-{result.get('city', '')}-{result.get('area', '')}-{result.get('isp', '')}"
+
+            # 尝试使用百度 API
+            url = f"https://qifu-api.baidubce.com/ip/geo/v1/district?ip={ip}"
+            response = await cls._make_api_request(url)
+            if response and response.json().get("code") == "Success":
+                data = response.json().get("data", {})
+                # 修正原代码中的格式错误
+                return f"{data.get('country', '')}-{data.get('prov', '')}-{data.get('city', '')}-{data.get('district', '')}-{data.get('isp', '')}"
 
         except Exception as e:
             log.error(f"获取IP归属地失败: {e}")
             return "未知"
 
     @classmethod
-    async def _make_api_request(cls, client: httpx.AsyncClient, url: str):
+    async def _make_api_request(cls, url: str) -> httpx.Response | None:
         """
-        单独的 API 请求方法，包含重试机制。
+        单独的 API 请求方法，通过共享客户端发送（复用连接池，失败时自动退避重试，上游故障时熔断）。
 
         参数:
-        - client (AsyncClient): httpx 异步客户端。
         - url (str): 请求 URL。
 
         返回:
         - Response | None: 响应对象，失败时返回None。
         """
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                response = await client.get(url, timeout=10)
-                if response.status_code == 200:
-                    return response
-            except Exception as e:
-                if attempt < max_retries - 1:
-                    continue
-                log.error(f"API 请求失败: {e}")
+        try:
+            response = await HttpClient.get(url, timeout=10)
+        except Exception as e:
+            log.error(f"API 请求失败: {e}")
+            return None
+        if response.status_code == 200:
+            return response
         return None
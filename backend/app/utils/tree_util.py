@@ -0,0 +1,325 @@
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any
+
+from app.core.exceptions import CustomException
+
+
+class TreeIndex:
+    """
+    基于 parent_id 的树形索引
+
+    一次线性扫描把节点列表转换为下标数组：
+    - ids[i]: 第 i 个节点的ID；index: {ID: 下标}；
+    - parents[i]: 父节点下标，根节点为 -1；
+    - children[i]: 子节点下标列表（保持输入顺序）；
+    - roots: 根节点下标列表。父节点不存在（孤儿节点）或指向自身的节点视为根节点，
+      构成环的节点从环中首个出现的节点处断开并作为根节点，保证所有遍历都能终止。
+    所有遍历均为迭代实现，层级再深也不会触发递归深度限制。
+    节点可以是字典，也可以是具有 id/parent_id 属性的对象（如 ORM 模型）；组装树形结构仅支持字典。
+    """
+
+    __slots__ = ("children", "ids", "index", "nodes", "parents", "roots")
+
+    def __init__(
+        self, nodes: Sequence[Any], id_key: str = "id", parent_key: str = "parent_id"
+    ) -> None:
+        """
+        构建索引，整体 O(n)。
+
+        参数:
+        - nodes (Sequence[Any]): 节点列表（字典或对象）。
+        - id_key (str): ID 字段名。
+        - parent_key (str): 父ID 字段名。
+        """
+        self.nodes = list(nodes)
+        size = len(self.nodes)
+        if self.nodes and isinstance(self.nodes[0], dict):
+            self.ids = [node[id_key] for node in self.nodes]
+            parent_ids = [node.get(parent_key) for node in self.nodes]
+        else:
+            self.ids = [getattr(node, id_key) for node in self.nodes]
+            parent_ids = [getattr(node, parent_key, None) for node in self.nodes]
+
+        self.index: dict[Any, int] = {node_id: i for i, node_id in enumerate(self.ids)}
+        self.parents = [-1] * size
+        self.children: list[list[int]] = [[] for _ in range(size)]
+        self.roots: list[int] = []
+        for i, parent_id in enumerate(parent_ids):
+            parent = self.index.get(parent_id) if parent_id is not None else None
+            if parent is None or parent == i:
+                self.roots.append(i)
+            else:
+                self.parents[i] = parent
+                self.children[parent].append(i)
+
+        if len(self.roots) < size:
+            self._break_cycles()
+
+    def _break_cycles(self) -> None:
+        """
+        把根节点不可达的节点（位于环上或环的下方）挂到根上。
+
+        按输入顺序找到第一个不可达节点，将其从父节点摘下作为根，再标记其整棵子树为可达，
+        重复直到所有节点可达，O(n)。
+
+        返回:
+        - None
+        """
+        reached = [False] * len(self.nodes)
+        stack = list(self.roots)
+        while stack:
+            i = stack.pop()
+            reached[i] = True
+            stack.extend(self.children[i])
+        for i in range(len(self.nodes)):
+            if reached[i]:
+                continue
+            self.children[self.parents[i]].remove(i)
+            self.parents[i] = -1
+            self.roots.append(i)
+            stack = [i]
+            while stack:
+                j = stack.pop()
+                reached[j] = True
+                stack.extend(self.children[j])
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __contains__(self, node_id: Any) -> bool:
+        return node_id in self.index
+
+    def _position(self, node_id: Any) -> int:
+        """
+        获取节点下标。
+
+        参数:
+        - node_id (Any): 节点ID。
+
+        返回:
+        - int: 节点下标。
+
+        异常:
+        - CustomException: 节点不存在。
+        """
+        position = self.index.get(node_id)
+        if position is None:
+            raise CustomException(msg=f"节点不存在: {node_id}")
+        return position
+
+    def _descendants(self, starts: Iterable[int]) -> list[int]:
+        """
+        先序遍历给定节点及其所有子孙的下标（迭代实现）。
+
+        参数:
+        - starts (Iterable[int]): 起始节点下标。
+
+        返回:
+        - list[int]: 先序排列的下标列表。
+        """
+        result: list[int] = []
+        stack = list(reversed(list(starts)))
+        while stack:
+            i = stack.pop()
+            result.append(i)
+            stack.extend(reversed(self.children[i]))
+        return result
+
+    def preorder(self) -> list[int]:
+        """
+        先序遍历全部节点下标（父节点总在子节点之前）。
+
+        返回:
+        - list[int]: 下标列表。
+        """
+        return self._descendants(self.roots)
+
+    def descendant_ids(self, node_id: Any, include_self: bool = True) -> list[Any]:
+        """
+        获取所有子孙节点ID（先序）。
+
+        参数:
+        - node_id (Any): 节点ID。
+        - include_self (bool): 是否包含节点自身。
+
+        返回:
+        - list[Any]: 子孙节点ID列表。
+
+        异常:
+        - CustomException: 节点不存在。
+        """
+        positions = self._descendants([self._position(node_id)])
+        if not include_self:
+            positions = positions[1:]
+        return [self.ids[i] for i in positions]
+
+    def ancestor_ids(self, node_id: Any, include_self: bool = True) -> list[Any]:
+        """
+        获取祖先节点ID，由近及远（父、祖父……根）。
+
+        参数:
+        - node_id (Any): 节点ID。
+        - include_self (bool): 是否包含节点自身（位于列表首位）。
+
+        返回:
+        - list[Any]: 祖先节点ID列表。
+
+        异常:
+        - CustomException: 节点不存在。
+        """
+        i = self._position(node_id)
+        result = [self.ids[i]] if include_self else []
+        i = self.parents[i]
+        while i != -1:
+            result.append(self.ids[i])
+            i = self.parents[i]
+        return result
+
+    def path(self, node_id: Any) -> list[Any]:
+        """
+        获取从根节点到该节点的ID路径。
+
+        参数:
+        - node_id (Any): 节点ID。
+
+        返回:
+        - list[Any]: [根ID, ..., 节点ID]。
+
+        异常:
+        - CustomException: 节点不存在。
+        """
+        return self.ancestor_ids(node_id)[::-1]
+
+    def depth(self, node_id: Any) -> int:
+        """
+        获取节点深度（根节点为 0）。
+
+        参数:
+        - node_id (Any): 节点ID。
+
+        返回:
+        - int: 节点深度。
+
+        异常:
+        - CustomException: 节点不存在。
+        """
+        return len(self.ancestor_ids(node_id)) - 1
+
+    def _assemble(
+        self,
+        roots: Iterable[int],
+        keep: list[bool] | None,
+        children_key: str,
+        leaf_children: Any,
+        copy: bool,
+    ) -> list[dict[str, Any]]:
+        """
+        按下标组装树形字典列表，O(n)。
+
+        参数:
+        - roots (Iterable[int]): 作为根的节点下标。
+        - keep (list[bool] | None): 保留标记，None 表示全部保留。
+        - children_key (str): 子节点字段名。
+        - leaf_children (Any): 叶子节点的子节点字段值。
+        - copy (bool): 是否浅拷贝节点字典；为 False 时直接在输入字典上写入子节点字段。
+
+        返回:
+        - list[dict[str, Any]]: 树形结构列表。
+        """
+        if not copy:
+            nodes = self.nodes
+        elif keep is None:
+            nodes = [dict(node) for node in self.nodes]
+        else:
+            nodes = [
+                dict(node) if kept else node for node, kept in zip(self.nodes, keep, strict=True)
+            ]
+        for i, node in enumerate(nodes):
+            if keep is not None and not keep[i]:
+                continue
+            children = self.children[i]
+            if keep is not None:
+                children = [c for c in children if keep[c]]
+            node[children_key] = [nodes[c] for c in children] if children else leaf_children
+        return [nodes[i] for i in roots]
+
+    def to_tree(
+        self, children_key: str = "children", leaf_children: Any = None, copy: bool = True
+    ) -> list[dict[str, Any]]:
+        """
+        组装完整的树形结构（仅支持字典节点）。
+
+        参数:
+        - children_key (str): 子节点字段名。
+        - leaf_children (Any): 叶子节点的子节点字段值，默认 None。
+        - copy (bool): 是否浅拷贝节点字典，默认拷贝，避免修改输入。
+
+        返回:
+        - list[dict[str, Any]]: 树形结构列表。
+        """
+        return self._assemble(self.roots, None, children_key, leaf_children, copy)
+
+    def subtree(
+        self,
+        node_id: Any,
+        children_key: str = "children",
+        leaf_children: Any = None,
+        copy: bool = True,
+    ) -> list[dict[str, Any]]:
+        """
+        提取以指定节点为根的子树（仅支持字典节点）。
+
+        参数:
+        - node_id (Any): 子树根节点ID。
+        - children_key (str): 子节点字段名。
+        - leaf_children (Any): 叶子节点的子节点字段值。
+        - copy (bool): 是否浅拷贝节点字典。
+
+        返回:
+        - list[dict[str, Any]]: 只含一个根节点的树形结构列表。
+
+        异常:
+        - CustomException: 节点不存在。
+        """
+        root = self._position(node_id)
+        keep = [False] * len(self.nodes)
+        for i in self._descendants([root]):
+            keep[i] = True
+        return self._assemble([root], keep, children_key, leaf_children, copy)
+
+    def prune(
+        self,
+        predicate: Callable[[Any], bool],
+        keep_descendants: bool = False,
+        children_key: str = "children",
+        leaf_children: Any = None,
+        copy: bool = True,
+    ) -> list[dict[str, Any]]:
+        """
+        按条件裁剪树：保留命中的节点及其所有祖先，用于树形搜索时展示命中节点的完整路径。
+
+        每个祖先最多被标记一次（向上回溯遇到已保留节点即停止），整体 O(n)。
+
+        参数:
+        - predicate (Callable[[Any], bool]): 节点过滤条件。
+        - keep_descendants (bool): 是否同时保留命中节点的所有子孙。
+        - children_key (str): 子节点字段名。
+        - leaf_children (Any): 叶子节点的子节点字段值。
+        - copy (bool): 是否浅拷贝节点字典。
+
+        返回:
+        - list[dict[str, Any]]: 裁剪后的树形结构列表。
+        """
+        keep = [False] * len(self.nodes)
+        matched = [i for i, node in enumerate(self.nodes) if predicate(node)]
+        if keep_descendants:
+            for i in self._descendants(matched):
+                keep[i] = True
+        for i in matched:
+            keep[i] = True
+            j = self.parents[i]
+            while j != -1 and not keep[j]:
+                keep[j] = True
+                j = self.parents[j]
+        roots = [i for i in self.roots if keep[i]]
+        return self._assemble(roots, keep, children_key, leaf_children, copy)
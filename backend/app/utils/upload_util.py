@@ -1,5 +1,8 @@
+import hashlib
 import mimetypes
+import os
 import random
+import uuid
 from datetime import datetime
 from pathlib import Path
 from urllib.parse import urljoin
@@ -7,6 +10,7 @@ from urllib.parse import urljoin
 import aiofiles
 from fastapi import UploadFile
 
+from app.config.path_conf import BASE_DIR
 from app.config.setting import settings
 from app.core.exceptions import CustomException
 from app.core.logger import log
@@ -225,6 +229,121 @@ class UploadUtil:
             log.error(f"文件上传失败: {e}")
             raise CustomException(msg=f"文件上传失败: {e}")
 
+    @staticmethod
+    def new_hasher():
+        """
+        按配置创建内容摘要对象。
+
+        返回:
+        - hashlib._Hash: 摘要对象（sha256 或 blake2b-256）。
+        """
+        if settings.UPLOAD_HASH_ALGORITHM == "blake2b":
+            return hashlib.blake2b(digest_size=32)
+        return hashlib.sha256()
+
+    @staticmethod
+    def get_blob_path(digest: str, ext: str = "") -> Path:
+        """
+        根据内容摘要计算存储路径（两级目录分片，避免单目录文件过多）。
+
+        参数:
+        - digest (str): 内容摘要。
+        - ext (str): 文件拓展名（含点），保留以便静态服务返回正确的类型。
+
+        返回:
+        - Path: 存储路径。
+        """
+        return settings.UPLOAD_BLOB_PATH.joinpath(digest[:2], digest[2:4], f"{digest}{ext}")
+
+    @staticmethod
+    def to_blob_record_path(blob_path: Path) -> str:
+        """
+        将存储路径转为文件记录中保存的路径：位于项目目录下时保存相对路径（用于拼接访问 URL）。
+
+        参数:
+        - blob_path (Path): 存储路径。
+
+        返回:
+        - str: 记录路径。
+        """
+        try:
+            return blob_path.relative_to(BASE_DIR).as_posix()
+        except ValueError:
+            return str(blob_path)
+
+    @staticmethod
+    def from_blob_record_path(file_path: str) -> Path:
+        """
+        将文件记录中保存的路径还原为磁盘路径（相对路径以项目目录为基准，与工作目录无关）。
+
+        参数:
+        - file_path (str): 记录路径。
+
+        返回:
+        - Path: 磁盘路径。
+        """
+        return BASE_DIR.joinpath(file_path)
+
+    @classmethod
+    async def write_temp_blob(cls, file: UploadFile) -> tuple[str, int, Path]:
+        """
+        将上传文件流式写入临时文件，并在写入的同时计算内容摘要。
+
+        参数:
+        - file (UploadFile): 上传的文件对象。
+
+        返回:
+        - tuple[str, int, Path]: (内容摘要, 文件大小, 临时文件路径)。
+
+        异常:
+        - CustomException: 当文件类型不支持、大小超限或写入失败时抛出。
+        """
+        if not all([
+            cls.check_file_extension(file),
+            cls.check_file_size(file),
+        ]):
+            raise CustomException(msg="文件类型或大小不合法")
+
+        # 临时文件放在静态目录之外，未写完或校验失败的文件不会被公开访问
+        settings.UPLOAD_TEMP_PATH.mkdir(parents=True, exist_ok=True)
+        tmp_path = settings.UPLOAD_TEMP_PATH.joinpath(uuid.uuid4().hex)
+        hasher = cls.new_hasher()
+        size = 0
+        try:
+            chunk_size = 8 * 1024 * 1024  # 8MB chunks
+            async with aiofiles.open(tmp_path, "wb") as f:
+                while chunk := await file.read(chunk_size):
+                    size += len(chunk)
+                    if size > settings.MAX_FILE_SIZE:
+                        raise CustomException(msg="文件大小超出限制")
+                    hasher.update(chunk)
+                    await f.write(chunk)
+        except Exception as e:
+            cls.delete_file(tmp_path)
+            log.error(f"文件上传失败: {e}")
+            if isinstance(e, CustomException):
+                raise
+            raise CustomException(msg=f"文件上传失败: {e}")
+        return hasher.hexdigest(), size, tmp_path
+
+    @classmethod
+    def commit_temp_blob(cls, tmp_path: Path, blob_path: Path) -> None:
+        """
+        将临时文件落盘到内容寻址路径；目标已存在时（内容相同）直接丢弃临时文件。
+
+        参数:
+        - tmp_path (Path): 临时文件路径。
+        - blob_path (Path): 内容寻址存储路径。
+
+        返回:
+        - None
+        """
+        if blob_path.exists():
+            cls.delete_file(tmp_path)
+            return
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(tmp_path, blob_path)
+
     @staticmethod
     def get_file_tree(file_path: str) -> list[dict]:
         """
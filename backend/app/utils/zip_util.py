@@ -0,0 +1,64 @@
+import zipfile
+from collections.abc import AsyncIterable, AsyncIterator
+
+
+class _ChunkBuffer:
+    """
+    只写、不可寻址的缓冲区
+
+    zipfile 检测到输出不支持 seek 时改用数据描述符写入条目，
+    因此条目写完即可把已产生的字节取走发送，无需在内存中保留整个压缩包。
+    """
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        return None
+
+    def drain(self) -> bytes:
+        """
+        取出并清空当前缓冲的字节。
+
+        返回:
+        - bytes: 缓冲的字节。
+        """
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def stream_zip(
+    entries: AsyncIterable[tuple[str, str | bytes]],
+    compression: int = zipfile.ZIP_DEFLATED,
+) -> AsyncIterator[bytes]:
+    """
+    边生成条目边输出 ZIP 字节流。
+
+    参数:
+    - entries (AsyncIterable[tuple[str, str | bytes]]): (压缩包内路径, 内容) 异步序列。
+    - compression (int): 压缩方式，默认 ZIP_DEFLATED。
+
+    返回:
+    - AsyncIterator[bytes]: ZIP 字节块，每写完一个条目输出一次。
+    """
+    buffer = _ChunkBuffer()
+    with zipfile.ZipFile(buffer, "w", compression) as zip_file:  # type: ignore[arg-type]
+        async for name, content in entries:
+            zip_file.writestr(name, content)
+            chunk = buffer.drain()
+            if chunk:
+                yield chunk
+    # 中央目录在关闭时写入
+    chunk = buffer.drain()
+    if chunk:
+        yield chunk
@@ -1,3 +1,4 @@
+import asyncio
 import os
 from typing import Annotated
 
@@ -125,5 +126,81 @@ def upgrade(
     typer.echo("所有迁移已应用。")
 
 
+@aixlab_cli.command(
+    name="precompress",
+    help="为静态资源生成 .br/.gz 预压缩文件, 运行 python main.py precompress --env=dev",
+)
+def precompress(
+    env: Annotated[
+        EnvironmentEnum, typer.Option("--env", help="运行环境 (dev, prod)")
+    ] = EnvironmentEnum.DEV,
+) -> None:
+    """生成静态资源预压缩文件"""
+    os.environ["ENVIRONMENT"] = env.value
+    from app.config.setting import settings
+    from app.core.compression import precompress_static
+
+    count = precompress_static(settings.STATIC_ROOT)
+    typer.echo(f"静态资源预压缩完成，新生成 {count} 个文件。")
+
+
+@aixlab_cli.command(
+    name="partition",
+    help="维护日志表按月分区, 运行 python main.py partition --env=dev [--convert]",
+)
+def partition(
+    env: Annotated[
+        EnvironmentEnum, typer.Option("--env", help="运行环境 (dev, prod)")
+    ] = EnvironmentEnum.DEV,
+    convert: Annotated[
+        bool, typer.Option("--convert", help="将已有数据的普通日志表转换为分区表(会锁表)")
+    ] = False,
+) -> None:
+    """转换并维护日志表分区"""
+    os.environ["ENVIRONMENT"] = env.value
+    from app.core.base_model import MappedBase
+    from app.core.partition import LogPartition
+    from app.utils.import_util import ImportUtil
+
+    # 注册全部模型，分区维护需要从元数据中读取表结构
+    ImportUtil.find_models(MappedBase)
+
+    async def _run() -> dict:
+        if convert:
+            converted = await LogPartition.convert(force=True)
+            typer.echo(f"已转换为分区表: {converted or '无'}")
+        return await LogPartition.maintain()
+
+    for name, changes in asyncio.run(_run()).items():
+        typer.echo(f"{name}: 新建 {changes['created']}，删除 {changes['dropped']}")
+    typer.echo("日志分区维护完成。")
+
+
+@aixlab_cli.command(
+    name="importtime",
+    help="统计创建应用时各模块的导入耗时, 运行 python main.py importtime --env=dev [--top 20]",
+)
+def importtime(
+    env: Annotated[
+        EnvironmentEnum, typer.Option("--env", help="运行环境 (dev, prod)")
+    ] = EnvironmentEnum.DEV,
+    top: Annotated[int, typer.Option("--top", help="显示耗时最多的前 N 项")] = 20,
+) -> None:
+    """统计导入耗时（基于 python -X importtime）"""
+    os.environ["ENVIRONMENT"] = env.value
+    from app.utils.import_util import ImportUtil
+
+    report = ImportUtil.profile_imports(
+        "from main import create_app; create_app()", env=dict(os.environ)
+    )
+    typer.echo(f"导入总耗时: {report['total'] / 1000:.1f} ms, 模块数: {len(report['modules'])}")
+    typer.echo(f"\n按包汇总(自身耗时) 前 {top} 项:")
+    for name, self_us, count in report["packages"][:top]:
+        typer.echo(f"{self_us / 1000:>10.1f} ms  {count:>5} 个模块  {name}")
+    typer.echo(f"\n按模块(累计耗时，含其依赖) 前 {top} 项:")
+    for name, self_us, cumulative_us in report["modules"][:top]:
+        typer.echo(f"{cumulative_us / 1000:>10.1f} ms  (自身 {self_us / 1000:.1f} ms)  {name}")
+
+
 if __name__ == "__main__":
     aixlab_cli()
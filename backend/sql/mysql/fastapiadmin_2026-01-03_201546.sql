@@ -382,6 +382,7 @@ CREATE TABLE `sys_dept` (
   `updated_time` datetime NOT NULL COMMENT '更新时间',
   `created_id` int DEFAULT NULL COMMENT '创建人ID',
   `updated_id` int DEFAULT NULL COMMENT '更新人ID',
+  `tree_path` varchar(255) DEFAULT NULL COMMENT '物化路径(/根ID/.../自身ID/)',
   PRIMARY KEY (`id`),
   UNIQUE KEY `ix_sys_dept_uuid` (`uuid`),
   KEY `ix_sys_dept_created_id` (`created_id`),
@@ -392,6 +393,7 @@ CREATE TABLE `sys_dept` (
   KEY `ix_sys_dept_code` (`code`),
   KEY `ix_sys_dept_updated_time` (`updated_time`),
   KEY `ix_sys_dept_parent_id` (`parent_id`),
+  KEY `ix_sys_dept_tree_path` (`tree_path`),
   CONSTRAINT `sys_dept_ibfk_1` FOREIGN KEY (`created_id`) REFERENCES `sys_user` (`id`) ON DELETE SET NULL ON UPDATE CASCADE,
   CONSTRAINT `sys_dept_ibfk_2` FOREIGN KEY (`updated_id`) REFERENCES `sys_user` (`id`) ON DELETE SET NULL ON UPDATE CASCADE,
   CONSTRAINT `sys_dept_ibfk_3` FOREIGN KEY (`parent_id`) REFERENCES `sys_dept` (`id`) ON DELETE SET NULL ON UPDATE CASCADE
@@ -403,7 +405,7 @@ CREATE TABLE `sys_dept` (
 --
 
 /*!40000 ALTER TABLE `sys_dept` DISABLE KEYS */;
-INSERT INTO `sys_dept` VALUES ('集团总公司',1,'GROUP','部门负责人','1582112620','deptadmin@example.com',NULL,1,'5100f8a1-c846-4e9f-bc48-03ddf7b8cfa8','0','集团总公司','2026-01-03 20:15:40','2026-01-03 20:15:40',NULL,NULL);
+INSERT INTO `sys_dept` VALUES ('集团总公司',1,'GROUP','部门负责人','1582112620','deptadmin@example.com',NULL,1,'5100f8a1-c846-4e9f-bc48-03ddf7b8cfa8','0','集团总公司','2026-01-03 20:15:40','2026-01-03 20:15:40',NULL,NULL,'/1/');
 /*!40000 ALTER TABLE `sys_dept` ENABLE KEYS */;
 
 --
@@ -558,6 +560,7 @@ CREATE TABLE `sys_menu` (
   `description` text COMMENT '备注/描述',
   `created_time` datetime NOT NULL COMMENT '创建时间',
   `updated_time` datetime NOT NULL COMMENT '更新时间',
+  `tree_path` varchar(255) DEFAULT NULL COMMENT '物化路径(/根ID/.../自身ID/)',
   PRIMARY KEY (`id`),
   UNIQUE KEY `ix_sys_menu_uuid` (`uuid`),
   KEY `ix_sys_menu_updated_time` (`updated_time`),
@@ -565,6 +568,7 @@ CREATE TABLE `sys_menu` (
   KEY `ix_sys_menu_created_time` (`created_time`),
   KEY `ix_sys_menu_id` (`id`),
   KEY `ix_sys_menu_parent_id` (`parent_id`),
+  KEY `ix_sys_menu_tree_path` (`tree_path`),
   CONSTRAINT `sys_menu_ibfk_1` FOREIGN KEY (`parent_id`) REFERENCES `sys_menu` (`id`) ON DELETE SET NULL
 ) ENGINE=InnoDB AUTO_INCREMENT=138 DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci COMMENT='菜单表';
 /*!40101 SET character_set_client = @saved_cs_client */;
@@ -574,7 +578,7 @@ CREATE TABLE `sys_menu` (
 --
 
 /*!40000 ALTER TABLE `sys_menu` DISABLE KEYS */;
-INSERT INTO `sys_menu` VALUES ('仪表盘',1,1,'','client','Dashboard','/dashboard',NULL,'/dashboard/workplace',0,1,1,'仪表盘','null',0,NULL,1,'6ab03272-a823-4d2b-8bcc-00ef363f96fd','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('系统管理',1,2,NULL,'system','System','/system',NULL,'/system/menu',0,1,0,'系统管理','null',0,NULL,2,'87609dc2-9d90-48df-ab17-568f67665e4a','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('应用管理',1,3,NULL,'el-icon-ShoppingBag','Application','/application',NULL,'/application/myapp',0,1,0,'应用管理','null',0,NULL,3,'f4200bfa-839e-483b-85e1-01b8f4620aaa','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('监控管理',1,4,NULL,'monitor','Monitor','/monitor',NULL,'/monitor/online',0,1,0,'监控管理','null',0,NULL,4,'fbe6a232-649b-48c9-853f-e34aeb21dc04','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('代码管理',1,5,NULL,'code','Generator','/generator',NULL,'/generator/gencode',0,1,0,'代码管理','null',0,NULL,5,'8c1085c1-8b43-4442-a319-bd1b50272a42','0','代码管理','2026-01-03 20:15:40','2026-01-03 20:15:40'),('接口管理',1,6,NULL,'document','Common','/common',NULL,'/common/docs',0,1,0,'接口管理','null',0,NULL,6,'6994bc7e-eacc-4ccd-908b-83c67616aac3','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('案例管理',1,7,NULL,'menu','Example','/example',NULL,'/example/demo',0,1,0,'案例管理','null',0,NULL,7,'5da39814-6873-48ec-8b36-da6042d06e3f','0','案例管理','2026-01-03 20:15:40','2026-01-03 20:15:40'),('工作台',2,1,'dashboard:workplace:query','el-icon-PieChart','Workplace','/dashboard/workplace','dashboard/workplace',NULL,0,1,0,'工作台','null',0,1,8,'ca9b78d3-05f8-4fe7-ada8-6b00b7c935c4','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('菜单管理',2,1,'module_system:menu:query','menu','Menu','/system/menu','module_system/menu/index',NULL,0,1,0,'菜单管理','null',0,2,9,'18f7afa0-cbb1-4952-8dab-025d9aac0a97','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('部门管理',2,2,'module_system:dept:query','tree','Dept','/system/dept','module_system/dept/index',NULL,0,1,0,'部门管理','null',0,2,10,'31c8381e-6195-4844-8c15-4f2898d0b981','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('岗位管理',2,3,'module_system:position:query','el-icon-Coordinate','Position','/system/position','module_system/position/index',NULL,0,1,0,'岗位管理','null',0,2,11,'387ae485-b8cd-4a73-83b8-1aa431a706eb','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('角色管理',2,4,'module_system:role:query','role','Role','/system/role','module_system/role/index',NULL,0,1,0,'角色管理','null',0,2,12,'02f3f896-5dee-4039-86e4-d40872b0774b','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('用户管理',2,5,'module_system:user:query','el-icon-User','User','/system/user','module_system/user/index',NULL,0,1,0,'用户管理','null',0,2,13,'5d7fffee-5972-478b-8d64-5c4fa5ec5cd9','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('日志管理',2,6,'module_system:log:query','el-icon-Aim','Log','/system/log','module_system/log/index',NULL,0,1,0,'日志管理','null',0,2,14,'b9545a78-7165-464b-bcd0-23c1f8464e5d','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('公告管理',2,7,'module_system:notice:query','bell','Notice','/system/notice','module_system/notice/index',NULL,0,1,0,'公告管理','null',0,2,15,'9e1a1629-5b45-4f50-8ccc-afe8db61d015','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('参数管理',2,8,'module_system:param:query','setting','Params','/system/param','module_system/param/index',NULL,0,1,0,'参数管理','null',0,2,16,'f37e7718-6b98-43d7-af8f-c863c4749a20','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('字典管理',2,9,'module_system:dict_type:query','dict','Dict','/system/dict','module_system/dict/index',NULL,0,1,0,'字典管理','null',0,2,17,'4379b2b9-c070-45cf-b4b2-0864324e6161','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('我的应用',2,1,'module_application:myapp:query','el-icon-ShoppingCartFull','MYAPP','/application/myapp','module_application/myapp/index',NULL,0,1,0,'我的应用','null',0,3,18,'1e4a5308-6e0d-4cb6-b099-100572b203a7','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('任务管理',2,2,'module_application:job:query','el-icon-DataLine','Job','/application/job','module_application/job/index',NULL,0,1,0,'任务管理','null',0,3,19,'fb8f7fc5-6fbf-4c03-91ff-20017d0757a4','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('AI智能助手',2,3,'module_application:ai:chat','el-icon-ToiletPaper','AI','/application/ai','module_application/ai/index',NULL,0,1,0,'AI智能助手','null',0,3,20,'800d1611-bc2b-46df-9878-7a8454c67d51','0','AI智能助手','2026-01-03 20:15:40','2026-01-03 20:15:40'),('流程管理',2,4,'module_application:workflow:query','el-icon-ShoppingBag','Workflow','/application/workflow','module_application/workflow/index',NULL,0,1,0,'我的流程','null',0,3,21,'85887c52-f2b1-40eb-96c8-4b50fdc4ac38','0','我的流程','2026-01-03 20:15:40','2026-01-03 20:15:40'),('在线用户',2,1,'module_monitor:online:query','el-icon-Headset','MonitorOnline','/monitor/online','module_monitor/online/index',NULL,0,1,0,'在线用户','null',0,4,22,'f0d77cc8-4b29-4b8a-83a0-c07f50104596','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('服务器监控',2,2,'module_monitor:server:query','el-icon-Odometer','MonitorServer','/monitor/server','module_monitor/server/index',NULL,0,1,0,'服务器监控','null',0,4,23,'d819eb52-36c8-4b87-bcc0-23a70cd00f78','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('缓存监控',2,3,'module_monitor:cache:query','el-icon-Stopwatch','MonitorCache','/monitor/cache','module_monitor/cache/index',NULL,0,1,0,'缓存监控','null',0,4,24,'dad0cf0b-33ef-42bc-8f79-cdc467b6845d','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('文件管理',2,4,'module_monitor:resource:query','el-icon-Files','Resource','/monitor/resource','module_monitor/resource/index',NULL,0,1,0,'文件管理','null',0,4,25,'89979d3f-5d2f-4b0a-81b0-bb2b1c74b50c','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('代码生成',2,1,'module_generator:gencode:query','code','GenCode','/generator/gencode','module_generator/gencode/index',NULL,0,1,0,'代码生成','null',0,5,26,'15b626e5-151d-443d-bdc5-dc6b4dff4da6','0','代码生成','2026-01-03 20:15:40','2026-01-03 20:15:40'),('Swagger文档',4,1,'module_common:docs:query','api','Docs','/common/docs','module_common/docs/index',NULL,0,1,0,'Swagger文档','null',0,6,27,'6a12698f-7fba-4b4e-850f-4b19db12ad74','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('Redoc文档',4,2,'module_common:redoc:query','el-icon-Document','Redoc','/common/redoc','module_common/redoc/index',NULL,0,1,0,'Redoc文档','null',0,6,28,'79750178-0a65-48fd-b775-8da287ccfee5','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('示例管理',2,1,'module_example:demo:query','menu','Demo','/example/demo','module_example/demo/index',NULL,0,1,0,'示例管理','null',0,7,29,'6628cf01-5efc-42bd-b5fd-6a7505bfc76a','0','示例管理','2026-01-03 20:15:40','2026-01-03 20:15:40'),('创建菜单',3,1,'module_system:menu:create',NULL,NULL,NULL,NULL,NULL,0,1,0,'创建菜单','null',0,9,30,'47862c59-6fef-4e9e-84b7-c6e90243e486','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('修改菜单',3,2,'module_system:menu:update',NULL,NULL,NULL,NULL,NULL,0,1,0,'修改菜单','null',0,9,31,'53a8a559-72bd-451d-98c1-8fa3dbec99fe','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('删除菜单',3,3,'module_system:menu:delete',NULL,NULL,NULL,NULL,NULL,0,1,0,'删除菜单','null',0,9,32,'aa59878c-68ac-44f8-9854-b1a3c8ba8295','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('批量修改菜单状态',3,4,'module_system:menu:patch',NULL,NULL,NULL,NULL,NULL,0,1,0,'批量修改菜单状态','null',0,9,33,'314f09ee-c734-416e-98c0-e11672388419','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('详情改菜',3,5,'module_system:menu:detail',NULL,NULL,NULL,NULL,NULL,0,1,0,'详情改菜','null',0,9,34,'94624520-2148-437b-8353-a791650beee7','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('查询菜单',3,6,'module_system:menu:query',NULL,NULL,NULL,NULL,NULL,0,1,0,'查询菜单','null',0,9,35,'ae0f36d1-09b0-4142-a65f-14aeef82cbba','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('创建部门',3,1,'module_system:dept:create',NULL,NULL,NULL,NULL,NULL,0,1,0,'创建部门','null',0,10,36,'e6082d5e-eea1-450b-a181-321896040785','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('修改部门',3,2,'module_system:dept:update',NULL,NULL,NULL,NULL,NULL,0,1,0,'修改部门','null',0,10,37,'ae60f687-ba81-4859-944a-be0388e47dc0','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('删除部门',3,3,'module_system:dept:delete',NULL,NULL,NULL,NULL,NULL,0,1,0,'删除部门','null',0,10,38,'6e396a56-735d-43c6-b259-8505dc102210','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('批量修改部门状态',3,4,'module_system:dept:patch',NULL,NULL,NULL,NULL,NULL,0,1,0,'批量修改部门状态','null',0,10,39,'48dce68d-0d1e-4eb4-96e2-6691df9dfd87','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('详情部门',3,5,'module_system:dept:detail',NULL,NULL,NULL,NULL,NULL,0,1,0,'详情部门','null',0,10,40,'0cf88465-a6cc-4015-8a3d-a7cfd2337d74','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('查询部门',3,6,'module_system:dept:query',NULL,NULL,NULL,NULL,NULL,0,1,0,'查询部门','null',0,10,41,'3d7ab65a-150b-49b9-9eaa-9b093ee1fe9b','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('创建岗位',3,1,'module_system:position:create',NULL,NULL,NULL,NULL,NULL,0,1,0,'创建岗位','null',0,11,42,'9dafe232-089d-4b32-a419-dfb5faef3f0e','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('修改岗位',3,2,'module_system:position:update',NULL,NULL,NULL,NULL,NULL,0,1,0,'修改岗位','null',0,11,43,'7aa63e69-6b07-4880-80aa-bfba5999e06a','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('删除岗位',3,3,'module_system:position:delete',NULL,NULL,NULL,NULL,NULL,0,1,0,'修改岗位','null',0,11,44,'e413a979-81f6-4619-960c-5abfb70d0e2c','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('批量修改岗位状态',3,4,'module_system:position:patch',NULL,NULL,NULL,NULL,NULL,0,1,0,'批量修改岗位状态','null',0,11,45,'97212313-5f3c-48b1-8c52-d78452880521','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('岗位导出',3,5,'module_system:position:export',NULL,NULL,NULL,NULL,NULL,0,1,0,'岗位导出','null',0,11,46,'b5b51722-448b-4a88-8165-2caaa5ac527b','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('详情岗位',3,6,'module_system:position:detail',NULL,NULL,NULL,NULL,NULL,0,1,0,'详情岗位','null',0,11,47,'1134acaf-0b12-4f96-ad0a-ef8f238d722a','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('查询岗位',3,7,'module_system:position:query',NULL,NULL,NULL,NULL,NULL,0,1,0,'查询岗位','null',0,11,48,'7cf2acae-a154-4aa9-80bf-6ee681006423','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('创建角色',3,1,'module_system:role:create',NULL,NULL,NULL,NULL,NULL,0,1,0,'创建角色','null',0,12,49,'2f8063bb-dd5d-4439-9bd9-016cbcbdfd17','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('修改角色',3,2,'module_system:role:update',NULL,NULL,NULL,NULL,NULL,0,1,0,'修改角色','null',0,12,50,'0c1afd4d-7ad6-4df8-bcc1-db4ab5b03ff9','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('删除角色',3,3,'module_system:role:delete',NULL,NULL,NULL,NULL,NULL,0,1,0,'删除角色','null',0,12,51,'4bea1760-b42c-451d-8c23-4d2b99a11f63','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('批量修改角色状态',3,4,'module_system:role:patch',NULL,NULL,NULL,NULL,NULL,0,1,0,'批量修改角色状态','null',0,12,52,'add80b1b-6a00-40ea-9088-ac8f77ac7cae','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('角色导出',3,5,'module_system:role:export',NULL,NULL,NULL,NULL,NULL,0,1,0,'角色导出','null',0,12,53,'0ad7f1a3-9068-45dc-9d1a-95fcc43751b6','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('详情角色',3,6,'module_system:role:detail',NULL,NULL,NULL,NULL,NULL,0,1,0,'详情角色','null',0,12,54,'d0f92ba2-8482-4f48-b008-b29f6b4efc4e','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('查询角色',3,7,'module_system:role:query',NULL,NULL,NULL,NULL,NULL,0,1,0,'查询角色','null',0,12,55,'37e16cb6-12a9-4f81-ae23-e035eb905cd4','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('创建用户',3,1,'module_system:user:create',NULL,NULL,NULL,NULL,NULL,0,1,0,'创建用户','null',0,13,56,'316a2b7f-5570-4d27-b15a-0e898faa4c65','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('修改用户',3,2,'module_system:user:update',NULL,NULL,NULL,NULL,NULL,0,1,0,'修改用户','null',0,13,57,'38ed04bf-e0d3-49a3-b989-3b901d0306ca','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('删除用户',3,3,'module_system:user:delete',NULL,NULL,NULL,NULL,NULL,0,1,0,'删除用户','null',0,13,58,'7a81183f-efa6-40cf-80ea-e35c5897b544','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('批量修改用户状态',3,4,'module_system:user:patch',NULL,NULL,NULL,NULL,NULL,0,1,0,'批量修改用户状态','null',0,13,59,'0374c345-551f-4d54-a8d1-dc933a0df6ab','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('导出用户',3,5,'module_system:user:export',NULL,NULL,NULL,NULL,NULL,0,1,0,'导出用户','null',0,13,60,'370e1517-567e-4720-ab20-2ea9698ba967','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('导入用户',3,6,'module_system:user:import',NULL,NULL,NULL,NULL,NULL,0,1,0,'导入用户','null',0,13,61,'2eb7f372-91a7-498b-9d63-83f50cdcae5b','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('下载用户导入模板',3,7,'module_system:user:download',NULL,NULL,NULL,NULL,NULL,0,1,0,'下载用户导入模板','null',0,13,62,'28b4fb56-4c00-427c-be4f-bfe91baac3d4','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('详情用户',3,8,'module_system:user:detail',NULL,NULL,NULL,NULL,NULL,0,1,0,'详情用户','null',0,13,63,'d4c70e6f-9843-4cbb-bc1e-27125e45ba47','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('查询用户',3,9,'module_system:user:query',NULL,NULL,NULL,NULL,NULL,0,1,0,'查询用户','null',0,13,64,'7fa25727-ac0f-456a-9e35-571fa816adce','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('日志删除',3,1,'module_system:log:delete',NULL,NULL,NULL,NULL,NULL,0,1,0,'日志删除','null',0,14,65,'f16ddf24-2f57-4927-a10e-bab6211e3383','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('日志导出',3,2,'module_system:log:export',NULL,NULL,NULL,NULL,NULL,0,1,0,'日志导出','null',0,14,66,'696fade5-15a7-4d76-80c3-b5a4e48cb9b0','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('日志详情',3,3,'module_system:log:detail',NULL,NULL,NULL,NULL,NULL,0,1,0,'日志详情','null',0,14,67,'4e23594b-589f-44d1-8db7-fb301c28e0f7','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('查询日志',3,4,'module_system:log:query',NULL,NULL,NULL,NULL,NULL,0,1,0,'查询日志','null',0,14,68,'769ec72d-8668-419d-9707-5566c1103454','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('公告创建',3,1,'module_system:notice:create',NULL,NULL,NULL,NULL,NULL,0,1,0,'公告创建','null',0,15,69,'783afff0-8fd8-476d-85e4-0baff953d153','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('公告修改',3,2,'module_system:notice:update',NULL,NULL,NULL,NULL,NULL,0,1,0,'修改用户','null',0,15,70,'509fbedd-db66-4bea-bb15-142b13a1a0cc','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('公告删除',3,3,'module_system:notice:delete',NULL,NULL,NULL,NULL,NULL,0,1,0,'公告删除','null',0,15,71,'3fd48660-a6be-41df-8d4a-d6df2deedb97','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('公告导出',3,4,'module_system:notice:export',NULL,NULL,NULL,NULL,NULL,0,1,0,'公告导出','null',0,15,72,'cb7d6846-7f38-426d-b902-f860a97cf244','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('公告批量修改状态',3,5,'module_system:notice:patch',NULL,NULL,NULL,NULL,NULL,0,1,0,'公告批量修改状态','null',0,15,73,'9509cccc-9833-47c5-b53c-0727233a52fa','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('公告详情',3,6,'module_system:notice:detail',NULL,NULL,NULL,NULL,NULL,0,1,0,'公告详情','null',0,15,74,'14047ac2-d576-484a-9cae-674ac4fca0fa','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('查询公告',3,5,'module_system:notice:query',NULL,NULL,NULL,NULL,NULL,0,1,0,'查询公告','null',0,15,75,'18101b02-45c3-4b20-bab6-9ce85efc52dc','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('创建参数',3,1,'module_system:param:create',NULL,NULL,NULL,NULL,NULL,0,1,0,'创建参数','null',0,16,76,'c01a78e9-2ee6-4359-9d2d-e912655ee5c2','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('修改参数',3,2,'module_system:param:update',NULL,NULL,NULL,NULL,NULL,0,1,0,'修改参数','null',0,16,77,'a73c8245-0c7c-4ea2-ab7c-c7c31fff52da','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('删除参数',3,3,'module_system:param:delete',NULL,NULL,NULL,NULL,NULL,0,1,0,'删除参数','null',0,16,78,'7b066411-073f-4e4f-a754-3ad8e0da6489','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('导出参数',3,4,'module_system:param:export',NULL,NULL,NULL,NULL,NULL,0,1,0,'导出参数','null',0,16,79,'72c49289-b82b-4f91-97f5-7451022dc5ad','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('参数上传',3,5,'module_system:param:upload',NULL,NULL,NULL,NULL,NULL,0,1,0,'参数上传','null',0,16,80,'75bcfd6d-b99c-47fd-a85e-4fbec852e2b2','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('参数详情',3,6,'module_system:param:detail',NULL,NULL,NULL,NULL,NULL,0,1,0,'参数详情','null',0,16,81,'48f507e3-3439-425c-9a21-1b9b057e19d8','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('查询参数',3,7,'module_system:param:query',NULL,NULL,NULL,NULL,NULL,0,1,0,'查询参数','null',0,16,82,'75528178-c64a-48fa-80e5-0c329371a978','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('创建字典类型',3,1,'module_system:dict_type:create',NULL,NULL,NULL,NULL,NULL,0,1,0,'创建字典类型','null',0,17,83,'30a58b57-8fa0-4913-845b-bd8fc05ae132','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('修改字典类型',3,2,'module_system:dict_type:update',NULL,NULL,NULL,NULL,NULL,0,1,0,'修改字典类型','null',0,17,84,'f01e1fb3-ab3c-47fe-aca3-da3b4189d02b','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('删除字典类型',3,3,'module_system:dict_type:delete',NULL,NULL,NULL,NULL,NULL,0,1,0,'删除字典类型','null',0,17,85,'c72c207c-19ca-477e-9ac6-28b7252d14bc','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('导出字典类型',3,4,'module_system:dict_type:export',NULL,NULL,NULL,NULL,NULL,0,1,0,'导出字典类型','null',0,17,86,'5ddcd280-6b45-496b-b358-538b58126b74','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('批量修改字典状态',3,5,'module_system:dict_type:patch',NULL,NULL,NULL,NULL,NULL,0,1,0,'导出字典类型','null',0,17,87,'42d69567-3a63-4ed7-99a1-592c2c328045','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('字典数据查询',3,6,'module_system:dict_data:query',NULL,NULL,NULL,NULL,NULL,0,1,0,'字典数据查询','null',0,17,88,'a017e99e-ead8-41c0-8eaa-232c100d36d1','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('创建字典数据',3,7,'module_system:dict_data:create',NULL,NULL,NULL,NULL,NULL,0,1,0,'创建字典数据','null',0,17,89,'8969e135-4787-41a3-8cae-4fd49cfc49b9','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('修改字典数据',3,8,'module_system:dict_data:update',NULL,NULL,NULL,NULL,NULL,0,1,0,'修改字典数据','null',0,17,90,'b9b7242e-bc87-45fb-8f43-60c93d632a47','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('删除字典数据',3,9,'module_system:dict_data:delete',NULL,NULL,NULL,NULL,NULL,0,1,0,'删除字典数据','null',0,17,91,'18052459-cd11-4a6c-8af1-76e4efae8225','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('导出字典数据',3,10,'module_system:dict_data:export',NULL,NULL,NULL,NULL,NULL,0,1,0,'导出字典数据','null',0,17,92,'581d5104-a50f-498e-a7e6-f6801c97c965','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('批量修改字典数据状态',3,11,'module_system:dict_data:patch',NULL,NULL,NULL,NULL,NULL,0,1,0,'批量修改字典数据状态','null',0,17,93,'30f42b10-10b3-4c4a-aeb6-fd84eacba90b','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('详情字典类型',3,12,'module_system:dict_type:detail',NULL,NULL,NULL,NULL,NULL,0,1,0,'详情字典类型','null',0,17,94,'13326374-adca-4fcf-b725-08013e8644f9','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('查询字典类型',3,13,'module_system:dict_type:query',NULL,NULL,NULL,NULL,NULL,0,1,0,'查询字典类型','null',0,17,95,'752593ea-d769-4c71-88fe-bef629acba9c','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('详情字典数据',3,14,'module_system:dict_data:detail',NULL,NULL,NULL,NULL,NULL,0,1,0,'详情字典数据','null',0,17,96,'b6e8f504-11c1-4ba7-8c64-f4446f958e26','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('创建应用',3,1,'module_application:myapp:create',NULL,NULL,NULL,NULL,NULL,0,1,0,'创建应用','null',0,18,97,'91cb1744-65ca-415c-b85a-b176f77473be','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('修改应用',3,2,'module_application:myapp:update',NULL,NULL,NULL,NULL,NULL,0,1,0,'修改应用','null',0,18,98,'e7b80cc7-9f9d-4580-be2b-cda26642c300','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('删除应用',3,3,'module_application:myapp:delete',NULL,NULL,NULL,NULL,NULL,0,1,0,'删除应用','null',0,18,99,'2b955ecc-80af-4a4a-9554-b33d01da8788','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('批量修改应用状态',3,4,'module_application:myapp:patch',NULL,NULL,NULL,NULL,NULL,0,1,0,'批量修改应用状态','null',0,18,100,'897e06b4-cf07-4432-9770-da926272a518','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('详情应用',3,5,'module_application:myapp:detail',NULL,NULL,NULL,NULL,NULL,0,1,0,'详情应用','null',0,18,101,'37983db4-d172-4621-ab01-5ab18e3a5794','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('查询应用',3,6,'module_application:myapp:query',NULL,NULL,NULL,NULL,NULL,0,1,0,'查询应用','null',0,18,102,'3fced896-d9fc-4cd4-9875-1861c784a239','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('创建任务',3,1,'module_application:job:create',NULL,NULL,NULL,NULL,NULL,0,1,0,'创建任务','null',0,19,103,'589bf53a-4b80-4446-9f92-f27d72cddef9','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('修改和操作任务',3,2,'module_application:job:update',NULL,NULL,NULL,NULL,NULL,0,1,0,'修改和操作任务','null',0,19,104,'71f748e4-8f6e-4e5b-94cb-41984e09d1f5','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('删除和清除任务',3,3,'module_application:job:delete',NULL,NULL,NULL,NULL,NULL,0,1,0,'删除和清除任务','null',0,19,105,'7c323e09-76f6-4bd8-a6c0-644d35b94693','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('导出定时任务',3,4,'module_application:job:export',NULL,NULL,NULL,NULL,NULL,0,1,0,'导出定时任务','null',0,19,106,'dad17cfc-19ca-472e-9b58-25d0e06f4057','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('详情定时任务',3,5,'module_application:job:detail',NULL,NULL,NULL,NULL,NULL,0,1,0,'详情任务','null',0,19,107,'680439b9-2190-4dda-8b87-4fe0bece8919','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('查询定时任务',3,6,'module_application:job:query',NULL,NULL,NULL,NULL,NULL,0,1,0,'查询定时任务','null',0,19,108,'bd3736e5-8c25-4858-891b-0fa9e8ee6bcb','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('智能对话',3,1,'module_application:ai:chat',NULL,NULL,NULL,NULL,NULL,0,1,0,'智能对话','null',0,20,109,'40841301-1361-4c5f-af5b-9fafc92d498a','0','智能对话','2026-01-03 20:15:40','2026-01-03 20:15:40'),('在线用户强制下线',3,1,'module_monitor:online:delete',NULL,NULL,NULL,NULL,NULL,0,1,0,'在线用户强制下线','null',0,22,110,'b86c973c-6554-44fe-a8f9-3547b4e4c51d','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('清除缓存',3,1,'module_monitor:cache:delete',NULL,NULL,NULL,NULL,NULL,0,1,0,'清除缓存','null',0,24,111,'a035a875-d730-422e-80de-37aec6c1a49c','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('文件上传',3,1,'module_monitor:resource:upload',NULL,NULL,NULL,NULL,NULL,0,1,0,'文件上传','null',0,25,112,'db1d5cb3-b839-4d4b-b8ea-7cd76514ef8c','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('文件下载',3,2,'module_monitor:resource:download',NULL,NULL,NULL,NULL,NULL,0,1,0,'文件下载','null',0,25,113,'076370a2-2ff2-4a46-b01f-8f1aac0d4b71','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('文件删除',3,3,'module_monitor:resource:delete',NULL,NULL,NULL,NULL,NULL,0,1,0,'文件删除','null',0,25,114,'1de098f5-a21c-43fa-b825-8f8abf48ae92','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('文件移动',3,4,'module_monitor:resource:move',NULL,NULL,NULL,NULL,NULL,0,1,0,'文件移动','null',0,25,115,'1f7ee57a-b1ea-4513-8cec-0deef018a787','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('文件复制',3,5,'module_monitor:resource:copy',NULL,NULL,NULL,NULL,NULL,0,1,0,'文件复制','null',0,25,116,'53547c60-b049-413b-909b-02f340b78066','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('文件重命名',3,6,'module_monitor:resource:rename',NULL,NULL,NULL,NULL,NULL,0,1,0,'文件重命名','null',0,25,117,'9ae32f22-be06-4753-a878-19321751fe27','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('创建目录',3,7,'module_monitor:resource:create_dir',NULL,NULL,NULL,NULL,NULL,0,1,0,'创建目录','null',0,25,118,'92d91df4-1d57-4e84-9e51-a4eafad23bbd','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('导出文件列表',3,9,'module_monitor:resource:export',NULL,NULL,NULL,NULL,NULL,0,1,0,'导出文件列表','null',0,25,119,'f6a748db-ba49-41da-afe9-18720604e037','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('查询代码生成业务表列表',3,1,'module_generator:gencode:query',NULL,NULL,NULL,NULL,NULL,0,1,0,'查询代码生成业务表列表','null',0,26,120,'7c169e8a-dd9c-4955-9722-c3ca05d5c908','0','查询代码生成业务表列表','2026-01-03 20:15:40','2026-01-03 20:15:40'),('创建表结构',3,2,'module_generator:gencode:create',NULL,NULL,NULL,NULL,NULL,0,1,0,'创建表结构','null',0,26,121,'ddf13f80-8178-4133-926e-51d148f9300d','0','创建表结构','2026-01-03 20:15:40','2026-01-03 20:15:40'),('编辑业务表信息',3,3,'module_generator:gencode:update',NULL,NULL,NULL,NULL,NULL,0,1,0,'编辑业务表信息','null',0,26,122,'2bc87149-640c-40a4-85bc-2c9486b5f5bd','0','编辑业务表信息','2026-01-03 20:15:40','2026-01-03 20:15:40'),('删除业务表信息',3,4,'module_generator:gencode:delete',NULL,NULL,NULL,NULL,NULL,0,1,0,'删除业务表信息','null',0,26,123,'9590e6a5-83fb-47fe-ad10-5d71f67ee56d','0','删除业务表信息','2026-01-03 20:15:40','2026-01-03 20:15:40'),('导入表结构',3,5,'module_generator:gencode:import',NULL,NULL,NULL,NULL,NULL,0,1,0,'导入表结构','null',0,26,124,'10d28c8d-f0c9-4e4f-85f2-ea9a0aa36127','0','导入表结构','2026-01-03 20:15:40','2026-01-03 20:15:40'),('批量生成代码',3,6,'module_generator:gencode:operate',NULL,NULL,NULL,NULL,NULL,0,1,0,'批量生成代码','null',0,26,125,'1e42140f-53ce-4d27-aefe-352c5cbb3140','0','批量生成代码','2026-01-03 20:15:40','2026-01-03 20:15:40'),('生成代码到指定路径',3,7,'module_generator:gencode:code',NULL,NULL,NULL,NULL,NULL,0,1,0,'生成代码到指定路径','null',0,26,126,'b57a92e7-1715-4541-85b0-8514c04103b1','0','生成代码到指定路径','2026-01-03 20:15:40','2026-01-03 20:15:40'),('查询数据库表列表',3,8,'module_generator:dblist:query',NULL,NULL,NULL,NULL,NULL,0,1,0,'查询数据库表列表','null',0,26,127,'5686315b-843f-4bdd-b85f-ee48b68d5c06','0','查询数据库表列表','2026-01-03 20:15:40','2026-01-03 20:15:40'),('同步数据库',3,9,'module_generator:db:sync',NULL,NULL,NULL,NULL,NULL,0,1,0,'同步数据库','null',0,26,128,'09c5ab99-cce1-4086-ab11-5c8677ac05d5','0','同步数据库','2026-01-03 20:15:40','2026-01-03 20:15:40'),('创建示例',3,1,'module_example:demo:create',NULL,NULL,NULL,NULL,NULL,0,1,0,'创建示例','null',0,29,129,'240b81f0-cea2-4991-a20c-9b8660bcc062','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('更新示例',3,2,'module_example:demo:update',NULL,NULL,NULL,NULL,NULL,0,1,0,'更新示例','null',0,29,130,'ed418b6a-d70f-429f-8aa1-482f82996557','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('删除示例',3,3,'module_example:demo:delete',NULL,NULL,NULL,NULL,NULL,0,1,0,'删除示例','null',0,29,131,'02ff30ca-80d2-48e7-b150-bc44e449e761','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('批量修改示例状态',3,4,'module_example:demo:patch',NULL,NULL,NULL,NULL,NULL,0,1,0,'批量修改示例状态','null',0,29,132,'444ed212-729e-4651-9751-30fa4b9fdb94','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('导出示例',3,5,'module_example:demo:export',NULL,NULL,NULL,NULL,NULL,0,1,0,'导出示例','null',0,29,133,'a61b99e3-d0f9-435a-a1a4-9a0a86991f72','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('导入示例',3,6,'module_example:demo:import',NULL,NULL,NULL,NULL,NULL,0,1,0,'导入示例','null',0,29,134,'b4693ca0-d8a6-46b1-a6d3-b0c2e3aa82cd','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('下载导入示例模版',3,7,'module_example:demo:download',NULL,NULL,NULL,NULL,NULL,0,1,0,'下载导入示例模版','null',0,29,135,'4f57c2dc-d4a6-48c9-984a-45805713c138','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('详情示例',3,8,'module_example:demo:detail',NULL,NULL,NULL,NULL,NULL,0,1,0,'详情示例','null',0,29,136,'46bdd3ae-ddac-4685-9264-5c039dd5958f','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40'),('查询示例',3,9,'module_example:demo:query',NULL,NULL,NULL,NULL,NULL,0,1,0,'查询示例','null',0,29,137,'52ef488f-6a6a-4d84-abd7-ff13da9f5e84','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40');
+INSERT INTO `sys_menu` VALUES ('仪表盘',1,1,'','client','Dashboard','/dashboard',NULL,'/dashboard/workplace',0,1,1,'仪表盘','null',0,NULL,1,'6ab03272-a823-4d2b-8bcc-00ef363f96fd','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/1/'),('系统管理',1,2,NULL,'system','System','/system',NULL,'/system/menu',0,1,0,'系统管理','null',0,NULL,2,'87609dc2-9d90-48df-ab17-568f67665e4a','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/'),('应用管理',1,3,NULL,'el-icon-ShoppingBag','Application','/application',NULL,'/application/myapp',0,1,0,'应用管理','null',0,NULL,3,'f4200bfa-839e-483b-85e1-01b8f4620aaa','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/3/'),('监控管理',1,4,NULL,'monitor','Monitor','/monitor',NULL,'/monitor/online',0,1,0,'监控管理','null',0,NULL,4,'fbe6a232-649b-48c9-853f-e34aeb21dc04','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/4/'),('代码管理',1,5,NULL,'code','Generator','/generator',NULL,'/generator/gencode',0,1,0,'代码管理','null',0,NULL,5,'8c1085c1-8b43-4442-a319-bd1b50272a42','0','代码管理','2026-01-03 20:15:40','2026-01-03 20:15:40','/5/'),('接口管理',1,6,NULL,'document','Common','/common',NULL,'/common/docs',0,1,0,'接口管理','null',0,NULL,6,'6994bc7e-eacc-4ccd-908b-83c67616aac3','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/6/'),('案例管理',1,7,NULL,'menu','Example','/example',NULL,'/example/demo',0,1,0,'案例管理','null',0,NULL,7,'5da39814-6873-48ec-8b36-da6042d06e3f','0','案例管理','2026-01-03 20:15:40','2026-01-03 20:15:40','/7/'),('工作台',2,1,'dashboard:workplace:query','el-icon-PieChart','Workplace','/dashboard/workplace','dashboard/workplace',NULL,0,1,0,'工作台','null',0,1,8,'ca9b78d3-05f8-4fe7-ada8-6b00b7c935c4','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/1/8/'),('菜单管理',2,1,'module_system:menu:query','menu','Menu','/system/menu','module_system/menu/index',NULL,0,1,0,'菜单管理','null',0,2,9,'18f7afa0-cbb1-4952-8dab-025d9aac0a97','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/9/'),('部门管理',2,2,'module_system:dept:query','tree','Dept','/system/dept','module_system/dept/index',NULL,0,1,0,'部门管理','null',0,2,10,'31c8381e-6195-4844-8c15-4f2898d0b981','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/10/'),('岗位管理',2,3,'module_system:position:query','el-icon-Coordinate','Position','/system/position','module_system/position/index',NULL,0,1,0,'岗位管理','null',0,2,11,'387ae485-b8cd-4a73-83b8-1aa431a706eb','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/11/'),('角色管理',2,4,'module_system:role:query','role','Role','/system/role','module_system/role/index',NULL,0,1,0,'角色管理','null',0,2,12,'02f3f896-5dee-4039-86e4-d40872b0774b','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/12/'),('用户管理',2,5,'module_system:user:query','el-icon-User','User','/system/user','module_system/user/index',NULL,0,1,0,'用户管理','null',0,2,13,'5d7fffee-5972-478b-8d64-5c4fa5ec5cd9','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/13/'),('日志管理',2,6,'module_system:log:query','el-icon-Aim','Log','/system/log','module_system/log/index',NULL,0,1,0,'日志管理','null',0,2,14,'b9545a78-7165-464b-bcd0-23c1f8464e5d','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/14/'),('公告管理',2,7,'module_system:notice:query','bell','Notice','/system/notice','module_system/notice/index',NULL,0,1,0,'公告管理','null',0,2,15,'9e1a1629-5b45-4f50-8ccc-afe8db61d015','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/15/'),('参数管理',2,8,'module_system:param:query','setting','Params','/system/param','module_system/param/index',NULL,0,1,0,'参数管理','null',0,2,16,'f37e7718-6b98-43d7-af8f-c863c4749a20','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/16/'),('字典管理',2,9,'module_system:dict_type:query','dict','Dict','/system/dict','module_system/dict/index',NULL,0,1,0,'字典管理','null',0,2,17,'4379b2b9-c070-45cf-b4b2-0864324e6161','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/17/'),('我的应用',2,1,'module_application:myapp:query','el-icon-ShoppingCartFull','MYAPP','/application/myapp','module_application/myapp/index',NULL,0,1,0,'我的应用','null',0,3,18,'1e4a5308-6e0d-4cb6-b099-100572b203a7','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/3/18/'),('任务管理',2,2,'module_application:job:query','el-icon-DataLine','Job','/application/job','module_application/job/index',NULL,0,1,0,'任务管理','null',0,3,19,'fb8f7fc5-6fbf-4c03-91ff-20017d0757a4','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/3/19/'),('AI智能助手',2,3,'module_application:ai:chat','el-icon-ToiletPaper','AI','/application/ai','module_application/ai/index',NULL,0,1,0,'AI智能助手','null',0,3,20,'800d1611-bc2b-46df-9878-7a8454c67d51','0','AI智能助手','2026-01-03 20:15:40','2026-01-03 20:15:40','/3/20/'),('流程管理',2,4,'module_application:workflow:query','el-icon-ShoppingBag','Workflow','/application/workflow','module_application/workflow/index',NULL,0,1,0,'我的流程','null',0,3,21,'85887c52-f2b1-40eb-96c8-4b50fdc4ac38','0','我的流程','2026-01-03 20:15:40','2026-01-03 20:15:40','/3/21/'),('在线用户',2,1,'module_monitor:online:query','el-icon-Headset','MonitorOnline','/monitor/online','module_monitor/online/index',NULL,0,1,0,'在线用户','null',0,4,22,'f0d77cc8-4b29-4b8a-83a0-c07f50104596','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/4/22/'),('服务器监控',2,2,'module_monitor:server:query','el-icon-Odometer','MonitorServer','/monitor/server','module_monitor/server/index',NULL,0,1,0,'服务器监控','null',0,4,23,'d819eb52-36c8-4b87-bcc0-23a70cd00f78','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/4/23/'),('缓存监控',2,3,'module_monitor:cache:query','el-icon-Stopwatch','MonitorCache','/monitor/cache','module_monitor/cache/index',NULL,0,1,0,'缓存监控','null',0,4,24,'dad0cf0b-33ef-42bc-8f79-cdc467b6845d','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/4/24/'),('文件管理',2,4,'module_monitor:resource:query','el-icon-Files','Resource','/monitor/resource','module_monitor/resource/index',NULL,0,1,0,'文件管理','null',0,4,25,'89979d3f-5d2f-4b0a-81b0-bb2b1c74b50c','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/4/25/'),('代码生成',2,1,'module_generator:gencode:query','code','GenCode','/generator/gencode','module_generator/gencode/index',NULL,0,1,0,'代码生成','null',0,5,26,'15b626e5-151d-443d-bdc5-dc6b4dff4da6','0','代码生成','2026-01-03 20:15:40','2026-01-03 20:15:40','/5/26/'),('Swagger文档',4,1,'module_common:docs:query','api','Docs','/common/docs','module_common/docs/index',NULL,0,1,0,'Swagger文档','null',0,6,27,'6a12698f-7fba-4b4e-850f-4b19db12ad74','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/6/27/'),('Redoc文档',4,2,'module_common:redoc:query','el-icon-Document','Redoc','/common/redoc','module_common/redoc/index',NULL,0,1,0,'Redoc文档','null',0,6,28,'79750178-0a65-48fd-b775-8da287ccfee5','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/6/28/'),('示例管理',2,1,'module_example:demo:query','menu','Demo','/example/demo','module_example/demo/index',NULL,0,1,0,'示例管理','null',0,7,29,'6628cf01-5efc-42bd-b5fd-6a7505bfc76a','0','示例管理','2026-01-03 20:15:40','2026-01-03 20:15:40','/7/29/'),('创建菜单',3,1,'module_system:menu:create',NULL,NULL,NULL,NULL,NULL,0,1,0,'创建菜单','null',0,9,30,'47862c59-6fef-4e9e-84b7-c6e90243e486','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/9/30/'),('修改菜单',3,2,'module_system:menu:update',NULL,NULL,NULL,NULL,NULL,0,1,0,'修改菜单','null',0,9,31,'53a8a559-72bd-451d-98c1-8fa3dbec99fe','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/9/31/'),('删除菜单',3,3,'module_system:menu:delete',NULL,NULL,NULL,NULL,NULL,0,1,0,'删除菜单','null',0,9,32,'aa59878c-68ac-44f8-9854-b1a3c8ba8295','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/9/32/'),('批量修改菜单状态',3,4,'module_system:menu:patch',NULL,NULL,NULL,NULL,NULL,0,1,0,'批量修改菜单状态','null',0,9,33,'314f09ee-c734-416e-98c0-e11672388419','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/9/33/'),('详情改菜',3,5,'module_system:menu:detail',NULL,NULL,NULL,NULL,NULL,0,1,0,'详情改菜','null',0,9,34,'94624520-2148-437b-8353-a791650beee7','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/9/34/'),('查询菜单',3,6,'module_system:menu:query',NULL,NULL,NULL,NULL,NULL,0,1,0,'查询菜单','null',0,9,35,'ae0f36d1-09b0-4142-a65f-14aeef82cbba','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/9/35/'),('创建部门',3,1,'module_system:dept:create',NULL,NULL,NULL,NULL,NULL,0,1,0,'创建部门','null',0,10,36,'e6082d5e-eea1-450b-a181-321896040785','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/10/36/'),('修改部门',3,2,'module_system:dept:update',NULL,NULL,NULL,NULL,NULL,0,1,0,'修改部门','null',0,10,37,'ae60f687-ba81-4859-944a-be0388e47dc0','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/10/37/'),('删除部门',3,3,'module_system:dept:delete',NULL,NULL,NULL,NULL,NULL,0,1,0,'删除部门','null',0,10,38,'6e396a56-735d-43c6-b259-8505dc102210','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/10/38/'),('批量修改部门状态',3,4,'module_system:dept:patch',NULL,NULL,NULL,NULL,NULL,0,1,0,'批量修改部门状态','null',0,10,39,'48dce68d-0d1e-4eb4-96e2-6691df9dfd87','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/10/39/'),('详情部门',3,5,'module_system:dept:detail',NULL,NULL,NULL,NULL,NULL,0,1,0,'详情部门','null',0,10,40,'0cf88465-a6cc-4015-8a3d-a7cfd2337d74','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/10/40/'),('查询部门',3,6,'module_system:dept:query',NULL,NULL,NULL,NULL,NULL,0,1,0,'查询部门','null',0,10,41,'3d7ab65a-150b-49b9-9eaa-9b093ee1fe9b','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/10/41/'),('创建岗位',3,1,'module_system:position:create',NULL,NULL,NULL,NULL,NULL,0,1,0,'创建岗位','null',0,11,42,'9dafe232-089d-4b32-a419-dfb5faef3f0e','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/11/42/'),('修改岗位',3,2,'module_system:position:update',NULL,NULL,NULL,NULL,NULL,0,1,0,'修改岗位','null',0,11,43,'7aa63e69-6b07-4880-80aa-bfba5999e06a','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/11/43/'),('删除岗位',3,3,'module_system:position:delete',NULL,NULL,NULL,NULL,NULL,0,1,0,'修改岗位','null',0,11,44,'e413a979-81f6-4619-960c-5abfb70d0e2c','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/11/44/'),('批量修改岗位状态',3,4,'module_system:position:patch',NULL,NULL,NULL,NULL,NULL,0,1,0,'批量修改岗位状态','null',0,11,45,'97212313-5f3c-48b1-8c52-d78452880521','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/11/45/'),('岗位导出',3,5,'module_system:position:export',NULL,NULL,NULL,NULL,NULL,0,1,0,'岗位导出','null',0,11,46,'b5b51722-448b-4a88-8165-2caaa5ac527b','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/11/46/'),('详情岗位',3,6,'module_system:position:detail',NULL,NULL,NULL,NULL,NULL,0,1,0,'详情岗位','null',0,11,47,'1134acaf-0b12-4f96-ad0a-ef8f238d722a','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/11/47/'),('查询岗位',3,7,'module_system:position:query',NULL,NULL,NULL,NULL,NULL,0,1,0,'查询岗位','null',0,11,48,'7cf2acae-a154-4aa9-80bf-6ee681006423','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/11/48/'),('创建角色',3,1,'module_system:role:create',NULL,NULL,NULL,NULL,NULL,0,1,0,'创建角色','null',0,12,49,'2f8063bb-dd5d-4439-9bd9-016cbcbdfd17','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/12/49/'),('修改角色',3,2,'module_system:role:update',NULL,NULL,NULL,NULL,NULL,0,1,0,'修改角色','null',0,12,50,'0c1afd4d-7ad6-4df8-bcc1-db4ab5b03ff9','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/12/50/'),('删除角色',3,3,'module_system:role:delete',NULL,NULL,NULL,NULL,NULL,0,1,0,'删除角色','null',0,12,51,'4bea1760-b42c-451d-8c23-4d2b99a11f63','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/12/51/'),('批量修改角色状态',3,4,'module_system:role:patch',NULL,NULL,NULL,NULL,NULL,0,1,0,'批量修改角色状态','null',0,12,52,'add80b1b-6a00-40ea-9088-ac8f77ac7cae','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/12/52/'),('角色导出',3,5,'module_system:role:export',NULL,NULL,NULL,NULL,NULL,0,1,0,'角色导出','null',0,12,53,'0ad7f1a3-9068-45dc-9d1a-95fcc43751b6','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/12/53/'),('详情角色',3,6,'module_system:role:detail',NULL,NULL,NULL,NULL,NULL,0,1,0,'详情角色','null',0,12,54,'d0f92ba2-8482-4f48-b008-b29f6b4efc4e','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/12/54/'),('查询角色',3,7,'module_system:role:query',NULL,NULL,NULL,NULL,NULL,0,1,0,'查询角色','null',0,12,55,'37e16cb6-12a9-4f81-ae23-e035eb905cd4','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/12/55/'),('创建用户',3,1,'module_system:user:create',NULL,NULL,NULL,NULL,NULL,0,1,0,'创建用户','null',0,13,56,'316a2b7f-5570-4d27-b15a-0e898faa4c65','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/13/56/'),('修改用户',3,2,'module_system:user:update',NULL,NULL,NULL,NULL,NULL,0,1,0,'修改用户','null',0,13,57,'38ed04bf-e0d3-49a3-b989-3b901d0306ca','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/13/57/'),('删除用户',3,3,'module_system:user:delete',NULL,NULL,NULL,NULL,NULL,0,1,0,'删除用户','null',0,13,58,'7a81183f-efa6-40cf-80ea-e35c5897b544','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/13/58/'),('批量修改用户状态',3,4,'module_system:user:patch',NULL,NULL,NULL,NULL,NULL,0,1,0,'批量修改用户状态','null',0,13,59,'0374c345-551f-4d54-a8d1-dc933a0df6ab','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/13/59/'),('导出用户',3,5,'module_system:user:export',NULL,NULL,NULL,NULL,NULL,0,1,0,'导出用户','null',0,13,60,'370e1517-567e-4720-ab20-2ea9698ba967','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/13/60/'),('导入用户',3,6,'module_system:user:import',NULL,NULL,NULL,NULL,NULL,0,1,0,'导入用户','null',0,13,61,'2eb7f372-91a7-498b-9d63-83f50cdcae5b','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/13/61/'),('下载用户导入模板',3,7,'module_system:user:download',NULL,NULL,NULL,NULL,NULL,0,1,0,'下载用户导入模板','null',0,13,62,'28b4fb56-4c00-427c-be4f-bfe91baac3d4','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/13/62/'),('详情用户',3,8,'module_system:user:detail',NULL,NULL,NULL,NULL,NULL,0,1,0,'详情用户','null',0,13,63,'d4c70e6f-9843-4cbb-bc1e-27125e45ba47','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/13/63/'),('查询用户',3,9,'module_system:user:query',NULL,NULL,NULL,NULL,NULL,0,1,0,'查询用户','null',0,13,64,'7fa25727-ac0f-456a-9e35-571fa816adce','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/13/64/'),('日志删除',3,1,'module_system:log:delete',NULL,NULL,NULL,NULL,NULL,0,1,0,'日志删除','null',0,14,65,'f16ddf24-2f57-4927-a10e-bab6211e3383','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/14/65/'),('日志导出',3,2,'module_system:log:export',NULL,NULL,NULL,NULL,NULL,0,1,0,'日志导出','null',0,14,66,'696fade5-15a7-4d76-80c3-b5a4e48cb9b0','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/14/66/'),('日志详情',3,3,'module_system:log:detail',NULL,NULL,NULL,NULL,NULL,0,1,0,'日志详情','null',0,14,67,'4e23594b-589f-44d1-8db7-fb301c28e0f7','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/14/67/'),('查询日志',3,4,'module_system:log:query',NULL,NULL,NULL,NULL,NULL,0,1,0,'查询日志','null',0,14,68,'769ec72d-8668-419d-9707-5566c1103454','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/14/68/'),('公告创建',3,1,'module_system:notice:create',NULL,NULL,NULL,NULL,NULL,0,1,0,'公告创建','null',0,15,69,'783afff0-8fd8-476d-85e4-0baff953d153','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/15/69/'),('公告修改',3,2,'module_system:notice:update',NULL,NULL,NULL,NULL,NULL,0,1,0,'修改用户','null',0,15,70,'509fbedd-db66-4bea-bb15-142b13a1a0cc','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/15/70/'),('公告删除',3,3,'module_system:notice:delete',NULL,NULL,NULL,NULL,NULL,0,1,0,'公告删除','null',0,15,71,'3fd48660-a6be-41df-8d4a-d6df2deedb97','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/15/71/'),('公告导出',3,4,'module_system:notice:export',NULL,NULL,NULL,NULL,NULL,0,1,0,'公告导出','null',0,15,72,'cb7d6846-7f38-426d-b902-f860a97cf244','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/15/72/'),('公告批量修改状态',3,5,'module_system:notice:patch',NULL,NULL,NULL,NULL,NULL,0,1,0,'公告批量修改状态','null',0,15,73,'9509cccc-9833-47c5-b53c-0727233a52fa','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/15/73/'),('公告详情',3,6,'module_system:notice:detail',NULL,NULL,NULL,NULL,NULL,0,1,0,'公告详情','null',0,15,74,'14047ac2-d576-484a-9cae-674ac4fca0fa','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/15/74/'),('查询公告',3,5,'module_system:notice:query',NULL,NULL,NULL,NULL,NULL,0,1,0,'查询公告','null',0,15,75,'18101b02-45c3-4b20-bab6-9ce85efc52dc','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/15/75/'),('创建参数',3,1,'module_system:param:create',NULL,NULL,NULL,NULL,NULL,0,1,0,'创建参数','null',0,16,76,'c01a78e9-2ee6-4359-9d2d-e912655ee5c2','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/16/76/'),('修改参数',3,2,'module_system:param:update',NULL,NULL,NULL,NULL,NULL,0,1,0,'修改参数','null',0,16,77,'a73c8245-0c7c-4ea2-ab7c-c7c31fff52da','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/16/77/'),('删除参数',3,3,'module_system:param:delete',NULL,NULL,NULL,NULL,NULL,0,1,0,'删除参数','null',0,16,78,'7b066411-073f-4e4f-a754-3ad8e0da6489','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/16/78/'),('导出参数',3,4,'module_system:param:export',NULL,NULL,NULL,NULL,NULL,0,1,0,'导出参数','null',0,16,79,'72c49289-b82b-4f91-97f5-7451022dc5ad','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/16/79/'),('参数上传',3,5,'module_system:param:upload',NULL,NULL,NULL,NULL,NULL,0,1,0,'参数上传','null',0,16,80,'75bcfd6d-b99c-47fd-a85e-4fbec852e2b2','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/16/80/'),('参数详情',3,6,'module_system:param:detail',NULL,NULL,NULL,NULL,NULL,0,1,0,'参数详情','null',0,16,81,'48f507e3-3439-425c-9a21-1b9b057e19d8','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/16/81/'),('查询参数',3,7,'module_system:param:query',NULL,NULL,NULL,NULL,NULL,0,1,0,'查询参数','null',0,16,82,'75528178-c64a-48fa-80e5-0c329371a978','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/16/82/'),('创建字典类型',3,1,'module_system:dict_type:create',NULL,NULL,NULL,NULL,NULL,0,1,0,'创建字典类型','null',0,17,83,'30a58b57-8fa0-4913-845b-bd8fc05ae132','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/17/83/'),('修改字典类型',3,2,'module_system:dict_type:update',NULL,NULL,NULL,NULL,NULL,0,1,0,'修改字典类型','null',0,17,84,'f01e1fb3-ab3c-47fe-aca3-da3b4189d02b','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/17/84/'),('删除字典类型',3,3,'module_system:dict_type:delete',NULL,NULL,NULL,NULL,NULL,0,1,0,'删除字典类型','null',0,17,85,'c72c207c-19ca-477e-9ac6-28b7252d14bc','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/17/85/'),('导出字典类型',3,4,'module_system:dict_type:export',NULL,NULL,NULL,NULL,NULL,0,1,0,'导出字典类型','null',0,17,86,'5ddcd280-6b45-496b-b358-538b58126b74','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/17/86/'),('批量修改字典状态',3,5,'module_system:dict_type:patch',NULL,NULL,NULL,NULL,NULL,0,1,0,'导出字典类型','null',0,17,87,'42d69567-3a63-4ed7-99a1-592c2c328045','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/17/87/'),('字典数据查询',3,6,'module_system:dict_data:query',NULL,NULL,NULL,NULL,NULL,0,1,0,'字典数据查询','null',0,17,88,'a017e99e-ead8-41c0-8eaa-232c100d36d1','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/17/88/'),('创建字典数据',3,7,'module_system:dict_data:create',NULL,NULL,NULL,NULL,NULL,0,1,0,'创建字典数据','null',0,17,89,'8969e135-4787-41a3-8cae-4fd49cfc49b9','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/17/89/'),('修改字典数据',3,8,'module_system:dict_data:update',NULL,NULL,NULL,NULL,NULL,0,1,0,'修改字典数据','null',0,17,90,'b9b7242e-bc87-45fb-8f43-60c93d632a47','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/17/90/'),('删除字典数据',3,9,'module_system:dict_data:delete',NULL,NULL,NULL,NULL,NULL,0,1,0,'删除字典数据','null',0,17,91,'18052459-cd11-4a6c-8af1-76e4efae8225','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/17/91/'),('导出字典数据',3,10,'module_system:dict_data:export',NULL,NULL,NULL,NULL,NULL,0,1,0,'导出字典数据','null',0,17,92,'581d5104-a50f-498e-a7e6-f6801c97c965','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/17/92/'),('批量修改字典数据状态',3,11,'module_system:dict_data:patch',NULL,NULL,NULL,NULL,NULL,0,1,0,'批量修改字典数据状态','null',0,17,93,'30f42b10-10b3-4c4a-aeb6-fd84eacba90b','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/17/93/'),('详情字典类型',3,12,'module_system:dict_type:detail',NULL,NULL,NULL,NULL,NULL,0,1,0,'详情字典类型','null',0,17,94,'13326374-adca-4fcf-b725-08013e8644f9','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/17/94/'),('查询字典类型',3,13,'module_system:dict_type:query',NULL,NULL,NULL,NULL,NULL,0,1,0,'查询字典类型','null',0,17,95,'752593ea-d769-4c71-88fe-bef629acba9c','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/17/95/'),('详情字典数据',3,14,'module_system:dict_data:detail',NULL,NULL,NULL,NULL,NULL,0,1,0,'详情字典数据','null',0,17,96,'b6e8f504-11c1-4ba7-8c64-f4446f958e26','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/2/17/96/'),('创建应用',3,1,'module_application:myapp:create',NULL,NULL,NULL,NULL,NULL,0,1,0,'创建应用','null',0,18,97,'91cb1744-65ca-415c-b85a-b176f77473be','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/3/18/97/'),('修改应用',3,2,'module_application:myapp:update',NULL,NULL,NULL,NULL,NULL,0,1,0,'修改应用','null',0,18,98,'e7b80cc7-9f9d-4580-be2b-cda26642c300','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/3/18/98/'),('删除应用',3,3,'module_application:myapp:delete',NULL,NULL,NULL,NULL,NULL,0,1,0,'删除应用','null',0,18,99,'2b955ecc-80af-4a4a-9554-b33d01da8788','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/3/18/99/'),('批量修改应用状态',3,4,'module_application:myapp:patch',NULL,NULL,NULL,NULL,NULL,0,1,0,'批量修改应用状态','null',0,18,100,'897e06b4-cf07-4432-9770-da926272a518','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/3/18/100/'),('详情应用',3,5,'module_application:myapp:detail',NULL,NULL,NULL,NULL,NULL,0,1,0,'详情应用','null',0,18,101,'37983db4-d172-4621-ab01-5ab18e3a5794','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/3/18/101/'),('查询应用',3,6,'module_application:myapp:query',NULL,NULL,NULL,NULL,NULL,0,1,0,'查询应用','null',0,18,102,'3fced896-d9fc-4cd4-9875-1861c784a239','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/3/18/102/'),('创建任务',3,1,'module_application:job:create',NULL,NULL,NULL,NULL,NULL,0,1,0,'创建任务','null',0,19,103,'589bf53a-4b80-4446-9f92-f27d72cddef9','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/3/19/103/'),('修改和操作任务',3,2,'module_application:job:update',NULL,NULL,NULL,NULL,NULL,0,1,0,'修改和操作任务','null',0,19,104,'71f748e4-8f6e-4e5b-94cb-41984e09d1f5','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/3/19/104/'),('删除和清除任务',3,3,'module_application:job:delete',NULL,NULL,NULL,NULL,NULL,0,1,0,'删除和清除任务','null',0,19,105,'7c323e09-76f6-4bd8-a6c0-644d35b94693','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/3/19/105/'),('导出定时任务',3,4,'module_application:job:export',NULL,NULL,NULL,NULL,NULL,0,1,0,'导出定时任务','null',0,19,106,'dad17cfc-19ca-472e-9b58-25d0e06f4057','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/3/19/106/'),('详情定时任务',3,5,'module_application:job:detail',NULL,NULL,NULL,NULL,NULL,0,1,0,'详情任务','null',0,19,107,'680439b9-2190-4dda-8b87-4fe0bece8919','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/3/19/107/'),('查询定时任务',3,6,'module_application:job:query',NULL,NULL,NULL,NULL,NULL,0,1,0,'查询定时任务','null',0,19,108,'bd3736e5-8c25-4858-891b-0fa9e8ee6bcb','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/3/19/108/'),('智能对话',3,1,'module_application:ai:chat',NULL,NULL,NULL,NULL,NULL,0,1,0,'智能对话','null',0,20,109,'40841301-1361-4c5f-af5b-9fafc92d498a','0','智能对话','2026-01-03 20:15:40','2026-01-03 20:15:40','/3/20/109/'),('在线用户强制下线',3,1,'module_monitor:online:delete',NULL,NULL,NULL,NULL,NULL,0,1,0,'在线用户强制下线','null',0,22,110,'b86c973c-6554-44fe-a8f9-3547b4e4c51d','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/4/22/110/'),('清除缓存',3,1,'module_monitor:cache:delete',NULL,NULL,NULL,NULL,NULL,0,1,0,'清除缓存','null',0,24,111,'a035a875-d730-422e-80de-37aec6c1a49c','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/4/24/111/'),('文件上传',3,1,'module_monitor:resource:upload',NULL,NULL,NULL,NULL,NULL,0,1,0,'文件上传','null',0,25,112,'db1d5cb3-b839-4d4b-b8ea-7cd76514ef8c','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/4/25/112/'),('文件下载',3,2,'module_monitor:resource:download',NULL,NULL,NULL,NULL,NULL,0,1,0,'文件下载','null',0,25,113,'076370a2-2ff2-4a46-b01f-8f1aac0d4b71','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/4/25/113/'),('文件删除',3,3,'module_monitor:resource:delete',NULL,NULL,NULL,NULL,NULL,0,1,0,'文件删除','null',0,25,114,'1de098f5-a21c-43fa-b825-8f8abf48ae92','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/4/25/114/'),('文件移动',3,4,'module_monitor:resource:move',NULL,NULL,NULL,NULL,NULL,0,1,0,'文件移动','null',0,25,115,'1f7ee57a-b1ea-4513-8cec-0deef018a787','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/4/25/115/'),('文件复制',3,5,'module_monitor:resource:copy',NULL,NULL,NULL,NULL,NULL,0,1,0,'文件复制','null',0,25,116,'53547c60-b049-413b-909b-02f340b78066','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/4/25/116/'),('文件重命名',3,6,'module_monitor:resource:rename',NULL,NULL,NULL,NULL,NULL,0,1,0,'文件重命名','null',0,25,117,'9ae32f22-be06-4753-a878-19321751fe27','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/4/25/117/'),('创建目录',3,7,'module_monitor:resource:create_dir',NULL,NULL,NULL,NULL,NULL,0,1,0,'创建目录','null',0,25,118,'92d91df4-1d57-4e84-9e51-a4eafad23bbd','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/4/25/118/'),('导出文件列表',3,9,'module_monitor:resource:export',NULL,NULL,NULL,NULL,NULL,0,1,0,'导出文件列表','null',0,25,119,'f6a748db-ba49-41da-afe9-18720604e037','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/4/25/119/'),('查询代码生成业务表列表',3,1,'module_generator:gencode:query',NULL,NULL,NULL,NULL,NULL,0,1,0,'查询代码生成业务表列表','null',0,26,120,'7c169e8a-dd9c-4955-9722-c3ca05d5c908','0','查询代码生成业务表列表','2026-01-03 20:15:40','2026-01-03 20:15:40','/5/26/120/'),('创建表结构',3,2,'module_generator:gencode:create',NULL,NULL,NULL,NULL,NULL,0,1,0,'创建表结构','null',0,26,121,'ddf13f80-8178-4133-926e-51d148f9300d','0','创建表结构','2026-01-03 20:15:40','2026-01-03 20:15:40','/5/26/121/'),('编辑业务表信息',3,3,'module_generator:gencode:update',NULL,NULL,NULL,NULL,NULL,0,1,0,'编辑业务表信息','null',0,26,122,'2bc87149-640c-40a4-85bc-2c9486b5f5bd','0','编辑业务表信息','2026-01-03 20:15:40','2026-01-03 20:15:40','/5/26/122/'),('删除业务表信息',3,4,'module_generator:gencode:delete',NULL,NULL,NULL,NULL,NULL,0,1,0,'删除业务表信息','null',0,26,123,'9590e6a5-83fb-47fe-ad10-5d71f67ee56d','0','删除业务表信息','2026-01-03 20:15:40','2026-01-03 20:15:40','/5/26/123/'),('导入表结构',3,5,'module_generator:gencode:import',NULL,NULL,NULL,NULL,NULL,0,1,0,'导入表结构','null',0,26,124,'10d28c8d-f0c9-4e4f-85f2-ea9a0aa36127','0','导入表结构','2026-01-03 20:15:40','2026-01-03 20:15:40','/5/26/124/'),('批量生成代码',3,6,'module_generator:gencode:operate',NULL,NULL,NULL,NULL,NULL,0,1,0,'批量生成代码','null',0,26,125,'1e42140f-53ce-4d27-aefe-352c5cbb3140','0','批量生成代码','2026-01-03 20:15:40','2026-01-03 20:15:40','/5/26/125/'),('生成代码到指定路径',3,7,'module_generator:gencode:code',NULL,NULL,NULL,NULL,NULL,0,1,0,'生成代码到指定路径','null',0,26,126,'b57a92e7-1715-4541-85b0-8514c04103b1','0','生成代码到指定路径','2026-01-03 20:15:40','2026-01-03 20:15:40','/5/26/126/'),('查询数据库表列表',3,8,'module_generator:dblist:query',NULL,NULL,NULL,NULL,NULL,0,1,0,'查询数据库表列表','null',0,26,127,'5686315b-843f-4bdd-b85f-ee48b68d5c06','0','查询数据库表列表','2026-01-03 20:15:40','2026-01-03 20:15:40','/5/26/127/'),('同步数据库',3,9,'module_generator:db:sync',NULL,NULL,NULL,NULL,NULL,0,1,0,'同步数据库','null',0,26,128,'09c5ab99-cce1-4086-ab11-5c8677ac05d5','0','同步数据库','2026-01-03 20:15:40','2026-01-03 20:15:40','/5/26/128/'),('创建示例',3,1,'module_example:demo:create',NULL,NULL,NULL,NULL,NULL,0,1,0,'创建示例','null',0,29,129,'240b81f0-cea2-4991-a20c-9b8660bcc062','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/7/29/129/'),('更新示例',3,2,'module_example:demo:update',NULL,NULL,NULL,NULL,NULL,0,1,0,'更新示例','null',0,29,130,'ed418b6a-d70f-429f-8aa1-482f82996557','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/7/29/130/'),('删除示例',3,3,'module_example:demo:delete',NULL,NULL,NULL,NULL,NULL,0,1,0,'删除示例','null',0,29,131,'02ff30ca-80d2-48e7-b150-bc44e449e761','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/7/29/131/'),('批量修改示例状态',3,4,'module_example:demo:patch',NULL,NULL,NULL,NULL,NULL,0,1,0,'批量修改示例状态','null',0,29,132,'444ed212-729e-4651-9751-30fa4b9fdb94','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/7/29/132/'),('导出示例',3,5,'module_example:demo:export',NULL,NULL,NULL,NULL,NULL,0,1,0,'导出示例','null',0,29,133,'a61b99e3-d0f9-435a-a1a4-9a0a86991f72','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/7/29/133/'),('导入示例',3,6,'module_example:demo:import',NULL,NULL,NULL,NULL,NULL,0,1,0,'导入示例','null',0,29,134,'b4693ca0-d8a6-46b1-a6d3-b0c2e3aa82cd','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/7/29/134/'),('下载导入示例模版',3,7,'module_example:demo:download',NULL,NULL,NULL,NULL,NULL,0,1,0,'下载导入示例模版','null',0,29,135,'4f57c2dc-d4a6-48c9-984a-45805713c138','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/7/29/135/'),('详情示例',3,8,'module_example:demo:detail',NULL,NULL,NULL,NULL,NULL,0,1,0,'详情示例','null',0,29,136,'46bdd3ae-ddac-4685-9264-5c039dd5958f','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/7/29/136/'),('查询示例',3,9,'module_example:demo:query',NULL,NULL,NULL,NULL,NULL,0,1,0,'查询示例','null',0,29,137,'52ef488f-6a6a-4d84-abd7-ff13da9f5e84','0','初始化数据','2026-01-03 20:15:40','2026-01-03 20:15:40','/7/29/137/');
 /*!40000 ALTER TABLE `sys_menu` ENABLE KEYS */;
 
 --
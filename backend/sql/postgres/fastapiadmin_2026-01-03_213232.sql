@@ -1326,7 +1326,8 @@ CREATE TABLE public.sys_dept (
     created_time timestamp without time zone NOT NULL,
     updated_time timestamp without time zone NOT NULL,
     created_id integer,
-    updated_id integer
+    updated_id integer,
+    tree_path character varying(255)
 );
 
 
@@ -1444,6 +1445,13 @@ COMMENT ON COLUMN public.sys_dept.created_id IS '创建人ID';
 COMMENT ON COLUMN public.sys_dept.updated_id IS '更新人ID';
 
 
+--
+-- Name: COLUMN sys_dept.tree_path; Type: COMMENT; Schema: public; Owner: tao
+--
+
+COMMENT ON COLUMN public.sys_dept.tree_path IS '物化路径(/根ID/.../自身ID/)';
+
+
 --
 -- Name: sys_dept_id_seq; Type: SEQUENCE; Schema: public; Owner: tao
 --
@@ -1937,7 +1945,8 @@ CREATE TABLE public.sys_menu (
     status character varying(10) NOT NULL,
     description text,
     created_time timestamp without time zone NOT NULL,
-    updated_time timestamp without time zone NOT NULL
+    updated_time timestamp without time zone NOT NULL,
+    tree_path character varying(255)
 );
 
 
@@ -2104,6 +2113,13 @@ COMMENT ON COLUMN public.sys_menu.created_time IS '创建时间';
 COMMENT ON COLUMN public.sys_menu.updated_time IS '更新时间';
 
 
+--
+-- Name: COLUMN sys_menu.tree_path; Type: COMMENT; Schema: public; Owner: tao
+--
+
+COMMENT ON COLUMN public.sys_menu.tree_path IS '物化路径(/根ID/.../自身ID/)';
+
+
 --
 -- Name: sys_menu_id_seq; Type: SEQUENCE; Schema: public; Owner: tao
 --
@@ -3144,8 +3160,8 @@ COPY public.gen_table_column (column_name, column_comment, column_type, column_l
 -- Data for Name: sys_dept; Type: TABLE DATA; Schema: public; Owner: tao
 --
 
-COPY public.sys_dept (name, "order", code, leader, phone, email, parent_id, id, uuid, status, description, created_time, updated_time, created_id, updated_id) FROM stdin;
-集团总公司	1	GROUP	部门负责人	1582112620	deptadmin@example.com	\N	1	8d654e65-99ff-4387-a37c-84d62a88a028	0	集团总公司	2026-01-03 21:32:18.926144	2026-01-03 21:32:18.926145	\N	\N
+COPY public.sys_dept (name, "order", code, leader, phone, email, parent_id, id, uuid, status, description, created_time, updated_time, created_id, updated_id, tree_path) FROM stdin;
+集团总公司	1	GROUP	部门负责人	1582112620	deptadmin@example.com	\N	1	8d654e65-99ff-4387-a37c-84d62a88a028	0	集团总公司	2026-01-03 21:32:18.926144	2026-01-03 21:32:18.926145	\N	\N	/1/
 \.
 
 
@@ -3221,144 +3237,144 @@ COPY public.sys_log (type, request_path, request_method, request_payload, reques
 -- Data for Name: sys_menu; Type: TABLE DATA; Schema: public; Owner: tao
 --
 
-COPY public.sys_menu (name, type, "order", permission, icon, route_name, route_path, component_path, redirect, hidden, keep_alive, always_show, title, params, affix, parent_id, id, uuid, status, description, created_time, updated_time) FROM stdin;
-仪表盘	1	1		client	Dashboard	/dashboard	\N	/dashboard/workplace	f	t	t	仪表盘	null	f	\N	1	cb8697f1-d99f-486f-a35d-ca588d00ecee	0	初始化数据	2026-01-03 21:32:18.905383	2026-01-03 21:32:18.905387
-系统管理	1	2	\N	system	System	/system	\N	/system/menu	f	t	f	系统管理	null	f	\N	2	8686a005-e6f2-4f27-a592-dd1e33c1c5e7	0	初始化数据	2026-01-03 21:32:18.905392	2026-01-03 21:32:18.905392
-应用管理	1	3	\N	el-icon-ShoppingBag	Application	/application	\N	/application/myapp	f	t	f	应用管理	null	f	\N	3	aed230c6-6a2f-47a2-ae17-19a36111987f	0	初始化数据	2026-01-03 21:32:18.905395	2026-01-03 21:32:18.905395
-监控管理	1	4	\N	monitor	Monitor	/monitor	\N	/monitor/online	f	t	f	监控管理	null	f	\N	4	f94f6492-288a-4df3-b6a2-37eaec7f7b6f	0	初始化数据	2026-01-03 21:32:18.905398	2026-01-03 21:32:18.905399
-代码管理	1	5	\N	code	Generator	/generator	\N	/generator/gencode	f	t	f	代码管理	null	f	\N	5	9a68972f-7c40-4104-97b1-372213d500c1	0	代码管理	2026-01-03 21:32:18.905401	2026-01-03 21:32:18.905402
-接口管理	1	6	\N	document	Common	/common	\N	/common/docs	f	t	f	接口管理	null	f	\N	6	75341f65-6da9-4bd6-a9c1-eab807edd5fb	0	初始化数据	2026-01-03 21:32:18.905405	2026-01-03 21:32:18.905405
-案例管理	1	7	\N	menu	Example	/example	\N	/example/demo	f	t	f	案例管理	null	f	\N	7	5145f454-4bd1-48c9-a780-c809cfcf669e	0	案例管理	2026-01-03 21:32:18.905408	2026-01-03 21:32:18.905408
-工作台	2	1	dashboard:workplace:query	el-icon-PieChart	Workplace	/dashboard/workplace	dashboard/workplace	\N	f	t	f	工作台	null	f	1	8	15605dd7-2ab4-4ad4-b2e6-3a32976d4c1a	0	初始化数据	2026-01-03 21:32:18.907989	2026-01-03 21:32:18.907991
-菜单管理	2	1	module_system:menu:query	menu	Menu	/system/menu	module_system/menu/index	\N	f	t	f	菜单管理	null	f	2	9	7ba1cbc7-4822-472a-a239-647ef5807fb8	0	初始化数据	2026-01-03 21:32:18.907995	2026-01-03 21:32:18.907996
-部门管理	2	2	module_system:dept:query	tree	Dept	/system/dept	module_system/dept/index	\N	f	t	f	部门管理	null	f	2	10	4d852241-ce79-45b2-aac2-cb683b4fe502	0	初始化数据	2026-01-03 21:32:18.907999	2026-01-03 21:32:18.907999
-岗位管理	2	3	module_system:position:query	el-icon-Coordinate	Position	/system/position	module_system/position/index	\N	f	t	f	岗位管理	null	f	2	11	0515619f-cc9c-4a94-a11b-4c56c14a7ad7	0	初始化数据	2026-01-03 21:32:18.908002	2026-01-03 21:32:18.908003
-角色管理	2	4	module_system:role:query	role	Role	/system/role	module_system/role/index	\N	f	t	f	角色管理	null	f	2	12	680024f6-08da-4141-a993-452a0bbbc008	0	初始化数据	2026-01-03 21:32:18.908005	2026-01-03 21:32:18.908006
-用户管理	2	5	module_system:user:query	el-icon-User	User	/system/user	module_system/user/index	\N	f	t	f	用户管理	null	f	2	13	9900d01f-556f-4580-a09a-aecd51a99c86	0	初始化数据	2026-01-03 21:32:18.908009	2026-01-03 21:32:18.908009
-日志管理	2	6	module_system:log:query	el-icon-Aim	Log	/system/log	module_system/log/index	\N	f	t	f	日志管理	null	f	2	14	4cf02289-e5d6-4fd4-8a35-2415dec384fa	0	初始化数据	2026-01-03 21:32:18.908012	2026-01-03 21:32:18.908012
-公告管理	2	7	module_system:notice:query	bell	Notice	/system/notice	module_system/notice/index	\N	f	t	f	公告管理	null	f	2	15	c4cac9c7-d750-4b27-9731-039149f2897d	0	初始化数据	2026-01-03 21:32:18.908015	2026-01-03 21:32:18.908015
-参数管理	2	8	module_system:param:query	setting	Params	/system/param	module_system/param/index	\N	f	t	f	参数管理	null	f	2	16	2385358e-b01c-4a48-93e0-d3b85f18438b	0	初始化数据	2026-01-03 21:32:18.908018	2026-01-03 21:32:18.908018
-字典管理	2	9	module_system:dict_type:query	dict	Dict	/system/dict	module_system/dict/index	\N	f	t	f	字典管理	null	f	2	17	b9da7600-bbc3-48b9-86bd-c87d99e782e8	0	初始化数据	2026-01-03 21:32:18.908021	2026-01-03 21:32:18.908021
-我的应用	2	1	module_application:myapp:query	el-icon-ShoppingCartFull	MYAPP	/application/myapp	module_application/myapp/index	\N	f	t	f	我的应用	null	f	3	18	4b89ed0b-c1c2-4a08-95a9-c0aff320fbbf	0	初始化数据	2026-01-03 21:32:18.908024	2026-01-03 21:32:18.908024
-任务管理	2	2	module_application:job:query	el-icon-DataLine	Job	/application/job	module_application/job/index	\N	f	t	f	任务管理	null	f	3	19	586828bb-10f6-4eff-82b9-1ac747bafef2	0	初始化数据	2026-01-03 21:32:18.908027	2026-01-03 21:32:18.908027
-AI智能助手	2	3	module_application:ai:chat	el-icon-ToiletPaper	AI	/application/ai	module_application/ai/index	\N	f	t	f	AI智能助手	null	f	3	20	be03f057-ed7d-4c9e-9cb3-a17eabc58920	0	AI智能助手	2026-01-03 21:32:18.90803	2026-01-03 21:32:18.90803
-流程管理	2	4	module_application:workflow:query	el-icon-ShoppingBag	Workflow	/application/workflow	module_application/workflow/index	\N	f	t	f	我的流程	null	f	3	21	b3e1ec0a-4411-4909-9b91-b11fa7cb56ae	0	我的流程	2026-01-03 21:32:18.908033	2026-01-03 21:32:18.908034
-在线用户	2	1	module_monitor:online:query	el-icon-Headset	MonitorOnline	/monitor/online	module_monitor/online/index	\N	f	t	f	在线用户	null	f	4	22	bd3696da-f6cd-4d37-b2d3-458c0653c86b	0	初始化数据	2026-01-03 21:32:18.908036	2026-01-03 21:32:18.908037
-服务器监控	2	2	module_monitor:server:query	el-icon-Odometer	MonitorServer	/monitor/server	module_monitor/server/index	\N	f	t	f	服务器监控	null	f	4	23	da8f2dd6-a3c8-4d0e-b4b8-995baafa47a4	0	初始化数据	2026-01-03 21:32:18.908039	2026-01-03 21:32:18.90804
-缓存监控	2	3	module_monitor:cache:query	el-icon-Stopwatch	MonitorCache	/monitor/cache	module_monitor/cache/index	\N	f	t	f	缓存监控	null	f	4	24	4a738c1e-2d6a-4c43-abf7-0ead777544df	0	初始化数据	2026-01-03 21:32:18.908042	2026-01-03 21:32:18.908043
-文件管理	2	4	module_monitor:resource:query	el-icon-Files	Resource	/monitor/resource	module_monitor/resource/index	\N	f	t	f	文件管理	null	f	4	25	b57d3b59-82a1-4430-8b8a-7545c296f86a	0	初始化数据	2026-01-03 21:32:18.908045	2026-01-03 21:32:18.908046
-代码生成	2	1	module_generator:gencode:query	code	GenCode	/generator/gencode	module_generator/gencode/index	\N	f	t	f	代码生成	null	f	5	26	d7bba83a-d934-4692-976c-56a43e69665a	0	代码生成	2026-01-03 21:32:18.908048	2026-01-03 21:32:18.908049
-Swagger文档	4	1	module_common:docs:query	api	Docs	/common/docs	module_common/docs/index	\N	f	t	f	Swagger文档	null	f	6	27	f8d27069-6348-474d-9338-f063cdeab56e	0	初始化数据	2026-01-03 21:32:18.908052	2026-01-03 21:32:18.908052
-Redoc文档	4	2	module_common:redoc:query	el-icon-Document	Redoc	/common/redoc	module_common/redoc/index	\N	f	t	f	Redoc文档	null	f	6	28	572fd0dc-26c6-480a-a142-223da6de2697	0	初始化数据	2026-01-03 21:32:18.908054	2026-01-03 21:32:18.908055
-示例管理	2	1	module_example:demo:query	menu	Demo	/example/demo	module_example/demo/index	\N	f	t	f	示例管理	null	f	7	29	8bdeda95-8219-48ef-abe4-cba88a251e88	0	示例管理	2026-01-03 21:32:18.908057	2026-01-03 21:32:18.908058
-创建菜单	3	1	module_system:menu:create	\N	\N	\N	\N	\N	f	t	f	创建菜单	null	f	9	30	d7e7d1da-e452-422f-a05b-3220b5534abc	0	初始化数据	2026-01-03 21:32:18.911445	2026-01-03 21:32:18.911447
-修改菜单	3	2	module_system:menu:update	\N	\N	\N	\N	\N	f	t	f	修改菜单	null	f	9	31	82b62e27-b2d0-44b1-9319-9f8b2160be2a	0	初始化数据	2026-01-03 21:32:18.91145	2026-01-03 21:32:18.91145
-删除菜单	3	3	module_system:menu:delete	\N	\N	\N	\N	\N	f	t	f	删除菜单	null	f	9	32	d796f75f-ea78-41fa-a6f6-d8b3cc9698db	0	初始化数据	2026-01-03 21:32:18.911453	2026-01-03 21:32:18.911453
-批量修改菜单状态	3	4	module_system:menu:patch	\N	\N	\N	\N	\N	f	t	f	批量修改菜单状态	null	f	9	33	5e130db5-b6f1-40ae-bba6-f8f08bc433be	0	初始化数据	2026-01-03 21:32:18.911456	2026-01-03 21:32:18.911456
-详情改菜	3	5	module_system:menu:detail	\N	\N	\N	\N	\N	f	t	f	详情改菜	null	f	9	34	5f31aeb8-beda-46fc-8715-5bc807787c38	0	初始化数据	2026-01-03 21:32:18.911459	2026-01-03 21:32:18.911459
-查询菜单	3	6	module_system:menu:query	\N	\N	\N	\N	\N	f	t	f	查询菜单	null	f	9	35	a0f600b3-b948-4197-a162-b0f0019e0029	0	初始化数据	2026-01-03 21:32:18.911462	2026-01-03 21:32:18.911462
-创建部门	3	1	module_system:dept:create	\N	\N	\N	\N	\N	f	t	f	创建部门	null	f	10	36	d699fba9-3c38-4f6d-aaad-e0fe1c6e4ef9	0	初始化数据	2026-01-03 21:32:18.911465	2026-01-03 21:32:18.911465
-修改部门	3	2	module_system:dept:update	\N	\N	\N	\N	\N	f	t	f	修改部门	null	f	10	37	7fbc26de-231f-47e5-a776-549bc1d6e8da	0	初始化数据	2026-01-03 21:32:18.911468	2026-01-03 21:32:18.911468
-删除部门	3	3	module_system:dept:delete	\N	\N	\N	\N	\N	f	t	f	删除部门	null	f	10	38	e2adf21d-20b9-4a66-b3e9-22dd97067f47	0	初始化数据	2026-01-03 21:32:18.911471	2026-01-03 21:32:18.911471
-批量修改部门状态	3	4	module_system:dept:patch	\N	\N	\N	\N	\N	f	t	f	批量修改部门状态	null	f	10	39	174fc5cc-f3d0-48e5-a2f2-4d5d3768601f	0	初始化数据	2026-01-03 21:32:18.911474	2026-01-03 21:32:18.911474
-详情部门	3	5	module_system:dept:detail	\N	\N	\N	\N	\N	f	t	f	详情部门	null	f	10	40	0cd163e8-e13d-4e54-af81-4d3b51fb8421	0	初始化数据	2026-01-03 21:32:18.911477	2026-01-03 21:32:18.911477
-查询部门	3	6	module_system:dept:query	\N	\N	\N	\N	\N	f	t	f	查询部门	null	f	10	41	39776689-4fb6-47a6-acbc-cd0f63a88113	0	初始化数据	2026-01-03 21:32:18.91148	2026-01-03 21:32:18.91148
-创建岗位	3	1	module_system:position:create	\N	\N	\N	\N	\N	f	t	f	创建岗位	null	f	11	42	6087b1ed-b52a-4a71-bbfe-74cd6d16752d	0	初始化数据	2026-01-03 21:32:18.911483	2026-01-03 21:32:18.911483
-修改岗位	3	2	module_system:position:update	\N	\N	\N	\N	\N	f	t	f	修改岗位	null	f	11	43	c81de02c-8781-47b3-804d-e8b572f2b1d1	0	初始化数据	2026-01-03 21:32:18.911485	2026-01-03 21:32:18.911486
-删除岗位	3	3	module_system:position:delete	\N	\N	\N	\N	\N	f	t	f	修改岗位	null	f	11	44	9ada8ac9-50c3-4251-88a6-1cea182b6e23	0	初始化数据	2026-01-03 21:32:18.911488	2026-01-03 21:32:18.911489
-批量修改岗位状态	3	4	module_system:position:patch	\N	\N	\N	\N	\N	f	t	f	批量修改岗位状态	null	f	11	45	bfcd71e3-b90e-4dfd-bb99-1e58ec411745	0	初始化数据	2026-01-03 21:32:18.911491	2026-01-03 21:32:18.911491
-岗位导出	3	5	module_system:position:export	\N	\N	\N	\N	\N	f	t	f	岗位导出	null	f	11	46	e4f86a4d-b64c-484c-833f-5fcf7f55273c	0	初始化数据	2026-01-03 21:32:18.911494	2026-01-03 21:32:18.911494
-详情岗位	3	6	module_system:position:detail	\N	\N	\N	\N	\N	f	t	f	详情岗位	null	f	11	47	5cbfc463-d1b2-4268-af93-2bd80012a80c	0	初始化数据	2026-01-03 21:32:18.911497	2026-01-03 21:32:18.911497
-查询岗位	3	7	module_system:position:query	\N	\N	\N	\N	\N	f	t	f	查询岗位	null	f	11	48	20aaaf6d-f02e-422e-8800-48e1c0ae9dd7	0	初始化数据	2026-01-03 21:32:18.911499	2026-01-03 21:32:18.9115
-创建角色	3	1	module_system:role:create	\N	\N	\N	\N	\N	f	t	f	创建角色	null	f	12	49	f7f2a522-4d2f-4ae2-b081-fc455b5fd869	0	初始化数据	2026-01-03 21:32:18.911502	2026-01-03 21:32:18.911503
-修改角色	3	2	module_system:role:update	\N	\N	\N	\N	\N	f	t	f	修改角色	null	f	12	50	0c7738be-cf93-42cd-a77b-473262ba35b8	0	初始化数据	2026-01-03 21:32:18.911505	2026-01-03 21:32:18.911506
-删除角色	3	3	module_system:role:delete	\N	\N	\N	\N	\N	f	t	f	删除角色	null	f	12	51	d74eb083-c965-4002-9cab-d28c944941e8	0	初始化数据	2026-01-03 21:32:18.911508	2026-01-03 21:32:18.911509
-批量修改角色状态	3	4	module_system:role:patch	\N	\N	\N	\N	\N	f	t	f	批量修改角色状态	null	f	12	52	8f3181f4-3797-4c8d-9727-73b65e83dc13	0	初始化数据	2026-01-03 21:32:18.911511	2026-01-03 21:32:18.911512
-角色导出	3	5	module_system:role:export	\N	\N	\N	\N	\N	f	t	f	角色导出	null	f	12	53	0409184f-4e47-4e5b-ab46-06977ac912ee	0	初始化数据	2026-01-03 21:32:18.911514	2026-01-03 21:32:18.911515
-详情角色	3	6	module_system:role:detail	\N	\N	\N	\N	\N	f	t	f	详情角色	null	f	12	54	1a1a37ae-f6f6-471d-a296-382edebfedb8	0	初始化数据	2026-01-03 21:32:18.911517	2026-01-03 21:32:18.911518
-查询角色	3	7	module_system:role:query	\N	\N	\N	\N	\N	f	t	f	查询角色	null	f	12	55	81bd5583-a5e7-403e-9388-fd7b5be62d50	0	初始化数据	2026-01-03 21:32:18.91152	2026-01-03 21:32:18.91152
-创建用户	3	1	module_system:user:create	\N	\N	\N	\N	\N	f	t	f	创建用户	null	f	13	56	1b409e37-c8e1-4b32-9842-96d4d5870769	0	初始化数据	2026-01-03 21:32:18.911523	2026-01-03 21:32:18.911523
-修改用户	3	2	module_system:user:update	\N	\N	\N	\N	\N	f	t	f	修改用户	null	f	13	57	89d8146a-0a01-42f0-8249-538c65fcb20a	0	初始化数据	2026-01-03 21:32:18.911526	2026-01-03 21:32:18.911526
-删除用户	3	3	module_system:user:delete	\N	\N	\N	\N	\N	f	t	f	删除用户	null	f	13	58	58fee4f1-cf15-4b41-ac10-d07246b4ee59	0	初始化数据	2026-01-03 21:32:18.911529	2026-01-03 21:32:18.911529
-批量修改用户状态	3	4	module_system:user:patch	\N	\N	\N	\N	\N	f	t	f	批量修改用户状态	null	f	13	59	c7df3326-7d54-4a34-85f6-0ba84c2f00bf	0	初始化数据	2026-01-03 21:32:18.911532	2026-01-03 21:32:18.911532
-导出用户	3	5	module_system:user:export	\N	\N	\N	\N	\N	f	t	f	导出用户	null	f	13	60	e7a89f3c-7add-4580-a6f6-fd4c27893973	0	初始化数据	2026-01-03 21:32:18.911534	2026-01-03 21:32:18.911535
-导入用户	3	6	module_system:user:import	\N	\N	\N	\N	\N	f	t	f	导入用户	null	f	13	61	79e9601e-1ded-4883-8ef4-f0602d5c1767	0	初始化数据	2026-01-03 21:32:18.911537	2026-01-03 21:32:18.911538
-下载用户导入模板	3	7	module_system:user:download	\N	\N	\N	\N	\N	f	t	f	下载用户导入模板	null	f	13	62	9af6e9b9-71ce-4dfc-8df3-a97a6556d115	0	初始化数据	2026-01-03 21:32:18.91154	2026-01-03 21:32:18.91154
-详情用户	3	8	module_system:user:detail	\N	\N	\N	\N	\N	f	t	f	详情用户	null	f	13	63	5ae4fded-90d9-4d28-b93b-1d78a71a3ad6	0	初始化数据	2026-01-03 21:32:18.911543	2026-01-03 21:32:18.911543
-查询用户	3	9	module_system:user:query	\N	\N	\N	\N	\N	f	t	f	查询用户	null	f	13	64	a26b1bd7-d863-4c6c-80f5-da4e6fa9d34b	0	初始化数据	2026-01-03 21:32:18.911546	2026-01-03 21:32:18.911546
-日志删除	3	1	module_system:log:delete	\N	\N	\N	\N	\N	f	t	f	日志删除	null	f	14	65	7ed74443-10e7-40e9-b7d2-99b814597417	0	初始化数据	2026-01-03 21:32:18.911548	2026-01-03 21:32:18.911549
-日志导出	3	2	module_system:log:export	\N	\N	\N	\N	\N	f	t	f	日志导出	null	f	14	66	cab97ed3-a0fe-4a37-8a86-9d394e7de088	0	初始化数据	2026-01-03 21:32:18.911551	2026-01-03 21:32:18.911551
-日志详情	3	3	module_system:log:detail	\N	\N	\N	\N	\N	f	t	f	日志详情	null	f	14	67	d4964258-ec78-4e05-98f1-0174bb914cc4	0	初始化数据	2026-01-03 21:32:18.911554	2026-01-03 21:32:18.911554
-查询日志	3	4	module_system:log:query	\N	\N	\N	\N	\N	f	t	f	查询日志	null	f	14	68	b4e13038-5e5e-4a1b-8b32-b0132b5271c5	0	初始化数据	2026-01-03 21:32:18.911557	2026-01-03 21:32:18.911557
-公告创建	3	1	module_system:notice:create	\N	\N	\N	\N	\N	f	t	f	公告创建	null	f	15	69	dd2c2504-743e-48e3-a758-f9aa2bcdcd83	0	初始化数据	2026-01-03 21:32:18.911559	2026-01-03 21:32:18.91156
-公告修改	3	2	module_system:notice:update	\N	\N	\N	\N	\N	f	t	f	修改用户	null	f	15	70	3daceab3-ec00-4fc8-bd3a-dac224b727e0	0	初始化数据	2026-01-03 21:32:18.911562	2026-01-03 21:32:18.911564
-公告删除	3	3	module_system:notice:delete	\N	\N	\N	\N	\N	f	t	f	公告删除	null	f	15	71	4966506d-bc03-4df9-b0e5-9a1a78946357	0	初始化数据	2026-01-03 21:32:18.911567	2026-01-03 21:32:18.911567
-公告导出	3	4	module_system:notice:export	\N	\N	\N	\N	\N	f	t	f	公告导出	null	f	15	72	fc4a35a3-8795-4d58-859d-31be25af894f	0	初始化数据	2026-01-03 21:32:18.911571	2026-01-03 21:32:18.911571
-公告批量修改状态	3	5	module_system:notice:patch	\N	\N	\N	\N	\N	f	t	f	公告批量修改状态	null	f	15	73	f41bfd30-e52c-4ac8-a008-27f5d4fde5de	0	初始化数据	2026-01-03 21:32:18.911575	2026-01-03 21:32:18.911575
-公告详情	3	6	module_system:notice:detail	\N	\N	\N	\N	\N	f	t	f	公告详情	null	f	15	74	8a129bcf-53fb-4c73-872b-8e281d09bb1d	0	初始化数据	2026-01-03 21:32:18.911579	2026-01-03 21:32:18.911579
-查询公告	3	5	module_system:notice:query	\N	\N	\N	\N	\N	f	t	f	查询公告	null	f	15	75	3f24b0f2-5d84-4e98-9097-d90f6276678c	0	初始化数据	2026-01-03 21:32:18.911582	2026-01-03 21:32:18.911583
-创建参数	3	1	module_system:param:create	\N	\N	\N	\N	\N	f	t	f	创建参数	null	f	16	76	8513bd00-0f00-4cd6-a76a-1e83e194a4e4	0	初始化数据	2026-01-03 21:32:18.911586	2026-01-03 21:32:18.911587
-修改参数	3	2	module_system:param:update	\N	\N	\N	\N	\N	f	t	f	修改参数	null	f	16	77	36a7d50e-34a1-462b-b388-b9d6d8539ad2	0	初始化数据	2026-01-03 21:32:18.91159	2026-01-03 21:32:18.911591
-删除参数	3	3	module_system:param:delete	\N	\N	\N	\N	\N	f	t	f	删除参数	null	f	16	78	505028b6-0362-4792-9b86-4edd40f81ffd	0	初始化数据	2026-01-03 21:32:18.911594	2026-01-03 21:32:18.911594
-导出参数	3	4	module_system:param:export	\N	\N	\N	\N	\N	f	t	f	导出参数	null	f	16	79	2c5d2b14-366f-4632-930b-0396b6ac4bd3	0	初始化数据	2026-01-03 21:32:18.911598	2026-01-03 21:32:18.911598
-参数上传	3	5	module_system:param:upload	\N	\N	\N	\N	\N	f	t	f	参数上传	null	f	16	80	60aee432-dd9b-448c-b527-18b49c7d137a	0	初始化数据	2026-01-03 21:32:18.911602	2026-01-03 21:32:18.911602
-参数详情	3	6	module_system:param:detail	\N	\N	\N	\N	\N	f	t	f	参数详情	null	f	16	81	c87eb5ed-62a1-4cd4-8851-0e00cb69b2cc	0	初始化数据	2026-01-03 21:32:18.911605	2026-01-03 21:32:18.911605
-查询参数	3	7	module_system:param:query	\N	\N	\N	\N	\N	f	t	f	查询参数	null	f	16	82	d44dccb9-3b72-4e56-bff4-842ccab4cf6a	0	初始化数据	2026-01-03 21:32:18.911608	2026-01-03 21:32:18.911608
-创建字典类型	3	1	module_system:dict_type:create	\N	\N	\N	\N	\N	f	t	f	创建字典类型	null	f	17	83	9550ae0d-72c5-4594-b478-a5fae5b27fc9	0	初始化数据	2026-01-03 21:32:18.911611	2026-01-03 21:32:18.911611
-修改字典类型	3	2	module_system:dict_type:update	\N	\N	\N	\N	\N	f	t	f	修改字典类型	null	f	17	84	6c9762a7-0846-40df-82ba-4472ca2b5881	0	初始化数据	2026-01-03 21:32:18.911614	2026-01-03 21:32:18.911614
-删除字典类型	3	3	module_system:dict_type:delete	\N	\N	\N	\N	\N	f	t	f	删除字典类型	null	f	17	85	7f8d933f-dee6-4dde-b72f-707a7f1b7e49	0	初始化数据	2026-01-03 21:32:18.911617	2026-01-03 21:32:18.911617
-导出字典类型	3	4	module_system:dict_type:export	\N	\N	\N	\N	\N	f	t	f	导出字典类型	null	f	17	86	5d14d903-230c-413a-8bba-b70e6b91d33c	0	初始化数据	2026-01-03 21:32:18.911619	2026-01-03 21:32:18.91162
-批量修改字典状态	3	5	module_system:dict_type:patch	\N	\N	\N	\N	\N	f	t	f	导出字典类型	null	f	17	87	d1712e01-35ac-443b-aece-06c62c0ab088	0	初始化数据	2026-01-03 21:32:18.911622	2026-01-03 21:32:18.911623
-字典数据查询	3	6	module_system:dict_data:query	\N	\N	\N	\N	\N	f	t	f	字典数据查询	null	f	17	88	1565475c-f3a9-4bbb-b93b-5e220467cc81	0	初始化数据	2026-01-03 21:32:18.911625	2026-01-03 21:32:18.911625
-创建字典数据	3	7	module_system:dict_data:create	\N	\N	\N	\N	\N	f	t	f	创建字典数据	null	f	17	89	578edd73-25f7-43bb-9f8b-1502e6a028d3	0	初始化数据	2026-01-03 21:32:18.911628	2026-01-03 21:32:18.911628
-修改字典数据	3	8	module_system:dict_data:update	\N	\N	\N	\N	\N	f	t	f	修改字典数据	null	f	17	90	71a3bab7-d934-484c-aa9a-e7a7266cddc5	0	初始化数据	2026-01-03 21:32:18.911631	2026-01-03 21:32:18.911631
-删除字典数据	3	9	module_system:dict_data:delete	\N	\N	\N	\N	\N	f	t	f	删除字典数据	null	f	17	91	e336aadd-a4fa-41f7-8649-7269ec57f691	0	初始化数据	2026-01-03 21:32:18.911634	2026-01-03 21:32:18.911634
-导出字典数据	3	10	module_system:dict_data:export	\N	\N	\N	\N	\N	f	t	f	导出字典数据	null	f	17	92	3595a298-ff90-400a-bbb7-b22b5991b53d	0	初始化数据	2026-01-03 21:32:18.911636	2026-01-03 21:32:18.911637
-批量修改字典数据状态	3	11	module_system:dict_data:patch	\N	\N	\N	\N	\N	f	t	f	批量修改字典数据状态	null	f	17	93	f19ece16-4c9e-4e36-9d40-e95119439dba	0	初始化数据	2026-01-03 21:32:18.911639	2026-01-03 21:32:18.911639
-详情字典类型	3	12	module_system:dict_type:detail	\N	\N	\N	\N	\N	f	t	f	详情字典类型	null	f	17	94	8c8a3c93-4b81-4f2a-9f19-69d55289bed0	0	初始化数据	2026-01-03 21:32:18.911642	2026-01-03 21:32:18.911642
-查询字典类型	3	13	module_system:dict_type:query	\N	\N	\N	\N	\N	f	t	f	查询字典类型	null	f	17	95	3c086e98-80be-43a9-bf92-9e549ce52001	0	初始化数据	2026-01-03 21:32:18.911645	2026-01-03 21:32:18.911645
-详情字典数据	3	14	module_system:dict_data:detail	\N	\N	\N	\N	\N	f	t	f	详情字典数据	null	f	17	96	7747b9b0-4876-4379-838c-71746abf40d3	0	初始化数据	2026-01-03 21:32:18.911647	2026-01-03 21:32:18.911648
-创建应用	3	1	module_application:myapp:create	\N	\N	\N	\N	\N	f	t	f	创建应用	null	f	18	97	6597310c-0997-4adf-ab77-a3abf3c06fdb	0	初始化数据	2026-01-03 21:32:18.91165	2026-01-03 21:32:18.91165
-修改应用	3	2	module_application:myapp:update	\N	\N	\N	\N	\N	f	t	f	修改应用	null	f	18	98	bf921c89-86aa-429c-b00d-92b9b4267451	0	初始化数据	2026-01-03 21:32:18.911653	2026-01-03 21:32:18.911653
-删除应用	3	3	module_application:myapp:delete	\N	\N	\N	\N	\N	f	t	f	删除应用	null	f	18	99	dcd2b033-e1ff-4361-abb9-499358d7533b	0	初始化数据	2026-01-03 21:32:18.911656	2026-01-03 21:32:18.911656
-批量修改应用状态	3	4	module_application:myapp:patch	\N	\N	\N	\N	\N	f	t	f	批量修改应用状态	null	f	18	100	abde1610-99f2-4366-9cbf-dbc0991a9aa3	0	初始化数据	2026-01-03 21:32:18.911658	2026-01-03 21:32:18.911659
-详情应用	3	5	module_application:myapp:detail	\N	\N	\N	\N	\N	f	t	f	详情应用	null	f	18	101	e4ec94d0-7514-4423-80aa-c3e6f6a9e840	0	初始化数据	2026-01-03 21:32:18.911661	2026-01-03 21:32:18.911662
-查询应用	3	6	module_application:myapp:query	\N	\N	\N	\N	\N	f	t	f	查询应用	null	f	18	102	3f4ad15e-a846-43ba-81b7-c07998fae40e	0	初始化数据	2026-01-03 21:32:18.911664	2026-01-03 21:32:18.911665
-创建任务	3	1	module_application:job:create	\N	\N	\N	\N	\N	f	t	f	创建任务	null	f	19	103	f3bd89ed-6be3-4b1b-9c8d-5f1473074c6a	0	初始化数据	2026-01-03 21:32:18.911667	2026-01-03 21:32:18.911667
-修改和操作任务	3	2	module_application:job:update	\N	\N	\N	\N	\N	f	t	f	修改和操作任务	null	f	19	104	af780bd5-d542-422f-8714-17a67628b705	0	初始化数据	2026-01-03 21:32:18.91167	2026-01-03 21:32:18.91167
-删除和清除任务	3	3	module_application:job:delete	\N	\N	\N	\N	\N	f	t	f	删除和清除任务	null	f	19	105	1b6d0689-87fe-4092-9407-7da413b99786	0	初始化数据	2026-01-03 21:32:18.911672	2026-01-03 21:32:18.911673
-导出定时任务	3	4	module_application:job:export	\N	\N	\N	\N	\N	f	t	f	导出定时任务	null	f	19	106	5e1b35b0-c349-41a6-8873-e80787e5a00b	0	初始化数据	2026-01-03 21:32:18.911675	2026-01-03 21:32:18.911676
-详情定时任务	3	5	module_application:job:detail	\N	\N	\N	\N	\N	f	t	f	详情任务	null	f	19	107	7e9c0d83-f381-42c9-a0a0-448680e8c36c	0	初始化数据	2026-01-03 21:32:18.91168	2026-01-03 21:32:18.911681
-查询定时任务	3	6	module_application:job:query	\N	\N	\N	\N	\N	f	t	f	查询定时任务	null	f	19	108	9020114f-35f2-4383-9659-b72f2ff9d72a	0	初始化数据	2026-01-03 21:32:18.911684	2026-01-03 21:32:18.911684
-智能对话	3	1	module_application:ai:chat	\N	\N	\N	\N	\N	f	t	f	智能对话	null	f	20	109	353ee35e-c3c1-4ee1-8a64-324bdc7f1d96	0	智能对话	2026-01-03 21:32:18.911686	2026-01-03 21:32:18.911687
-在线用户强制下线	3	1	module_monitor:online:delete	\N	\N	\N	\N	\N	f	t	f	在线用户强制下线	null	f	22	110	0edf0de3-ae8d-4a47-9e43-74ac1ff9a8a9	0	初始化数据	2026-01-03 21:32:18.911689	2026-01-03 21:32:18.91169
-清除缓存	3	1	module_monitor:cache:delete	\N	\N	\N	\N	\N	f	t	f	清除缓存	null	f	24	111	8ba7c514-fcfe-4bf7-a3fb-3683e2a2927c	0	初始化数据	2026-01-03 21:32:18.911692	2026-01-03 21:32:18.911693
-文件上传	3	1	module_monitor:resource:upload	\N	\N	\N	\N	\N	f	t	f	文件上传	null	f	25	112	2e1be8fb-fa3e-422b-baeb-491ca1b39a25	0	初始化数据	2026-01-03 21:32:18.911695	2026-01-03 21:32:18.911695
-文件下载	3	2	module_monitor:resource:download	\N	\N	\N	\N	\N	f	t	f	文件下载	null	f	25	113	5876d559-7e73-4f02-bb76-447a5d20a452	0	初始化数据	2026-01-03 21:32:18.911698	2026-01-03 21:32:18.911698
-文件删除	3	3	module_monitor:resource:delete	\N	\N	\N	\N	\N	f	t	f	文件删除	null	f	25	114	a37dfbdc-dd4a-43f0-82f5-ff2ad50481ec	0	初始化数据	2026-01-03 21:32:18.911701	2026-01-03 21:32:18.911701
-文件移动	3	4	module_monitor:resource:move	\N	\N	\N	\N	\N	f	t	f	文件移动	null	f	25	115	99cf44db-1661-4fd6-8d7d-1d9fd0e963d2	0	初始化数据	2026-01-03 21:32:18.911704	2026-01-03 21:32:18.911704
-文件复制	3	5	module_monitor:resource:copy	\N	\N	\N	\N	\N	f	t	f	文件复制	null	f	25	116	43eeccb8-f09e-4a35-9df7-04009fd7ffd4	0	初始化数据	2026-01-03 21:32:18.911706	2026-01-03 21:32:18.911707
-文件重命名	3	6	module_monitor:resource:rename	\N	\N	\N	\N	\N	f	t	f	文件重命名	null	f	25	117	c8fd4446-9147-4dd0-9dbb-b7ad7531edb2	0	初始化数据	2026-01-03 21:32:18.911709	2026-01-03 21:32:18.911709
-创建目录	3	7	module_monitor:resource:create_dir	\N	\N	\N	\N	\N	f	t	f	创建目录	null	f	25	118	d2c29d13-d63c-41e0-9798-db94fdd06e38	0	初始化数据	2026-01-03 21:32:18.911712	2026-01-03 21:32:18.911712
-导出文件列表	3	9	module_monitor:resource:export	\N	\N	\N	\N	\N	f	t	f	导出文件列表	null	f	25	119	5bb86efe-3d16-41d9-a3e6-e1e22cc8683c	0	初始化数据	2026-01-03 21:32:18.911715	2026-01-03 21:32:18.911715
-查询代码生成业务表列表	3	1	module_generator:gencode:query	\N	\N	\N	\N	\N	f	t	f	查询代码生成业务表列表	null	f	26	120	2a292a26-2ca3-42ab-ab6c-f8225d916df8	0	查询代码生成业务表列表	2026-01-03 21:32:18.911717	2026-01-03 21:32:18.911718
-创建表结构	3	2	module_generator:gencode:create	\N	\N	\N	\N	\N	f	t	f	创建表结构	null	f	26	121	ec7640e8-1790-4563-a54f-d6b487bc3501	0	创建表结构	2026-01-03 21:32:18.91172	2026-01-03 21:32:18.911721
-编辑业务表信息	3	3	module_generator:gencode:update	\N	\N	\N	\N	\N	f	t	f	编辑业务表信息	null	f	26	122	c38e5ba5-ffc4-47e3-910e-c24978781830	0	编辑业务表信息	2026-01-03 21:32:18.911723	2026-01-03 21:32:18.911724
-删除业务表信息	3	4	module_generator:gencode:delete	\N	\N	\N	\N	\N	f	t	f	删除业务表信息	null	f	26	123	9f534ac6-8ccd-4ea6-a30b-e9aa41177146	0	删除业务表信息	2026-01-03 21:32:18.911726	2026-01-03 21:32:18.911726
-导入表结构	3	5	module_generator:gencode:import	\N	\N	\N	\N	\N	f	t	f	导入表结构	null	f	26	124	8fbc97e8-583a-4f51-a87b-819c1158568e	0	导入表结构	2026-01-03 21:32:18.911729	2026-01-03 21:32:18.911729
-批量生成代码	3	6	module_generator:gencode:operate	\N	\N	\N	\N	\N	f	t	f	批量生成代码	null	f	26	125	8c98d051-8277-4382-887e-8f11a27fa839	0	批量生成代码	2026-01-03 21:32:18.911732	2026-01-03 21:32:18.911732
-生成代码到指定路径	3	7	module_generator:gencode:code	\N	\N	\N	\N	\N	f	t	f	生成代码到指定路径	null	f	26	126	b516e17a-68c7-447b-b67e-e706bec688c6	0	生成代码到指定路径	2026-01-03 21:32:18.911735	2026-01-03 21:32:18.911735
-查询数据库表列表	3	8	module_generator:dblist:query	\N	\N	\N	\N	\N	f	t	f	查询数据库表列表	null	f	26	127	c489c527-1397-4763-afb5-39c6bce33c34	0	查询数据库表列表	2026-01-03 21:32:18.911737	2026-01-03 21:32:18.911738
-同步数据库	3	9	module_generator:db:sync	\N	\N	\N	\N	\N	f	t	f	同步数据库	null	f	26	128	e98d0079-e340-45bc-b09f-9476f71b2aa3	0	同步数据库	2026-01-03 21:32:18.91174	2026-01-03 21:32:18.911741
-创建示例	3	1	module_example:demo:create	\N	\N	\N	\N	\N	f	t	f	创建示例	null	f	29	129	065ff5d5-e279-4df3-91d1-4c81eb589794	0	初始化数据	2026-01-03 21:32:18.911743	2026-01-03 21:32:18.911743
-更新示例	3	2	module_example:demo:update	\N	\N	\N	\N	\N	f	t	f	更新示例	null	f	29	130	a7778542-d3cd-4964-839a-6aa631b8955c	0	初始化数据	2026-01-03 21:32:18.911746	2026-01-03 21:32:18.911746
-删除示例	3	3	module_example:demo:delete	\N	\N	\N	\N	\N	f	t	f	删除示例	null	f	29	131	e72c989e-69b1-4bad-8c9f-192312c671ba	0	初始化数据	2026-01-03 21:32:18.911749	2026-01-03 21:32:18.911749
-批量修改示例状态	3	4	module_example:demo:patch	\N	\N	\N	\N	\N	f	t	f	批量修改示例状态	null	f	29	132	7ef6f0b7-cc65-4283-b1aa-02c29a4a68fc	0	初始化数据	2026-01-03 21:32:18.911751	2026-01-03 21:32:18.911752
-导出示例	3	5	module_example:demo:export	\N	\N	\N	\N	\N	f	t	f	导出示例	null	f	29	133	e3e0a107-d9c7-4e2a-85d8-442201477bda	0	初始化数据	2026-01-03 21:32:18.911754	2026-01-03 21:32:18.911754
-导入示例	3	6	module_example:demo:import	\N	\N	\N	\N	\N	f	t	f	导入示例	null	f	29	134	82a3f388-66ac-4804-87d5-6c1553a9fb73	0	初始化数据	2026-01-03 21:32:18.911757	2026-01-03 21:32:18.911757
-下载导入示例模版	3	7	module_example:demo:download	\N	\N	\N	\N	\N	f	t	f	下载导入示例模版	null	f	29	135	37044da4-53aa-45ca-b0b4-c482a6267738	0	初始化数据	2026-01-03 21:32:18.91176	2026-01-03 21:32:18.91176
-详情示例	3	8	module_example:demo:detail	\N	\N	\N	\N	\N	f	t	f	详情示例	null	f	29	136	bcb8c7c2-8336-445b-bd5a-e520df635780	0	初始化数据	2026-01-03 21:32:18.911763	2026-01-03 21:32:18.911763
-查询示例	3	9	module_example:demo:query	\N	\N	\N	\N	\N	f	t	f	查询示例	null	f	29	137	b9c1eeb0-426a-42ba-9cec-a6dca30bdb9d	0	初始化数据	2026-01-03 21:32:18.911766	2026-01-03 21:32:18.911766
+COPY public.sys_menu (name, type, "order", permission, icon, route_name, route_path, component_path, redirect, hidden, keep_alive, always_show, title, params, affix, parent_id, id, uuid, status, description, created_time, updated_time, tree_path) FROM stdin;
+仪表盘	1	1		client	Dashboard	/dashboard	\N	/dashboard/workplace	f	t	t	仪表盘	null	f	\N	1	cb8697f1-d99f-486f-a35d-ca588d00ecee	0	初始化数据	2026-01-03 21:32:18.905383	2026-01-03 21:32:18.905387	/1/
+系统管理	1	2	\N	system	System	/system	\N	/system/menu	f	t	f	系统管理	null	f	\N	2	8686a005-e6f2-4f27-a592-dd1e33c1c5e7	0	初始化数据	2026-01-03 21:32:18.905392	2026-01-03 21:32:18.905392	/2/
+应用管理	1	3	\N	el-icon-ShoppingBag	Application	/application	\N	/application/myapp	f	t	f	应用管理	null	f	\N	3	aed230c6-6a2f-47a2-ae17-19a36111987f	0	初始化数据	2026-01-03 21:32:18.905395	2026-01-03 21:32:18.905395	/3/
+监控管理	1	4	\N	monitor	Monitor	/monitor	\N	/monitor/online	f	t	f	监控管理	null	f	\N	4	f94f6492-288a-4df3-b6a2-37eaec7f7b6f	0	初始化数据	2026-01-03 21:32:18.905398	2026-01-03 21:32:18.905399	/4/
+代码管理	1	5	\N	code	Generator	/generator	\N	/generator/gencode	f	t	f	代码管理	null	f	\N	5	9a68972f-7c40-4104-97b1-372213d500c1	0	代码管理	2026-01-03 21:32:18.905401	2026-01-03 21:32:18.905402	/5/
+接口管理	1	6	\N	document	Common	/common	\N	/common/docs	f	t	f	接口管理	null	f	\N	6	75341f65-6da9-4bd6-a9c1-eab807edd5fb	0	初始化数据	2026-01-03 21:32:18.905405	2026-01-03 21:32:18.905405	/6/
+案例管理	1	7	\N	menu	Example	/example	\N	/example/demo	f	t	f	案例管理	null	f	\N	7	5145f454-4bd1-48c9-a780-c809cfcf669e	0	案例管理	2026-01-03 21:32:18.905408	2026-01-03 21:32:18.905408	/7/
+工作台	2	1	dashboard:workplace:query	el-icon-PieChart	Workplace	/dashboard/workplace	dashboard/workplace	\N	f	t	f	工作台	null	f	1	8	15605dd7-2ab4-4ad4-b2e6-3a32976d4c1a	0	初始化数据	2026-01-03 21:32:18.907989	2026-01-03 21:32:18.907991	/1/8/
+菜单管理	2	1	module_system:menu:query	menu	Menu	/system/menu	module_system/menu/index	\N	f	t	f	菜单管理	null	f	2	9	7ba1cbc7-4822-472a-a239-647ef5807fb8	0	初始化数据	2026-01-03 21:32:18.907995	2026-01-03 21:32:18.907996	/2/9/
+部门管理	2	2	module_system:dept:query	tree	Dept	/system/dept	module_system/dept/index	\N	f	t	f	部门管理	null	f	2	10	4d852241-ce79-45b2-aac2-cb683b4fe502	0	初始化数据	2026-01-03 21:32:18.907999	2026-01-03 21:32:18.907999	/2/10/
+岗位管理	2	3	module_system:position:query	el-icon-Coordinate	Position	/system/position	module_system/position/index	\N	f	t	f	岗位管理	null	f	2	11	0515619f-cc9c-4a94-a11b-4c56c14a7ad7	0	初始化数据	2026-01-03 21:32:18.908002	2026-01-03 21:32:18.908003	/2/11/
+角色管理	2	4	module_system:role:query	role	Role	/system/role	module_system/role/index	\N	f	t	f	角色管理	null	f	2	12	680024f6-08da-4141-a993-452a0bbbc008	0	初始化数据	2026-01-03 21:32:18.908005	2026-01-03 21:32:18.908006	/2/12/
+用户管理	2	5	module_system:user:query	el-icon-User	User	/system/user	module_system/user/index	\N	f	t	f	用户管理	null	f	2	13	9900d01f-556f-4580-a09a-aecd51a99c86	0	初始化数据	2026-01-03 21:32:18.908009	2026-01-03 21:32:18.908009	/2/13/
+日志管理	2	6	module_system:log:query	el-icon-Aim	Log	/system/log	module_system/log/index	\N	f	t	f	日志管理	null	f	2	14	4cf02289-e5d6-4fd4-8a35-2415dec384fa	0	初始化数据	2026-01-03 21:32:18.908012	2026-01-03 21:32:18.908012	/2/14/
+公告管理	2	7	module_system:notice:query	bell	Notice	/system/notice	module_system/notice/index	\N	f	t	f	公告管理	null	f	2	15	c4cac9c7-d750-4b27-9731-039149f2897d	0	初始化数据	2026-01-03 21:32:18.908015	2026-01-03 21:32:18.908015	/2/15/
+参数管理	2	8	module_system:param:query	setting	Params	/system/param	module_system/param/index	\N	f	t	f	参数管理	null	f	2	16	2385358e-b01c-4a48-93e0-d3b85f18438b	0	初始化数据	2026-01-03 21:32:18.908018	2026-01-03 21:32:18.908018	/2/16/
+字典管理	2	9	module_system:dict_type:query	dict	Dict	/system/dict	module_system/dict/index	\N	f	t	f	字典管理	null	f	2	17	b9da7600-bbc3-48b9-86bd-c87d99e782e8	0	初始化数据	2026-01-03 21:32:18.908021	2026-01-03 21:32:18.908021	/2/17/
+我的应用	2	1	module_application:myapp:query	el-icon-ShoppingCartFull	MYAPP	/application/myapp	module_application/myapp/index	\N	f	t	f	我的应用	null	f	3	18	4b89ed0b-c1c2-4a08-95a9-c0aff320fbbf	0	初始化数据	2026-01-03 21:32:18.908024	2026-01-03 21:32:18.908024	/3/18/
+任务管理	2	2	module_application:job:query	el-icon-DataLine	Job	/application/job	module_application/job/index	\N	f	t	f	任务管理	null	f	3	19	586828bb-10f6-4eff-82b9-1ac747bafef2	0	初始化数据	2026-01-03 21:32:18.908027	2026-01-03 21:32:18.908027	/3/19/
+AI智能助手	2	3	module_application:ai:chat	el-icon-ToiletPaper	AI	/application/ai	module_application/ai/index	\N	f	t	f	AI智能助手	null	f	3	20	be03f057-ed7d-4c9e-9cb3-a17eabc58920	0	AI智能助手	2026-01-03 21:32:18.90803	2026-01-03 21:32:18.90803	/3/20/
+流程管理	2	4	module_application:workflow:query	el-icon-ShoppingBag	Workflow	/application/workflow	module_application/workflow/index	\N	f	t	f	我的流程	null	f	3	21	b3e1ec0a-4411-4909-9b91-b11fa7cb56ae	0	我的流程	2026-01-03 21:32:18.908033	2026-01-03 21:32:18.908034	/3/21/
+在线用户	2	1	module_monitor:online:query	el-icon-Headset	MonitorOnline	/monitor/online	module_monitor/online/index	\N	f	t	f	在线用户	null	f	4	22	bd3696da-f6cd-4d37-b2d3-458c0653c86b	0	初始化数据	2026-01-03 21:32:18.908036	2026-01-03 21:32:18.908037	/4/22/
+服务器监控	2	2	module_monitor:server:query	el-icon-Odometer	MonitorServer	/monitor/server	module_monitor/server/index	\N	f	t	f	服务器监控	null	f	4	23	da8f2dd6-a3c8-4d0e-b4b8-995baafa47a4	0	初始化数据	2026-01-03 21:32:18.908039	2026-01-03 21:32:18.90804	/4/23/
+缓存监控	2	3	module_monitor:cache:query	el-icon-Stopwatch	MonitorCache	/monitor/cache	module_monitor/cache/index	\N	f	t	f	缓存监控	null	f	4	24	4a738c1e-2d6a-4c43-abf7-0ead777544df	0	初始化数据	2026-01-03 21:32:18.908042	2026-01-03 21:32:18.908043	/4/24/
+文件管理	2	4	module_monitor:resource:query	el-icon-Files	Resource	/monitor/resource	module_monitor/resource/index	\N	f	t	f	文件管理	null	f	4	25	b57d3b59-82a1-4430-8b8a-7545c296f86a	0	初始化数据	2026-01-03 21:32:18.908045	2026-01-03 21:32:18.908046	/4/25/
+代码生成	2	1	module_generator:gencode:query	code	GenCode	/generator/gencode	module_generator/gencode/index	\N	f	t	f	代码生成	null	f	5	26	d7bba83a-d934-4692-976c-56a43e69665a	0	代码生成	2026-01-03 21:32:18.908048	2026-01-03 21:32:18.908049	/5/26/
+Swagger文档	4	1	module_common:docs:query	api	Docs	/common/docs	module_common/docs/index	\N	f	t	f	Swagger文档	null	f	6	27	f8d27069-6348-474d-9338-f063cdeab56e	0	初始化数据	2026-01-03 21:32:18.908052	2026-01-03 21:32:18.908052	/6/27/
+Redoc文档	4	2	module_common:redoc:query	el-icon-Document	Redoc	/common/redoc	module_common/redoc/index	\N	f	t	f	Redoc文档	null	f	6	28	572fd0dc-26c6-480a-a142-223da6de2697	0	初始化数据	2026-01-03 21:32:18.908054	2026-01-03 21:32:18.908055	/6/28/
+示例管理	2	1	module_example:demo:query	menu	Demo	/example/demo	module_example/demo/index	\N	f	t	f	示例管理	null	f	7	29	8bdeda95-8219-48ef-abe4-cba88a251e88	0	示例管理	2026-01-03 21:32:18.908057	2026-01-03 21:32:18.908058	/7/29/
+创建菜单	3	1	module_system:menu:create	\N	\N	\N	\N	\N	f	t	f	创建菜单	null	f	9	30	d7e7d1da-e452-422f-a05b-3220b5534abc	0	初始化数据	2026-01-03 21:32:18.911445	2026-01-03 21:32:18.911447	/2/9/30/
+修改菜单	3	2	module_system:menu:update	\N	\N	\N	\N	\N	f	t	f	修改菜单	null	f	9	31	82b62e27-b2d0-44b1-9319-9f8b2160be2a	0	初始化数据	2026-01-03 21:32:18.91145	2026-01-03 21:32:18.91145	/2/9/31/
+删除菜单	3	3	module_system:menu:delete	\N	\N	\N	\N	\N	f	t	f	删除菜单	null	f	9	32	d796f75f-ea78-41fa-a6f6-d8b3cc9698db	0	初始化数据	2026-01-03 21:32:18.911453	2026-01-03 21:32:18.911453	/2/9/32/
+批量修改菜单状态	3	4	module_system:menu:patch	\N	\N	\N	\N	\N	f	t	f	批量修改菜单状态	null	f	9	33	5e130db5-b6f1-40ae-bba6-f8f08bc433be	0	初始化数据	2026-01-03 21:32:18.911456	2026-01-03 21:32:18.911456	/2/9/33/
+详情改菜	3	5	module_system:menu:detail	\N	\N	\N	\N	\N	f	t	f	详情改菜	null	f	9	34	5f31aeb8-beda-46fc-8715-5bc807787c38	0	初始化数据	2026-01-03 21:32:18.911459	2026-01-03 21:32:18.911459	/2/9/34/
+查询菜单	3	6	module_system:menu:query	\N	\N	\N	\N	\N	f	t	f	查询菜单	null	f	9	35	a0f600b3-b948-4197-a162-b0f0019e0029	0	初始化数据	2026-01-03 21:32:18.911462	2026-01-03 21:32:18.911462	/2/9/35/
+创建部门	3	1	module_system:dept:create	\N	\N	\N	\N	\N	f	t	f	创建部门	null	f	10	36	d699fba9-3c38-4f6d-aaad-e0fe1c6e4ef9	0	初始化数据	2026-01-03 21:32:18.911465	2026-01-03 21:32:18.911465	/2/10/36/
+修改部门	3	2	module_system:dept:update	\N	\N	\N	\N	\N	f	t	f	修改部门	null	f	10	37	7fbc26de-231f-47e5-a776-549bc1d6e8da	0	初始化数据	2026-01-03 21:32:18.911468	2026-01-03 21:32:18.911468	/2/10/37/
+删除部门	3	3	module_system:dept:delete	\N	\N	\N	\N	\N	f	t	f	删除部门	null	f	10	38	e2adf21d-20b9-4a66-b3e9-22dd97067f47	0	初始化数据	2026-01-03 21:32:18.911471	2026-01-03 21:32:18.911471	/2/10/38/
+批量修改部门状态	3	4	module_system:dept:patch	\N	\N	\N	\N	\N	f	t	f	批量修改部门状态	null	f	10	39	174fc5cc-f3d0-48e5-a2f2-4d5d3768601f	0	初始化数据	2026-01-03 21:32:18.911474	2026-01-03 21:32:18.911474	/2/10/39/
+详情部门	3	5	module_system:dept:detail	\N	\N	\N	\N	\N	f	t	f	详情部门	null	f	10	40	0cd163e8-e13d-4e54-af81-4d3b51fb8421	0	初始化数据	2026-01-03 21:32:18.911477	2026-01-03 21:32:18.911477	/2/10/40/
+查询部门	3	6	module_system:dept:query	\N	\N	\N	\N	\N	f	t	f	查询部门	null	f	10	41	39776689-4fb6-47a6-acbc-cd0f63a88113	0	初始化数据	2026-01-03 21:32:18.91148	2026-01-03 21:32:18.91148	/2/10/41/
+创建岗位	3	1	module_system:position:create	\N	\N	\N	\N	\N	f	t	f	创建岗位	null	f	11	42	6087b1ed-b52a-4a71-bbfe-74cd6d16752d	0	初始化数据	2026-01-03 21:32:18.911483	2026-01-03 21:32:18.911483	/2/11/42/
+修改岗位	3	2	module_system:position:update	\N	\N	\N	\N	\N	f	t	f	修改岗位	null	f	11	43	c81de02c-8781-47b3-804d-e8b572f2b1d1	0	初始化数据	2026-01-03 21:32:18.911485	2026-01-03 21:32:18.911486	/2/11/43/
+删除岗位	3	3	module_system:position:delete	\N	\N	\N	\N	\N	f	t	f	修改岗位	null	f	11	44	9ada8ac9-50c3-4251-88a6-1cea182b6e23	0	初始化数据	2026-01-03 21:32:18.911488	2026-01-03 21:32:18.911489	/2/11/44/
+批量修改岗位状态	3	4	module_system:position:patch	\N	\N	\N	\N	\N	f	t	f	批量修改岗位状态	null	f	11	45	bfcd71e3-b90e-4dfd-bb99-1e58ec411745	0	初始化数据	2026-01-03 21:32:18.911491	2026-01-03 21:32:18.911491	/2/11/45/
+岗位导出	3	5	module_system:position:export	\N	\N	\N	\N	\N	f	t	f	岗位导出	null	f	11	46	e4f86a4d-b64c-484c-833f-5fcf7f55273c	0	初始化数据	2026-01-03 21:32:18.911494	2026-01-03 21:32:18.911494	/2/11/46/
+详情岗位	3	6	module_system:position:detail	\N	\N	\N	\N	\N	f	t	f	详情岗位	null	f	11	47	5cbfc463-d1b2-4268-af93-2bd80012a80c	0	初始化数据	2026-01-03 21:32:18.911497	2026-01-03 21:32:18.911497	/2/11/47/
+查询岗位	3	7	module_system:position:query	\N	\N	\N	\N	\N	f	t	f	查询岗位	null	f	11	48	20aaaf6d-f02e-422e-8800-48e1c0ae9dd7	0	初始化数据	2026-01-03 21:32:18.911499	2026-01-03 21:32:18.9115	/2/11/48/
+创建角色	3	1	module_system:role:create	\N	\N	\N	\N	\N	f	t	f	创建角色	null	f	12	49	f7f2a522-4d2f-4ae2-b081-fc455b5fd869	0	初始化数据	2026-01-03 21:32:18.911502	2026-01-03 21:32:18.911503	/2/12/49/
+修改角色	3	2	module_system:role:update	\N	\N	\N	\N	\N	f	t	f	修改角色	null	f	12	50	0c7738be-cf93-42cd-a77b-473262ba35b8	0	初始化数据	2026-01-03 21:32:18.911505	2026-01-03 21:32:18.911506	/2/12/50/
+删除角色	3	3	module_system:role:delete	\N	\N	\N	\N	\N	f	t	f	删除角色	null	f	12	51	d74eb083-c965-4002-9cab-d28c944941e8	0	初始化数据	2026-01-03 21:32:18.911508	2026-01-03 21:32:18.911509	/2/12/51/
+批量修改角色状态	3	4	module_system:role:patch	\N	\N	\N	\N	\N	f	t	f	批量修改角色状态	null	f	12	52	8f3181f4-3797-4c8d-9727-73b65e83dc13	0	初始化数据	2026-01-03 21:32:18.911511	2026-01-03 21:32:18.911512	/2/12/52/
+角色导出	3	5	module_system:role:export	\N	\N	\N	\N	\N	f	t	f	角色导出	null	f	12	53	0409184f-4e47-4e5b-ab46-06977ac912ee	0	初始化数据	2026-01-03 21:32:18.911514	2026-01-03 21:32:18.911515	/2/12/53/
+详情角色	3	6	module_system:role:detail	\N	\N	\N	\N	\N	f	t	f	详情角色	null	f	12	54	1a1a37ae-f6f6-471d-a296-382edebfedb8	0	初始化数据	2026-01-03 21:32:18.911517	2026-01-03 21:32:18.911518	/2/12/54/
+查询角色	3	7	module_system:role:query	\N	\N	\N	\N	\N	f	t	f	查询角色	null	f	12	55	81bd5583-a5e7-403e-9388-fd7b5be62d50	0	初始化数据	2026-01-03 21:32:18.91152	2026-01-03 21:32:18.91152	/2/12/55/
+创建用户	3	1	module_system:user:create	\N	\N	\N	\N	\N	f	t	f	创建用户	null	f	13	56	1b409e37-c8e1-4b32-9842-96d4d5870769	0	初始化数据	2026-01-03 21:32:18.911523	2026-01-03 21:32:18.911523	/2/13/56/
+修改用户	3	2	module_system:user:update	\N	\N	\N	\N	\N	f	t	f	修改用户	null	f	13	57	89d8146a-0a01-42f0-8249-538c65fcb20a	0	初始化数据	2026-01-03 21:32:18.911526	2026-01-03 21:32:18.911526	/2/13/57/
+删除用户	3	3	module_system:user:delete	\N	\N	\N	\N	\N	f	t	f	删除用户	null	f	13	58	58fee4f1-cf15-4b41-ac10-d07246b4ee59	0	初始化数据	2026-01-03 21:32:18.911529	2026-01-03 21:32:18.911529	/2/13/58/
+批量修改用户状态	3	4	module_system:user:patch	\N	\N	\N	\N	\N	f	t	f	批量修改用户状态	null	f	13	59	c7df3326-7d54-4a34-85f6-0ba84c2f00bf	0	初始化数据	2026-01-03 21:32:18.911532	2026-01-03 21:32:18.911532	/2/13/59/
+导出用户	3	5	module_system:user:export	\N	\N	\N	\N	\N	f	t	f	导出用户	null	f	13	60	e7a89f3c-7add-4580-a6f6-fd4c27893973	0	初始化数据	2026-01-03 21:32:18.911534	2026-01-03 21:32:18.911535	/2/13/60/
+导入用户	3	6	module_system:user:import	\N	\N	\N	\N	\N	f	t	f	导入用户	null	f	13	61	79e9601e-1ded-4883-8ef4-f0602d5c1767	0	初始化数据	2026-01-03 21:32:18.911537	2026-01-03 21:32:18.911538	/2/13/61/
+下载用户导入模板	3	7	module_system:user:download	\N	\N	\N	\N	\N	f	t	f	下载用户导入模板	null	f	13	62	9af6e9b9-71ce-4dfc-8df3-a97a6556d115	0	初始化数据	2026-01-03 21:32:18.91154	2026-01-03 21:32:18.91154	/2/13/62/
+详情用户	3	8	module_system:user:detail	\N	\N	\N	\N	\N	f	t	f	详情用户	null	f	13	63	5ae4fded-90d9-4d28-b93b-1d78a71a3ad6	0	初始化数据	2026-01-03 21:32:18.911543	2026-01-03 21:32:18.911543	/2/13/63/
+查询用户	3	9	module_system:user:query	\N	\N	\N	\N	\N	f	t	f	查询用户	null	f	13	64	a26b1bd7-d863-4c6c-80f5-da4e6fa9d34b	0	初始化数据	2026-01-03 21:32:18.911546	2026-01-03 21:32:18.911546	/2/13/64/
+日志删除	3	1	module_system:log:delete	\N	\N	\N	\N	\N	f	t	f	日志删除	null	f	14	65	7ed74443-10e7-40e9-b7d2-99b814597417	0	初始化数据	2026-01-03 21:32:18.911548	2026-01-03 21:32:18.911549	/2/14/65/
+日志导出	3	2	module_system:log:export	\N	\N	\N	\N	\N	f	t	f	日志导出	null	f	14	66	cab97ed3-a0fe-4a37-8a86-9d394e7de088	0	初始化数据	2026-01-03 21:32:18.911551	2026-01-03 21:32:18.911551	/2/14/66/
+日志详情	3	3	module_system:log:detail	\N	\N	\N	\N	\N	f	t	f	日志详情	null	f	14	67	d4964258-ec78-4e05-98f1-0174bb914cc4	0	初始化数据	2026-01-03 21:32:18.911554	2026-01-03 21:32:18.911554	/2/14/67/
+查询日志	3	4	module_system:log:query	\N	\N	\N	\N	\N	f	t	f	查询日志	null	f	14	68	b4e13038-5e5e-4a1b-8b32-b0132b5271c5	0	初始化数据	2026-01-03 21:32:18.911557	2026-01-03 21:32:18.911557	/2/14/68/
+公告创建	3	1	module_system:notice:create	\N	\N	\N	\N	\N	f	t	f	公告创建	null	f	15	69	dd2c2504-743e-48e3-a758-f9aa2bcdcd83	0	初始化数据	2026-01-03 21:32:18.911559	2026-01-03 21:32:18.91156	/2/15/69/
+公告修改	3	2	module_system:notice:update	\N	\N	\N	\N	\N	f	t	f	修改用户	null	f	15	70	3daceab3-ec00-4fc8-bd3a-dac224b727e0	0	初始化数据	2026-01-03 21:32:18.911562	2026-01-03 21:32:18.911564	/2/15/70/
+公告删除	3	3	module_system:notice:delete	\N	\N	\N	\N	\N	f	t	f	公告删除	null	f	15	71	4966506d-bc03-4df9-b0e5-9a1a78946357	0	初始化数据	2026-01-03 21:32:18.911567	2026-01-03 21:32:18.911567	/2/15/71/
+公告导出	3	4	module_system:notice:export	\N	\N	\N	\N	\N	f	t	f	公告导出	null	f	15	72	fc4a35a3-8795-4d58-859d-31be25af894f	0	初始化数据	2026-01-03 21:32:18.911571	2026-01-03 21:32:18.911571	/2/15/72/
+公告批量修改状态	3	5	module_system:notice:patch	\N	\N	\N	\N	\N	f	t	f	公告批量修改状态	null	f	15	73	f41bfd30-e52c-4ac8-a008-27f5d4fde5de	0	初始化数据	2026-01-03 21:32:18.911575	2026-01-03 21:32:18.911575	/2/15/73/
+公告详情	3	6	module_system:notice:detail	\N	\N	\N	\N	\N	f	t	f	公告详情	null	f	15	74	8a129bcf-53fb-4c73-872b-8e281d09bb1d	0	初始化数据	2026-01-03 21:32:18.911579	2026-01-03 21:32:18.911579	/2/15/74/
+查询公告	3	5	module_system:notice:query	\N	\N	\N	\N	\N	f	t	f	查询公告	null	f	15	75	3f24b0f2-5d84-4e98-9097-d90f6276678c	0	初始化数据	2026-01-03 21:32:18.911582	2026-01-03 21:32:18.911583	/2/15/75/
+创建参数	3	1	module_system:param:create	\N	\N	\N	\N	\N	f	t	f	创建参数	null	f	16	76	8513bd00-0f00-4cd6-a76a-1e83e194a4e4	0	初始化数据	2026-01-03 21:32:18.911586	2026-01-03 21:32:18.911587	/2/16/76/
+修改参数	3	2	module_system:param:update	\N	\N	\N	\N	\N	f	t	f	修改参数	null	f	16	77	36a7d50e-34a1-462b-b388-b9d6d8539ad2	0	初始化数据	2026-01-03 21:32:18.91159	2026-01-03 21:32:18.911591	/2/16/77/
+删除参数	3	3	module_system:param:delete	\N	\N	\N	\N	\N	f	t	f	删除参数	null	f	16	78	505028b6-0362-4792-9b86-4edd40f81ffd	0	初始化数据	2026-01-03 21:32:18.911594	2026-01-03 21:32:18.911594	/2/16/78/
+导出参数	3	4	module_system:param:export	\N	\N	\N	\N	\N	f	t	f	导出参数	null	f	16	79	2c5d2b14-366f-4632-930b-0396b6ac4bd3	0	初始化数据	2026-01-03 21:32:18.911598	2026-01-03 21:32:18.911598	/2/16/79/
+参数上传	3	5	module_system:param:upload	\N	\N	\N	\N	\N	f	t	f	参数上传	null	f	16	80	60aee432-dd9b-448c-b527-18b49c7d137a	0	初始化数据	2026-01-03 21:32:18.911602	2026-01-03 21:32:18.911602	/2/16/80/
+参数详情	3	6	module_system:param:detail	\N	\N	\N	\N	\N	f	t	f	参数详情	null	f	16	81	c87eb5ed-62a1-4cd4-8851-0e00cb69b2cc	0	初始化数据	2026-01-03 21:32:18.911605	2026-01-03 21:32:18.911605	/2/16/81/
+查询参数	3	7	module_system:param:query	\N	\N	\N	\N	\N	f	t	f	查询参数	null	f	16	82	d44dccb9-3b72-4e56-bff4-842ccab4cf6a	0	初始化数据	2026-01-03 21:32:18.911608	2026-01-03 21:32:18.911608	/2/16/82/
+创建字典类型	3	1	module_system:dict_type:create	\N	\N	\N	\N	\N	f	t	f	创建字典类型	null	f	17	83	9550ae0d-72c5-4594-b478-a5fae5b27fc9	0	初始化数据	2026-01-03 21:32:18.911611	2026-01-03 21:32:18.911611	/2/17/83/
+修改字典类型	3	2	module_system:dict_type:update	\N	\N	\N	\N	\N	f	t	f	修改字典类型	null	f	17	84	6c9762a7-0846-40df-82ba-4472ca2b5881	0	初始化数据	2026-01-03 21:32:18.911614	2026-01-03 21:32:18.911614	/2/17/84/
+删除字典类型	3	3	module_system:dict_type:delete	\N	\N	\N	\N	\N	f	t	f	删除字典类型	null	f	17	85	7f8d933f-dee6-4dde-b72f-707a7f1b7e49	0	初始化数据	2026-01-03 21:32:18.911617	2026-01-03 21:32:18.911617	/2/17/85/
+导出字典类型	3	4	module_system:dict_type:export	\N	\N	\N	\N	\N	f	t	f	导出字典类型	null	f	17	86	5d14d903-230c-413a-8bba-b70e6b91d33c	0	初始化数据	2026-01-03 21:32:18.911619	2026-01-03 21:32:18.91162	/2/17/86/
+批量修改字典状态	3	5	module_system:dict_type:patch	\N	\N	\N	\N	\N	f	t	f	导出字典类型	null	f	17	87	d1712e01-35ac-443b-aece-06c62c0ab088	0	初始化数据	2026-01-03 21:32:18.911622	2026-01-03 21:32:18.911623	/2/17/87/
+字典数据查询	3	6	module_system:dict_data:query	\N	\N	\N	\N	\N	f	t	f	字典数据查询	null	f	17	88	1565475c-f3a9-4bbb-b93b-5e220467cc81	0	初始化数据	2026-01-03 21:32:18.911625	2026-01-03 21:32:18.911625	/2/17/88/
+创建字典数据	3	7	module_system:dict_data:create	\N	\N	\N	\N	\N	f	t	f	创建字典数据	null	f	17	89	578edd73-25f7-43bb-9f8b-1502e6a028d3	0	初始化数据	2026-01-03 21:32:18.911628	2026-01-03 21:32:18.911628	/2/17/89/
+修改字典数据	3	8	module_system:dict_data:update	\N	\N	\N	\N	\N	f	t	f	修改字典数据	null	f	17	90	71a3bab7-d934-484c-aa9a-e7a7266cddc5	0	初始化数据	2026-01-03 21:32:18.911631	2026-01-03 21:32:18.911631	/2/17/90/
+删除字典数据	3	9	module_system:dict_data:delete	\N	\N	\N	\N	\N	f	t	f	删除字典数据	null	f	17	91	e336aadd-a4fa-41f7-8649-7269ec57f691	0	初始化数据	2026-01-03 21:32:18.911634	2026-01-03 21:32:18.911634	/2/17/91/
+导出字典数据	3	10	module_system:dict_data:export	\N	\N	\N	\N	\N	f	t	f	导出字典数据	null	f	17	92	3595a298-ff90-400a-bbb7-b22b5991b53d	0	初始化数据	2026-01-03 21:32:18.911636	2026-01-03 21:32:18.911637	/2/17/92/
+批量修改字典数据状态	3	11	module_system:dict_data:patch	\N	\N	\N	\N	\N	f	t	f	批量修改字典数据状态	null	f	17	93	f19ece16-4c9e-4e36-9d40-e95119439dba	0	初始化数据	2026-01-03 21:32:18.911639	2026-01-03 21:32:18.911639	/2/17/93/
+详情字典类型	3	12	module_system:dict_type:detail	\N	\N	\N	\N	\N	f	t	f	详情字典类型	null	f	17	94	8c8a3c93-4b81-4f2a-9f19-69d55289bed0	0	初始化数据	2026-01-03 21:32:18.911642	2026-01-03 21:32:18.911642	/2/17/94/
+查询字典类型	3	13	module_system:dict_type:query	\N	\N	\N	\N	\N	f	t	f	查询字典类型	null	f	17	95	3c086e98-80be-43a9-bf92-9e549ce52001	0	初始化数据	2026-01-03 21:32:18.911645	2026-01-03 21:32:18.911645	/2/17/95/
+详情字典数据	3	14	module_system:dict_data:detail	\N	\N	\N	\N	\N	f	t	f	详情字典数据	null	f	17	96	7747b9b0-4876-4379-838c-71746abf40d3	0	初始化数据	2026-01-03 21:32:18.911647	2026-01-03 21:32:18.911648	/2/17/96/
+创建应用	3	1	module_application:myapp:create	\N	\N	\N	\N	\N	f	t	f	创建应用	null	f	18	97	6597310c-0997-4adf-ab77-a3abf3c06fdb	0	初始化数据	2026-01-03 21:32:18.91165	2026-01-03 21:32:18.91165	/3/18/97/
+修改应用	3	2	module_application:myapp:update	\N	\N	\N	\N	\N	f	t	f	修改应用	null	f	18	98	bf921c89-86aa-429c-b00d-92b9b4267451	0	初始化数据	2026-01-03 21:32:18.911653	2026-01-03 21:32:18.911653	/3/18/98/
+删除应用	3	3	module_application:myapp:delete	\N	\N	\N	\N	\N	f	t	f	删除应用	null	f	18	99	dcd2b033-e1ff-4361-abb9-499358d7533b	0	初始化数据	2026-01-03 21:32:18.911656	2026-01-03 21:32:18.911656	/3/18/99/
+批量修改应用状态	3	4	module_application:myapp:patch	\N	\N	\N	\N	\N	f	t	f	批量修改应用状态	null	f	18	100	abde1610-99f2-4366-9cbf-dbc0991a9aa3	0	初始化数据	2026-01-03 21:32:18.911658	2026-01-03 21:32:18.911659	/3/18/100/
+详情应用	3	5	module_application:myapp:detail	\N	\N	\N	\N	\N	f	t	f	详情应用	null	f	18	101	e4ec94d0-7514-4423-80aa-c3e6f6a9e840	0	初始化数据	2026-01-03 21:32:18.911661	2026-01-03 21:32:18.911662	/3/18/101/
+查询应用	3	6	module_application:myapp:query	\N	\N	\N	\N	\N	f	t	f	查询应用	null	f	18	102	3f4ad15e-a846-43ba-81b7-c07998fae40e	0	初始化数据	2026-01-03 21:32:18.911664	2026-01-03 21:32:18.911665	/3/18/102/
+创建任务	3	1	module_application:job:create	\N	\N	\N	\N	\N	f	t	f	创建任务	null	f	19	103	f3bd89ed-6be3-4b1b-9c8d-5f1473074c6a	0	初始化数据	2026-01-03 21:32:18.911667	2026-01-03 21:32:18.911667	/3/19/103/
+修改和操作任务	3	2	module_application:job:update	\N	\N	\N	\N	\N	f	t	f	修改和操作任务	null	f	19	104	af780bd5-d542-422f-8714-17a67628b705	0	初始化数据	2026-01-03 21:32:18.91167	2026-01-03 21:32:18.91167	/3/19/104/
+删除和清除任务	3	3	module_application:job:delete	\N	\N	\N	\N	\N	f	t	f	删除和清除任务	null	f	19	105	1b6d0689-87fe-4092-9407-7da413b99786	0	初始化数据	2026-01-03 21:32:18.911672	2026-01-03 21:32:18.911673	/3/19/105/
+导出定时任务	3	4	module_application:job:export	\N	\N	\N	\N	\N	f	t	f	导出定时任务	null	f	19	106	5e1b35b0-c349-41a6-8873-e80787e5a00b	0	初始化数据	2026-01-03 21:32:18.911675	2026-01-03 21:32:18.911676	/3/19/106/
+详情定时任务	3	5	module_application:job:detail	\N	\N	\N	\N	\N	f	t	f	详情任务	null	f	19	107	7e9c0d83-f381-42c9-a0a0-448680e8c36c	0	初始化数据	2026-01-03 21:32:18.91168	2026-01-03 21:32:18.911681	/3/19/107/
+查询定时任务	3	6	module_application:job:query	\N	\N	\N	\N	\N	f	t	f	查询定时任务	null	f	19	108	9020114f-35f2-4383-9659-b72f2ff9d72a	0	初始化数据	2026-01-03 21:32:18.911684	2026-01-03 21:32:18.911684	/3/19/108/
+智能对话	3	1	module_application:ai:chat	\N	\N	\N	\N	\N	f	t	f	智能对话	null	f	20	109	353ee35e-c3c1-4ee1-8a64-324bdc7f1d96	0	智能对话	2026-01-03 21:32:18.911686	2026-01-03 21:32:18.911687	/3/20/109/
+在线用户强制下线	3	1	module_monitor:online:delete	\N	\N	\N	\N	\N	f	t	f	在线用户强制下线	null	f	22	110	0edf0de3-ae8d-4a47-9e43-74ac1ff9a8a9	0	初始化数据	2026-01-03 21:32:18.911689	2026-01-03 21:32:18.91169	/4/22/110/
+清除缓存	3	1	module_monitor:cache:delete	\N	\N	\N	\N	\N	f	t	f	清除缓存	null	f	24	111	8ba7c514-fcfe-4bf7-a3fb-3683e2a2927c	0	初始化数据	2026-01-03 21:32:18.911692	2026-01-03 21:32:18.911693	/4/24/111/
+文件上传	3	1	module_monitor:resource:upload	\N	\N	\N	\N	\N	f	t	f	文件上传	null	f	25	112	2e1be8fb-fa3e-422b-baeb-491ca1b39a25	0	初始化数据	2026-01-03 21:32:18.911695	2026-01-03 21:32:18.911695	/4/25/112/
+文件下载	3	2	module_monitor:resource:download	\N	\N	\N	\N	\N	f	t	f	文件下载	null	f	25	113	5876d559-7e73-4f02-bb76-447a5d20a452	0	初始化数据	2026-01-03 21:32:18.911698	2026-01-03 21:32:18.911698	/4/25/113/
+文件删除	3	3	module_monitor:resource:delete	\N	\N	\N	\N	\N	f	t	f	文件删除	null	f	25	114	a37dfbdc-dd4a-43f0-82f5-ff2ad50481ec	0	初始化数据	2026-01-03 21:32:18.911701	2026-01-03 21:32:18.911701	/4/25/114/
+文件移动	3	4	module_monitor:resource:move	\N	\N	\N	\N	\N	f	t	f	文件移动	null	f	25	115	99cf44db-1661-4fd6-8d7d-1d9fd0e963d2	0	初始化数据	2026-01-03 21:32:18.911704	2026-01-03 21:32:18.911704	/4/25/115/
+文件复制	3	5	module_monitor:resource:copy	\N	\N	\N	\N	\N	f	t	f	文件复制	null	f	25	116	43eeccb8-f09e-4a35-9df7-04009fd7ffd4	0	初始化数据	2026-01-03 21:32:18.911706	2026-01-03 21:32:18.911707	/4/25/116/
+文件重命名	3	6	module_monitor:resource:rename	\N	\N	\N	\N	\N	f	t	f	文件重命名	null	f	25	117	c8fd4446-9147-4dd0-9dbb-b7ad7531edb2	0	初始化数据	2026-01-03 21:32:18.911709	2026-01-03 21:32:18.911709	/4/25/117/
+创建目录	3	7	module_monitor:resource:create_dir	\N	\N	\N	\N	\N	f	t	f	创建目录	null	f	25	118	d2c29d13-d63c-41e0-9798-db94fdd06e38	0	初始化数据	2026-01-03 21:32:18.911712	2026-01-03 21:32:18.911712	/4/25/118/
+导出文件列表	3	9	module_monitor:resource:export	\N	\N	\N	\N	\N	f	t	f	导出文件列表	null	f	25	119	5bb86efe-3d16-41d9-a3e6-e1e22cc8683c	0	初始化数据	2026-01-03 21:32:18.911715	2026-01-03 21:32:18.911715	/4/25/119/
+查询代码生成业务表列表	3	1	module_generator:gencode:query	\N	\N	\N	\N	\N	f	t	f	查询代码生成业务表列表	null	f	26	120	2a292a26-2ca3-42ab-ab6c-f8225d916df8	0	查询代码生成业务表列表	2026-01-03 21:32:18.911717	2026-01-03 21:32:18.911718	/5/26/120/
+创建表结构	3	2	module_generator:gencode:create	\N	\N	\N	\N	\N	f	t	f	创建表结构	null	f	26	121	ec7640e8-1790-4563-a54f-d6b487bc3501	0	创建表结构	2026-01-03 21:32:18.91172	2026-01-03 21:32:18.911721	/5/26/121/
+编辑业务表信息	3	3	module_generator:gencode:update	\N	\N	\N	\N	\N	f	t	f	编辑业务表信息	null	f	26	122	c38e5ba5-ffc4-47e3-910e-c24978781830	0	编辑业务表信息	2026-01-03 21:32:18.911723	2026-01-03 21:32:18.911724	/5/26/122/
+删除业务表信息	3	4	module_generator:gencode:delete	\N	\N	\N	\N	\N	f	t	f	删除业务表信息	null	f	26	123	9f534ac6-8ccd-4ea6-a30b-e9aa41177146	0	删除业务表信息	2026-01-03 21:32:18.911726	2026-01-03 21:32:18.911726	/5/26/123/
+导入表结构	3	5	module_generator:gencode:import	\N	\N	\N	\N	\N	f	t	f	导入表结构	null	f	26	124	8fbc97e8-583a-4f51-a87b-819c1158568e	0	导入表结构	2026-01-03 21:32:18.911729	2026-01-03 21:32:18.911729	/5/26/124/
+批量生成代码	3	6	module_generator:gencode:operate	\N	\N	\N	\N	\N	f	t	f	批量生成代码	null	f	26	125	8c98d051-8277-4382-887e-8f11a27fa839	0	批量生成代码	2026-01-03 21:32:18.911732	2026-01-03 21:32:18.911732	/5/26/125/
+生成代码到指定路径	3	7	module_generator:gencode:code	\N	\N	\N	\N	\N	f	t	f	生成代码到指定路径	null	f	26	126	b516e17a-68c7-447b-b67e-e706bec688c6	0	生成代码到指定路径	2026-01-03 21:32:18.911735	2026-01-03 21:32:18.911735	/5/26/126/
+查询数据库表列表	3	8	module_generator:dblist:query	\N	\N	\N	\N	\N	f	t	f	查询数据库表列表	null	f	26	127	c489c527-1397-4763-afb5-39c6bce33c34	0	查询数据库表列表	2026-01-03 21:32:18.911737	2026-01-03 21:32:18.911738	/5/26/127/
+同步数据库	3	9	module_generator:db:sync	\N	\N	\N	\N	\N	f	t	f	同步数据库	null	f	26	128	e98d0079-e340-45bc-b09f-9476f71b2aa3	0	同步数据库	2026-01-03 21:32:18.91174	2026-01-03 21:32:18.911741	/5/26/128/
+创建示例	3	1	module_example:demo:create	\N	\N	\N	\N	\N	f	t	f	创建示例	null	f	29	129	065ff5d5-e279-4df3-91d1-4c81eb589794	0	初始化数据	2026-01-03 21:32:18.911743	2026-01-03 21:32:18.911743	/7/29/129/
+更新示例	3	2	module_example:demo:update	\N	\N	\N	\N	\N	f	t	f	更新示例	null	f	29	130	a7778542-d3cd-4964-839a-6aa631b8955c	0	初始化数据	2026-01-03 21:32:18.911746	2026-01-03 21:32:18.911746	/7/29/130/
+删除示例	3	3	module_example:demo:delete	\N	\N	\N	\N	\N	f	t	f	删除示例	null	f	29	131	e72c989e-69b1-4bad-8c9f-192312c671ba	0	初始化数据	2026-01-03 21:32:18.911749	2026-01-03 21:32:18.911749	/7/29/131/
+批量修改示例状态	3	4	module_example:demo:patch	\N	\N	\N	\N	\N	f	t	f	批量修改示例状态	null	f	29	132	7ef6f0b7-cc65-4283-b1aa-02c29a4a68fc	0	初始化数据	2026-01-03 21:32:18.911751	2026-01-03 21:32:18.911752	/7/29/132/
+导出示例	3	5	module_example:demo:export	\N	\N	\N	\N	\N	f	t	f	导出示例	null	f	29	133	e3e0a107-d9c7-4e2a-85d8-442201477bda	0	初始化数据	2026-01-03 21:32:18.911754	2026-01-03 21:32:18.911754	/7/29/133/
+导入示例	3	6	module_example:demo:import	\N	\N	\N	\N	\N	f	t	f	导入示例	null	f	29	134	82a3f388-66ac-4804-87d5-6c1553a9fb73	0	初始化数据	2026-01-03 21:32:18.911757	2026-01-03 21:32:18.911757	/7/29/134/
+下载导入示例模版	3	7	module_example:demo:download	\N	\N	\N	\N	\N	f	t	f	下载导入示例模版	null	f	29	135	37044da4-53aa-45ca-b0b4-c482a6267738	0	初始化数据	2026-01-03 21:32:18.91176	2026-01-03 21:32:18.91176	/7/29/135/
+详情示例	3	8	module_example:demo:detail	\N	\N	\N	\N	\N	f	t	f	详情示例	null	f	29	136	bcb8c7c2-8336-445b-bd5a-e520df635780	0	初始化数据	2026-01-03 21:32:18.911763	2026-01-03 21:32:18.911763	/7/29/136/
+查询示例	3	9	module_example:demo:query	\N	\N	\N	\N	\N	f	t	f	查询示例	null	f	29	137	b9c1eeb0-426a-42ba-9cec-a6dca30bdb9d	0	初始化数据	2026-01-03 21:32:18.911766	2026-01-03 21:32:18.911766	/7/29/137/
 \.
 
 
@@ -4186,6 +4202,13 @@ CREATE INDEX ix_sys_dept_updated_id ON public.sys_dept USING btree (updated_id);
 CREATE INDEX ix_sys_dept_updated_time ON public.sys_dept USING btree (updated_time);
 
 
+--
+-- Name: ix_sys_dept_tree_path; Type: INDEX; Schema: public; Owner: tao
+--
+
+CREATE INDEX ix_sys_dept_tree_path ON public.sys_dept USING btree (tree_path);
+
+
 --
 -- Name: ix_sys_dept_uuid; Type: INDEX; Schema: public; Owner: tao
 --
@@ -4347,6 +4370,13 @@ CREATE INDEX ix_sys_menu_status ON public.sys_menu USING btree (status);
 CREATE INDEX ix_sys_menu_updated_time ON public.sys_menu USING btree (updated_time);
 
 
+--
+-- Name: ix_sys_menu_tree_path; Type: INDEX; Schema: public; Owner: tao
+--
+
+CREATE INDEX ix_sys_menu_tree_path ON public.sys_menu USING btree (tree_path);
+
+
 --
 -- Name: ix_sys_menu_uuid; Type: INDEX; Schema: public; Owner: tao
 --
@@ -0,0 +1,106 @@
+"""
+响应序列化性能对比
+
+对比 10k 行列表响应的两条路径：
+- 原路径：逐行 OutSchema.model_validate(obj).model_dump() -> ResponseSchema(...).model_dump() -> json.dumps
+- 新路径：SuccessResponse 直接编码字典（服务层已 model_dump），或传入 ORM 对象 + schema 一次校验、一次编码
+
+执行命令: python tests/benchmark_response.py [行数]
+"""
+
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import uuid4
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ConfigDict
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.common.response import ResponseSchema, SuccessResponse
+from app.core.validator import DateTimeStr
+
+
+class RowOutSchema(BaseModel):
+    """与业务 OutSchema 相同写法的行模型"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    uuid: str
+    name: str
+    status: str
+    amount: Decimal
+    description: str | None = None
+    created_time: DateTimeStr
+    updated_time: DateTimeStr
+
+
+def make_rows(count: int) -> list[SimpleNamespace]:
+    """构造模拟的 ORM 行对象"""
+    now = datetime(2025, 1, 1, 8, 0, 0)
+    return [
+        SimpleNamespace(
+            id=i,
+            uuid=str(uuid4()),
+            name=f"名称-{i}",
+            status="0",
+            amount=Decimal(i) / 100,
+            description="备注" * 8,
+            created_time=now + timedelta(seconds=i),
+            updated_time=now + timedelta(seconds=i),
+        )
+        for i in range(count)
+    ]
+
+
+def legacy_path(rows: list[SimpleNamespace]) -> bytes:
+    """原路径"""
+    data = [RowOutSchema.model_validate(row).model_dump(mode="json") for row in rows]
+    content = ResponseSchema(data=data).model_dump()
+    return JSONResponse(content=content).body
+
+
+def dict_path(rows: list[SimpleNamespace]) -> bytes:
+    """新路径：服务层仍返回字典"""
+    data = [RowOutSchema.model_validate(row).model_dump() for row in rows]
+    return SuccessResponse(data=data).body
+
+
+def schema_path(rows: list[SimpleNamespace]) -> bytes:
+    """新路径：直接传入 ORM 对象与 schema"""
+    return SuccessResponse(data=rows, schema=RowOutSchema).body
+
+
+def bench(func, rows: list[SimpleNamespace], repeat: int = 5) -> float:
+    """取多次运行的最短耗时(毫秒)"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(rows)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main(count: int = 10_000) -> None:
+    rows = make_rows(count)
+    # 原路径中 Decimal 需 mode="json" 才能被 json.dumps 编码，三条路径输出的 JSON 完全一致
+    expected = json.loads(legacy_path(rows))
+    assert json.loads(dict_path(rows)) == expected
+    assert json.loads(schema_path(rows)) == expected
+
+    legacy = bench(legacy_path, rows)
+    print(f"{count} 行列表响应")
+    print(f"{'原路径':<24}{legacy:>10.1f} ms")
+    for name, func in (("新路径(字典)", dict_path), ("新路径(ORM + schema)", schema_path)):
+        cost = bench(func, rows)
+        print(f"{name:<24}{cost:>10.1f} ms  ({legacy / cost:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
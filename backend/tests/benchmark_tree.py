@@ -0,0 +1,141 @@
+"""
+树形工具基准测试
+
+执行命令: python tests/benchmark_tree.py [--sizes 10000 100000] [--repeat 5]
+
+分别在随机树（宽而浅，模拟部门/菜单）和单链（深度等于节点数）两种形态上，
+统计建索引、组装整树、子树提取、祖先路径、搜索裁剪以及子级/父级 ID 收集的耗时。
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.utils.common_util import (
+    get_child_recursion,
+    get_parent_recursion,
+    recursive_to_tree,
+    traversal_to_tree,
+)
+from app.utils.tree_util import TreeIndex
+
+
+def make_random_tree(size: int, seed: int = 0) -> list[dict[str, Any]]:
+    """
+    生成随机树：每个节点的父节点在其之前的节点中随机选取，约 1% 为根节点。
+
+    参数:
+    - size (int): 节点数量。
+    - seed (int): 随机种子。
+
+    返回:
+    - list[dict[str, Any]]: 节点列表。
+    """
+    rng = random.Random(seed)
+    nodes = []
+    for i in range(1, size + 1):
+        parent_id = None if i == 1 or rng.random() < 0.01 else rng.randint(1, i - 1)
+        nodes.append({"id": i, "parent_id": parent_id, "name": f"node-{i}"})
+    return nodes
+
+
+def make_chain(size: int) -> list[dict[str, Any]]:
+    """
+    生成单链树：深度等于节点数。
+
+    参数:
+    - size (int): 节点数量。
+
+    返回:
+    - list[dict[str, Any]]: 节点列表。
+    """
+    return [
+        {"id": i, "parent_id": i - 1 if i > 1 else None, "name": f"node-{i}"}
+        for i in range(1, size + 1)
+    ]
+
+
+def timeit(func: Callable[[], Any], repeat: int) -> float:
+    """
+    取多次执行的最短耗时(毫秒)，计时期间与标准库 timeit 一样关闭垃圾回收。
+
+    参数:
+    - func (Callable[[], Any]): 被测函数。
+    - repeat (int): 执行次数。
+
+    返回:
+    - float: 最短耗时(毫秒)。
+    """
+    best = float("inf")
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - started)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return best * 1000
+
+
+def run_case(shape: str, nodes: list[dict[str, Any]], repeat: int) -> list[tuple[str, float]]:
+    """
+    对一组节点执行全部基准项。
+
+    参数:
+    - shape (str): 树形态名称。
+    - nodes (list[dict[str, Any]]): 节点列表。
+    - repeat (int): 每项执行次数。
+
+    返回:
+    - list[tuple[str, float]]: (基准项, 耗时毫秒) 列表。
+    """
+    index = TreeIndex(nodes)
+    leaf = nodes[-1]["id"]
+    child_map: dict[int, list[int]] = {}
+    for node in nodes:
+        child_map.setdefault(node["id"], [])
+        if node["parent_id"]:
+            child_map.setdefault(node["parent_id"], []).append(node["id"])
+    parent_map = {node["id"]: node["parent_id"] for node in nodes}
+
+    cases: list[tuple[str, Callable[[], Any]]] = [
+        ("TreeIndex 建索引", lambda: TreeIndex(nodes)),
+        ("TreeIndex.to_tree", index.to_tree),
+        ("traversal_to_tree", lambda: traversal_to_tree([dict(node) for node in nodes])),
+        ("recursive_to_tree", lambda: recursive_to_tree([dict(node) for node in nodes])),
+        ("TreeIndex.subtree(根)", lambda: index.subtree(nodes[0]["id"])),
+        ("TreeIndex.path(末节点)", lambda: index.path(leaf)),
+        ("TreeIndex.prune(name 以 9 结尾)", lambda: index.prune(lambda n: n["name"][-1] == "9")),
+        ("get_child_recursion(根)", lambda: get_child_recursion(nodes[0]["id"], child_map)),
+        ("get_parent_recursion(末节点)", lambda: get_parent_recursion(leaf, parent_map)),
+    ]
+    return [(f"{shape} {name}", timeit(func, repeat)) for name, func in cases]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="树形工具基准测试")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        print(f"\n== {size} 个节点 ==")
+        results = run_case("随机树", make_random_tree(size), args.repeat)
+        results += run_case("单链", make_chain(size), args.repeat)
+        width = max(len(name) for name, _ in results)
+        for name, elapsed in results:
+            print(f"{name:<{width}}  {elapsed:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+日志分区维护测试（SQLite 月份表滚动）
+
+注意：使用普通的 def 定义测试函数，不要使用 async def
+执行命令: pytest tests/test_partition.py
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.config.setting import settings
+from app.core import partition
+from app.core.base_model import MappedBase
+from app.core.partition import LogPartition
+
+
+@pytest.fixture
+def sqlite_engine(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'partition.db'}")
+    monkeypatch.setattr(partition, "async_engine", engine)
+    monkeypatch.setattr(settings, "DATABASE_TYPE", "sqlite")
+    monkeypatch.setattr(settings, "LOG_PARTITION_ENABLE", True)
+    monkeypatch.setattr(settings, "LOG_PARTITION_TABLES", {"sys_log": 6})
+    yield engine
+    asyncio.run(engine.dispose())
+
+
+def _rows(days: list[int]) -> list[dict]:
+    now = datetime.now()
+    return [
+        {
+            "type": 1,
+            "request_path": "/test",
+            "request_method": "GET",
+            "response_code": 200,
+            "uuid": str(uuid.uuid4()),
+            "status": "0",
+            "created_time": now - timedelta(days=day),
+            "updated_time": now - timedelta(days=day),
+        }
+        for day in days
+    ]
+
+
+async def _count_all(engine) -> int:
+    async with engine.connect() as conn:
+        names = (
+            await conn.execute(
+                text("SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE 'sys_log%'")
+            )
+        ).scalars()
+        total = 0
+        for name in names:
+            total += (await conn.execute(text(f'SELECT COUNT(*) FROM "{name}"'))).scalar()
+        return total
+
+
+def test_sqlite_existing_rows_survive_first_maintenance(sqlite_engine) -> None:
+    """已有数据的 SQLite 日志表未显式转换时，维护任务不滚动、不删除任何行"""
+    sys_log = MappedBase.metadata.tables["sys_log"]
+
+    async def run() -> tuple[dict, int, int]:
+        async with sqlite_engine.begin() as conn:
+            await conn.run_sync(sys_log.create)
+            await conn.execute(insert(sys_log), _rows([400, 250, 40, 0]))
+        result = await LogPartition.maintain()
+        async with sqlite_engine.connect() as conn:
+            main_rows = (await conn.execute(select(func.count()).select_from(sys_log))).scalar()
+        return result, main_rows, await _count_all(sqlite_engine)
+
+    result, main_rows, total = asyncio.run(run())
+    assert result == {}
+    assert main_rows == 4
+    assert total == 4
+
+
+def test_sqlite_convert_moves_rows_before_dropping(sqlite_engine) -> None:
+    """显式转换后，超出保留期的行先滚动到月份表，再随月份表删除并出现在 dropped 中"""
+    sys_log = MappedBase.metadata.tables["sys_log"]
+
+    async def run() -> tuple[list[str], dict, int]:
+        async with sqlite_engine.begin() as conn:
+            await conn.run_sync(sys_log.create)
+            await conn.execute(insert(sys_log), _rows([400, 250, 40, 0]))
+        converted = await LogPartition.convert(force=True)
+        result = await LogPartition.maintain()
+        return converted, result, await _count_all(sqlite_engine)
+
+    converted, result, total = asyncio.run(run())
+    assert converted == ["sys_log"]
+    old_months = {f"sys_log_p{datetime.now() - timedelta(days=day):%Y%m}" for day in (400, 250)}
+    assert old_months <= set(result["sys_log"]["dropped"])
+    assert total == 2
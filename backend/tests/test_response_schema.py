@@ -0,0 +1,71 @@
+"""
+SuccessResponse(schema=...) 分页响应测试
+
+注意：使用普通的 def 定义测试函数，不要使用 async def
+执行命令: pytest tests/test_response_schema.py
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.api.v1.module_system.log.model import OperationLogModel
+from app.api.v1.module_system.log.schema import OperationLogOutSchema
+from app.common.request import PaginationService
+from app.common.response import SuccessResponse, validate_data
+from app.core.base_model import MappedBase
+
+
+def _load_logs(db_path: Path, count: int) -> list[OperationLogModel]:
+    sys_log = MappedBase.metadata.tables["sys_log"]
+    now = datetime.now()
+    rows = [
+        {
+            "type": 1,
+            "request_path": f"/test/{i}",
+            "request_method": "GET",
+            "response_code": 200,
+            "uuid": str(uuid.uuid4()),
+            "status": "0",
+            "created_time": now - timedelta(minutes=i),
+            "updated_time": now - timedelta(minutes=i),
+        }
+        for i in range(count)
+    ]
+
+    async def run() -> list[OperationLogModel]:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(sys_log.create)
+                await conn.execute(insert(sys_log), rows)
+            async with engine.connect() as conn:
+                result = await conn.execute(select(sys_log).order_by(sys_log.c.id))
+                return [OperationLogModel(**row._mapping) for row in result]
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(run())
+
+
+def test_page_schema_response_matches_dumped_dicts(tmp_path: Path) -> None:
+    """分页结果传 ORM 对象 + schema 与逐行 model_dump 后分页的响应完全一致"""
+    logs = _load_logs(tmp_path / "response.db", 25)
+
+    dumped = [OperationLogOutSchema.model_validate(obj).model_dump() for obj in logs]
+    old_page = asyncio.run(PaginationService.paginate(data_list=dumped, page_no=2, page_size=10))
+    new_page = asyncio.run(PaginationService.paginate(data_list=logs, page_no=2, page_size=10))
+
+    old_body = SuccessResponse(data=old_page, msg="查询日志成功").body
+    new_body = SuccessResponse(data=new_page, msg="查询日志成功", schema=OperationLogOutSchema).body
+    assert new_body == old_body
+
+
+def test_validate_data_only_validates_page_items() -> None:
+    """分页结果只校验 items，分页字段原样保留"""
+    page = {"items": [], "total": 0, "page_no": 1, "page_size": 10, "has_next": False}
+    assert validate_data(page, OperationLogOutSchema) == page
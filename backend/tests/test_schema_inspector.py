@@ -0,0 +1,84 @@
+"""
+代码生成表结构缓存测试（Redis 版本号跨实例失效）
+
+注意：使用普通的 def 定义测试函数，不要使用 async def
+执行命令: pytest tests/test_schema_inspector.py
+"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.common.enums import RedisInitKeyConfig
+from app.config.setting import settings
+from app.core import database
+from app.plugin.module_generator.gencode.tools.schema_inspector import SchemaInspector
+
+
+class FakeRedis:
+    """只实现 get / incr 的内存 Redis，多个实例共享同一个对象即模拟共享的 Redis"""
+
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+
+    async def get(self, name: str) -> str | None:
+        return self.data.get(name)
+
+    async def incr(self, name: str) -> int:
+        value = int(self.data.get(name, 0)) + 1
+        self.data[name] = str(value)
+        return value
+
+
+@pytest.fixture
+def sqlite_engine(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'schema.db'}")
+    monkeypatch.setattr(database, "async_engine", engine)
+    monkeypatch.setattr(settings, "DATABASE_TYPE", "sqlite")
+    SchemaInspector._clear()
+    SchemaInspector._version = None
+    yield engine
+    SchemaInspector._clear()
+    SchemaInspector._version = None
+    asyncio.run(engine.dispose())
+
+
+def test_version_bump_from_other_instance_drops_local_cache(sqlite_engine) -> None:
+    """其他实例递增版本号后，本实例下次读取时重新反射表列表"""
+    redis = FakeRedis()
+
+    async def run() -> tuple[list[str], list[str], list[str]]:
+        async with sqlite_engine.begin() as conn:
+            await conn.execute(text("CREATE TABLE gen_a (id INTEGER PRIMARY KEY)"))
+        await SchemaInspector.sync_version(redis)
+        before = [name for name, _ in await SchemaInspector.get_tables()]
+
+        # 其他实例建表：本实例的进程内缓存仍是旧表列表
+        async with sqlite_engine.begin() as conn:
+            await conn.execute(text("CREATE TABLE gen_b (id INTEGER PRIMARY KEY)"))
+        await SchemaInspector.sync_version(redis)
+        cached = [name for name, _ in await SchemaInspector.get_tables()]
+
+        await redis.incr(RedisInitKeyConfig.GEN_SCHEMA_VERSION.key)
+        await SchemaInspector.sync_version(redis)
+        after = [name for name, _ in await SchemaInspector.get_tables()]
+        return before, cached, after
+
+    before, cached, after = asyncio.run(run())
+    assert before == ["gen_a"]
+    assert cached == ["gen_a"]
+    assert after == ["gen_a", "gen_b"]
+
+
+def test_invalidate_bumps_redis_version(sqlite_engine) -> None:
+    """invalidate() 递增 Redis 中的版本号"""
+    redis = FakeRedis()
+
+    async def run() -> str | None:
+        await SchemaInspector.invalidate(redis, ["gen_a"])
+        return await redis.get(RedisInitKeyConfig.GEN_SCHEMA_VERSION.key)
+
+    assert asyncio.run(run()) == "1"
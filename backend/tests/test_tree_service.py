@@ -0,0 +1,74 @@
+"""
+部门/菜单树查询测试（无过滤条件时不做二次查询）
+
+注意：使用普通的 def 定义测试函数，不要使用 async def
+执行命令: pytest tests/test_tree_service.py
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.api.v1.module_system.dept.crud import DeptCRUD
+from app.api.v1.module_system.dept.schema import DeptQueryParam
+from app.api.v1.module_system.dept.service import DeptService
+from app.api.v1.module_system.menu.crud import MenuCRUD
+from app.api.v1.module_system.menu.schema import MenuQueryParam
+from app.api.v1.module_system.menu.service import MenuService
+from app.core.base_params import has_active_filter
+
+# 控制器经 Depends() 构造查询对象时，未传的查询参数均为 None
+DEPT_QUERY = {"name": None, "status": None, "created_time": None, "updated_time": None}
+MENU_QUERY = {
+    "name": None,
+    "route_path": None,
+    "component_path": None,
+    "type": None,
+    "permission": None,
+    "description": None,
+    "status": None,
+    "created_time": None,
+    "updated_time": None,
+    "created_id": None,
+    "updated_id": None,
+}
+
+
+@pytest.fixture
+def tree_calls(monkeypatch: pytest.MonkeyPatch) -> list[dict | None]:
+    calls: list[dict | None] = []
+
+    async def get_tree_list_crud(self, search=None, order_by=None, preload=None):
+        calls.append(search)
+        return []
+
+    monkeypatch.setattr(DeptCRUD, "get_tree_list_crud", get_tree_list_crud)
+    monkeypatch.setattr(MenuCRUD, "get_tree_list_crud", get_tree_list_crud)
+    return calls
+
+
+def test_has_active_filter() -> None:
+    """空值与值为空的 (操作符, 值) 元组不算过滤条件"""
+    assert not has_active_filter(None)
+    assert not has_active_filter(DeptQueryParam(**DEPT_QUERY))
+    assert not has_active_filter(MenuQueryParam(**MENU_QUERY))
+    assert has_active_filter(DeptQueryParam(**{**DEPT_QUERY, "name": "研发"}))
+    assert has_active_filter(DeptQueryParam(**{**DEPT_QUERY, "status": "0"}))
+    assert has_active_filter(MenuQueryParam(**{**MENU_QUERY, "type": 1}))
+
+
+def test_unfiltered_tree_takes_single_query_path(tree_calls: list[dict | None]) -> None:
+    """控制器传入的空查询对象只查询一次全量数据并直接返回整棵树"""
+    auth = SimpleNamespace(db=None)
+    asyncio.run(DeptService.get_dept_tree_service(auth=auth, search=DeptQueryParam(**DEPT_QUERY)))
+    asyncio.run(MenuService.get_menu_tree_service(auth=auth, search=MenuQueryParam(**MENU_QUERY)))
+    assert tree_calls == [None, None]
+
+
+def test_filtered_tree_queries_matches(tree_calls: list[dict | None]) -> None:
+    """有过滤条件时额外查询命中节点用于裁剪"""
+    auth = SimpleNamespace(db=None)
+    search = DeptQueryParam(**{**DEPT_QUERY, "name": "研发"})
+    asyncio.run(DeptService.get_dept_tree_service(auth=auth, search=search))
+    assert tree_calls == [None, search.__dict__]
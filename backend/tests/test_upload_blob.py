@@ -0,0 +1,52 @@
+"""
+上传文件临时落盘测试
+
+注意：使用普通的 def 定义测试函数，不要使用 async def
+执行命令: pytest tests/test_upload_blob.py
+"""
+
+import asyncio
+import hashlib
+import io
+from pathlib import Path
+
+import pytest
+from fastapi import UploadFile
+from starlette.datastructures import Headers
+
+from app.config.setting import settings
+from app.utils.upload_util import UploadUtil
+
+
+@pytest.fixture
+def upload_dirs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(settings, "STATIC_ROOT", tmp_path / "static")
+    monkeypatch.setattr(settings, "UPLOAD_BLOB_PATH", tmp_path / "static/upload/blobs")
+    monkeypatch.setattr(settings, "UPLOAD_TEMP_PATH", tmp_path / ".upload_tmp")
+    monkeypatch.setattr(settings, "UPLOAD_HASH_ALGORITHM", "sha256")
+    return tmp_path
+
+
+def _upload(content: bytes) -> UploadFile:
+    return UploadFile(
+        file=io.BytesIO(content),
+        size=len(content),
+        filename="a.txt",
+        headers=Headers({"content-type": "text/plain"}),
+    )
+
+
+def test_temp_blob_written_outside_static_root(upload_dirs: Path) -> None:
+    """临时文件不在静态目录内，落盘后移动到内容寻址路径"""
+    content = b"hello blob"
+    digest, size, tmp_path = asyncio.run(UploadUtil.write_temp_blob(_upload(content)))
+
+    assert digest == hashlib.sha256(content).hexdigest()
+    assert size == len(content)
+    assert tmp_path.parent == settings.UPLOAD_TEMP_PATH
+    assert not tmp_path.is_relative_to(settings.STATIC_ROOT)
+
+    blob_path = UploadUtil.get_blob_path(digest, ".txt")
+    UploadUtil.commit_temp_blob(tmp_path, blob_path)
+    assert blob_path.read_bytes() == content
+    assert not tmp_path.exists()
@@ -0,0 +1,81 @@
+"""
+WebSocket 聊天连接认证测试
+
+注意：使用普通的 def 定义测试函数，不要使用 async def
+执行命令: pytest tests/test_ws_auth.py
+"""
+
+import json
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from app.api.v1.module_system.auth.schema import JWTPayloadSchema
+from app.api.v1.module_system.user.crud import UserCRUD
+from app.common.enums import RedisInitKeyConfig
+from app.core.security import create_access_token
+from app.plugin.module_application.ai.tools.stream_util import ChatSocketSession
+from app.plugin.module_application.ai.ws import WS_AI
+
+
+class FakeRedis:
+    """只实现 exists 的内存 Redis，保存在线会话键"""
+
+    def __init__(self, keys: set[str]) -> None:
+        self.keys = keys
+
+    async def exists(self, *names: str) -> int:
+        return sum(name in self.keys for name in names)
+
+
+def _token(session_id: str, is_refresh: bool = False) -> str:
+    return create_access_token(
+        JWTPayloadSchema(
+            sub=json.dumps({"session_id": session_id, "user_id": 1, "user_name": "admin"}),
+            is_refresh=is_refresh,
+            exp=datetime.now() + timedelta(minutes=5),
+        )
+    )
+
+
+@pytest.fixture
+def ws_client(monkeypatch: pytest.MonkeyPatch):
+    async def get_by_username_crud(self, username: str, preload=None):
+        return SimpleNamespace(id=1, username=username, status="0", roles=[], positions=[])
+
+    async def run(self) -> None:
+        await self.websocket.send_text(f"user:{self.user_id}")
+
+    monkeypatch.setattr(UserCRUD, "get_by_username_crud", get_by_username_crud)
+    monkeypatch.setattr(ChatSocketSession, "run", run)
+    app = FastAPI()
+    app.include_router(WS_AI)
+    app.state.redis = FakeRedis({f"{RedisInitKeyConfig.ACCESS_TOKEN.key}:online"})
+    return TestClient(app)
+
+
+def _close_code(client: TestClient, token: str) -> int | str:
+    with client.websocket_connect(f"/application/ai/ws?token={token}") as websocket:
+        try:
+            return websocket.receive_text()
+        except WebSocketDisconnect as e:
+            return e.code
+
+
+def test_websocket_accepts_online_access_token(ws_client: TestClient) -> None:
+    """在线会话的访问令牌可以建立聊天连接"""
+    assert _close_code(ws_client, _token("online")) == "user:1"
+
+
+def test_websocket_rejects_refresh_token(ws_client: TestClient) -> None:
+    """刷新令牌不能建立聊天连接"""
+    assert _close_code(ws_client, _token("online", is_refresh=True)) == 1008
+
+
+def test_websocket_rejects_logged_out_session(ws_client: TestClient) -> None:
+    """已退出登录（在线会话键不存在）的令牌不能建立聊天连接"""
+    assert _close_code(ws_client, _token("logged-out")) == 1008
@@ -128,6 +128,14 @@ const DictAPI = {
       method: "get",
     });
   },
+
+  getInitDictBatch(dict_types: string[]) {
+    return request<ApiResponse<Record<string, DictDataTable[]>>>({
+      url: `${API_PATH}/data/info`,
+      method: "get",
+      params: { dict_types },
+    });
+  },
 };
 
 export default DictAPI;
@@ -27,15 +27,18 @@ export const useDictStore = defineStore("dict", {
     // 批量获取字典数据
     async getDict(types: string[]): Promise<Record<string, DictDataTable[]>> {
       try {
-        for (const type of types) {
-          if (!this.dictData[type]) {
-            const response = await DictAPI.getInitDict(type);
+        // 未缓存的字典类型合并为一次请求
+        const missing = types.filter((type) => !this.dictData[type]);
+        if (missing.length) {
+          const response = await DictAPI.getInitDictBatch(missing);
+          const data = response.data.data || {};
+          for (const type of missing) {
             // 确保数据格式正确
-            this.dictData[type] = ((response.data.data as DictDataTable[]) || []).filter(
+            this.dictData[type] = (data[type] || []).filter(
               (item) => item.dict_value !== undefined && item.dict_label !== undefined
             );
-            this.isLoaded = true;
           }
+          this.isLoaded = true;
         }
         // 返回请求的字典数据
         return types.reduce(